@@ -15,6 +15,7 @@ from backend.ai.prompts import (
 )
 from backend.ai.service import (
     explain_content,
+    explain_content_stream,
     ask_about_content,
     get_available_explanation_types,
     clear_explanation_cache
@@ -59,6 +60,7 @@ __all__ = [
     "ExplanationType",
     "EXPLANATION_STYLE_MAP",
     "explain_content",
+    "explain_content_stream",
     "ask_about_content",
     "get_available_explanation_types",
     "clear_explanation_cache",
@@ -26,6 +26,7 @@ from backend.orm.learn_content import LearnContent
 from backend.orm.case_content import CaseContent
 from backend.orm.curriculum import CourseCurriculum
 from backend.exceptions import ForbiddenError, ContextValidationError
+from backend.services.tutor_context_cache import cached_student_context
 
 logger = logging.getLogger(__name__)
 
@@ -108,7 +109,26 @@ async def resolve_ai_context(
     Raises:
         ForbiddenError: If validation fails
         ContextValidationError: If IDs are invalid
+    
+    Resolved contexts are cached per user and scope until curriculum or
+    content changes (see tutor_context_cache); failed validations are
+    not cached.
     """
+    return await cached_student_context(
+        "ai_context",
+        user_id,
+        lambda: _resolve_ai_context(db, user_id, subject_id, module_id, content_id),
+        key=(subject_id, module_id, content_id)
+    )
+
+
+async def _resolve_ai_context(
+    db: AsyncSession,
+    user_id: int,
+    subject_id: int,
+    module_id: Optional[int],
+    content_id: Optional[int]
+) -> AIContext:
     logger.info(f"[AI Context] Resolving: user={user_id}, subject={subject_id}, module={module_id}, content={content_id}")
     
     subject_result = await db.execute(
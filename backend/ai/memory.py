@@ -39,7 +39,7 @@ from typing import Optional, Dict, Any, List
 from dataclasses import dataclass, field
 from datetime import datetime, timedelta
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, func, and_, desc
+from sqlalchemy import select, and_, desc
 
 from backend.orm.topic_mastery import TopicMastery
 from backend.orm.practice_attempt import PracticeAttempt
@@ -47,9 +47,13 @@ from backend.orm.practice_question import PracticeQuestion
 from backend.orm.subject_progress import SubjectProgress
 from backend.orm.content_module import ContentModule
 from backend.orm.subject import Subject
+from backend.services.daily_activity_service import get_study_streak
+from backend.services.tutor_context_cache import cached_student_context
 
 logger = logging.getLogger(__name__)
 
+STUDY_STREAK_MAX_DAYS = 30
+
 
 @dataclass
 class TopicStruggle:
@@ -171,7 +175,23 @@ async def compute_tutor_memory(
     - Explanation usage
     
     Returns a TutorMemory object that AI can verbalize but NOT modify.
+    Memories are cached per student and subject until the student's
+    practice or progress changes (see tutor_context_cache).
     """
+    return await cached_student_context(
+        "tutor_memory",
+        user_id,
+        lambda: _compute_tutor_memory(db, user_id, subject_id, lookback_days),
+        key=(subject_id, lookback_days)
+    )
+
+
+async def _compute_tutor_memory(
+    db: AsyncSession,
+    user_id: int,
+    subject_id: int,
+    lookback_days: int
+) -> TutorMemory:
     logger.info(f"[Memory] Computing for user={user_id}, subject={subject_id}")
     
     subject_result = await db.execute(
@@ -309,34 +329,10 @@ def _topics_related(topic_a: str, topic_b: str) -> bool:
 
 
 async def _compute_study_streak(db: AsyncSession, user_id: int, subject_id: int) -> int:
-    """Compute consecutive days of study activity"""
-    today = datetime.utcnow().date()
-    streak = 0
-    
-    for days_ago in range(30):
-        check_date = today - timedelta(days=days_ago)
-        start = datetime.combine(check_date, datetime.min.time())
-        end = datetime.combine(check_date, datetime.max.time())
-        
-        count_result = await db.execute(
-            select(func.count(PracticeAttempt.id))
-            .join(PracticeQuestion)
-            .join(ContentModule)
-            .where(
-                PracticeAttempt.user_id == user_id,
-                ContentModule.subject_id == subject_id,
-                PracticeAttempt.attempted_at >= start,
-                PracticeAttempt.attempted_at <= end
-            )
-        )
-        count = count_result.scalar()
-        
-        if count and count > 0:
-            streak += 1
-        elif days_ago > 0:
-            break
-    
-    return streak
+    """Compute consecutive days of study activity (capped at 30), from the daily activity rollup"""
+    return await get_study_streak(
+        db, user_id, kind="practice", subject_id=subject_id, max_days=STUDY_STREAK_MAX_DAYS
+    )
 
 
 def build_memory_context_for_ai(memory: TutorMemory) -> str:
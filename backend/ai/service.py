@@ -15,7 +15,7 @@ GUARANTEES:
 
 import logging
 import hashlib
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, AsyncIterator
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select
 
@@ -32,6 +32,7 @@ from backend.orm.case_content import CaseContent
 from backend.orm.content_module import ContentModule
 from backend.orm.subject import Subject
 from backend.exceptions import ForbiddenError, NotFoundError
+from backend.services.llm_streaming import StreamResult, guarded_sse, sse_event, stream_gemini
 
 logger = logging.getLogger(__name__)
 
@@ -81,6 +82,15 @@ async def _call_llm(prompt: str, system_prompt: str = None) -> str:
         raise
 
 
+async def _stream_llm(prompt: str) -> AsyncIterator[str]:
+    """Streaming counterpart of _call_llm: text chunks as they arrive."""
+    import google.generativeai as genai
+    
+    model = genai.GenerativeModel("gemini-1.5-flash")
+    async for text in stream_gemini(model, prompt):
+        yield text
+
+
 async def get_content_with_context(
     db: AsyncSession,
     content_id: int,
@@ -155,6 +165,25 @@ async def get_content_with_context(
     }
 
 
+def _build_prompt(content_data: Dict[str, Any], explanation_type: str, question: Optional[str]) -> str:
+    """Question-answer prompt when a question is given, explanation prompt otherwise"""
+    if question:
+        return build_question_answer_prompt(
+            question=question,
+            subject_name=content_data["subject_name"],
+            module_title=content_data["module_title"],
+            content_title=content_data["content_title"],
+            content_text=content_data["content_text"]
+        )
+    return build_explanation_prompt(
+        explanation_type=explanation_type,
+        subject_name=content_data["subject_name"],
+        module_title=content_data["module_title"],
+        content_title=content_data["content_title"],
+        content_text=content_data["content_text"]
+    )
+
+
 async def explain_content(
     *,
     db: AsyncSession,
@@ -217,23 +246,7 @@ async def explain_content(
             }
     
     content_data = await get_content_with_context(db, content_id, module_id)
-    
-    if question:
-        prompt = build_question_answer_prompt(
-            question=question,
-            subject_name=content_data["subject_name"],
-            module_title=content_data["module_title"],
-            content_title=content_data["content_title"],
-            content_text=content_data["content_text"]
-        )
-    else:
-        prompt = build_explanation_prompt(
-            explanation_type=explanation_type,
-            subject_name=content_data["subject_name"],
-            module_title=content_data["module_title"],
-            content_title=content_data["content_title"],
-            content_text=content_data["content_text"]
-        )
+    prompt = _build_prompt(content_data, explanation_type, question)
     
     try:
         explanation = await _call_llm(prompt)
@@ -254,6 +267,79 @@ async def explain_content(
     }
 
 
+async def explain_content_stream(
+    *,
+    db: AsyncSession,
+    user_id: int,
+    subject_id: int,
+    module_id: int,
+    content_id: int,
+    explanation_type: str = "simple",
+    question: Optional[str] = None,
+    use_cache: bool = True
+) -> AsyncIterator[bytes]:
+    """
+    Streaming variant of explain_content (server-sent events, see
+    llm_streaming).
+    
+    Context resolution, scope guards and content lookup run before this
+    returns, so they raise exactly like explain_content; the returned
+    iterator only generates. Cached explanations are sent as a single
+    delta. A fully streamed, unblocked explanation is cached on
+    completion. The done event carries the explain_content fields
+    except the explanation text.
+    """
+    logger.info(f"[Explain] stream user={user_id}, content={content_id}, type={explanation_type}")
+    
+    context = await resolve_ai_context(
+        db,
+        user_id=user_id,
+        subject_id=subject_id,
+        module_id=module_id,
+        content_id=content_id
+    )
+    
+    if question:
+        enforce_scope(question, context.subject_title)
+    
+    done = {
+        "content_id": content_id,
+        "explanation_type": explanation_type,
+        "from_cache": False,
+        "context": context.to_dict()
+    }
+    
+    cache_key = _get_cache_key(content_id, explanation_type)
+    cached = _cache_get(cache_key) if use_cache and not question else None
+    
+    if cached:
+        logger.info(f"[Explain] Cache hit for {cache_key}")
+        
+        async def cached_events() -> AsyncIterator[bytes]:
+            yield sse_event("delta", {"text": cached})
+            yield sse_event("done", {**done, "from_cache": True})
+        
+        return cached_events()
+    
+    content_data = await get_content_with_context(db, content_id, module_id)
+    prompt = _build_prompt(content_data, explanation_type, question)
+    
+    async def events() -> AsyncIterator[bytes]:
+        result = StreamResult()
+        async for event in guarded_sse(_stream_llm(prompt), result):
+            yield event
+        if result.error:
+            return
+        
+        if result.completed and not question and use_cache:
+            _cache_set(cache_key, result.text)
+            logger.info(f"[Explain] Cached response for {cache_key}")
+        
+        yield sse_event("done", {**done, "blocked": result.blocked_reason})
+    
+    return events()
+
+
 async def ask_about_content(
     *,
     db: AsyncSession,
@@ -214,6 +214,7 @@ async def init_db():
         from backend.orm.content_module import ContentModule
         from backend.orm.learn_content import LearnContent
         from backend.orm.case_content import CaseContent
+        from backend.orm.case_citation_key import CaseCitationKey
         from backend.orm.practice_question import PracticeQuestion
         from backend.orm.user_notes import UserNotes
         from backend.orm.user_progress import UserProgress
@@ -239,6 +240,13 @@ async def init_db():
         from backend.orm.user_content_progress import UserContentProgress
         from backend.orm.practice_attempt import PracticeAttempt
         from backend.orm.subject_progress import SubjectProgress
+        from backend.orm.user_stats import UserStats
+        from backend.orm.user_daily_activity import UserDailyActivity
+        from backend.orm.rollup_backfill import RollupBackfill
+        
+        # Dashboard and daily activity rollup listeners
+        import backend.services.user_stats_service
+        import backend.services.daily_activity_service
         
         # First, handle migration for existing database
         await check_and_migrate_role_column()
@@ -248,6 +256,16 @@ async def init_db():
         async with engine.begin() as conn:
             await conn.run_sync(Base.metadata.create_all)
         
+        # Index any cases added without the citation index listeners loaded
+        from backend.services.citation_index import sync_citation_index
+        async with AsyncSessionLocal() as session:
+            await sync_citation_index(session)
+        
+        # Build the daily activity rollup on first deploy
+        from backend.services.daily_activity_service import backfill_daily_activity
+        async with AsyncSessionLocal() as session:
+            await backfill_daily_activity(session)
+        
         logger.info("✓ Database initialization complete")
         
     except Exception as e:
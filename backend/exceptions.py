@@ -73,3 +73,14 @@ class NotFoundError(JurisException):
     
     def __init__(self, message: str = "Resource not found"):
         super().__init__(message, self.status_code)
+
+
+class FileTooLargeError(JurisException):
+    """
+    Raised when an upload exceeds its size limit while streaming to disk.
+    """
+    status_code = 413
+    
+    def __init__(self, max_size: int, message: str = None):
+        self.max_size = max_size
+        super().__init__(message or f"File exceeds maximum size of {max_size} bytes", self.status_code)
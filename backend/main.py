@@ -124,6 +124,15 @@ async def lifespan(app: FastAPI):
     yield
     
     logger.info("Shutting down application...")
+    # Only loaded with the audio routes; drains queued chunks into the database
+    transcription = sys.modules.get("backend.services.audio_transcription")
+    if transcription is not None:
+        try:
+            await transcription.transcription_service.shutdown()
+            logger.info("Transcription queue drained")
+        except Exception as e:
+            logger.error(f"Error draining transcription queue: {str(e)}")
+
     try:
         await close_db()
         logger.info("Database connection closed")
@@ -18,6 +18,7 @@ from .oral_round_score import OralRoundScore
 from .classroom_session import ClassroomSession
 from .classroom_round import ClassroomRound
 from .classroom_round_action import ClassroomRoundAction
+from .ai_opponent_session import AIOpponentSession
 
 
 __all__ = [
@@ -0,0 +1,53 @@
+"""
+backend/orm/case_citation_key.py
+Normalized citation index over CaseContent
+
+One row per lookup key of a case:
+- kind='parties':  canonical party pair, e.g. 'puttaswamy v union of india'
+- kind='citation': parsed law-report citation, e.g. 'scc:2017:10:1'
+
+Keys are produced by backend.utils.citation_normalizer and kept in sync
+with case_content by backend.services.citation_index.
+"""
+from sqlalchemy import Column, Integer, String, ForeignKey, Index, UniqueConstraint
+from backend.orm.base import Base
+
+
+class CaseCitationKey(Base):
+    """
+    Lookup key → case mapping used by guardrail citation checks.
+
+    Verification of every citation in a response is a single
+    `key IN (...)` query against ix_case_citation_keys_key.
+    """
+    __tablename__ = "case_citation_keys"
+
+    id = Column(Integer, primary_key=True, index=True)
+
+    case_id = Column(
+        Integer,
+        ForeignKey("case_content.id", ondelete="CASCADE"),
+        nullable=False,
+        index=True,
+        comment="Indexed case"
+    )
+
+    key = Column(
+        String(300),
+        nullable=False,
+        comment="Normalized lookup key"
+    )
+
+    kind = Column(
+        String(20),
+        nullable=False,
+        comment="Key kind: parties | citation"
+    )
+
+    __table_args__ = (
+        UniqueConstraint("case_id", "key", name="uq_case_citation_key"),
+        Index("ix_case_citation_keys_key", "key"),
+    )
+
+    def __repr__(self):
+        return f"<CaseCitationKey(case_id={self.case_id}, key='{self.key}')>"
@@ -253,3 +253,16 @@ class ClassroomRound(Base):
             "winner_id": self.winner_id,
             "remaining_seconds": self.get_remaining_seconds()
         }
+
+
+# Add relationships to User model
+def add_user_relationships():
+    """Add classroom round relationships to User model."""
+    from backend.orm.user import User
+    
+    User.rounds_as_petitioner = relationship("ClassroomRound", foreign_keys=[ClassroomRound.petitioner_id], back_populates="petitioner")
+    User.rounds_as_respondent = relationship("ClassroomRound", foreign_keys=[ClassroomRound.respondent_id], back_populates="respondent")
+    User.rounds_as_judge = relationship("ClassroomRound", foreign_keys=[ClassroomRound.judge_id], back_populates="judge")
+
+
+add_user_relationships()
@@ -57,7 +57,7 @@ class ClassroomSession(Base):
     id = Column(Integer, primary_key=True, index=True)
     session_code = Column(String(12), unique=True, index=True, nullable=False)
     teacher_id = Column(Integer, ForeignKey("users.id"), nullable=False)
-    case_id = Column(Integer, ForeignKey("moot_cases.id"), nullable=True)  # Optional case reference
+    case_id = Column(Integer, nullable=True)  # Optional case reference (no moot_cases table)
     
     # Session configuration
     topic = Column(String(255), nullable=False)
@@ -88,6 +88,8 @@ class ClassroomSession(Base):
     participants = relationship("ClassroomParticipant", back_populates="session", cascade="all, delete-orphan")
     scores = relationship("ClassroomScore", back_populates="session", cascade="all, delete-orphan")
     arguments = relationship("ClassroomArgument", back_populates="session", cascade="all, delete-orphan")
+    rounds = relationship("ClassroomRound", back_populates="session", cascade="all, delete-orphan")
+    round_actions = relationship("ClassroomRoundAction", back_populates="session", cascade="all, delete-orphan")
     
     # Production-grade constraints
     __table_args__ = (
@@ -280,6 +282,7 @@ class ClassroomScore(Base):
     session = relationship("ClassroomSession", back_populates="scores")
     user = relationship("User", foreign_keys=[user_id], back_populates="classroom_scores")
     submitted_by_user = relationship("User", foreign_keys=[submitted_by])
+    participant = relationship("ClassroomParticipant", back_populates="score", uselist=False)
     
     def calculate_total(self):
         """Calculate total score from criteria."""
@@ -352,3 +355,6 @@ def add_user_relationships():
     User.classroom_participations = relationship("ClassroomParticipant", back_populates="user")
     User.classroom_scores = relationship("ClassroomScore", foreign_keys=[ClassroomScore.user_id], back_populates="user")
     User.classroom_arguments = relationship("ClassroomArgument", back_populates="user")
+
+
+add_user_relationships()
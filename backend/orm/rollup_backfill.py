@@ -0,0 +1,22 @@
+"""
+backend/orm/rollup_backfill.py
+Completion markers of one-time rollup backfills
+
+A rollup that is maintained by mapper events is built once from its
+source tables; the marker row records that this happened, so the backfill
+neither repeats nor is skipped just because events already wrote rows.
+"""
+from sqlalchemy import Column, Integer, String, DateTime, func
+from backend.orm.base import Base
+
+
+class RollupBackfill(Base):
+    """One completed backfill, keyed by the rollup's table name"""
+    __tablename__ = "rollup_backfills"
+
+    name = Column(String(100), primary_key=True, comment="Rollup table that was backfilled")
+    rows_written = Column(Integer, default=0, nullable=False, comment="Rows written by the backfill")
+    completed_at = Column(DateTime, server_default=func.now(), nullable=False)
+
+    def __repr__(self):
+        return f"<RollupBackfill(name={self.name}, rows_written={self.rows_written})>"
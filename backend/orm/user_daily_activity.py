@@ -0,0 +1,62 @@
+"""
+backend/orm/user_daily_activity.py
+Per-user, per-day, per-subject study activity rollup
+
+One row per (user, day, subject) with practice and content totals, so
+streaks, weekly trends and consistency metrics read a handful of rows
+instead of scanning practice_attempts and user_content_progress.
+
+Maintained on write by backend.services.daily_activity_service
+(mapper events on PracticeAttempt and UserContentProgress) and
+backfilled once from those tables (see backend.orm.rollup_backfill).
+"""
+from sqlalchemy import Column, Integer, Date, DateTime, ForeignKey, Index, UniqueConstraint
+from backend.orm.base import Base
+
+
+class UserDailyActivity(Base):
+    """
+    Study activity of one user on one day for one subject.
+
+    subject_id is 0 for activity that cannot be attributed to a subject.
+    Rows record history: deleting an attempt or progress record does not
+    remove the activity it represented.
+    """
+    __tablename__ = "user_daily_activity"
+
+    id = Column(Integer, primary_key=True, index=True)
+
+    user_id = Column(
+        Integer,
+        ForeignKey("users.id", ondelete="CASCADE"),
+        nullable=False,
+        comment="Active user"
+    )
+
+    activity_date = Column(Date, nullable=False, comment="Day of activity (UTC)")
+
+    subject_id = Column(Integer, nullable=False, default=0, comment="Subject (0 = unattributed)")
+
+    # Practice
+    attempts = Column(Integer, default=0, nullable=False, comment="Practice attempts")
+    graded_attempts = Column(Integer, default=0, nullable=False, comment="Attempts with a correctness verdict")
+    correct_attempts = Column(Integer, default=0, nullable=False, comment="Correct attempts")
+    practice_time_seconds = Column(Integer, default=0, nullable=False, comment="Time taken on attempts")
+    last_attempted_at = Column(DateTime, nullable=True, comment="Latest attempt of the day")
+
+    # Content
+    content_viewed = Column(Integer, default=0, nullable=False, comment="Content views")
+    content_completed = Column(Integer, default=0, nullable=False, comment="Content items completed")
+    content_time_seconds = Column(Integer, default=0, nullable=False, comment="Time spent on content")
+    last_viewed_at = Column(DateTime, nullable=True, comment="Latest content view of the day")
+
+    __table_args__ = (
+        UniqueConstraint("user_id", "activity_date", "subject_id", name="uq_user_daily_activity"),
+        Index("ix_user_daily_activity_user_date", "user_id", "activity_date"),
+    )
+
+    def __repr__(self):
+        return (
+            f"<UserDailyActivity(user_id={self.user_id}, date={self.activity_date}, "
+            f"subject_id={self.subject_id}, attempts={self.attempts}, viewed={self.content_viewed})>"
+        )
@@ -0,0 +1,58 @@
+"""
+backend/orm/user_stats.py
+Per-user activity rollup behind the dashboard
+
+One row per user with running totals of content progress and practice
+attempts, so the dashboard reads a single row by primary key instead of
+aggregating user_content_progress and practice_attempts on every load.
+
+Kept current by backend.services.user_stats_service (mapper events on
+UserContentProgress and PracticeAttempt); a missing row is rebuilt from
+the source tables on first read.
+"""
+from datetime import datetime
+from sqlalchemy import Column, Integer, Date, DateTime, ForeignKey
+from backend.orm.base import Base
+
+
+class UserStats(Base):
+    """
+    Running dashboard totals of one user.
+
+    Streak:
+    - study_streak counts consecutive days with content activity,
+      ending on streak_last_date
+    - The streak is current while streak_last_date is today or yesterday
+    """
+    __tablename__ = "user_stats"
+
+    user_id = Column(
+        Integer,
+        ForeignKey("users.id", ondelete="CASCADE"),
+        primary_key=True,
+        comment="User the totals belong to"
+    )
+
+    # Content progress
+    content_completed = Column(Integer, default=0, nullable=False, comment="Completed content items")
+    total_time_spent_seconds = Column(Integer, default=0, nullable=False, comment="Time spent on content")
+    last_activity_at = Column(DateTime, nullable=True, comment="Most recent content view")
+
+    # Practice
+    total_attempts = Column(Integer, default=0, nullable=False, comment="Practice attempts")
+    correct_attempts = Column(Integer, default=0, nullable=False, comment="Correct practice attempts")
+
+    # Streak
+    study_streak = Column(Integer, default=0, nullable=False, comment="Consecutive active days")
+    streak_last_date = Column(Date, nullable=True, comment="Last day counted in study_streak")
+
+    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow, nullable=False)
+
+    def current_streak(self, today) -> int:
+        """Streak as of today (0 once a full day was missed)"""
+        if self.streak_last_date is None or (today - self.streak_last_date).days > 1:
+            return 0
+        return self.study_streak
+
+    def __repr__(self):
+        return f"<UserStats(user_id={self.user_id}, completed={self.content_completed}, attempts={self.total_attempts})>"
@@ -21,6 +21,7 @@ from passlib.context import CryptContext
 from backend.database import get_db
 from backend.orm.user import User, UserRole
 from backend.errors import ErrorCode
+from backend.services.principal_cache import get_user_by_sub
 
 logger = logging.getLogger(__name__)
 
@@ -124,8 +125,7 @@ async def get_current_user(
     if not email:
         raise credentials_exception
 
-    result = await db.execute(select(User).where(User.email == email))
-    user = result.scalar_one_or_none()
+    user = await get_user_by_sub(db, email)
 
     if not user or not user.is_active:
         raise credentials_exception
@@ -152,8 +152,7 @@ async def get_current_user_optional(
     if not email:
         return None
 
-    result = await db.execute(select(User).where(User.email == email))
-    user = result.scalar_one_or_none()
+    user = await get_user_by_sub(db, email)
 
     if not user or not user.is_active:
         return None
@@ -11,15 +11,16 @@ All endpoints:
 - Return standardized JSON
 - No AI/LLM calls
 """
+import asyncio
 import logging
 from typing import Dict, Any, List
-from fastapi import APIRouter, Depends, HTTPException, status, Query
+from fastapi import APIRouter, Depends, HTTPException, status, Query, Request
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select
 from sqlalchemy.orm import joinedload
 
 from backend.database import get_db
-from backend.orm.user import User
+from backend.orm.user import User, UserRole
 from backend.orm.subject import Subject
 from backend.orm.topic_mastery import TopicMastery
 from backend.orm.subject_progress import SubjectProgress
@@ -474,11 +475,13 @@ async def get_comprehensive_analytics(
     logger.info(f"[ANALYTICS] Comprehensive analytics requested: user={current_user.email}")
     
     try:
-        # Get all analytics data
-        snapshot = await analytics.get_user_learning_snapshot(current_user.id)
-        consistency = await analytics.get_study_consistency_metrics(current_user.id)
-        strength_map = await analytics.get_subject_strength_map(current_user.id)
-        recommendations = await analytics.get_revision_recommendations(current_user.id)
+        # Get all analytics data (base datasets are loaded once and shared)
+        snapshot, consistency, strength_map, recommendations = await asyncio.gather(
+            analytics.get_user_learning_snapshot(current_user.id),
+            analytics.get_study_consistency_metrics(current_user.id),
+            analytics.get_subject_strength_map(current_user.id),
+            analytics.get_revision_recommendations(current_user.id)
+        )
         
         # Extract top items
         weak_subjects = [
@@ -770,6 +773,12 @@ from backend.orm.competition import Competition
 from backend.orm.team import Team, TeamMember
 from backend.services.analytics_calculator import AnalyticsCalculator
 from backend.services.certificate_generator import get_certificate_generator
+from backend.services.certificate_batch_service import (
+    create_batch, get_batch, issue_competition_certificates_in_background
+)
+from backend.services.file_serving import serve_file
+from backend.services.analytics_export import build_export_response
+from fastapi import BackgroundTasks
 from pydantic import BaseModel as PydanticBaseModel, Field
 from typing import List as TypingList, Optional
 
@@ -860,6 +869,24 @@ class CertificateResponse(PydanticBaseModel):
     download_url: str
 
 
+class CertificateBatchRequest(PydanticBaseModel):
+    competition_id: int
+
+
+class CertificateBatchResponse(PydanticBaseModel):
+    batch_id: str
+    competition_id: int
+    requested_by: int
+    status: str
+    total: int
+    rendered: int
+    issued: int
+    error: Optional[str]
+    started_at: str
+    completed_at: Optional[str]
+    progress_percentage: int
+
+
 class CertificateVerifyResponse(PydanticBaseModel):
     valid: bool
     revoked: bool
@@ -1160,11 +1187,11 @@ async def generate_certificate_v5(
     
     generator = get_certificate_generator()
     
-    competition_dates = f"{competition.start_date.strftime('%B %d')} - {competition.end_date.strftime('%B %d, %Y')}"
+    competition_dates = f"{competition.start_date.strftime('%B %d')} - {competition.oral_end_date.strftime('%B %d, %Y')}"
     
     certificate, pdf_path, qr_path = await generator.generate_certificate(
         user_id=current_user.id,
-        user_name=current_user.name,
+        user_name=current_user.full_name,
         user_photo_path=None,
         competition_id=request.competition_id,
         competition_title=competition.title,
@@ -1182,7 +1209,7 @@ async def generate_certificate_v5(
     return CertificateResponse(
         id=certificate.id,
         user_id=certificate.user_id,
-        user_name=current_user.name,
+        user_name=current_user.full_name,
         competition_id=certificate.competition_id,
         competition_title=competition.title,
         team_id=certificate.team_id,
@@ -1197,6 +1224,55 @@ async def generate_certificate_v5(
     )
 
 
+@router.post("/certificates/generate-batch", response_model=CertificateBatchResponse, status_code=status.HTTP_202_ACCEPTED)
+async def generate_certificate_batch_v5(
+    request: CertificateBatchRequest,
+    background_tasks: BackgroundTasks,
+    current_user: User = Depends(get_current_user),
+    db: AsyncSession = Depends(get_db)
+):
+    """
+    Phase 5: Issue certificates to every ranked participant of a competition.
+    Admin/Faculty only. Renders in the background; poll the batch for progress.
+    """
+    _check_admin_permission_v5(current_user)
+    
+    comp_result = await db.execute(
+        select(Competition.id).where(Competition.id == request.competition_id)
+    )
+    if comp_result.scalar_one_or_none() is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Competition not found"
+        )
+    
+    batch = create_batch(request.competition_id, current_user.id)
+    background_tasks.add_task(issue_competition_certificates_in_background, batch)
+    
+    return CertificateBatchResponse(**batch.to_dict())
+
+
+@router.get("/certificates/batches/{batch_id}", response_model=CertificateBatchResponse)
+async def get_certificate_batch_v5(
+    batch_id: str,
+    current_user: User = Depends(get_current_user)
+):
+    """
+    Phase 5: Progress of a certificate batch.
+    Admin/Faculty only.
+    """
+    _check_admin_permission_v5(current_user)
+    
+    batch = get_batch(batch_id)
+    if not batch:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Certificate batch not found"
+        )
+    
+    return CertificateBatchResponse(**batch.to_dict())
+
+
 @router.get("/certificates/{certificate_code}/verify", response_model=CertificateVerifyResponse)
 async def verify_certificate_v5(
     certificate_code: str,
@@ -1235,6 +1311,40 @@ async def verify_certificate_v5(
     )
 
 
+@router.get("/certificates/{certificate_code}/download")
+async def download_certificate_v5(
+    certificate_code: str,
+    request: Request,
+    current_user: User = Depends(get_current_user),
+    db: AsyncSession = Depends(get_db)
+):
+    """
+    Phase 5: Download certificate PDF.
+    Owner or admin only. Streams from disk with ETag/Range support.
+    """
+    result = await db.execute(
+        select(CompetitionCertificate).where(
+            CompetitionCertificate.certificate_code == certificate_code
+        )
+    )
+    certificate = result.scalar_one_or_none()
+    
+    if not certificate:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Certificate not found"
+        )
+    
+    _check_ownership_or_admin_v5(certificate.user_id, current_user)
+    
+    return await serve_file(
+        request,
+        certificate.pdf_file_path,
+        media_type="application/pdf",
+        filename=f"certificate_{certificate_code[:16]}.pdf"
+    )
+
+
 @router.get("/admin/competition/{competition_id}", response_model=AdminAnalyticsResponse)
 async def get_competition_analytics_v5(
     competition_id: int,
@@ -1271,4 +1381,35 @@ async def get_competition_analytics_v5(
         doctrine_mastery=analytics["doctrine_mastery"],
         completion_rate=analytics["completion_rate"],
         avg_scores_by_criteria=analytics["avg_scores_by_criteria"]
-    )
\ No newline at end of file
+    )
+
+@router.get("/admin/export/{dataset}")
+async def export_institution_analytics_v5(
+    dataset: str,
+    export_format: str = Query("csv", alias="format", pattern="^(csv|ndjson|parquet)$"),
+    institution_id: Optional[int] = Query(None, description="SUPER_ADMIN only; defaults to own institution"),
+    current_user: User = Depends(get_current_user)
+):
+    """
+    Stream an institution dataset export (CSV, NDJSON or Parquet).
+    ADMIN/FACULTY/SUPER_ADMIN only; others are limited to their own institution.
+    
+    Datasets: cohort_progress, practice_attempts, judge_scores, ai_usage
+    """
+    _check_admin_permission_v5(current_user)
+    
+    if institution_id is None or current_user.role != UserRole.SUPER_ADMIN:
+        if institution_id is not None and institution_id != current_user.institution_id:
+            raise HTTPException(
+                status_code=status.HTTP_403_FORBIDDEN,
+                detail="Can only export your own institution"
+            )
+        institution_id = current_user.institution_id
+    
+    if institution_id is None:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="No institution to export"
+        )
+    
+    return build_export_response(dataset, institution_id, export_format)
@@ -11,7 +11,7 @@ from datetime import datetime, timezone
 import logging
 
 from backend.database import get_db
-from backend.services.audio_transcription import transcription_service
+from backend.services.audio_transcription import transcription_service, TranscriptionQueueFull
 from backend.routes.auth import get_current_user
 from backend.orm.user import User
 from backend.orm.oral_round import OralRound
@@ -38,7 +38,7 @@ class ChunkUploadResponse(BaseModel):
 
 class ChunkStatusResponse(BaseModel):
     chunk_id: str
-    status: str  # "processing", "completed", "failed"
+    status: str  # "queued", "processing", "completed", "failed"
     speaker_role: str
     transcript_text: Optional[str] = None
     confidence: Optional[float] = None
@@ -60,6 +60,7 @@ class FinalizedTranscriptResponse(BaseModel):
     chunk_count: int
     completed_chunks: int
     failed_chunks: int
+    pending_chunks: int = 0
 
 
 class ErrorResponse(BaseModel):
@@ -78,7 +79,8 @@ class ErrorResponse(BaseModel):
         400: {"model": ErrorResponse, "description": "Invalid request"},
         403: {"model": ErrorResponse, "description": "Not authorized"},
         404: {"model": ErrorResponse, "description": "Round not found"},
-        413: {"model": ErrorResponse, "description": "Chunk too large"}
+        413: {"model": ErrorResponse, "description": "Chunk too large"},
+        503: {"model": ErrorResponse, "description": "Transcription queue full"}
     }
 )
 async def upload_audio_chunk(
@@ -134,22 +136,28 @@ async def upload_audio_chunk(
             detail=f"Audio chunk exceeds 5MB limit ({len(audio_data)} bytes)"
         )
     
-    # Process chunk
+    # Queue chunk (transcription runs in the background worker pool)
     try:
         result = await transcription_service.process_audio_chunk(
             round_id=round_id,
             audio_data=audio_data,
             speaker_role=speaker_role,
             chunk_index=chunk_index,
-            timestamp=datetime.now(timezone.utc)
+            timestamp=datetime.now(timezone.utc),
+            db=db
         )
         
         return ChunkUploadResponse(
             chunk_id=result["chunk_id"],
             status=result["status"],
-            message="Chunk queued for transcription"
+            message="Chunk queued for transcription" if result["status"] == "queued" else result.get("error", "")
         )
         
+    except TranscriptionQueueFull as e:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail=str(e)
+        )
     except Exception as e:
         logger.error(f"Error processing chunk: {e}")
         raise HTTPException(
@@ -176,12 +184,12 @@ async def get_chunk_status(
     Get transcription status for a specific audio chunk.
     
     Returns:
-    - status: "processing", "completed", or "failed"
+    - status: "queued", "processing", "completed", or "failed"
     - transcript_text: Transcribed text (if completed)
     - confidence: 0.0-1.0 confidence score
     - word_timestamps: Word-level timing data
     """
-    status_data = transcription_service.get_chunk_status(chunk_id)
+    status_data = await transcription_service.get_chunk_status(chunk_id, db)
     
     if not status_data:
         raise HTTPException(
@@ -226,8 +234,9 @@ async def finalize_transcript(
     
     **JUDGE ONLY** - Only judges can finalize transcripts.
     
-    Concatenates all processed chunks in chronological order,
-    applies speaker labels, and generates final transcript.
+    Returns the transcript assembled so far from processed chunks in
+    chronological order with speaker labels; chunks still being
+    transcribed are reported in pending_chunks.
     """
     logger.info(f"Finalizing transcript for round {round_id}, user {current_user.id}")
     
@@ -251,7 +260,7 @@ async def finalize_transcript(
     
     try:
         # Finalize transcript
-        transcript_data = await transcription_service.finalize_transcript(round_id)
+        transcript_data = await transcription_service.finalize_transcript(round_id, db)
         
         # Save to RoundTranscript model if it exists
         # Note: RoundTranscript is a placeholder in Phase 3
@@ -284,29 +293,14 @@ async def get_live_transcript(
     Returns all completed chunk transcripts for real-time display.
     Used by frontend to poll for new transcript segments.
     """
-    chunks = transcription_service.get_round_chunks(round_id)
-    
-    # Filter completed chunks and format
-    segments = []
-    for chunk in chunks:
-        if chunk.get("status") == "completed":
-            segments.append({
-                "chunk_id": chunk.get("chunk_id"),
-                "timestamp": chunk.get("created_at"),
-                "speaker_role": chunk.get("speaker_role"),
-                "text": chunk.get("transcript_text", ""),
-                "confidence": chunk.get("confidence", 0.0),
-                "chunk_index": chunk.get("chunk_index", 0)
-            })
-    
-    # Sort by chunk index
-    segments.sort(key=lambda x: x["chunk_index"])
+    live = await transcription_service.get_live_segments(round_id, db)
+    segments = live["segments"]
     
     return {
         "round_id": round_id,
         "segments": segments,
         "total_segments": len(segments),
-        "is_recording_active": len(chunks) > 0 and any(c.get("status") == "processing" for c in chunks)
+        "is_recording_active": live["pending_chunks"] > 0
     }
 
 
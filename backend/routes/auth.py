@@ -24,6 +24,7 @@ from backend.rbac import (
 from backend.database import get_db
 from backend.orm.user import User, UserRole
 from backend.errors import ErrorCode, raise_bad_request, raise_unauthorized
+from backend.services.principal_cache import get_user_by_sub
 
 logger = logging.getLogger(__name__)
 
@@ -162,8 +163,7 @@ async def get_current_user(
             headers={"WWW-Authenticate": "Bearer"},
         )
 
-    result = await db.execute(select(User).where(User.email == email))
-    user = result.scalar_one_or_none()
+    user = await get_user_by_sub(db, email)
 
     if not user:
         raise HTTPException(
@@ -160,7 +160,7 @@ async def get_cohort_config() -> Dict[str, Any]:
             "per_subject": [
                 "students_with_progress",
                 "avg_mastery",
-                "median_mastery (P50)",
+                "median_mastery (P50, approximated within 1 point)",
                 "distribution (weak/average/strong counts)"
             ],
             "global": [
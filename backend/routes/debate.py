@@ -10,14 +10,15 @@ ALL endpoints protected with RBAC:
 """
 import os
 import logging
-from typing import Dict, Any, List, Optional
-from fastapi import APIRouter, HTTPException, Depends
+from typing import Dict, Any, AsyncIterator, List, Optional
+from fastapi import APIRouter, HTTPException, Depends, Query
 from pydantic import BaseModel, Field
 import google.generativeai as genai
 
 # Phase 5A: RBAC imports
 from backend.rbac import get_current_user, require_role, require_permission
 from backend.orm.user import User, UserRole
+from backend.services.llm_streaming import sse_event, sse_response, stream_gemini
 
 router = APIRouter(prefix="/api/moot-court", tags=["Moot Court"])
 logger = logging.getLogger(__name__)
@@ -120,6 +121,27 @@ async def generate_gemini_response(prompt: str) -> str:
         raise RuntimeError(f"AI generation failed: {str(e)}")
 
 
+async def stream_gemini_response(prompt: str, **done_fields) -> AsyncIterator[bytes]:
+    """
+    Server-sent events for a Gemini response: delta events as text
+    arrives, the disclaimer if the model left it out, then a done event
+    carrying done_fields (or an error event).
+    """
+    text = ""
+    try:
+        async for chunk in stream_gemini(model, prompt):
+            text += chunk
+            yield sse_event("delta", {"text": chunk})
+    except Exception as e:
+        logger.error(f"Gemini streaming error: {str(e)}")
+        yield sse_event("error", {"detail": "AI generation failed"})
+        return
+
+    if AI_DISCLAIMER not in text:
+        yield sse_event("delta", {"text": f"\n\n{AI_DISCLAIMER}"})
+    yield sse_event("done", {"success": True, "disclaimer": AI_DISCLAIMER, **done_fields})
+
+
 async def score_user_argument(
     user_argument: str,
     case_facts: str,
@@ -394,7 +416,8 @@ REASONING: [Your detailed legal reasoning, 200-300 words]
 @router.post("/ai-coach")
 async def ai_coach(
     request: AICoachRequest,
-    current_user: User = Depends(get_current_user)
+    current_user: User = Depends(get_current_user),
+    stream: bool = Query(False, description="Stream the response as server-sent events")
 ) -> Dict[str, Any]:
     """
     AI Moot Coach — responds to student questions with guidance,
@@ -447,6 +470,9 @@ STRICT RULES — you MUST follow every one:
 
 Respond now:"""
 
+    if stream:
+        return sse_response(stream_gemini_response(prompt))
+
     try:
         response = await generate_gemini_response(prompt)
         if AI_DISCLAIMER not in response:
@@ -460,7 +486,8 @@ Respond now:"""
 @router.post("/ai-review")
 async def ai_review(
     request: AIReviewRequest,
-    current_user: User = Depends(get_current_user)
+    current_user: User = Depends(get_current_user),
+    stream: bool = Query(False, description="Stream the response as server-sent events")
 ) -> Dict[str, Any]:
     """
     Issue-Level AI Review — analyses one IRAC block and returns
@@ -525,6 +552,9 @@ STRICT RULES:
 End with exactly: "{AI_DISCLAIMER}"
 """
 
+    if stream:
+        return sse_response(stream_gemini_response(prompt))
+
     try:
         response = await generate_gemini_response(prompt)
         if AI_DISCLAIMER not in response:
@@ -538,7 +568,8 @@ End with exactly: "{AI_DISCLAIMER}"
 @router.post("/counter-argument")
 async def counter_argument(
     request: CounterArgumentRequest,
-    current_user: User = Depends(get_current_user)
+    current_user: User = Depends(get_current_user),
+    stream: bool = Query(False, description="Stream the response as server-sent events")
 ) -> Dict[str, Any]:
     """
     Counter-Argument Simulator — describes likely opposing arguments,
@@ -588,6 +619,9 @@ STRICT RULES:
 End with exactly: "{AI_DISCLAIMER}"
 """
 
+    if stream:
+        return sse_response(stream_gemini_response(prompt))
+
     try:
         response = await generate_gemini_response(prompt)
         if AI_DISCLAIMER not in response:
@@ -601,7 +635,8 @@ End with exactly: "{AI_DISCLAIMER}"
 @router.post("/judge-assist")
 async def judge_assist(
     request: JudgeAssistRequest,
-    current_user: User = Depends(get_current_user)
+    current_user: User = Depends(get_current_user),
+    stream: bool = Query(False, description="Stream the response as server-sent events")
 ) -> Dict[str, Any]:
     """
     Judge Assist Mode — helps evaluators summarize, compare, or
@@ -685,6 +720,9 @@ HARD RULES:
 End with exactly: "{AI_DISCLAIMER}"
 """
 
+    if stream:
+        return sse_response(stream_gemini_response(prompt, mode=request.mode))
+
     try:
         response = await generate_gemini_response(prompt)
         if AI_DISCLAIMER not in response:
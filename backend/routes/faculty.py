@@ -113,30 +113,37 @@ async def get_faculty_dashboard(
     )
     teams = teams_result.scalars().all()
     
-    # Get team summaries
-    team_summaries = []
-    for team in teams:
-        # Count projects per team
+    team_ids = [team.id for team in teams]
+    
+    # Project and member counts for all teams, one grouped query each
+    project_counts = {}
+    member_counts = {}
+    if team_ids:
         projects_result = await db.execute(
-            select(func.count(MootProject.id)).where(
+            select(MootProject.team_id, func.count(MootProject.id)).where(
                 and_(
-                    MootProject.team_id == team.id,
+                    MootProject.team_id.in_(team_ids),
                     MootProject.is_active == True
                 )
-            )
+            ).group_by(MootProject.team_id)
         )
-        project_count = projects_result.scalar() or 0
+        project_counts = dict(projects_result.all())
         
-        # Get team member count
         members_result = await db.execute(
-            select(func.count(TeamMember.id)).where(
+            select(TeamMember.team_id, func.count(TeamMember.id)).where(
                 and_(
-                    TeamMember.team_id == team.id,
+                    TeamMember.team_id.in_(team_ids),
                     TeamMember.status == "active"
                 )
-            )
+            ).group_by(TeamMember.team_id)
         )
-        member_count = members_result.scalar() or 0
+        member_counts = dict(members_result.all())
+    
+    # Get team summaries
+    team_summaries = []
+    for team in teams:
+        project_count = project_counts.get(team.id, 0)
+        member_count = member_counts.get(team.id, 0)
         
         team_summaries.append({
             "id": team.id,
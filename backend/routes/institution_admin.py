@@ -4,8 +4,9 @@ Phase 6: Institution admin API endpoints (8 endpoints)
 """
 import os
 import logging
+from datetime import datetime
 from typing import Optional
-from fastapi import APIRouter, Depends, HTTPException, status, UploadFile, File, Form
+from fastapi import APIRouter, Depends, HTTPException, status, UploadFile, File, Form, BackgroundTasks, Query
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select, func
 from pydantic import BaseModel, Field
@@ -19,6 +20,7 @@ from backend.orm.bulk_upload_session import BulkUploadSession, BulkUploadStatus
 from backend.routes.auth import get_current_user
 from backend.services.sso_service import SSOService
 from backend.services.bulk_upload_service import BulkUploadService
+from backend.services.analytics_export import build_export_response
 
 logger = logging.getLogger(__name__)
 router = APIRouter(prefix="/institutions", tags=["Institution Admin"])
@@ -85,6 +87,22 @@ def _check_institution_admin(user: User, institution_id: int):
     return True  # Simplified for now
 
 
+def _check_institution_export(user: User, institution_id: int):
+    """Same rule as /analytics/admin/export: staff of this institution, or super admin"""
+    if user.role == UserRole.SUPER_ADMIN:
+        return
+    if user.role not in [UserRole.ADMIN, UserRole.FACULTY]:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Admin/Faculty access required"
+        )
+    if user.institution_id != institution_id:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Can only export your own institution"
+        )
+
+
 # ================= ENDPOINTS =================
 
 @router.post("", status_code=status.HTTP_201_CREATED)
@@ -241,6 +259,7 @@ async def assign_institution_admin(
 @router.post("/{institution_id}/bulk-upload", status_code=status.HTTP_202_ACCEPTED)
 async def bulk_upload_students(
     institution_id: int,
+    background_tasks: BackgroundTasks,
     file: UploadFile = File(...),
     current_user: User = Depends(get_current_user),
     db: AsyncSession = Depends(get_db)
@@ -279,9 +298,8 @@ async def bulk_upload_students(
         db, institution_id, current_user.id, file_path, total_rows
     )
     
-    # In production, queue background task here
-    # For now, process synchronously
-    await service.process_csv_file(db, session.id)
+    # Import runs after the response; poll the status endpoint for progress
+    background_tasks.add_task(service.process_csv_file_in_background, session.id)
     
     return session.to_dict()
 
@@ -451,3 +469,21 @@ async def get_institution_stats(
         "usage_percentage": f"{usage_percentage:.1f}%",
         "max_students": institution.max_students
     }
+
+
+@router.get("/{institution_id}/export/{dataset}")
+async def export_institution_dataset(
+    institution_id: int,
+    dataset: str,
+    export_format: str = Query("csv", alias="format", pattern="^(csv|ndjson|parquet)$"),
+    current_user: User = Depends(get_current_user)
+):
+    """
+    GET /api/institutions/{institution_id}/export/{dataset}?format=csv|ndjson|parquet
+    Stream a dataset export. ADMIN/FACULTY of the institution, or SUPER_ADMIN.
+    
+    Datasets: cohort_progress, practice_attempts, judge_scores, ai_usage
+    """
+    _check_institution_export(current_user, institution_id)
+    
+    return build_export_response(dataset, institution_id, export_format)
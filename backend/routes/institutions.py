@@ -10,13 +10,14 @@ from datetime import datetime
 from fastapi import APIRouter, Depends, HTTPException, status, Query
 from pydantic import BaseModel, Field, ConfigDict
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, and_, or_, desc
+from sqlalchemy import select, and_, or_, desc, func
 
 from backend.database import get_db
 from backend.orm.institution import Institution
 from backend.orm.user import User, UserRole
 from backend.rbac import get_current_user, require_role, require_min_role
 from backend.errors import ErrorCode
+from backend.services.progress_calculator import get_institution_wide_metrics
 
 logger = logging.getLogger(__name__)
 router = APIRouter(prefix="/institutions", tags=["Institutions"])
@@ -475,40 +476,51 @@ async def get_institution_stats(
             }
         )
     
-    # Get counts
+    # Get counts (grouped, no row loads)
     from backend.orm.competition import Competition
     from backend.orm.team import Team
     
     comp_result = await db.execute(
-        select(Competition).where(Competition.institution_id == institution_id)
+        select(Competition.status, func.count(Competition.id))
+        .where(Competition.institution_id == institution_id)
+        .group_by(Competition.status)
     )
-    competitions = comp_result.scalars().all()
+    competitions_by_status = {
+        getattr(comp_status, "value", comp_status): count
+        for comp_status, count in comp_result.all()
+    }
     
     team_result = await db.execute(
-        select(Team).where(Team.institution_id == institution_id)
+        select(func.count(Team.id)).where(Team.institution_id == institution_id)
     )
-    teams = team_result.scalars().all()
+    total_teams = team_result.scalar() or 0
     
     user_result = await db.execute(
-        select(User).where(User.institution_id == institution_id)
+        select(User.role, func.count(User.id))
+        .where(User.institution_id == institution_id)
+        .group_by(User.role)
     )
-    users = user_result.scalars().all()
+    users_by_role = dict(user_result.all())
+    
+    # Moot project progress (set-based, briefly cached)
+    project_metrics = await get_institution_wide_metrics(db, institution_id)
     
     return {
         "success": True,
         "institution_id": institution_id,
         "name": institution.name,
         "stats": {
-            "total_users": len(users),
-            "total_competitions": len(competitions),
-            "total_teams": len(teams),
-            "active_competitions": sum(1 for c in competitions if c.status == "active"),
-            "draft_competitions": sum(1 for c in competitions if c.status == "draft"),
+            "total_users": sum(users_by_role.values()),
+            "total_competitions": sum(competitions_by_status.values()),
+            "total_teams": total_teams,
+            "active_competitions": competitions_by_status.get("active", 0),
+            "draft_competitions": competitions_by_status.get("draft", 0),
             "users_by_role": {
-                "student": sum(1 for u in users if u.role == UserRole.STUDENT),
-                "judge": sum(1 for u in users if u.role == UserRole.JUDGE),
-                "faculty": sum(1 for u in users if u.role == UserRole.FACULTY),
-                "admin": sum(1 for u in users if u.role == UserRole.ADMIN),
-            }
+                "student": users_by_role.get(UserRole.STUDENT, 0),
+                "judge": users_by_role.get(UserRole.JUDGE, 0),
+                "faculty": users_by_role.get(UserRole.FACULTY, 0),
+                "admin": users_by_role.get(UserRole.ADMIN, 0),
+            },
+            "project_metrics": project_metrics
         }
     }
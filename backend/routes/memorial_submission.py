@@ -3,18 +3,27 @@ Phase 4: Memorial Submission API Routes
 
 4 endpoints for PDF memorial upload, status tracking, and analysis results.
 """
-from fastapi import APIRouter, HTTPException, Depends, UploadFile, File, Form, status
-from fastapi.responses import FileResponse
+from fastapi import APIRouter, BackgroundTasks, HTTPException, Depends, UploadFile, File, Form, Request, status
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 from typing import List, Optional
 from datetime import datetime
-import os
+from pathlib import Path
 import shutil
 import uuid
+import logging
 
+from backend.orm.memorial import MemorialSubmission, MemorialStatus
+from backend.orm.team import Team
 from backend.services.memorial_analysis_service import MemorialAnalysisService
+from backend.services.file_storage import store_upload, delete_blob, is_blob_path
+from backend.services.file_serving import serve_file
+from backend.services.pdf_extraction_service import count_pages
+from backend.exceptions import FileTooLargeError
 from backend.database import get_db
 
+logger = logging.getLogger(__name__)
 
 router = APIRouter(
     prefix="/api/competitions",
@@ -22,19 +31,11 @@ router = APIRouter(
 )
 
 # Upload configuration
-UPLOAD_DIR = "uploads/memorials"
 MAX_FILE_SIZE = 50 * 1024 * 1024  # 50MB
 MAX_PAGES = 50
 ALLOWED_EXTENSIONS = {".pdf"}
 
 
-def ensure_upload_dir(competition_id: int):
-    """Ensure upload directory exists for competition."""
-    path = os.path.join(UPLOAD_DIR, str(competition_id))
-    os.makedirs(path, exist_ok=True)
-    return path
-
-
 def get_current_user():
     """
     Get current authenticated user from token.
@@ -93,13 +94,22 @@ def validate_pdf_file(file: UploadFile) -> tuple[bool, str]:
     return True, ""
 
 
+async def _prefetch_memorial_text(file_path: str, sha256: str):
+    """Extract memorial text in the background (result is cached by sha256)."""
+    try:
+        await MemorialAnalysisService.extract_text_and_pages_async(file_path, sha256=sha256)
+    except RuntimeError as e:
+        logger.warning(f"Memorial text prefetch failed for {sha256[:12]}: {e}")
+
+
 @router.post("/{competition_id}/memorials")
 async def upload_memorial(
     competition_id: int,
+    background_tasks: BackgroundTasks,
     file: UploadFile = File(...),
     team_id: int = Form(...),
     submission_notes: Optional[str] = Form(None),
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
     current_user: dict = Depends(get_current_user)
 ):
     """
@@ -127,36 +137,34 @@ async def upload_memorial(
             detail=error_msg
         )
     
-    # Read file content for validation
-    content = await file.read()
-    
-    # Check file size
-    if len(content) > MAX_FILE_SIZE:
+    # Stream file to content-addressed storage, hashing while writing
+    try:
+        blob = await store_upload(file, max_size=MAX_FILE_SIZE)
+    except FileTooLargeError:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail=f"File too large. Maximum size is {MAX_FILE_SIZE / (1024*1024):.0f}MB"
         )
     
-    # Save file
-    upload_path = ensure_upload_dir(competition_id)
+    file_path = str(blob.path)
     timestamp = datetime.utcnow().strftime("%Y%m%d%H%M%S")
     filename = f"{team_id}_{timestamp}.pdf"
-    file_path = os.path.join(upload_path, filename)
-    
-    with open(file_path, "wb") as f:
-        f.write(content)
     
-    # Extract text and count pages
+    # Count pages in a worker process (no text extraction on the request path)
     try:
-        text, page_count = MemorialAnalysisService.extract_text_and_pages(file_path)
+        page_count = await count_pages(file_path, sha256=blob.sha256)
         if page_count > MAX_PAGES:
-            os.remove(file_path)
+            if not blob.deduplicated:
+                delete_blob(blob.path)
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
                 detail=f"PDF has {page_count} pages. Maximum is {MAX_PAGES} pages."
             )
+    except HTTPException:
+        raise
     except Exception as e:
-        os.remove(file_path)
+        if not blob.deduplicated:
+            delete_blob(blob.path)
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail=f"Could not process PDF: {str(e)}"
@@ -166,36 +174,30 @@ async def upload_memorial(
     if submission_notes and len(submission_notes) > 500:
         submission_notes = submission_notes[:500]
     
-    # Create memorial record (simplified - would use ORM model in production)
+    # Create memorial record (the stored path names the blob digest)
     upload_id = f"mem_{uuid.uuid4().hex[:12]}"
     
-    memorial_data = {
-        "id": 1,  # Would be auto-generated
-        "competition_id": competition_id,
-        "team_id": team_id,
-        "file_path": file_path,
-        "filename": filename,
-        "file_size": len(content),
-        "page_count": page_count,
-        "submission_notes": submission_notes,
-        "status": "uploaded",
-        "upload_id": upload_id,
-        "uploaded_by": current_user["id"],
-        "uploaded_at": datetime.utcnow().isoformat()
-    }
+    memorial = MemorialSubmission(
+        team_id=team_id,
+        file_path=file_path,
+        original_filename=filename,
+        status=MemorialStatus.PENDING
+    )
+    db.add(memorial)
+    await db.commit()
     
-    # TODO: Save to database
-    # TODO: Queue AI analysis task (background)
+    # Warm the extracted-text cache so analysis never re-parses this PDF
+    background_tasks.add_task(_prefetch_memorial_text, file_path, blob.sha256)
     
     return {
-        "id": memorial_data["id"],
+        "id": memorial.id,
         "competition_id": competition_id,
         "team_id": team_id,
         "file_path": file_path,
         "status": "uploaded",
         "upload_id": upload_id,
         "page_count": page_count,
-        "file_size_mb": round(len(content) / (1024*1024), 2),
+        "file_size_mb": round(blob.size / (1024*1024), 2),
         "message": "Memorial uploaded successfully. AI analysis in progress...",
         "estimated_analysis_time": "30-60 seconds"
     }
@@ -418,34 +420,49 @@ async def list_team_memorials(
 async def download_memorial(
     competition_id: int,
     memorial_id: int,
-    db: Session = Depends(get_db),
+    request: Request,
+    db: AsyncSession = Depends(get_db),
     current_user: dict = Depends(get_current_user)
 ):
     """
     Download a memorial PDF file.
     
+    Supports Range requests and If-None-Match revalidation, so judges
+    re-opening the same memorial get a 304 instead of the full file.
+    
     Args:
         competition_id: Competition ID
         memorial_id: Memorial ID
+        request: Incoming request (conditional/range headers)
         db: Database session
-        current_user: Authenticated user
+        current_user: Authenticated judge or team member
     
     Returns:
         PDF file download
     """
-    # TODO: Fetch file path from database and verify permissions
-    # For now, return mock response
-    
-    file_path = f"uploads/memorials/{competition_id}/1_20260211143000.pdf"
-    
-    if not os.path.exists(file_path):
+    result = await db.execute(
+        select(MemorialSubmission)
+        .join(Team, Team.id == MemorialSubmission.team_id)
+        .where(MemorialSubmission.id == memorial_id, Team.competition_id == competition_id)
+    )
+    memorial = result.scalar_one_or_none()
+    if memorial is None:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
-            detail="File not found"
+            detail="Memorial not found"
         )
     
-    return FileResponse(
-        path=file_path,
-        filename=f"memorial_{memorial_id}.pdf",
-        media_type="application/pdf"
+    # Permission check
+    require_judge_or_team_member(current_user, memorial.team_id)
+    
+    # Uploads are stored under their SHA-256, which doubles as the ETag
+    path = Path(memorial.file_path)
+    sha256 = path.name if is_blob_path(path) else None
+    
+    return await serve_file(
+        request,
+        memorial.file_path,
+        media_type="application/pdf",
+        filename=memorial.original_filename,
+        sha256=sha256
     )
@@ -2,22 +2,25 @@
 backend/routes/rankings.py
 Phase 5E: Ranking and leaderboard API routes
 """
+import asyncio
 import logging
 from typing import List, Optional
 from datetime import datetime
 
-from fastapi import APIRouter, Depends, HTTPException, status, Query
+from fastapi import APIRouter, Depends, HTTPException, status, Query, WebSocket, WebSocketDisconnect
 from pydantic import BaseModel, Field
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select, and_, desc
 
 from backend.database import get_db
 from backend.services.ranking_service import RankingService
+from backend.services import live_leaderboard
 from backend.orm.ranking import TeamRanking, RankingType, RankStatus, Leaderboard, WinnerSelection, TieBreakRule
 from backend.orm.competition import Competition, CompetitionRound
 from backend.orm.team import Team
 from backend.orm.user import User, UserRole
-from backend.rbac import get_current_user
+from backend.rbac import get_current_user, decode_token
+from backend.services.principal_cache import get_user_by_sub
 from backend.errors import ErrorCode
 
 logger = logging.getLogger(__name__)
@@ -328,6 +331,69 @@ async def view_leaderboard(
     }
 
 
+@router.websocket("/live/{competition_id}")
+async def live_leaderboard_feed(
+    websocket: WebSocket,
+    competition_id: int,
+    token: str = Query(..., description="JWT access token")
+):
+    """
+    Phase 5E: Live standings of a competition.
+    
+    Sends the full standings on connect, then only the entries that change
+    as scores are published or unpublished (LeaderboardUpdateEvent).
+    """
+    from backend.database import AsyncSessionLocal
+    
+    async with AsyncSessionLocal() as db:
+        payload = decode_token(token)
+        user = None
+        if payload and payload.get("type") == "access" and payload.get("sub"):
+            user = await get_user_by_sub(db, payload["sub"])
+        if not user or not user.is_active:
+            await websocket.close(code=4001, reason="Invalid or expired token")
+            return
+        
+        comp_result = await db.execute(
+            select(Competition.institution_id).where(Competition.id == competition_id)
+        )
+        institution_id = comp_result.scalar_one_or_none()
+        if institution_id is None:
+            await websocket.close(code=4004, reason="Competition not found")
+            return
+        
+        if user.role != UserRole.SUPER_ADMIN and user.institution_id != institution_id:
+            await websocket.close(code=4003, reason="Access denied")
+            return
+        
+        board = await live_leaderboard.get_competition_board(db, competition_id)
+    
+    board_id = live_leaderboard.competition_board_id(competition_id)
+    await websocket.accept()
+    queue = live_leaderboard.subscribe(board_id)
+    sender = asyncio.create_task(
+        _send_live_updates(websocket, queue, live_leaderboard.snapshot_message(board_id, board))
+    )
+    try:
+        # The feed is one-way; receiving is what notices a client that left
+        # while no updates were being sent
+        while (await websocket.receive())["type"] != "websocket.disconnect":
+            pass
+    finally:
+        sender.cancel()
+        live_leaderboard.unsubscribe(board_id, queue)
+
+
+async def _send_live_updates(websocket: WebSocket, queue: asyncio.Queue, snapshot: dict) -> None:
+    try:
+        await websocket.send_json(snapshot)
+        while True:
+            await websocket.send_json(await queue.get())
+    except (WebSocketDisconnect, RuntimeError):
+        # Closed under us; the receive loop ends the feed
+        pass
+
+
 @router.post("/leaderboard/{leaderboard_id}/publish", status_code=200)
 async def publish_leaderboard(
     leaderboard_id: int,
@@ -410,6 +476,8 @@ async def create_tie_break_rule(
     await db.commit()
     await db.refresh(rule)
     
+    live_leaderboard.invalidate_competition(competition_id)
+    
     return {
         "success": True,
         "rule": rule.to_dict()
@@ -21,6 +21,7 @@ from backend.orm.submission_slot import SubmissionSlot
 from backend.orm.user import User, UserRole
 from backend.rbac import get_current_user
 from backend.errors import ErrorCode
+from backend.services import live_leaderboard
 
 logger = logging.getLogger(__name__)
 router = APIRouter(prefix="/scoring", tags=["Scoring"])
@@ -578,6 +579,9 @@ async def publish_score(
     # Log
     await log_score_action(score.id, "publish", current_user.id, db=db)
     
+    # Move the team on the live leaderboard
+    await live_leaderboard.on_judge_score_published(db, score)
+    
     logger.info(f"Score published: {score_id} by {current_user.id}")
     
     return {
@@ -629,6 +633,8 @@ async def unpublish_score(
     # Log
     await log_score_action(score.id, "unpublish", current_user.id, notes=reason, db=db)
     
+    live_leaderboard.on_judge_score_unpublished(score)
+    
     logger.info(f"Score unpublished: {score_id} by {current_user.id}, reason: {reason}")
     
     return {
@@ -721,6 +727,7 @@ async def resolve_conflict(
     conflict.override_score_id = data.override_score_id
     
     # Update involved scores
+    newly_published = []
     for score_id in conflict.judge_score_ids:
         score_result = await db.execute(
             select(JudgeScore).where(JudgeScore.id == score_id)
@@ -732,12 +739,16 @@ async def resolve_conflict(
             elif data.status == "overridden":
                 score.conflict_status = ScoreConflictStatus.OVERRIDDEN
                 # Mark the selected score as authoritative
-                if data.override_score_id == score_id:
+                if data.override_score_id == score_id and not score.is_published:
                     score.is_published = True  # Auto-publish override
+                    newly_published.append(score)
     
     await db.commit()
     await db.refresh(conflict)
     
+    for score in newly_published:
+        await live_leaderboard.on_judge_score_published(db, score)
+    
     logger.info(f"Conflict resolved: {conflict_id} by admin {current_user.id}")
     
     return {
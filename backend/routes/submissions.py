@@ -3,13 +3,12 @@ backend/routes/submissions.py
 Phase 5C: Formal submissions with file upload and deadline management
 """
 import os
-import hashlib
 import logging
 from typing import List, Optional
 from datetime import datetime, timedelta
 from pathlib import Path
 
-from fastapi import APIRouter, Depends, HTTPException, status, UploadFile, File, Form, Query
+from fastapi import APIRouter, Depends, HTTPException, status, UploadFile, File, Form, Query, Request
 from pydantic import BaseModel, Field, ConfigDict
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select, and_, or_, desc
@@ -17,10 +16,13 @@ from sqlalchemy import select, and_, or_, desc
 from backend.database import get_db
 from backend.orm.submission import Submission, SubmissionType, SubmissionStatus, SubmissionDeadline, SubmissionLog
 from backend.orm.competition import Competition
-from backend.orm.team import Team
+from backend.orm.team import Team, TeamMember
 from backend.orm.user import User, UserRole
 from backend.rbac import get_current_user, require_role
 from backend.errors import ErrorCode
+from backend.exceptions import FileTooLargeError
+from backend.services.file_storage import store_upload, is_blob_path, delete_blob
+from backend.services.file_serving import serve_file
 
 logger = logging.getLogger(__name__)
 router = APIRouter(prefix="/submissions", tags=["Submissions"])
@@ -83,13 +85,29 @@ def is_allowed_file(filename: str) -> bool:
     """Check if file extension is allowed"""
     return get_file_extension(filename) in ALLOWED_EXTENSIONS
 
-def calculate_file_hash(file_path: Path) -> str:
-    """Calculate SHA-256 hash of file for integrity"""
-    sha256_hash = hashlib.sha256()
-    with open(file_path, "rb") as f:
-        for byte_block in iter(lambda: f.read(4096), b""):
-            sha256_hash.update(byte_block)
-    return sha256_hash.hexdigest()
+async def _blob_has_other_references(db: AsyncSession, submission_id: int, file_path: str) -> bool:
+    """Check if another submission still points at a stored blob"""
+    result = await db.execute(
+        select(Submission.id).where(
+            and_(
+                Submission.file_path == file_path,
+                Submission.id != submission_id
+            )
+        ).limit(1)
+    )
+    return result.first() is not None
+
+async def _is_team_member(db: AsyncSession, team_id: int, user_id: int) -> bool:
+    """Check if a user is on a team (queried; Team.members is not eager-loaded)"""
+    result = await db.execute(
+        select(TeamMember.id).where(
+            and_(
+                TeamMember.team_id == team_id,
+                TeamMember.user_id == user_id
+            )
+        ).limit(1)
+    )
+    return result.first() is not None
 
 def format_file_size(size_bytes: int) -> str:
     """Format file size for display"""
@@ -355,7 +373,7 @@ async def upload_submission(
         raise HTTPException(status_code=404, detail="Team not found")
     
     # Check if user is team member
-    if current_user.role == UserRole.STUDENT and current_user.id not in [m.id for m in team.members]:
+    if current_user.role == UserRole.STUDENT and not await _is_team_member(db, team.id, current_user.id):
         raise HTTPException(status_code=403, detail="You are not a member of this team")
     
     # Check deadline status
@@ -380,23 +398,14 @@ async def upload_submission(
     )
     existing = existing_result.scalar_one_or_none()
     
-    # Read file content
-    content = await file.read()
-    
-    if len(content) > MAX_FILE_SIZE:
+    # Stream file to content-addressed storage, hashing while writing
+    try:
+        blob = await store_upload(file, max_size=MAX_FILE_SIZE)
+    except FileTooLargeError:
         raise HTTPException(status_code=400, detail=f"File too large. Max size: {format_file_size(MAX_FILE_SIZE)}")
     
-    # Generate unique filename
-    timestamp = datetime.utcnow().strftime("%Y%m%d_%H%M%S")
-    safe_filename = f"{competition_id}_{team_id}_{submission_type}_{timestamp}_{file.filename}"
-    file_path = UPLOAD_DIR / safe_filename
-    
-    # Save file
-    with open(file_path, "wb") as f:
-        f.write(content)
-    
-    # Calculate hash
-    file_hash = calculate_file_hash(file_path)
+    file_path = blob.path
+    file_hash = blob.sha256
     
     # Create or update submission
     if existing:
@@ -405,15 +414,18 @@ async def upload_submission(
         
         existing.file_name = file.filename
         existing.file_path = str(file_path)
-        existing.file_size = len(content)
+        existing.file_size = blob.size
         existing.file_hash = file_hash
         existing.mime_type = file.content_type
         existing.last_edited_at = datetime.utcnow()
         existing.student_notes = student_notes or existing.student_notes
         
-        # Delete old file
+        # Delete old file (blobs may be shared with other submissions)
         if old_file_path.exists() and old_file_path != file_path:
-            old_file_path.unlink()
+            if not is_blob_path(old_file_path):
+                old_file_path.unlink()
+            elif not await _blob_has_other_references(db, existing.id, str(old_file_path)):
+                delete_blob(old_file_path)
         
         action = "replace"
     else:
@@ -426,7 +438,7 @@ async def upload_submission(
             status=SubmissionStatus.DRAFT,
             file_name=file.filename,
             file_path=str(file_path),
-            file_size=len(content),
+            file_size=blob.size,
             file_hash=file_hash,
             mime_type=file.content_type,
             draft_started_at=datetime.utcnow(),
@@ -444,7 +456,7 @@ async def upload_submission(
         submission_id=existing.id,
         action=action,
         performed_by=current_user.id,
-        details=f"File: {file.filename}, Size: {len(content)} bytes"
+        details=f"File: {file.filename}, Size: {blob.size} bytes"
     )
     db.add(log)
     await db.commit()
@@ -481,11 +493,7 @@ async def finalize_submission(
     
     # Verify access
     if current_user.role == UserRole.STUDENT:
-        team_result = await db.execute(
-            select(Team).where(Team.id == submission.team_id)
-        )
-        team = team_result.scalar_one_or_none()
-        if not team or current_user.id not in [m.id for m in team.members]:
+        if not await _is_team_member(db, submission.team_id, current_user.id):
             raise HTTPException(status_code=403, detail="Access denied")
     
     # Check deadline
@@ -536,6 +544,43 @@ async def finalize_submission(
     }
 
 
+# ================= FILE DOWNLOAD =================
+
+@router.get("/{submission_id}/download")
+async def download_submission(
+    submission_id: int,
+    request: Request,
+    current_user: User = Depends(get_current_user),
+    db: AsyncSession = Depends(get_db)
+):
+    """
+    Download a submission file.
+    Supports Range requests and If-None-Match revalidation (ETag = file SHA-256).
+    """
+    result = await db.execute(
+        select(Submission).where(Submission.id == submission_id)
+    )
+    submission = result.scalar_one_or_none()
+    
+    if not submission:
+        raise HTTPException(status_code=404, detail="Submission not found")
+    
+    # Verify access
+    if current_user.role == UserRole.STUDENT:
+        if not await _is_team_member(db, submission.team_id, current_user.id):
+            raise HTTPException(status_code=403, detail="Access denied")
+    elif current_user.role != UserRole.SUPER_ADMIN and current_user.institution_id != submission.institution_id:
+        raise HTTPException(status_code=403, detail="Access denied")
+    
+    return await serve_file(
+        request,
+        submission.file_path,
+        media_type=submission.mime_type,
+        filename=submission.file_name,
+        sha256=submission.file_hash
+    )
+
+
 # ================= ADMIN UNLOCK =================
 
 @router.post("/{submission_id}/unlock", status_code=200)
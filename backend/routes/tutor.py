@@ -16,11 +16,13 @@ from backend.orm.user import User
 from backend.routes.auth import get_current_user
 from backend.ai.service import (
     explain_content,
+    explain_content_stream,
     ask_about_content,
     get_available_explanation_types
 )
 from backend.ai.prompts import ExplanationType
 from backend.exceptions import ForbiddenError, ScopeViolationError, NotFoundError
+from backend.services.llm_streaming import sse_response
 
 logger = logging.getLogger(__name__)
 
@@ -145,6 +147,61 @@ async def tutor_explain(
         )
 
 
+@router.post("/explain/stream")
+async def tutor_explain_stream(
+    payload: TutorExplainRequest,
+    current_user: User = Depends(get_current_user),
+    db: AsyncSession = Depends(get_db)
+):
+    """
+    Streaming variant of /explain (text/event-stream).
+    
+    Validation errors are returned as HTTP errors before the stream
+    starts. Then: `delta` events ({"text"}) as the explanation is
+    generated, and `done` with the /explain fields minus the text
+    (or `error`).
+    """
+    logger.info(f"[Tutor] Explain stream from {current_user.email}: content={payload.content_id}, type={payload.type}")
+    
+    valid_types = [e.value for e in ExplanationType]
+    if payload.type not in valid_types:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Invalid explanation type. Valid types: {valid_types}"
+        )
+    
+    try:
+        events = await explain_content_stream(
+            db=db,
+            user_id=current_user.id,
+            subject_id=payload.subject_id,
+            module_id=payload.module_id,
+            content_id=payload.content_id,
+            explanation_type=payload.type,
+            question=payload.question
+        )
+    except ForbiddenError as e:
+        logger.warning(f"[Tutor] Forbidden: {e.message}")
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail=e.message
+        )
+    except ScopeViolationError as e:
+        logger.info(f"[Tutor] Scope violation: {e.message}")
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=e.message
+        )
+    except NotFoundError as e:
+        logger.warning(f"[Tutor] Not found: {e.message}")
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=e.message
+        )
+    
+    return sse_response(events)
+
+
 @router.post("/ask", response_model=TutorExplainResponse)
 async def tutor_ask(
     payload: TutorAskRequest,
@@ -16,12 +16,14 @@ from backend.orm.user import User
 from backend.routes.auth import get_current_user
 from backend.services.context_aware_tutor import (
     generate_tutor_response,
+    stream_tutor_response,
     assemble_student_context,
     detect_query_intent,
     extract_topic_from_query,
     QueryIntent,
     MasteryLevel
 )
+from backend.services.llm_streaming import sse_event, sse_response
 from backend.services.tutor_session_service import (
     get_history,
     append_message,
@@ -158,6 +160,74 @@ async def ask_tutor(
         )
 
 
+@router.post("/ask/stream")
+async def ask_tutor_stream(
+    request: TutorChatRequest,
+    current_user: User = Depends(get_current_user),
+    db: AsyncSession = Depends(get_db)
+):
+    """
+    Streaming variant of /ask (text/event-stream).
+    
+    Events: `session` ({"session_id"}), then `delta` ({"text"}) as the
+    answer is generated, then `done` with the same fields as /ask minus
+    the response text (or `error`). Both messages are saved to the
+    session when the stream completes.
+    """
+    logger.info(f"Tutor chat stream: user={current_user.email}, query='{request.query[:50]}...'")
+    
+    user_id = current_user.id
+    session_id = request.session_id
+    session_history = None
+    
+    session = await get_session(session_id, user_id, db) if session_id else None
+    if session:
+        history = await get_history(session_id, user_id, db, limit=6)
+        if history and "messages" in history:
+            session_history = history["messages"]
+    else:
+        result = await start_session(
+            user_id=user_id,
+            db=db,
+            session_name="Tutor Chat"
+        )
+        session_id = result["session_id"]
+    
+    async def persist(response: Dict[str, Any]) -> None:
+        await append_message(
+            session_id=session_id,
+            user_id=user_id,
+            role="student",
+            text=request.query,
+            db=db,
+            metadata={"intent": response.get("intent")}
+        )
+        await append_message(
+            session_id=session_id,
+            user_id=user_id,
+            role="assistant",
+            text=response["response"],
+            db=db,
+            metadata={
+                "topic": response.get("topic"),
+                "mastery_level": response.get("mastery_level")
+            }
+        )
+    
+    async def events():
+        yield sse_event("session", {"session_id": session_id})
+        async for event in stream_tutor_response(
+            user_id=user_id,
+            query=request.query,
+            db=db,
+            session_history=session_history,
+            on_complete=persist
+        ):
+            yield event
+    
+    return sse_response(events())
+
+
 @router.get("/context", response_model=StudentContextResponse)
 async def get_student_context(
     current_user: User = Depends(get_current_user),
@@ -10,13 +10,17 @@ Generates unique counter-arguments based on:
 import json
 import logging
 import os
-from typing import List, Dict, Optional
+from typing import List, Optional
 from datetime import datetime, timezone
 
 from backend.services.llm_client import LLMClient
+from backend.services.ttl_store import create_ttl_store
 
 logger = logging.getLogger(__name__)
 
+AI_OPPONENT_CONTEXT_TTL_SECONDS = float(os.getenv("AI_OPPONENT_CONTEXT_TTL_SECONDS", "3600"))
+AI_OPPONENT_CONTEXT_MAX_SIZE = int(os.getenv("AI_OPPONENT_CONTEXT_MAX_SIZE", "1000"))
+
 
 class AIOpponentService:
     """
@@ -29,8 +33,10 @@ class AIOpponentService:
         self.llm_client = LLMClient()
         self.use_llm = self.llm_client.is_configured()
         
-        # Context cache to avoid repeated DB queries
-        self._context_cache: Dict[int, dict] = {}
+        # Context cache to avoid repeated DB queries (bounded, expiring)
+        self._context_cache = create_ttl_store(
+            "ai_opponent_context", AI_OPPONENT_CONTEXT_TTL_SECONDS, AI_OPPONENT_CONTEXT_MAX_SIZE
+        )
         
         if self.use_llm:
             logger.info("AI Opponent: Using real LLM for dynamic rebuttals")
@@ -285,7 +291,7 @@ I pray this Hon'ble Court may be pleased to allow the petition and declare the i
     
     def cache_context(self, round_id: int, context: dict):
         """Cache moot problem context for a round to avoid repeated DB queries."""
-        self._context_cache[round_id] = context
+        self._context_cache.set(round_id, context)
         logger.info(f"Cached moot context for round {round_id}")
     
     def get_cached_context(self, round_id: int) -> Optional[dict]:
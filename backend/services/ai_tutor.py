@@ -27,6 +27,7 @@ from backend.orm.user import User, UserRole
 from backend.orm.learn_content import LearnContent
 from backend.orm.case_content import CaseContent
 from backend.services.guardrails import validate_and_format_response, GuardrailViolation
+from backend.services.ttl_store import create_ttl_store
 
 logger = logging.getLogger(__name__)
 
@@ -37,42 +38,33 @@ model = genai.GenerativeModel('gemini-pro')
 
 class ConversationSession:
     """
-    In-memory conversation storage.
+    Conversation storage with a sliding timeout.
     
-    In production, use Redis with TTL for session management.
+    Sessions live in a bounded TTL store (shared across workers when
+    TTL_STORE_PATH is set); every stored turn restarts the timeout.
     """
-    _sessions: Dict[str, Dict] = {}
     SESSION_TIMEOUT = timedelta(hours=2)
+    MAX_SESSIONS = int(os.getenv("TUTOR_CONVERSATION_MAX_SESSIONS", "10000"))
+    _sessions = create_ttl_store("tutor_conversations", SESSION_TIMEOUT.total_seconds(), MAX_SESSIONS)
     
     @classmethod
     def create_session(cls, user_id: int) -> str:
         """Create new conversation session"""
         session_id = f"user_{user_id}_session_{datetime.utcnow().timestamp()}"
-        cls._sessions[session_id] = {
+        cls._sessions.set(session_id, {
             "user_id": user_id,
             "turns": [],
             "current_topic": None,
             "created_at": datetime.utcnow(),
             "last_updated": datetime.utcnow()
-        }
+        })
         logger.info(f"Created session: {session_id}")
         return session_id
     
     @classmethod
     def get_session(cls, session_id: str) -> Optional[Dict]:
-        """Get existing session"""
-        session = cls._sessions.get(session_id)
-        
-        if not session:
-            return None
-        
-        # Check if session expired
-        if datetime.utcnow() - session["last_updated"] > cls.SESSION_TIMEOUT:
-            cls.delete_session(session_id)
-            logger.info(f"Session expired: {session_id}")
-            return None
-        
-        return session
+        """Get existing session (None once expired)"""
+        return cls._sessions.get(session_id)
     
     @classmethod
     def add_turn(cls, session_id: str, role: str, content: str):
@@ -89,6 +81,7 @@ class ConversationSession:
             # Keep only last 6 turns (3 exchanges)
             if len(session["turns"]) > 6:
                 session["turns"] = session["turns"][-6:]
+            cls._sessions.set(session_id, session)
     
     @classmethod
     def update_topic(cls, session_id: str, topic: str):
@@ -96,12 +89,12 @@ class ConversationSession:
         session = cls.get_session(session_id)
         if session:
             session["current_topic"] = topic
+            cls._sessions.set(session_id, session)
     
     @classmethod
     def delete_session(cls, session_id: str):
         """Delete session"""
-        if session_id in cls._sessions:
-            del cls._sessions[session_id]
+        cls._sessions.pop(session_id)
 
 
 class AITutor:
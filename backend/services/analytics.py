@@ -27,6 +27,7 @@ from backend.orm.user_content_progress import UserContentProgress, ContentType
 from backend.orm.practice_attempt import PracticeAttempt
 from backend.orm.content_module import ContentModule, ModuleType
 from backend.orm.curriculum import CourseCurriculum
+from backend.services.daily_activity_service import get_activity_rows
 
 logger = logging.getLogger(__name__)
 
@@ -363,56 +364,37 @@ class LearningAnalytics:
         """
         logger.info(f"Calculating performance trends for user: {user.email}")
         
-        # Calculate week boundaries
+        # One read of the daily activity rollup covering every week
         today = datetime.utcnow()
-        weeks_data = []
+        rows = await get_activity_rows(
+            db, user.id, since=today.date() - timedelta(days=weeks * 7 - 1)
+        )
+        
+        # Week i covers the 7 days ending i weeks ago (today included in week 0)
+        totals = [
+            {"attempts": 0, "graded": 0, "correct": 0, "seconds": 0}
+            for _ in range(weeks)
+        ]
+        for row in rows:
+            week = (today.date() - row.activity_date).days // 7
+            if 0 <= week < weeks:
+                totals[week]["attempts"] += row.attempts
+                totals[week]["graded"] += row.graded_attempts
+                totals[week]["correct"] += row.correct_attempts
+                totals[week]["seconds"] += row.content_time_seconds
         
-        for i in range(weeks):
+        weeks_data = []
+        for i, week_totals in enumerate(totals):
             week_start = today - timedelta(weeks=i+1)
-            week_end = today - timedelta(weeks=i)
-            
-            # Count attempts in this week
-            attempts_stmt = select(func.count(PracticeAttempt.id)).where(
-                PracticeAttempt.user_id == user.id,
-                PracticeAttempt.attempted_at >= week_start,
-                PracticeAttempt.attempted_at < week_end
-            )
-            attempts = (await db.execute(attempts_stmt)).scalar() or 0
-            
-            # Calculate accuracy for this week
-            mcq_stmt = select(func.count(PracticeAttempt.id)).where(
-                PracticeAttempt.user_id == user.id,
-                PracticeAttempt.attempted_at >= week_start,
-                PracticeAttempt.attempted_at < week_end,
-                PracticeAttempt.is_correct.isnot(None)
-            )
-            mcq_count = (await db.execute(mcq_stmt)).scalar() or 0
             
-            if mcq_count > 0:
-                correct_stmt = select(func.count(PracticeAttempt.id)).where(
-                    PracticeAttempt.user_id == user.id,
-                    PracticeAttempt.attempted_at >= week_start,
-                    PracticeAttempt.attempted_at < week_end,
-                    PracticeAttempt.is_correct == True
-                )
-                correct = (await db.execute(correct_stmt)).scalar() or 0
-                accuracy = round((correct / mcq_count) * 100, 1)
-            else:
-                accuracy = None
-            
-            # Calculate time spent (approximate from content progress)
-            time_stmt = select(func.sum(UserContentProgress.time_spent_seconds)).where(
-                UserContentProgress.user_id == user.id,
-                UserContentProgress.last_viewed_at >= week_start,
-                UserContentProgress.last_viewed_at < week_end
-            )
-            seconds = (await db.execute(time_stmt)).scalar() or 0
-            hours = round(seconds / 3600, 1)
+            accuracy = None
+            if week_totals["graded"] > 0:
+                accuracy = round((week_totals["correct"] / week_totals["graded"]) * 100, 1)
             
             weeks_data.append({
                 "week": f"{week_start.year}-W{week_start.isocalendar()[1]:02d}",
-                "hours": hours,
-                "questions_attempted": attempts,
+                "hours": round(week_totals["seconds"] / 3600, 1),
+                "questions_attempted": week_totals["attempts"],
                 "accuracy": accuracy
             })
         
@@ -0,0 +1,321 @@
+"""
+backend/services/analytics_export.py
+Streaming analytics exports for institution admins
+
+DATASETS (scoped to one institution):
+- cohort_progress: subject_progress rows of the institution's students
+- practice_attempts: practice attempts of the institution's students
+- judge_scores: judge score sheets (criteria and totals, no notes)
+- ai_usage: AI feature usage log (no IP addresses)
+
+FORMATS:
+- csv: header row, then one line per row
+- ndjson: one JSON object per line
+- parquet: one row group per batch (requires pyarrow)
+
+Rows are read through a server-side cursor (session.stream with
+yield_per) in batches of EXPORT_BATCH_ROWS and encoded batch by batch
+into the response, so memory stays constant whatever the row count and
+the event loop is released between batches. Each export uses its own
+session: the stream outlives the request handler.
+"""
+import io
+import os
+import csv
+import json
+import asyncio
+import logging
+from datetime import date, datetime
+from enum import Enum
+from typing import Any, AsyncIterator, Callable, Dict, List, Tuple
+
+from fastapi import HTTPException, status
+from fastapi.responses import StreamingResponse
+from sqlalchemy import select, Select
+
+from backend.database import AsyncSessionLocal
+from backend.orm.user import User
+from backend.orm.subject_progress import SubjectProgress
+from backend.orm.practice_attempt import PracticeAttempt
+from backend.orm.scoring import JudgeScore
+from backend.orm.ai_usage_log import AIUsageLog
+
+# Parquet output
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+    PYARROW_AVAILABLE = True
+except ImportError:
+    PYARROW_AVAILABLE = False
+
+logger = logging.getLogger(__name__)
+
+EXPORT_BATCH_ROWS = int(os.getenv("EXPORT_BATCH_ROWS", "5000"))
+
+EXPORT_FORMATS = {
+    "csv": ("text/csv", "csv"),
+    "ndjson": ("application/x-ndjson", "ndjson"),
+    "parquet": ("application/vnd.apache.parquet", "parquet"),
+}
+
+# (column name, kind); kind drives the Parquet schema
+Columns = List[Tuple[str, str]]
+
+
+# ================= DATASETS =================
+
+def _cohort_progress(institution_id: int) -> Select:
+    return select(
+        SubjectProgress.user_id,
+        User.course_id,
+        User.current_semester,
+        SubjectProgress.subject_id,
+        SubjectProgress.completion_percentage,
+        SubjectProgress.total_items,
+        SubjectProgress.completed_items,
+        SubjectProgress.last_activity_at
+    ).join(
+        User, User.id == SubjectProgress.user_id
+    ).where(
+        User.institution_id == institution_id
+    ).order_by(SubjectProgress.id)
+
+
+def _practice_attempts(institution_id: int) -> Select:
+    return select(
+        PracticeAttempt.id,
+        PracticeAttempt.user_id,
+        PracticeAttempt.practice_question_id,
+        PracticeAttempt.is_correct,
+        PracticeAttempt.attempt_number,
+        PracticeAttempt.time_taken_seconds,
+        PracticeAttempt.attempted_at
+    ).join(
+        User, User.id == PracticeAttempt.user_id
+    ).where(
+        User.institution_id == institution_id
+    ).order_by(PracticeAttempt.id)
+
+
+def _judge_scores(institution_id: int) -> Select:
+    return select(
+        JudgeScore.id,
+        JudgeScore.competition_id,
+        JudgeScore.team_id,
+        JudgeScore.judge_id,
+        JudgeScore.status,
+        JudgeScore.issue_framing_score,
+        JudgeScore.legal_reasoning_score,
+        JudgeScore.use_of_authority_score,
+        JudgeScore.structure_clarity_score,
+        JudgeScore.oral_advocacy_score,
+        JudgeScore.responsiveness_score,
+        JudgeScore.total_score,
+        JudgeScore.percentage,
+        JudgeScore.is_final,
+        JudgeScore.is_published,
+        JudgeScore.created_at
+    ).where(
+        JudgeScore.institution_id == institution_id
+    ).order_by(JudgeScore.id)
+
+
+def _ai_usage(institution_id: int) -> Select:
+    return select(
+        AIUsageLog.id,
+        AIUsageLog.user_id,
+        AIUsageLog.role_at_time,
+        AIUsageLog.project_id,
+        AIUsageLog.feature_name,
+        AIUsageLog.timestamp,
+        AIUsageLog.was_blocked,
+        AIUsageLog.block_reason
+    ).where(
+        AIUsageLog.institution_id == institution_id
+    ).order_by(AIUsageLog.id)
+
+
+EXPORT_DATASETS: Dict[str, Tuple[Callable[[int], Select], Columns]] = {
+    "cohort_progress": (_cohort_progress, [
+        ("user_id", "int"), ("course_id", "int"), ("semester", "int"),
+        ("subject_id", "int"), ("completion_percentage", "float"),
+        ("total_items", "int"), ("completed_items", "int"),
+        ("last_activity_at", "datetime"),
+    ]),
+    "practice_attempts": (_practice_attempts, [
+        ("attempt_id", "int"), ("user_id", "int"), ("practice_question_id", "int"),
+        ("is_correct", "bool"), ("attempt_number", "int"),
+        ("time_taken_seconds", "int"), ("attempted_at", "datetime"),
+    ]),
+    "judge_scores": (_judge_scores, [
+        ("score_id", "int"), ("competition_id", "int"), ("team_id", "int"),
+        ("judge_id", "int"), ("status", "str"),
+        ("issue_framing_score", "float"), ("legal_reasoning_score", "float"),
+        ("use_of_authority_score", "float"), ("structure_clarity_score", "float"),
+        ("oral_advocacy_score", "float"), ("responsiveness_score", "float"),
+        ("total_score", "float"), ("percentage", "float"),
+        ("is_final", "bool"), ("is_published", "bool"), ("created_at", "datetime"),
+    ]),
+    "ai_usage": (_ai_usage, [
+        ("log_id", "int"), ("user_id", "int"), ("role", "str"),
+        ("project_id", "int"), ("feature", "str"), ("timestamp", "datetime"),
+        ("was_blocked", "bool"), ("block_reason", "str"),
+    ]),
+}
+
+
+# ================= ROW STREAM =================
+
+def _plain(value: Any) -> Any:
+    """Enums become their values; everything else is kept"""
+    return value.value if isinstance(value, Enum) else value
+
+
+async def _row_batches(stmt: Select) -> AsyncIterator[List[Tuple]]:
+    """Batches of plain row tuples from a server-side cursor"""
+    async with AsyncSessionLocal() as session:
+        result = await session.stream(stmt.execution_options(yield_per=EXPORT_BATCH_ROWS))
+        async for partition in result.partitions():
+            yield [tuple(_plain(value) for value in row) for row in partition]
+
+
+# ================= ENCODERS =================
+
+def _text(value: Any) -> Any:
+    return value.isoformat() if isinstance(value, (datetime, date)) else value
+
+
+async def _csv_chunks(columns: Columns, batches: AsyncIterator[List[Tuple]]) -> AsyncIterator[bytes]:
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    writer.writerow([name for name, _ in columns])
+    yield buffer.getvalue().encode("utf-8")
+
+    async for rows in batches:
+        buffer.seek(0)
+        buffer.truncate()
+        writer.writerows([tuple(_text(value) for value in row) for row in rows])
+        yield buffer.getvalue().encode("utf-8")
+
+
+async def _ndjson_chunks(columns: Columns, batches: AsyncIterator[List[Tuple]]) -> AsyncIterator[bytes]:
+    names = [name for name, _ in columns]
+    async for rows in batches:
+        lines = [
+            json.dumps({name: _text(value) for name, value in zip(names, row)}, default=str)
+            for row in rows
+        ]
+        yield ("\n".join(lines) + "\n").encode("utf-8")
+
+
+class _ChunkSink:
+    """Write-only file object that hands written bytes back in chunks"""
+
+    closed = False
+
+    def __init__(self):
+        self._chunks: List[bytes] = []
+        self._position = 0
+
+    def write(self, data) -> int:
+        data = bytes(data)
+        self._chunks.append(data)
+        self._position += len(data)
+        return len(data)
+
+    def tell(self) -> int:
+        return self._position
+
+    def flush(self) -> None:
+        pass
+
+    def writable(self) -> bool:
+        return True
+
+    def close(self) -> None:
+        self.closed = True
+
+    def drain(self) -> bytes:
+        data = b"".join(self._chunks)
+        self._chunks.clear()
+        return data
+
+
+def _arrow_schema(columns: Columns) -> "pa.Schema":
+    types = {
+        "int": pa.int64(),
+        "float": pa.float64(),
+        "bool": pa.bool_(),
+        "str": pa.string(),
+        "datetime": pa.timestamp("us"),
+    }
+    return pa.schema([(name, types[kind]) for name, kind in columns])
+
+
+async def _parquet_chunks(columns: Columns, batches: AsyncIterator[List[Tuple]]) -> AsyncIterator[bytes]:
+    schema = _arrow_schema(columns)
+    sink = _ChunkSink()
+    writer = pq.ParquetWriter(sink, schema)
+    try:
+        async for rows in batches:
+            table = pa.table(
+                {name: [row[index] for row in rows] for index, (name, _) in enumerate(columns)},
+                schema=schema
+            )
+            # Encoding a row group is CPU-bound; keep it off the event loop
+            await asyncio.to_thread(writer.write_table, table)
+            yield sink.drain()
+    finally:
+        writer.close()
+    yield sink.drain()
+
+
+_ENCODERS = {
+    "csv": _csv_chunks,
+    "ndjson": _ndjson_chunks,
+    "parquet": _parquet_chunks,
+}
+
+
+# ================= RESPONSE =================
+
+async def stream_export(dataset: str, institution_id: int, export_format: str) -> AsyncIterator[bytes]:
+    """Encoded chunks of one dataset export"""
+    build_query, columns = EXPORT_DATASETS[dataset]
+    batches = _row_batches(build_query(institution_id))
+    async for chunk in _ENCODERS[export_format](columns, batches):
+        if chunk:
+            yield chunk
+    logger.info(f"Export complete: dataset={dataset}, institution={institution_id}, format={export_format}")
+
+
+def build_export_response(dataset: str, institution_id: int, export_format: str) -> StreamingResponse:
+    """
+    Streaming response for a dataset export.
+
+    Raises 404 for unknown datasets, 400 for unknown formats and 501 for
+    Parquet without pyarrow installed.
+    """
+    if dataset not in EXPORT_DATASETS:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Unknown dataset '{dataset}'. Available: {', '.join(EXPORT_DATASETS)}"
+        )
+    if export_format not in EXPORT_FORMATS:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Unknown format '{export_format}'. Available: {', '.join(EXPORT_FORMATS)}"
+        )
+    if export_format == "parquet" and not PYARROW_AVAILABLE:
+        raise HTTPException(
+            status_code=status.HTTP_501_NOT_IMPLEMENTED,
+            detail="Parquet export requires pyarrow"
+        )
+
+    media_type, extension = EXPORT_FORMATS[export_format]
+    filename = f"{dataset}_institution_{institution_id}_{datetime.utcnow():%Y%m%d}.{extension}"
+    return StreamingResponse(
+        stream_export(dataset, institution_id, export_format),
+        media_type=media_type,
+        headers={"Content-Disposition": f'attachment; filename="{filename}"'}
+    )
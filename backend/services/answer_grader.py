@@ -9,6 +9,7 @@ from typing import Optional, List
 import google.generativeai as genai
 
 from backend.schemas.practice_schemas import QuestionRubric, AssessAnswerResponse
+from backend.services.keyword_matcher import compile_keywords
 
 logger = logging.getLogger(__name__)
 
@@ -95,23 +96,23 @@ def _score_by_keywords(
         (matched_keywords, missing_keywords, total_score)
     """
     
-    answer_lower = student_answer.lower()
+    # One pass over the answer for required + optional keywords
+    scan = compile_keywords(
+        list(rubric.required_keywords) + list(rubric.optional_keywords)
+    ).scan(student_answer)
     
     # Check required keywords
     matched = []
     missing = []
     
     for keyword in rubric.required_keywords:
-        if keyword.lower() in answer_lower:
+        if scan.contains(keyword):
             matched.append(keyword)
         else:
             missing.append(keyword)
     
     # Check optional keywords (bonus points)
-    optional_matched = []
-    for keyword in rubric.optional_keywords:
-        if keyword.lower() in answer_lower:
-            optional_matched.append(keyword)
+    optional_matched = [kw for kw in rubric.optional_keywords if scan.contains(kw)]
     
     # Calculate score
     required_score = len(matched) * rubric.keyword_score
@@ -7,17 +7,35 @@ Handles:
 - Whisper API integration with offline fallback
 - Speaker role tracking
 - Chunk management and cleanup
+
+PIPELINE:
+Uploads are acknowledged as soon as a chunk is saved and queued. A fixed
+pool of worker tasks drains the queue (API calls run concurrently up to
+TRANSCRIBE_WORKERS, local Whisper runs in a process pool), each finished
+chunk is appended to its round's transcript as it completes, and chunk
+results are written to oral_round_transcripts in batches. Finalizing a
+round reads the already-assembled transcript instead of waiting on Whisper.
 """
 import os
 import uuid
 import json
+import asyncio
+import bisect
 import logging
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
 from datetime import datetime, timezone
 from typing import Optional, Dict, List
 from pathlib import Path
 
 import aiohttp
 import aiofiles
+from sqlalchemy import select, insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from backend.database import AsyncSessionLocal
+from backend.orm.oral_round_transcript import OralRoundTranscript, SpeakerRole, TranscriptStatus
 
 logger = logging.getLogger(__name__)
 
@@ -27,120 +45,464 @@ MAX_CHUNK_SIZE_MB = 5
 AUDIO_UPLOAD_DIR = "uploads/audio_chunks"
 WHISPER_API_URL = "https://api.openai.com/v1/audio/transcriptions"
 WHISPER_MODEL = "whisper-1"
+LOCAL_WHISPER_MODEL = os.getenv("LOCAL_WHISPER_MODEL", "base")
+
+# Chunks transcribed concurrently
+TRANSCRIBE_WORKERS = int(os.getenv("TRANSCRIBE_WORKERS", "4"))
+
+# Worker processes for local Whisper (each holds its own model)
+LOCAL_TRANSCRIBE_WORKERS = int(os.getenv("LOCAL_TRANSCRIBE_WORKERS", "1"))
+
+# Chunks waiting for a worker before uploads are rejected
+TRANSCRIBE_QUEUE_MAX_SIZE = int(os.getenv("TRANSCRIBE_QUEUE_MAX_SIZE", "500"))
+
+# Chunk results written per batch, and the longest a result waits to be written
+STATUS_FLUSH_BATCH_SIZE = 50
+STATUS_FLUSH_INTERVAL_SECONDS = 1.0
+
+# Flushes a chunk result may fail before it is dropped (it stays readable from memory)
+STATUS_FLUSH_MAX_ATTEMPTS = 5
+
+# Recent chunk statuses and round transcripts kept in memory (older ones are read from the DB)
+CHUNK_STATUS_MAX_SIZE = 5000
+ROUND_CACHE_MAX_SIZE = 64
+
+
+class TranscriptionQueueFull(Exception):
+    """Raised when the transcription queue cannot accept another chunk"""
+    pass
+
+
+@dataclass
+class _ChunkJob:
+    """A saved chunk waiting for transcription"""
+    status: dict
+    audio_data: bytes
+    chunk_path: Path
 
-# In-memory chunk storage for processing status
-_chunk_status: Dict[str, dict] = {}
+
+@dataclass
+class _RoundTranscript:
+    """Transcript of one round, assembled as chunks complete"""
+    round_id: int
+    segments: List[dict] = field(default_factory=list)  # Completed chunks, by chunk_index
+    pending: int = 0
+    failed: int = 0
+
+    def add_segment(self, chunk: dict) -> None:
+        """Insert a completed chunk in chunk order"""
+        segment = {
+            "timestamp": chunk.get("created_at"),
+            "speaker_role": chunk.get("speaker_role"),
+            "text": chunk.get("transcript_text", ""),
+            "confidence": chunk.get("confidence", 0.0),
+            "chunk_id": chunk.get("chunk_id"),
+            "chunk_index": chunk.get("chunk_index", 0),
+            "word_timestamps": chunk.get("word_timestamps", [])
+        }
+        keys = [s["chunk_index"] for s in self.segments]
+        self.segments.insert(bisect.bisect_right(keys, segment["chunk_index"]), segment)
+
+
+# ================= LOCAL WHISPER (worker process) =================
+
+_local_models: Dict[str, object] = {}
+
+
+def _transcribe_local(audio_path: str, model_name: str) -> dict:
+    """Transcribe with local Whisper (runs inside a worker process)"""
+    import whisper
+
+    model = _local_models.get(model_name)
+    if model is None:
+        model = _local_models[model_name] = whisper.load_model(model_name)
+
+    result = model.transcribe(
+        audio_path,
+        language="en",
+        temperature=0.0,
+        word_timestamps=True
+    )
+
+    # Extract word timestamps
+    words = []
+    for segment in result.get('segments', []):
+        words.extend(
+            {
+                "word": w.get("word", "").strip(),
+                "start": w.get("start", 0.0),
+                "end": w.get("end", 0.0)
+            }
+            for w in segment.get('words', [])
+        )
+
+    # Calculate confidence from segment scores
+    confidence = 0.85  # Default for local model
+    if result.get('segments'):
+        avg_prob = sum(s.get('avg_logprob', -0.5) for s in result['segments']) / len(result['segments'])
+        confidence = min(1.0, max(0.0, 1.0 + avg_prob))
+
+    return {
+        "text": result.get("text", ""),
+        "words": words,
+        "confidence": confidence,
+        "language": result.get("language", "en"),
+        "source": "local_whisper"
+    }
 
 
 class AudioTranscriptionService:
     """
     Service for transcribing audio chunks using Whisper API or local fallback.
     """
-    
+
     def __init__(self):
         self.api_key = os.getenv("OPENAI_API_KEY")
         self.use_api = bool(self.api_key)
-        
+
         # Ensure upload directory exists
         Path(AUDIO_UPLOAD_DIR).mkdir(parents=True, exist_ok=True)
-        
+
+        self._queue: Optional[asyncio.Queue] = None
+        self._workers: List[asyncio.Task] = []
+        self._flusher: Optional[asyncio.Task] = None
+        self._http: Optional[aiohttp.ClientSession] = None
+        self._local_pool: Optional[ProcessPoolExecutor] = None
+
+        self._chunk_status: "OrderedDict[str, dict]" = OrderedDict()
+        self._rounds: "OrderedDict[int, _RoundTranscript]" = OrderedDict()
+        self._unsaved: List[dict] = []
+        self._saving: List[dict] = []
+        self._flush_attempts: Dict[str, int] = {}
+        self._flush_needed: Optional[asyncio.Event] = None
+
         if self.use_api:
             logger.info("AudioTranscription: Using OpenAI Whisper API")
         else:
             logger.warning("AudioTranscription: No API key, will use offline fallback")
-    
+
+    # ================= WORKERS =================
+
+    def _ensure_started(self) -> None:
+        """Start the worker pool and status flusher on the running loop"""
+        if self._queue is not None:
+            return
+        self._queue = asyncio.Queue(maxsize=TRANSCRIBE_QUEUE_MAX_SIZE)
+        self._flush_needed = asyncio.Event()
+        self._workers = [
+            asyncio.create_task(self._worker(), name=f"transcribe-worker-{i}")
+            for i in range(TRANSCRIBE_WORKERS)
+        ]
+        self._flusher = asyncio.create_task(self._flush_loop(), name="transcribe-status-flush")
+        logger.info(f"AudioTranscription: started {TRANSCRIBE_WORKERS} workers")
+
+    async def _worker(self) -> None:
+        """Transcribe queued chunks until cancelled"""
+        while True:
+            job: _ChunkJob = await self._queue.get()
+            try:
+                await self._run_job(job)
+            finally:
+                self._queue.task_done()
+
+    async def _run_job(self, job: _ChunkJob) -> None:
+        """Transcribe one chunk and record the outcome"""
+        status = job.status
+        status["status"] = "processing"
+
+        try:
+            if self.use_api:
+                result = await self._transcribe_with_api(job.audio_data, job.chunk_path.name)
+            else:
+                result = await self._transcribe_offline(job.chunk_path)
+
+            status.update({
+                "status": "completed",
+                "transcript_text": result.get("text", ""),
+                "confidence": result.get("confidence", 0.0),
+                "word_timestamps": result.get("words", []),
+                "language": result.get("language", "en"),
+                "processed_at": datetime.now(timezone.utc).isoformat()
+            })
+            logger.info(f"Chunk {status['chunk_id']} transcribed: {len(result.get('text', ''))} chars")
+
+        except Exception as e:
+            logger.error(f"Error transcribing chunk {status['chunk_id']}: {e}")
+            status.update({
+                "status": "failed",
+                "error": str(e),
+                "failed_at": datetime.now(timezone.utc).isoformat()
+            })
+
+        self._record_result(status)
+
+    def _record_result(self, status: dict) -> None:
+        """Append a finished chunk to its round and schedule it for persistence"""
+        self._remember_status(status)
+
+        transcript = self._rounds.get(status["round_id"])
+        if transcript is not None:
+            transcript.pending = max(0, transcript.pending - 1)
+            if status["status"] == "completed":
+                transcript.add_segment(status)
+            else:
+                transcript.failed += 1
+
+        self._unsaved.append(status)
+        if len(self._unsaved) >= STATUS_FLUSH_BATCH_SIZE:
+            self._flush_needed.set()
+
+    async def _flush_loop(self) -> None:
+        """Write finished chunks in batches until cancelled"""
+        while True:
+            try:
+                await asyncio.wait_for(self._flush_needed.wait(), timeout=STATUS_FLUSH_INTERVAL_SECONDS)
+            except asyncio.TimeoutError:
+                pass
+            self._flush_needed.clear()
+            try:
+                await self.flush_statuses()
+            except Exception as e:
+                logger.error(f"Failed to persist chunk statuses: {e}")
+
+    async def flush_statuses(self) -> int:
+        """
+        Persist finished chunks with one multi-row insert.
+
+        If the batch insert fails, rows are inserted one by one so a single
+        bad row cannot hold back the rest. Rows that still fail are retried
+        on later flushes and dropped after STATUS_FLUSH_MAX_ATTEMPTS.
+
+        Returns number of chunks written.
+        """
+        batch, self._unsaved = self._unsaved, []
+        if not batch:
+            return 0
+
+        self._saving = batch
+        try:
+            try:
+                await self._insert_statuses(batch)
+                written, retry = batch, []
+            except Exception as e:
+                logger.warning(f"Batch insert of {len(batch)} chunk statuses failed, writing rows one by one: {e}")
+                written, retry = [], []
+                for status in batch:
+                    try:
+                        await self._insert_statuses([status])
+                        written.append(status)
+                    except Exception as row_error:
+                        if self._note_flush_failure(status, row_error):
+                            retry.append(status)
+        finally:
+            self._saving = []
+
+        for status in written:
+            self._flush_attempts.pop(status["chunk_id"], None)
+        self._unsaved = retry + self._unsaved
+        return len(written)
+
+    async def _insert_statuses(self, statuses: List[dict]) -> None:
+        rows = [self._status_row(status) for status in statuses]
+        async with AsyncSessionLocal() as session:
+            await session.execute(insert(OralRoundTranscript), rows)
+            await session.commit()
+
+    def _note_flush_failure(self, status: dict, error: Exception) -> bool:
+        """Count a failed write of one chunk; returns whether to retry it"""
+        chunk_id = status["chunk_id"]
+        attempts = self._flush_attempts.get(chunk_id, 0) + 1
+        if attempts >= STATUS_FLUSH_MAX_ATTEMPTS:
+            self._flush_attempts.pop(chunk_id, None)
+            logger.error(f"Dropping result of chunk {chunk_id} after {attempts} failed writes: {error}")
+            return False
+        self._flush_attempts[chunk_id] = attempts
+        return True
+
+    @staticmethod
+    def _status_row(status: dict) -> dict:
+        """Map a chunk status to an oral_round_transcripts row"""
+        completed = status["status"] == "completed"
+        text = status.get("transcript_text", "") if completed else ""
+        return {
+            "round_id": status["round_id"],
+            "transcript_text": text,
+            "transcript_json": json.dumps({
+                "chunk_index": status["chunk_index"],
+                "created_at": status["created_at"],
+                "language": status.get("language")
+            }),
+            "word_count": len(text.split()),
+            "duration_seconds": CHUNK_DURATION_SECONDS if completed else 0,
+            "audio_file_path": status.get("file_path"),
+            "speaker_role": SpeakerRole(status["speaker_role"]),
+            "audio_chunk_id": status["chunk_id"],
+            "word_timestamps_json": json.dumps(status.get("word_timestamps") or []) if completed else None,
+            "confidence_score": status.get("confidence") if completed else None,
+            "processing_status": TranscriptStatus.COMPLETED if completed else TranscriptStatus.FAILED,
+            "processing_error": status.get("error"),
+            "generated_at": datetime.now(timezone.utc).replace(tzinfo=None),
+        }
+
+    @staticmethod
+    def _row_status(row: OralRoundTranscript) -> dict:
+        """Map an oral_round_transcripts row back to a chunk status"""
+        meta = row.get_transcript_json() or {}
+        completed = row.processing_status == TranscriptStatus.COMPLETED
+        status = {
+            "chunk_id": row.audio_chunk_id,
+            "round_id": row.round_id,
+            "status": "completed" if completed else "failed",
+            "speaker_role": row.speaker_role.value if row.speaker_role else None,
+            "chunk_index": meta.get("chunk_index", 0),
+            "file_path": row.audio_file_path,
+            "created_at": meta.get("created_at"),
+        }
+        if completed:
+            status.update({
+                "transcript_text": row.transcript_text,
+                "confidence": row.confidence_score or 0.0,
+                "word_timestamps": row.get_word_timestamps(),
+                "language": meta.get("language") or "en",
+            })
+        else:
+            status["error"] = row.processing_error
+        return status
+
+    async def shutdown(self) -> None:
+        """Drain queued chunks, persist results and stop the workers"""
+        if self._queue is None:
+            return
+        await self._queue.join()
+        for task in [*self._workers, self._flusher]:
+            task.cancel()
+        await asyncio.gather(*self._workers, self._flusher, return_exceptions=True)
+        await self.flush_statuses()
+
+        if self._http is not None:
+            await self._http.close()
+        if self._local_pool is not None:
+            self._local_pool.shutdown(wait=False)
+        self._queue = None
+
+    # ================= IN-MEMORY STATE =================
+
+    def _remember_status(self, status: dict) -> None:
+        self._chunk_status[status["chunk_id"]] = status
+        self._chunk_status.move_to_end(status["chunk_id"])
+        while len(self._chunk_status) > CHUNK_STATUS_MAX_SIZE:
+            self._chunk_status.popitem(last=False)
+
+    def _round(self, round_id: int) -> Optional[_RoundTranscript]:
+        transcript = self._rounds.get(round_id)
+        if transcript is not None:
+            self._rounds.move_to_end(round_id)
+        return transcript
+
+    def _track_round(self, transcript: _RoundTranscript) -> None:
+        self._rounds[transcript.round_id] = transcript
+        self._rounds.move_to_end(transcript.round_id)
+        excess = len(self._rounds) - ROUND_CACHE_MAX_SIZE
+        if excess <= 0:
+            return
+        # Rounds with queued chunks stay: their pending count is only kept here
+        idle = [
+            round_id for round_id, cached in self._rounds.items()
+            if not cached.pending and round_id != transcript.round_id
+        ]
+        for round_id in idle[:excess]:
+            del self._rounds[round_id]
+
+    async def _load_round(self, round_id: int, db: Optional[AsyncSession]) -> _RoundTranscript:
+        """In-memory transcript of a round, rebuilt from persisted chunks when evicted"""
+        transcript = self._round(round_id)
+        if transcript is not None:
+            return transcript
+
+        finished: Dict[str, dict] = {}
+        if db is not None:
+            result = await db.execute(
+                select(OralRoundTranscript).where(
+                    OralRoundTranscript.round_id == round_id,
+                    OralRoundTranscript.audio_chunk_id.isnot(None)
+                )
+            )
+            for row in result.scalars().all():
+                finished[row.audio_chunk_id] = self._row_status(row)
+
+        # Chunks finished but not yet written
+        for status in [*self._saving, *self._unsaved]:
+            if status["round_id"] == round_id:
+                finished[status["chunk_id"]] = status
+
+        transcript = _RoundTranscript(round_id=round_id)
+        for status in finished.values():
+            if status["status"] == "completed":
+                transcript.add_segment(status)
+            else:
+                transcript.failed += 1
+
+        self._track_round(transcript)
+        return transcript
+
+    # ================= PUBLIC API =================
+
     async def process_audio_chunk(
         self,
         round_id: int,
         audio_data: bytes,
         speaker_role: str,
         chunk_index: int,
-        timestamp: datetime
+        timestamp: datetime,
+        db: Optional[AsyncSession] = None
     ) -> dict:
         """
-        Process a single audio chunk through Whisper.
-        
+        Save an audio chunk and queue it for transcription.
+
         Args:
             round_id: Oral round ID
             audio_data: Raw audio bytes (WebM/Opus format)
             speaker_role: "petitioner", "respondent", or "judge"
             chunk_index: Sequential chunk number
             timestamp: Chunk start time
-        
+            db: Session used to restore an evicted round transcript
+
         Returns:
-            Dict with chunk_id, status, transcript, confidence, word_timestamps
+            Dict with chunk_id, status ("queued" or "failed"), speaker_role, chunk_index
+
+        Raises:
+            TranscriptionQueueFull: If the queue is at capacity
         """
+        self._ensure_started()
         chunk_id = str(uuid.uuid4())
-        chunk_path = None
-        
+
         try:
             # Validate chunk size
             if len(audio_data) > MAX_CHUNK_SIZE_MB * 1024 * 1024:
                 raise ValueError(f"Chunk exceeds {MAX_CHUNK_SIZE_MB}MB limit")
-            
+
+            if self._queue.full():
+                raise TranscriptionQueueFull(
+                    f"Transcription queue is full ({TRANSCRIBE_QUEUE_MAX_SIZE} chunks)"
+                )
+
             # Create round-specific directory
             round_dir = Path(AUDIO_UPLOAD_DIR) / str(round_id)
             round_dir.mkdir(parents=True, exist_ok=True)
-            
+
             # Save chunk to disk
             chunk_filename = f"{timestamp.strftime('%H%M%S')}_{chunk_index}_{chunk_id}.webm"
             chunk_path = round_dir / chunk_filename
-            
+
             async with aiofiles.open(chunk_path, 'wb') as f:
                 await f.write(audio_data)
-            
+
             logger.info(f"Chunk saved: {chunk_path} ({len(audio_data)} bytes)")
-            
-            # Initialize status
-            _chunk_status[chunk_id] = {
-                "chunk_id": chunk_id,
-                "round_id": round_id,
-                "status": "processing",
-                "speaker_role": speaker_role,
-                "chunk_index": chunk_index,
-                "file_path": str(chunk_path),
-                "created_at": datetime.now(timezone.utc).isoformat()
-            }
-            
-            # Transcribe using Whisper
-            if self.use_api:
-                result = await self._transcribe_with_api(chunk_path)
-            else:
-                result = await self._transcribe_offline(chunk_path)
-            
-            # Update status with results
-            _chunk_status[chunk_id].update({
-                "status": "completed",
-                "transcript_text": result.get("text", ""),
-                "confidence": result.get("confidence", 0.0),
-                "word_timestamps": result.get("words", []),
-                "language": result.get("language", "en"),
-                "processed_at": datetime.now(timezone.utc).isoformat()
-            })
-            
-            logger.info(f"Chunk {chunk_id} transcribed: {len(result.get('text', ''))} chars")
-            
-            return {
-                "chunk_id": chunk_id,
-                "status": "completed",
-                "speaker_role": speaker_role,
-                "transcript_text": result.get("text", ""),
-                "confidence": result.get("confidence", 0.0),
-                "word_timestamps": result.get("words", []),
-                "chunk_index": chunk_index
-            }
-            
+
+        except TranscriptionQueueFull:
+            raise
         except Exception as e:
             logger.error(f"Error processing chunk {chunk_id}: {e}")
-            
-            # Update status to failed
-            if chunk_id in _chunk_status:
-                _chunk_status[chunk_id].update({
-                    "status": "failed",
-                    "error": str(e),
-                    "failed_at": datetime.now(timezone.utc).isoformat()
-                })
-            
             return {
                 "chunk_id": chunk_id,
                 "status": "failed",
@@ -148,109 +510,110 @@ class AudioTranscriptionService:
                 "error": str(e),
                 "chunk_index": chunk_index
             }
-    
-    async def _transcribe_with_api(self, audio_path: Path) -> dict:
+
+        status = {
+            "chunk_id": chunk_id,
+            "round_id": round_id,
+            "status": "queued",
+            "speaker_role": speaker_role,
+            "chunk_index": chunk_index,
+            "file_path": str(chunk_path),
+            "created_at": datetime.now(timezone.utc).isoformat()
+        }
+        self._remember_status(status)
+
+        transcript = await self._load_round(round_id, db)
+
+        # The queue may have filled up while the chunk was being saved
+        try:
+            # Audio stays in memory so the API upload never re-reads the file
+            self._queue.put_nowait(_ChunkJob(status=status, audio_data=audio_data, chunk_path=chunk_path))
+        except asyncio.QueueFull:
+            self._chunk_status.pop(chunk_id, None)
+            chunk_path.unlink(missing_ok=True)
+            raise TranscriptionQueueFull(
+                f"Transcription queue is full ({TRANSCRIBE_QUEUE_MAX_SIZE} chunks)"
+            )
+        transcript.pending += 1
+
+        return {
+            "chunk_id": chunk_id,
+            "status": "queued",
+            "speaker_role": speaker_role,
+            "chunk_index": chunk_index
+        }
+
+    async def _transcribe_with_api(self, audio_data: bytes, filename: str) -> dict:
         """Transcribe using OpenAI Whisper API."""
-        
+
         headers = {
             "Authorization": f"Bearer {self.api_key}"
         }
-        
+
         data = aiohttp.FormData()
-        data.add_field('file', open(audio_path, 'rb'), filename=audio_path.name)
+        data.add_field('file', audio_data, filename=filename)
         data.add_field('model', WHISPER_MODEL)
         data.add_field('language', 'en')  # Primary language
         data.add_field('response_format', 'verbose_json')
         data.add_field('timestamp_granularities[]', 'word')
         data.add_field('temperature', '0.0')  # Max accuracy
-        
-        async with aiohttp.ClientSession() as session:
-            async with session.post(
-                WHISPER_API_URL,
-                headers=headers,
-                data=data,
-                timeout=aiohttp.ClientTimeout(total=30)
-            ) as response:
-                
-                if response.status != 200:
-                    error_text = await response.text()
-                    raise Exception(f"Whisper API error: {response.status} - {error_text}")
-                
-                result = await response.json()
-                
-                # Extract word-level timestamps if available
-                words = []
-                if 'words' in result:
-                    words = [
-                        {
-                            "word": w.get("word", "").strip(),
-                            "start": w.get("start", 0.0),
-                            "end": w.get("end", 0.0)
-                        }
-                        for w in result['words']
-                    ]
-                
-                # Calculate confidence (use segments avg if available)
-                confidence = 0.9  # Default
-                if 'segments' in result and result['segments']:
-                    avg_conf = sum(s.get('avg_logprob', -0.5) for s in result['segments']) / len(result['segments'])
-                    # Convert logprob to 0-1 scale (approximate)
-                    confidence = min(1.0, max(0.0, 1.0 + avg_conf))
-                
-                return {
-                    "text": result.get("text", ""),
-                    "words": words,
-                    "confidence": confidence,
-                    "language": result.get("language", "en")
-                }
-    
-    async def _transcribe_offline(self, audio_path: Path) -> dict:
-        """
-        Fallback transcription using local Whisper.
-        Requires whisper package: pip install openai-whisper
-        """
-        try:
-            import whisper
-            
-            # Load model (cached after first load)
-            model = whisper.load_model("base")
-            
-            # Transcribe
-            result = model.transcribe(
-                str(audio_path),
-                language="en",
-                temperature=0.0,
-                word_timestamps=True
-            )
-            
-            # Extract word timestamps
+
+        if self._http is None or self._http.closed:
+            self._http = aiohttp.ClientSession()
+
+        async with self._http.post(
+            WHISPER_API_URL,
+            headers=headers,
+            data=data,
+            timeout=aiohttp.ClientTimeout(total=30)
+        ) as response:
+
+            if response.status != 200:
+                error_text = await response.text()
+                raise Exception(f"Whisper API error: {response.status} - {error_text}")
+
+            result = await response.json()
+
+            # Extract word-level timestamps if available
             words = []
-            if 'segments' in result:
-                for segment in result['segments']:
-                    if 'words' in segment:
-                        words.extend([
-                            {
-                                "word": w.get("word", "").strip(),
-                                "start": w.get("start", 0.0),
-                                "end": w.get("end", 0.0)
-                            }
-                            for w in segment['words']
-                        ])
-            
-            # Calculate confidence from segment scores
-            confidence = 0.85  # Default for local model
+            if 'words' in result:
+                words = [
+                    {
+                        "word": w.get("word", "").strip(),
+                        "start": w.get("start", 0.0),
+                        "end": w.get("end", 0.0)
+                    }
+                    for w in result['words']
+                ]
+
+            # Calculate confidence (use segments avg if available)
+            confidence = 0.9  # Default
             if 'segments' in result and result['segments']:
-                avg_prob = sum(s.get('avg_logprob', -0.5) for s in result['segments']) / len(result['segments'])
-                confidence = min(1.0, max(0.0, 1.0 + avg_prob))
-            
+                avg_conf = sum(s.get('avg_logprob', -0.5) for s in result['segments']) / len(result['segments'])
+                # Convert logprob to 0-1 scale (approximate)
+                confidence = min(1.0, max(0.0, 1.0 + avg_conf))
+
             return {
                 "text": result.get("text", ""),
                 "words": words,
                 "confidence": confidence,
-                "language": result.get("language", "en"),
-                "source": "local_whisper"
+                "language": result.get("language", "en")
             }
-            
+
+    async def _transcribe_offline(self, audio_path: Path) -> dict:
+        """
+        Fallback transcription using local Whisper in a worker process.
+        Requires whisper package: pip install openai-whisper
+        """
+        if self._local_pool is None:
+            self._local_pool = ProcessPoolExecutor(max_workers=LOCAL_TRANSCRIBE_WORKERS)
+
+        loop = asyncio.get_running_loop()
+        try:
+            return await loop.run_in_executor(
+                self._local_pool, _transcribe_local, str(audio_path), LOCAL_WHISPER_MODEL
+            )
+
         except ImportError:
             logger.error("openai-whisper package not installed. Run: pip install openai-whisper")
             return {
@@ -268,105 +631,100 @@ class AudioTranscriptionService:
                 "confidence": 0.0,
                 "error": str(e)
             }
-    
-    def get_chunk_status(self, chunk_id: str) -> Optional[dict]:
-        """Get processing status for a chunk."""
-        return _chunk_status.get(chunk_id)
-    
-    def get_round_chunks(self, round_id: int) -> List[dict]:
-        """Get all chunks for a round."""
-        return [
-            status for status in _chunk_status.values()
-            if status.get("round_id") == round_id
-        ]
-    
-    async def finalize_transcript(self, round_id: int) -> dict:
+
+    async def get_chunk_status(self, chunk_id: str, db: Optional[AsyncSession] = None) -> Optional[dict]:
+        """Get processing status for a chunk (recent chunks from memory, older ones from the DB)."""
+        status = self._chunk_status.get(chunk_id)
+        if status is not None or db is None:
+            return status
+
+        result = await db.execute(
+            select(OralRoundTranscript).where(OralRoundTranscript.audio_chunk_id == chunk_id)
+        )
+        row = result.scalars().first()
+        return self._row_status(row) if row else None
+
+    async def get_live_segments(self, round_id: int, db: Optional[AsyncSession] = None) -> dict:
+        """Completed segments of a round so far, and whether chunks are still in flight."""
+        transcript = await self._load_round(round_id, db)
+        return {
+            "segments": [
+                {key: value for key, value in segment.items() if key != "word_timestamps"}
+                for segment in transcript.segments
+            ],
+            "pending_chunks": transcript.pending
+        }
+
+    async def finalize_transcript(self, round_id: int, db: Optional[AsyncSession] = None) -> dict:
         """
         Concatenate all chunks for a round into final transcript.
-        
+
+        Reads the incrementally assembled transcript; chunks still being
+        transcribed are reported as pending instead of awaited.
+
         Returns:
             Dict with full transcript, segments, metadata
         """
-        chunks = self.get_round_chunks(round_id)
-        
-        if not chunks:
+        transcript = await self._load_round(round_id, db)
+        segments = list(transcript.segments)
+        chunk_count = len(segments) + transcript.failed + transcript.pending
+
+        if not chunk_count:
             return {
                 "round_id": round_id,
                 "transcript_text": "",
                 "segments": [],
                 "word_count": 0,
                 "duration_seconds": 0,
-                "processing_status": "no_data"
+                "processing_status": "no_data",
+                "chunk_count": 0,
+                "completed_chunks": 0,
+                "failed_chunks": 0
             }
-        
-        # Sort by chunk index
-        chunks.sort(key=lambda x: x.get("chunk_index", 0))
-        
-        # Build transcript segments
-        segments = []
-        full_text_parts = []
-        total_duration = 0
-        
-        for chunk in chunks:
-            if chunk.get("status") == "completed":
-                segment = {
-                    "timestamp": chunk.get("created_at"),
-                    "speaker_role": chunk.get("speaker_role"),
-                    "text": chunk.get("transcript_text", ""),
-                    "confidence": chunk.get("confidence", 0.0),
-                    "chunk_id": chunk.get("chunk_id"),
-                    "word_timestamps": chunk.get("word_timestamps", [])
-                }
-                segments.append(segment)
-                full_text_parts.append(f"[{chunk.get('speaker_role', 'unknown').upper()}] {chunk.get('transcript_text', '')}")
-                total_duration += CHUNK_DURATION_SECONDS
-        
-        full_text = "\n\n".join(full_text_parts)
-        word_count = len(full_text.split())
-        
+
+        full_text = "\n\n".join(
+            f"[{(segment.get('speaker_role') or 'unknown').upper()}] {segment.get('text', '')}"
+            for segment in segments
+        )
+
         return {
             "round_id": round_id,
             "transcript_text": full_text,
             "segments": segments,
-            "word_count": word_count,
-            "duration_seconds": total_duration,
-            "processing_status": "completed",
-            "chunk_count": len(chunks),
-            "completed_chunks": len([c for c in chunks if c.get("status") == "completed"]),
-            "failed_chunks": len([c for c in chunks if c.get("status") == "failed"])
+            "word_count": len(full_text.split()),
+            "duration_seconds": len(segments) * CHUNK_DURATION_SECONDS,
+            "processing_status": "processing" if transcript.pending else "completed",
+            "chunk_count": chunk_count,
+            "completed_chunks": len(segments),
+            "failed_chunks": transcript.failed,
+            "pending_chunks": transcript.pending
         }
-    
+
     async def cleanup_old_chunks(self, max_age_hours: int = 24):
         """
         Clean up audio chunks older than specified hours.
         Called periodically or on round end.
+
+        Transcribed text stays in oral_round_transcripts; only audio files are removed.
         """
         cutoff = datetime.now(timezone.utc).timestamp() - (max_age_hours * 3600)
-        deleted_count = 0
-        
-        for chunk_id, status in list(_chunk_status.items()):
-            created_at = status.get("created_at")
-            if created_at:
+
+        def delete_old_files() -> int:
+            deleted = 0
+            for chunk_file in Path(AUDIO_UPLOAD_DIR).glob("*/*.webm"):
                 try:
-                    created_ts = datetime.fromisoformat(created_at).timestamp()
-                    if created_ts < cutoff:
-                        # Delete file if exists
-                        file_path = status.get("file_path")
-                        if file_path:
-                            try:
-                                Path(file_path).unlink(missing_ok=True)
-                                deleted_count += 1
-                            except Exception as e:
-                                logger.warning(f"Failed to delete chunk file {file_path}: {e}")
-                        
-                        # Remove from status
-                        del _chunk_status[chunk_id]
+                    if chunk_file.stat().st_mtime < cutoff:
+                        chunk_file.unlink(missing_ok=True)
+                        deleted += 1
                 except Exception as e:
-                    logger.warning(f"Error parsing chunk timestamp: {e}")
-        
+                    logger.warning(f"Failed to delete chunk file {chunk_file}: {e}")
+            return deleted
+
+        deleted_count = await asyncio.get_running_loop().run_in_executor(None, delete_old_files)
+
         if deleted_count > 0:
             logger.info(f"Cleaned up {deleted_count} old audio chunks")
-        
+
         return deleted_count
 
 
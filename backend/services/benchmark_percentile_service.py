@@ -36,10 +36,10 @@ CONSTRAINTS:
 """
 
 import logging
-from typing import Dict, List, Any, Optional
+from typing import Dict, List, Any, Optional, Tuple
 from datetime import datetime
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, and_
+from sqlalchemy import select, and_, or_, Select
 
 from backend.orm.user import User
 from backend.orm.subject import Subject
@@ -47,7 +47,8 @@ from backend.orm.subject_progress import SubjectProgress
 from backend.orm.practice_attempt import PracticeAttempt
 from backend.services.cohort_aggregation_service import (
     get_cohort_definition,
-    get_active_cohort_members,
+    active_cohort_members_query,
+    get_cohort_member_counts,
     get_cohort_subjects,
     ACTIVITY_WINDOW_DAYS,
 )
@@ -135,56 +136,49 @@ def get_relative_label(percentile: Optional[int], student_mastery: float, cohort
         return "Below average"
 
 
-async def get_student_mastery(
+async def get_subject_mastery_values(
     user_id: int,
-    subject_id: int,
+    subject_ids: List[int],
+    cohort_members: Select,
     db: AsyncSession
-) -> Optional[float]:
-    """
-    Get student's mastery for a subject.
-    
-    Uses subject_progress.completion_percentage.
-    Returns None if no progress data.
+) -> Tuple[Dict[int, List[float]], Dict[int, float]]:
     """
-    progress_stmt = select(SubjectProgress.completion_percentage).where(
-        and_(
-            SubjectProgress.user_id == user_id,
-            SubjectProgress.subject_id == subject_id
-        )
-    )
-    
-    result = await db.execute(progress_stmt)
-    row = result.fetchone()
+    Get cohort mastery values and the student's mastery for every subject.
     
-    if row and row[0] is not None:
-        return float(row[0])
-    return None
-
-
-async def get_cohort_mastery_values(
-    subject_id: int,
-    cohort_user_ids: List[int],
-    db: AsyncSession
-) -> List[float]:
-    """
-    Get all mastery values for a subject within the cohort.
+    One statement over subject_progress for all subjects; cohort_members
+    is the active-member SELECT (see active_cohort_members_query), applied
+    as a subquery.
     
-    Returns list of non-null completion_percentage values.
-    Used for percentile calculation.
+    Returns (cohort values by subject, student mastery by subject), using
+    non-null completion_percentage values only.
     """
-    if not cohort_user_ids:
-        return []
-    
-    progress_stmt = select(SubjectProgress.completion_percentage).where(
+    cohort_values: Dict[int, List[float]] = {subject_id: [] for subject_id in subject_ids}
+    student_mastery: Dict[int, float] = {}
+    if not subject_ids:
+        return cohort_values, student_mastery
+    
+    in_cohort = SubjectProgress.user_id.in_(cohort_members)
+    progress_stmt = select(
+        SubjectProgress.subject_id,
+        SubjectProgress.user_id,
+        SubjectProgress.completion_percentage,
+        in_cohort
+    ).where(
         and_(
-            SubjectProgress.subject_id == subject_id,
-            SubjectProgress.user_id.in_(cohort_user_ids),
-            SubjectProgress.completion_percentage.isnot(None)
+            SubjectProgress.subject_id.in_(subject_ids),
+            SubjectProgress.completion_percentage.isnot(None),
+            or_(in_cohort, SubjectProgress.user_id == user_id)
         )
     )
     
     result = await db.execute(progress_stmt)
-    return [float(row[0]) for row in result.fetchall() if row[0] is not None]
+    for subject_id, progress_user_id, mastery, is_member in result.all():
+        if is_member:
+            cohort_values[subject_id].append(float(mastery))
+        if progress_user_id == user_id:
+            student_mastery[subject_id] = float(mastery)
+    
+    return cohort_values, student_mastery
 
 
 async def get_student_attempt_count(
@@ -206,12 +200,11 @@ async def get_student_attempt_count(
     return result.scalar() or 0
 
 
-async def compute_subject_benchmark(
-    user_id: int,
+def compute_subject_benchmark(
     subject_id: int,
     subject_title: str,
-    cohort_user_ids: List[int],
-    db: AsyncSession
+    student_mastery: Optional[float],
+    cohort_values: List[float]
 ) -> Dict[str, Any]:
     """
     Compute benchmark metrics for a single subject.
@@ -229,9 +222,6 @@ async def compute_subject_benchmark(
         "cohort_size": 142
     }
     """
-    student_mastery = await get_student_mastery(user_id, subject_id, db)
-    cohort_values = await get_cohort_mastery_values(subject_id, cohort_user_ids, db)
-    
     if not cohort_values:
         return {
             "subject_id": subject_id,
@@ -421,30 +411,30 @@ async def get_benchmark_comparison(
             }
         }
     
-    cohort_user_ids = await get_active_cohort_members(course_id, semester, db)
+    cohort_members = active_cohort_members_query(course_id, semester)
     
     subjects = await get_cohort_subjects(course_id, semester, db)
     
-    subject_benchmarks = []
-    cohort_mastery_by_subject = {}
-    
-    for subject in subjects:
-        subject_id = subject["subject_id"]
-        cohort_values = await get_cohort_mastery_values(subject_id, cohort_user_ids, db)
-        cohort_mastery_by_subject[subject_id] = cohort_values
-        
-        benchmark = await compute_subject_benchmark(
-            user_id,
-            subject_id,
+    cohort_mastery_by_subject, student_mastery_by_subject = await get_subject_mastery_values(
+        user_id,
+        [subject["subject_id"] for subject in subjects],
+        cohort_members,
+        db
+    )
+    
+    subject_benchmarks = [
+        compute_subject_benchmark(
+            subject["subject_id"],
             subject["title"],
-            cohort_user_ids,
-            db
+            student_mastery_by_subject.get(subject["subject_id"]),
+            cohort_mastery_by_subject[subject["subject_id"]]
         )
-        subject_benchmarks.append(benchmark)
+        for subject in subjects
+    ]
     
     overall = compute_overall_benchmark(subject_benchmarks)
     
-    cohort_size = len(cohort_user_ids)
+    _, cohort_size = await get_cohort_member_counts(course_id, semester, db)
     small_cohort = cohort_size < MIN_COHORT_SIZE
     
     result = {
@@ -499,11 +489,7 @@ async def get_subject_percentile_detail(
     if "error" in cohort_def:
         return {"success": False, "error": cohort_def["error"]}
     
-    cohort_user_ids = await get_active_cohort_members(
-        cohort_def["course_id"], 
-        cohort_def["semester"], 
-        db
-    )
+    cohort_members = active_cohort_members_query(cohort_def["course_id"], cohort_def["semester"])
     
     subject_stmt = select(Subject).where(Subject.id == subject_id)
     subject_result = await db.execute(subject_stmt)
@@ -512,12 +498,17 @@ async def get_subject_percentile_detail(
     if not subject:
         return {"success": False, "error": "Subject not found"}
     
-    benchmark = await compute_subject_benchmark(
+    cohort_values, student_mastery = await get_subject_mastery_values(
         user_id,
+        [subject_id],
+        cohort_members,
+        db
+    )
+    benchmark = compute_subject_benchmark(
         subject_id,
         subject.title,
-        cohort_user_ids,
-        db
+        student_mastery.get(subject_id),
+        cohort_values[subject_id]
     )
     
     return {
@@ -4,17 +4,21 @@ Phase 6: CSV bulk upload service for student account creation
 """
 import os
 import csv
+import asyncio
 import logging
+import secrets
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Iterator, Set, Tuple
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select
+from sqlalchemy import select, insert, update
 from sqlalchemy.orm import selectinload
+from passlib.context import CryptContext
 
 from backend.orm.bulk_upload_session import BulkUploadSession, BulkUploadStatus
 from backend.orm.user import User, UserRole
 from backend.orm.institution import Institution
-from backend.auth import get_password_hash
+from backend.services.principal_cache import invalidate_principal
 
 logger = logging.getLogger(__name__)
 
@@ -22,6 +26,53 @@ logger = logging.getLogger(__name__)
 UPLOAD_DIR = os.getenv("BULK_UPLOAD_DIR", "uploads/bulk_uploads")
 os.makedirs(UPLOAD_DIR, exist_ok=True)
 
+# Rows parsed, looked up and inserted together
+IMPORT_CHUNK_SIZE = int(os.getenv("BULK_UPLOAD_CHUNK_SIZE", "500"))
+
+# Worker processes for bcrypt hashing
+HASH_WORKERS = int(os.getenv("BULK_UPLOAD_HASH_WORKERS", str(os.cpu_count() or 2)))
+
+# Temporary passwords are 96-bit random tokens that are never shown to anyone,
+# so key stretching adds no protection; a low cost factor keeps hashing cheap.
+TEMP_PASSWORD_BCRYPT_ROUNDS = int(os.getenv("BULK_UPLOAD_BCRYPT_ROUNDS", "4"))
+
+pwd_context = CryptContext(
+    schemes=["bcrypt"],
+    deprecated="auto",
+    bcrypt__rounds=TEMP_PASSWORD_BCRYPT_ROUNDS
+)
+
+_hash_pool: Optional[ProcessPoolExecutor] = None
+
+
+def _hash_passwords(passwords: List[str]) -> List[str]:
+    """Hash a batch of passwords (runs inside a worker process)"""
+    return [pwd_context.hash(password) for password in passwords]
+
+
+def _get_hash_pool() -> ProcessPoolExecutor:
+    """Lazily create the shared hashing pool"""
+    global _hash_pool
+    if _hash_pool is None:
+        _hash_pool = ProcessPoolExecutor(max_workers=HASH_WORKERS)
+    return _hash_pool
+
+
+async def _hash_in_pool(passwords: List[str]) -> List[str]:
+    """Hash passwords across the process pool, preserving order"""
+    loop = asyncio.get_running_loop()
+    pool = _get_hash_pool()
+    batch_size = max(1, -(-len(passwords) // HASH_WORKERS))
+    batches = [
+        passwords[i:i + batch_size]
+        for i in range(0, len(passwords), batch_size)
+    ]
+    results = await asyncio.gather(*[
+        loop.run_in_executor(pool, _hash_passwords, batch)
+        for batch in batches
+    ])
+    return [password_hash for batch in results for password_hash in batch]
+
 
 class BulkUploadService:
     """Service for handling bulk CSV uploads of student accounts"""
@@ -62,7 +113,13 @@ class BulkUploadService:
     ) -> None:
         """
         Process CSV file and create student accounts.
-        Target: Process 500 students in <60 seconds.
+        Target: Process 10,000 students in seconds.
+
+        Pipeline per chunk of IMPORT_CHUNK_SIZE rows:
+        1. Validate rows and drop duplicate emails
+        2. One IN query for all emails already registered
+        3. Hash temporary passwords in a process pool (off the event loop)
+        4. Bulk-insert new users and commit progress to the session row
         """
         # Get session
         result = await db.execute(
@@ -95,46 +152,26 @@ class BulkUploadService:
         # Prepare error log
         error_log_path = os.path.join(UPLOAD_DIR, f"errors_{session_id}.csv")
         errors = []
+        seen_emails = set()
         
         try:
-            with open(session.csv_file_path, 'r', encoding='utf-8') as f:
-                reader = csv.DictReader(f)
+            for chunk in cls._iter_csv_chunks(session.csv_file_path, IMPORT_CHUNK_SIZE):
+                success, chunk_errors = await cls._import_chunk(
+                    db, session.institution_id, chunk, seen_emails
+                )
                 
-                for row in reader:
-                    try:
-                        # Process each row
-                        success = await cls._process_student_row(
-                            db, session.institution_id, row
-                        )
-                        
-                        if success:
-                            session.success_count += 1
-                        else:
-                            session.error_count += 1
-                            errors.append({
-                                'row': row,
-                                'error': 'Failed to create account'
-                            })
-                        
-                        session.processed_rows += 1
-                        
-                        # Commit every 10 rows for performance
-                        if session.processed_rows % 10 == 0:
-                            await db.commit()
-                    
-                    except Exception as e:
-                        session.error_count += 1
-                        errors.append({
-                            'row': row,
-                            'error': str(e)
-                        })
-                        logger.error(f"Error processing row: {str(e)}")
+                # Publish progress once per chunk
+                session.success_count += success
+                session.error_count += len(chunk_errors)
+                session.processed_rows += len(chunk)
+                errors.extend(chunk_errors)
+                await db.commit()
             
             # Write error log if there are errors
             if errors:
                 with open(error_log_path, 'w', newline='', encoding='utf-8') as f:
                     fieldnames = list(errors[0]['row'].keys()) + ['error']
-                    writer = csv.DictWriter(f, fieldnames=fieldnames)
+                    writer = csv.DictWriter(f, fieldnames=fieldnames, extrasaction='ignore')
                     writer.writeheader()
                     for error in errors:
                         row = error['row'].copy()
@@ -153,72 +190,122 @@ class BulkUploadService:
             )
         
         except Exception as e:
+            await db.rollback()
             session.status = BulkUploadStatus.FAILED.value
             session.completed_at = datetime.utcnow()
             await db.commit()
             logger.error(f"Bulk upload session {session_id} failed: {str(e)}")
     
     @classmethod
-    async def _process_student_row(
+    async def process_csv_file_in_background(cls, session_id: int) -> None:
+        """
+        Background task entry point.
+        Uses a fresh database session so the request can return immediately.
+        """
+        from backend.database import AsyncSessionLocal
+        
+        async with AsyncSessionLocal() as db:
+            await cls.process_csv_file(db, session_id)
+    
+    @staticmethod
+    def _iter_csv_chunks(file_path: str, chunk_size: int) -> Iterator[List[Dict[str, str]]]:
+        """Stream the CSV in lists of at most chunk_size rows"""
+        with open(file_path, 'r', encoding='utf-8', newline='') as f:
+            reader = csv.DictReader(f)
+            chunk = []
+            for row in reader:
+                chunk.append(row)
+                if len(chunk) >= chunk_size:
+                    yield chunk
+                    chunk = []
+            if chunk:
+                yield chunk
+    
+    @classmethod
+    async def _import_chunk(
         cls,
         db: AsyncSession,
         institution_id: int,
-        row: Dict[str, str]
-    ) -> bool:
-        """Process a single student row and create account"""
-        try:
-            # Extract fields
-            name = row.get('name', '').strip()
-            email = row.get('email', '').strip().lower()
-            roll_number = row.get('roll_number', '').strip()
-            year = row.get('year', '').strip()
-            course = row.get('course', '').strip()
+        rows: List[Dict[str, str]],
+        seen_emails: Set[str]
+    ) -> Tuple[int, List[Dict[str, Any]]]:
+        """
+        Import one chunk of rows.
+        Returns: (success_count, errors)
+        """
+        errors = []
+        candidates: Dict[str, Dict[str, str]] = {}
+        
+        # Validate required fields
+        for row in rows:
+            name = (row.get('name') or '').strip()
+            email = (row.get('email') or '').strip().lower()
             
-            # Validate required fields
             if not name or not email:
-                logger.warning(f"Missing required fields: name={name}, email={email}")
-                return False
+                errors.append({'row': row, 'error': 'Missing required fields: name, email'})
+                continue
+            if email in seen_emails or email in candidates:
+                errors.append({'row': row, 'error': 'Duplicate email in upload'})
+                continue
             
-            # Check if user already exists
-            result = await db.execute(
-                select(User).where(User.email == email)
+            candidates[email] = {'name': name, 'email': email}
+        
+        seen_emails.update(candidates)
+        if not candidates:
+            return 0, errors
+        
+        # Check which users already exist (one query per chunk)
+        result = await db.execute(
+            select(User.id, User.email, User.institution_id).where(
+                User.email.in_(list(candidates))
             )
-            existing_user = result.scalar_one_or_none()
-            
-            if existing_user:
-                # Update institution if not set
-                if not existing_user.institution_id:
-                    existing_user.institution_id = institution_id
-                logger.info(f"User {email} already exists, updated institution")
-                return True
-            
-            # Generate password (random, user will use SSO or reset password)
-            import secrets
-            temp_password = secrets.token_urlsafe(12)
-            
-            # Create user
-            new_user = User(
-                email=email,
-                name=name,
-                hashed_password=get_password_hash(temp_password),
-                institution_id=institution_id,
-                role=UserRole.STUDENT,
-                is_active=True
+        )
+        existing = result.all()
+        
+        # Attach existing users without an institution
+        unassigned = [row for row in existing if not row.institution_id]
+        if unassigned:
+            await db.execute(
+                update(User)
+                .where(User.id.in_([row.id for row in unassigned]))
+                .values(institution_id=institution_id)
             )
-            
-            # Set additional metadata if available
-            if roll_number:
-                # Could store in a profile table or JSON field
-                pass
-            
-            db.add(new_user)
-            
-            logger.info(f"Created user: {email} for institution {institution_id}")
-            return True
+            for row in unassigned:
+                invalidate_principal(row.email)
         
-        except Exception as e:
-            logger.error(f"Error processing student row: {str(e)}")
-            return False
+        for row in existing:
+            candidates.pop(row.email, None)
+        
+        if not candidates:
+            return len(existing), errors
+        
+        # Generate passwords (random, user will use SSO or reset password)
+        # and hash them off the event loop
+        password_hashes = await _hash_in_pool(
+            [secrets.token_urlsafe(12) for _ in candidates]
+        )
+        
+        # Create users
+        await db.execute(
+            insert(User),
+            [
+                {
+                    'email': candidate['email'],
+                    'full_name': candidate['name'],
+                    'password_hash': password_hash,
+                    'institution_id': institution_id,
+                    'role': UserRole.STUDENT,
+                    'is_active': True,
+                }
+                for candidate, password_hash in zip(candidates.values(), password_hashes)
+            ]
+        )
+        
+        logger.info(
+            f"Imported chunk for institution {institution_id}: "
+            f"{len(candidates)} created, {len(existing)} existing, {len(errors)} errors"
+        )
+        return len(candidates) + len(existing), errors
     
     @classmethod
     async def get_session_status(
@@ -0,0 +1,171 @@
+"""
+backend/services/certificate_batch_service.py
+Phase 5: Issue certificates for every participant of a competition
+
+Recipients are resolved with one query (team members joined to the
+competition's overall ranking), rendered in the certificate process pool
+and written with one bulk insert. Progress is tracked per batch so the
+issuing admin can poll it.
+"""
+import uuid
+import logging
+from collections import OrderedDict
+from dataclasses import dataclass, field, asdict
+from datetime import datetime
+from typing import Dict, List, Optional
+
+from sqlalchemy import select, insert, and_
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from backend.orm.competition import Competition
+from backend.orm.competition_certificate import CompetitionCertificate
+from backend.orm.ranking import TeamRanking, RankingType
+from backend.orm.team import Team, TeamMember
+from backend.orm.user import User
+from backend.services.certificate_generator import get_certificate_generator
+
+logger = logging.getLogger(__name__)
+
+# Finished batches kept for progress polling
+BATCH_HISTORY_MAX_SIZE = 100
+
+
+@dataclass
+class CertificateBatch:
+    """Progress of one certificate batch"""
+    batch_id: str
+    competition_id: int
+    requested_by: int
+    status: str = "pending"  # pending, rendering, saving, completed, failed
+    total: int = 0
+    rendered: int = 0
+    issued: int = 0
+    error: Optional[str] = None
+    started_at: str = field(default_factory=lambda: datetime.utcnow().isoformat())
+    completed_at: Optional[str] = None
+
+    def to_dict(self) -> dict:
+        data = asdict(self)
+        data["progress_percentage"] = int(self.rendered / self.total * 100) if self.total else 0
+        return data
+
+
+_batches: "OrderedDict[str, CertificateBatch]" = OrderedDict()
+
+
+def create_batch(competition_id: int, requested_by: int) -> CertificateBatch:
+    """Register a new batch for progress tracking"""
+    batch = CertificateBatch(batch_id=str(uuid.uuid4()), competition_id=competition_id, requested_by=requested_by)
+    _batches[batch.batch_id] = batch
+    while len(_batches) > BATCH_HISTORY_MAX_SIZE:
+        _batches.popitem(last=False)
+    return batch
+
+
+def get_batch(batch_id: str) -> Optional[CertificateBatch]:
+    """Get progress of a batch"""
+    return _batches.get(batch_id)
+
+
+async def _load_recipients(db: AsyncSession, competition_id: int) -> List[Dict]:
+    """Every ranked team member without a valid certificate for the competition"""
+    issued = select(CompetitionCertificate.user_id).where(
+        and_(
+            CompetitionCertificate.competition_id == competition_id,
+            CompetitionCertificate.is_revoked == False
+        )
+    )
+    result = await db.execute(
+        select(
+            User.id, User.full_name, Team.id, Team.name, TeamRanking.rank, TeamRanking.total_score
+        )
+        .select_from(TeamMember)
+        .join(Team, Team.id == TeamMember.team_id)
+        .join(User, User.id == TeamMember.user_id)
+        .join(
+            TeamRanking,
+            and_(
+                TeamRanking.team_id == Team.id,
+                TeamRanking.competition_id == competition_id,
+                TeamRanking.ranking_type == RankingType.OVERALL,
+                TeamRanking.round_id.is_(None)
+            )
+        )
+        .where(
+            Team.competition_id == competition_id,
+            TeamMember.user_id.not_in(issued)
+        )
+        .order_by(TeamRanking.rank, Team.id, User.id)
+    )
+
+    recipients: Dict[int, Dict] = {}
+    for user_id, user_name, team_id, team_name, rank, total_score in result.all():
+        # A user in several teams gets the certificate of their best-ranked team
+        recipients.setdefault(user_id, {
+            "user_id": user_id,
+            "user_name": user_name,
+            "team_id": team_id,
+            "team_name": team_name,
+            "final_rank": rank,
+            "total_score": total_score or 0.0
+        })
+    return list(recipients.values())
+
+
+async def issue_competition_certificates(db: AsyncSession, batch: CertificateBatch) -> CertificateBatch:
+    """
+    Render and store certificates for every ranked participant of a competition.
+    Participants who already hold a valid certificate are skipped.
+    """
+    try:
+        competition = (await db.execute(
+            select(Competition).where(Competition.id == batch.competition_id)
+        )).scalar_one_or_none()
+        if not competition:
+            raise ValueError(f"Competition {batch.competition_id} not found")
+
+        recipients = await _load_recipients(db, batch.competition_id)
+        batch.total = len(recipients)
+        batch.status = "rendering"
+
+        competition_dates = f"{competition.start_date.strftime('%B %d')} - {competition.oral_end_date.strftime('%B %d, %Y')}"
+
+        def on_progress(rendered: int) -> None:
+            batch.rendered = rendered
+
+        rows = await get_certificate_generator().generate_batch(
+            competition_id=batch.competition_id,
+            competition_title=competition.title,
+            competition_dates=competition_dates,
+            recipients=recipients,
+            on_progress=on_progress
+        )
+
+        batch.status = "saving"
+        if rows:
+            await db.execute(insert(CompetitionCertificate), rows)
+            await db.commit()
+
+        batch.issued = len(rows)
+        batch.status = "completed"
+        logger.info(f"Issued {batch.issued} certificates for competition {batch.competition_id}")
+
+    except Exception as e:
+        await db.rollback()
+        batch.status = "failed"
+        batch.error = str(e)
+        logger.error(f"Certificate batch {batch.batch_id} failed: {e}")
+
+    batch.completed_at = datetime.utcnow().isoformat()
+    return batch
+
+
+async def issue_competition_certificates_in_background(batch: CertificateBatch) -> None:
+    """
+    Background task entry point.
+    Uses a fresh database session so the request can return immediately.
+    """
+    from backend.database import AsyncSessionLocal
+
+    async with AsyncSessionLocal() as db:
+        await issue_competition_certificates(db, batch)
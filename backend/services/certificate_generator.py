@@ -2,11 +2,19 @@
 backend/services/certificate_generator.py
 Phase 5: Certificate PDF generation service
 Isolated service - NEW FILE
+
+BATCH MODE:
+Certificates for a whole competition are rendered in chunks across a
+process pool. Each worker builds the certificate template (styles and
+static text) once and reuses one QR encoder for its whole chunk, and the
+caller receives certificate rows ready for a single bulk insert.
 """
 import os
+import asyncio
 import hashlib
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime
-from typing import Optional, Tuple
+from typing import Any, Callable, Dict, List, Optional, Tuple
 from io import BytesIO
 
 # ReportLab imports for PDF generation
@@ -33,6 +41,217 @@ except ImportError:
 
 from backend.orm.competition_certificate import CompetitionCertificate, generate_certificate_code
 
+# Worker processes for batch rendering
+CERT_RENDER_WORKERS = int(os.getenv("CERT_RENDER_WORKERS", str(os.cpu_count() or 2)))
+
+# Certificates rendered per worker task
+CERT_RENDER_CHUNK_SIZE = int(os.getenv("CERT_RENDER_CHUNK_SIZE", "25"))
+
+QR_IMAGE_SIZE = 200
+
+_render_pool: Optional[ProcessPoolExecutor] = None
+
+
+def _get_render_pool() -> ProcessPoolExecutor:
+    """Lazily create the shared rendering pool"""
+    global _render_pool
+    if _render_pool is None:
+        _render_pool = ProcessPoolExecutor(max_workers=CERT_RENDER_WORKERS)
+    return _render_pool
+
+
+def _rank_display(rank: int) -> str:
+    """Get human-readable rank display"""
+    rank_suffixes = {1: "st", 2: "nd", 3: "rd"}
+    suffix = rank_suffixes.get(rank, "th")
+    return f"{rank}{suffix} Place"
+
+
+def _signature(user_id: int, competition_id: int, team_id: int, final_rank: int,
+               total_score: float, cert_code: str) -> str:
+    """SHA-256 digital signature of certificate data"""
+    cert_data = f"{user_id}:{competition_id}:{team_id}:{final_rank}:{total_score}:{cert_code}:{datetime.utcnow().isoformat()}"
+    return hashlib.sha256(cert_data.encode()).hexdigest()
+
+
+# ================= TEMPLATE (built once per process) =================
+
+class _CertificateTemplate:
+    """Styles and static content shared by every certificate"""
+
+    def __init__(self, maroon, gold):
+        styles = getSampleStyleSheet()
+
+        self.title_style = ParagraphStyle(
+            'NLSIUTitle',
+            parent=styles['Heading1'],
+            fontSize=14,
+            textColor=maroon,
+            alignment=1,  # Center
+            spaceAfter=6
+        )
+        self.cert_title_style = ParagraphStyle(
+            'CertTitle',
+            parent=styles['Heading2'],
+            fontSize=24,
+            textColor=gold,
+            alignment=1,
+            spaceAfter=20
+        )
+        self.name_style = ParagraphStyle(
+            'StudentName',
+            parent=styles['Heading1'],
+            fontSize=28,
+            textColor=maroon,
+            alignment=1,
+            spaceAfter=10
+        )
+        self.body_style = ParagraphStyle(
+            'BodyText',
+            parent=styles['Normal'],
+            fontSize=12,
+            textColor=colors.black,
+            alignment=1,
+            spaceAfter=8
+        )
+        self.sig_style = ParagraphStyle(
+            'Signature',
+            parent=styles['Normal'],
+            fontSize=8,
+            textColor=colors.gray,
+            alignment=1
+        )
+        self.qr_table_style = TableStyle([
+            ('ALIGN', (0, 0), (-1, -1), 'CENTER'),
+            ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
+        ])
+
+    def render(
+        self,
+        pdf_path: str,
+        user_name: str,
+        competition_title: str,
+        competition_dates: str,
+        team_name: str,
+        final_rank: int,
+        total_score: float,
+        cert_code: str,
+        qr_image,
+        verification_url: str,
+        issue_date: str
+    ) -> None:
+        """Render one certificate PDF"""
+        doc = SimpleDocTemplate(
+            pdf_path,
+            pagesize=A4,
+            rightMargin=20*mm,
+            leftMargin=20*mm,
+            topMargin=20*mm,
+            bottomMargin=20*mm
+        )
+
+        details_text = f"""
+        has successfully participated in and completed<br/><br/>
+        <b>{competition_title}</b><br/>
+        held from {competition_dates}<br/><br/>
+        as a member of <b>{team_name}</b><br/><br/>
+        achieving <b>{_rank_display(final_rank)}</b> with an overall score of <b>{total_score:.2f}/5.0</b>
+        """
+
+        qr_table = Table(
+            [[Image(qr_image, width=30*mm, height=30*mm),
+              Paragraph(f"<b>Verify Online</b><br/>{verification_url}<br/><br/>Certificate Code:<br/>{cert_code[:16]}...", self.body_style)]],
+            colWidths=[40*mm, 120*mm]
+        )
+        qr_table.setStyle(self.qr_table_style)
+
+        doc.build([
+            Paragraph("NATIONAL LAW SCHOOL OF INDIA UNIVERSITY", self.title_style),
+            Spacer(1, 10),
+            Paragraph("CERTIFICATE OF ACHIEVEMENT", self.cert_title_style),
+            Spacer(1, 20),
+            Paragraph("This certifies that<br/><br/>", self.body_style),
+            Paragraph(user_name.upper(), self.name_style),
+            Spacer(1, 10),
+            Paragraph(details_text, self.body_style),
+            Spacer(1, 30),
+            Paragraph(f"Issued on: {issue_date}", self.body_style),
+            Spacer(1, 40),
+            qr_table,
+            Spacer(1, 20),
+            Paragraph(f"Digital Signature: {cert_code}", self.sig_style),
+        ])
+
+
+_template: Optional[_CertificateTemplate] = None
+
+
+def _get_template() -> _CertificateTemplate:
+    """Template of the current process, built on first use"""
+    global _template
+    if _template is None:
+        _template = _CertificateTemplate(CertificateGenerator.NLSIU_MAROON, CertificateGenerator.NLSIU_GOLD)
+    return _template
+
+
+# Any mask is valid per the QR spec; fixing one skips scoring all eight per code
+QR_MASK_PATTERN = 0
+
+
+def _new_qr_encoder():
+    return qrcode.QRCode(
+        version=None,
+        error_correction=qrcode.constants.ERROR_CORRECT_H,
+        box_size=10,
+        border=4,
+        mask_pattern=QR_MASK_PATTERN,
+    )
+
+
+def _render_qr(encoder, url: str, output_path: str, size: int = QR_IMAGE_SIZE, fit: bool = True) -> None:
+    """
+    Encode url with a reusable encoder and save the QR image.
+
+    fit=False keeps the version fitted for an earlier code of the same length.
+    """
+    encoder.clear()
+    encoder.add_data(url)
+    encoder.make(fit=fit)
+
+    img = encoder.make_image(fill_color="black", back_color="white")
+    img = img.resize((size, size))
+    img.save(output_path)
+
+
+def _render_certificate_chunk(competition: Dict[str, Any], items: List[Dict[str, Any]]) -> int:
+    """
+    Render QR images and PDFs for a chunk of certificates
+    (runs inside a worker process).
+
+    Returns number of certificates rendered.
+    """
+    template = _get_template()
+    encoder = _new_qr_encoder()
+
+    for index, item in enumerate(items):
+        # Verification URLs in a batch share one length, so the first fit holds for all
+        _render_qr(encoder, item["verification_url"], item["qr_path"], fit=index == 0)
+        template.render(
+            pdf_path=item["pdf_path"],
+            user_name=item["user_name"],
+            competition_title=competition["title"],
+            competition_dates=competition["dates"],
+            team_name=item["team_name"],
+            final_rank=item["final_rank"],
+            total_score=item["total_score"],
+            cert_code=item["certificate_code"],
+            qr_image=item["qr_path"],
+            verification_url=item["verification_url"],
+            issue_date=competition["issue_date"]
+        )
+
+    return len(items)
+
 
 class CertificateGenerator:
     """
@@ -85,28 +304,28 @@ class CertificateGenerator:
         qr_filename = f"qr_{cert_code}.png"
         qr_path = os.path.join(self.qr_dir, qr_filename)
         
-        # Generate QR code
+        # Generate QR code and PDF off the event loop
         verification_url = f"{base_url}/verify/{cert_code}"
-        self._generate_qr_code(verification_url, qr_path)
-        
-        # Generate PDF
-        self._generate_pdf(
-            pdf_path=pdf_path,
-            user_name=user_name,
-            user_photo_path=user_photo_path,
-            competition_title=competition_title,
-            competition_dates=competition_dates,
-            team_name=team_name,
-            final_rank=final_rank,
-            total_score=total_score,
-            cert_code=cert_code,
-            qr_path=qr_path,
-            verification_url=verification_url
-        )
+        competition = {
+            "title": competition_title,
+            "dates": competition_dates,
+            "issue_date": datetime.now().strftime("%B %d, %Y")
+        }
+        item = {
+            "user_name": user_name,
+            "team_name": team_name,
+            "final_rank": final_rank,
+            "total_score": total_score,
+            "certificate_code": cert_code,
+            "pdf_path": pdf_path,
+            "qr_path": qr_path,
+            "verification_url": verification_url
+        }
+        loop = asyncio.get_running_loop()
+        await loop.run_in_executor(_get_render_pool(), _render_certificate_chunk, competition, [item])
         
         # Calculate digital signature (SHA-256 hash of certificate data)
-        cert_data = f"{user_id}:{competition_id}:{team_id}:{final_rank}:{total_score}:{cert_code}:{datetime.utcnow().isoformat()}"
-        digital_signature = hashlib.sha256(cert_data.encode()).hexdigest()
+        digital_signature = _signature(user_id, competition_id, team_id, final_rank, total_score, cert_code)
         
         # Create certificate object
         certificate = CompetitionCertificate(
@@ -123,157 +342,94 @@ class CertificateGenerator:
         
         return certificate, pdf_path, qr_path
     
-    def _generate_qr_code(self, url: str, output_path: str, size: int = 200):
-        """Generate QR code image"""
-        qr = qrcode.QRCode(
-            version=1,
-            error_correction=qrcode.constants.ERROR_CORRECT_H,
-            box_size=10,
-            border=4,
-        )
-        qr.add_data(url)
-        qr.make(fit=True)
-        
-        img = qr.make_image(fill_color="black", back_color="white")
-        img = img.resize((size, size))
-        img.save(output_path)
+    def _get_rank_display(self, rank: int) -> str:
+        """Get human-readable rank display"""
+        return _rank_display(rank)
     
-    def _generate_pdf(
+    def _prepare_batch(
         self,
-        pdf_path: str,
-        user_name: str,
-        user_photo_path: Optional[str],
+        competition_id: int,
+        recipients: List[Dict[str, Any]],
+        base_url: str,
+        pdf_ext: str = "pdf",
+        qr_ext: str = "png"
+    ) -> Tuple[List[Dict[str, Any]], List[Dict[str, Any]]]:
+        """Assign codes and file paths. Returns (render items, certificate rows)."""
+        items = []
+        rows = []
+        for recipient in recipients:
+            cert_code = generate_certificate_code()
+            item = {
+                **recipient,
+                "certificate_code": cert_code,
+                "pdf_path": os.path.join(self.upload_dir, f"cert_{cert_code}.{pdf_ext}"),
+                "qr_path": os.path.join(self.qr_dir, f"qr_{cert_code}.{qr_ext}"),
+                "verification_url": f"{base_url}/verify/{cert_code}"
+            }
+            items.append(item)
+            rows.append({
+                "user_id": recipient["user_id"],
+                "competition_id": competition_id,
+                "team_id": recipient["team_id"],
+                "final_rank": recipient["final_rank"],
+                "total_score": recipient["total_score"],
+                "certificate_code": cert_code,
+                "pdf_file_path": item["pdf_path"],
+                "qr_image_path": item["qr_path"],
+                "digital_signature": _signature(
+                    recipient["user_id"], competition_id, recipient["team_id"],
+                    recipient["final_rank"], recipient["total_score"], cert_code
+                )
+            })
+        return items, rows
+    
+    async def generate_batch(
+        self,
+        competition_id: int,
         competition_title: str,
         competition_dates: str,
-        team_name: str,
-        final_rank: int,
-        total_score: float,
-        cert_code: str,
-        qr_path: str,
-        verification_url: str
-    ):
-        """Generate NLSIU-branded certificate PDF"""
-        # Create PDF document
-        doc = SimpleDocTemplate(
-            pdf_path,
-            pagesize=A4,
-            rightMargin=20*mm,
-            leftMargin=20*mm,
-            topMargin=20*mm,
-            bottomMargin=20*mm
-        )
-        
-        # Container for elements
-        elements = []
-        
-        # Styles
-        styles = getSampleStyleSheet()
-        
-        # Custom styles
-        title_style = ParagraphStyle(
-            'NLSIUTitle',
-            parent=styles['Heading1'],
-            fontSize=14,
-            textColor=self.NLSIU_MAROON,
-            alignment=1,  # Center
-            spaceAfter=6
-        )
-        
-        cert_title_style = ParagraphStyle(
-            'CertTitle',
-            parent=styles['Heading2'],
-            fontSize=24,
-            textColor=self.NLSIU_GOLD,
-            alignment=1,
-            spaceAfter=20
-        )
-        
-        name_style = ParagraphStyle(
-            'StudentName',
-            parent=styles['Heading1'],
-            fontSize=28,
-            textColor=self.NLSIU_MAROON,
-            alignment=1,
-            spaceAfter=10
-        )
-        
-        body_style = ParagraphStyle(
-            'BodyText',
-            parent=styles['Normal'],
-            fontSize=12,
-            textColor=colors.black,
-            alignment=1,
-            spaceAfter=8
-        )
-        
-        # Add NLSIU Header
-        elements.append(Paragraph("NATIONAL LAW SCHOOL OF INDIA UNIVERSITY", title_style))
-        elements.append(Spacer(1, 10))
-        
-        # Certificate Title
-        elements.append(Paragraph("CERTIFICATE OF ACHIEVEMENT", cert_title_style))
-        elements.append(Spacer(1, 20))
-        
-        # Certification text
-        cert_text = f"""
-        This certifies that<br/><br/>
+        recipients: List[Dict[str, Any]],
+        base_url: str = "https://juris.ai",
+        on_progress: Optional[Callable[[int], None]] = None
+    ) -> List[Dict[str, Any]]:
         """
-        elements.append(Paragraph(cert_text, body_style))
+        Render certificates for many participants across the process pool.
         
-        # Student Name (prominent)
-        elements.append(Paragraph(user_name.upper(), name_style))
-        elements.append(Spacer(1, 10))
+        Args:
+            recipients: Dicts with user_id, user_name, team_id, team_name,
+                final_rank, total_score
+            on_progress: Called with the number of certificates rendered so far
         
-        # Competition details
-        details_text = f"""
-        has successfully participated in and completed<br/><br/>
-        <b>{competition_title}</b><br/>
-        held from {competition_dates}<br/><br/>
-        as a member of <b>{team_name}</b><br/><br/>
-        achieving <b>{self._get_rank_display(final_rank)}</b> with an overall score of <b>{total_score:.2f}/5.0</b>
+        Returns:
+            CompetitionCertificate rows (column dicts) for one bulk insert
         """
-        elements.append(Paragraph(details_text, body_style))
-        elements.append(Spacer(1, 30))
+        if not REPORTLAB_AVAILABLE:
+            raise ImportError("ReportLab is required for PDF generation. Install with: pip install reportlab")
         
-        # Date
-        issue_date = datetime.now().strftime("%B %d, %Y")
-        elements.append(Paragraph(f"Issued on: {issue_date}", body_style))
-        elements.append(Spacer(1, 40))
+        if not QRCODE_AVAILABLE:
+            raise ImportError("qrcode is required for QR generation. Install with: pip install qrcode")
         
-        # QR Code and verification section
-        qr_data = [
-            [Image(qr_path, width=30*mm, height=30*mm), 
-             Paragraph(f"<b>Verify Online</b><br/>{verification_url}<br/><br/>Certificate Code:<br/>{cert_code[:16]}...", body_style)]
+        items, rows = self._prepare_batch(competition_id, recipients, base_url)
+        competition = {
+            "title": competition_title,
+            "dates": competition_dates,
+            "issue_date": datetime.now().strftime("%B %d, %Y")
+        }
+        
+        loop = asyncio.get_running_loop()
+        pool = _get_render_pool()
+        chunks = [
+            loop.run_in_executor(pool, _render_certificate_chunk, competition, items[i:i + CERT_RENDER_CHUNK_SIZE])
+            for i in range(0, len(items), CERT_RENDER_CHUNK_SIZE)
         ]
         
-        qr_table = Table(qr_data, colWidths=[40*mm, 120*mm])
-        qr_table.setStyle(TableStyle([
-            ('ALIGN', (0, 0), (-1, -1), 'CENTER'),
-            ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
-        ]))
-        
-        elements.append(qr_table)
-        elements.append(Spacer(1, 20))
+        rendered = 0
+        for chunk in asyncio.as_completed(chunks):
+            rendered += await chunk
+            if on_progress is not None:
+                on_progress(rendered)
         
-        # Digital signature hash
-        sig_text = f"Digital Signature: {cert_code}"
-        sig_style = ParagraphStyle(
-            'Signature',
-            parent=styles['Normal'],
-            fontSize=8,
-            textColor=colors.gray,
-            alignment=1
-        )
-        elements.append(Paragraph(sig_text, sig_style))
-        
-        # Build PDF
-        doc.build(elements)
-    
-    def _get_rank_display(self, rank: int) -> str:
-        """Get human-readable rank display"""
-        rank_suffixes = {1: "st", 2: "nd", 3: "rd"}
-        suffix = rank_suffixes.get(rank, "th")
-        return f"{rank}{suffix} Place"
+        return rows
     
     def verify_certificate_exists(self, pdf_path: str) -> bool:
         """Check if certificate PDF exists"""
@@ -319,6 +475,32 @@ class MockCertificateGenerator(CertificateGenerator):
         certificate.certificate_code = cert_code
         
         return certificate, pdf_path, qr_path
+    
+    async def generate_batch(
+        self,
+        competition_id: int,
+        competition_title: str,
+        competition_dates: str,
+        recipients: List[Dict[str, Any]],
+        base_url: str = "https://juris.ai",
+        on_progress: Optional[Callable[[int], None]] = None
+    ) -> List[Dict[str, Any]]:
+        """Create certificate rows with placeholder files"""
+        items, rows = self._prepare_batch(competition_id, recipients, base_url, "placeholder", "placeholder")
+        
+        for item in items:
+            with open(item["pdf_path"], 'w') as f:
+                f.write(f"Placeholder certificate: {item['certificate_code']}\n")
+            with open(item["qr_path"], 'w') as f:
+                f.write(f"Placeholder QR: {item['certificate_code']}\n")
+        
+        for row in rows:
+            row["digital_signature"] = None
+        
+        if on_progress is not None:
+            on_progress(len(rows))
+        
+        return rows
 
 
 def get_certificate_generator() -> CertificateGenerator:
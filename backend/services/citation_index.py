@@ -0,0 +1,189 @@
+"""
+backend/services/citation_index.py
+Persisted normalized-citation index and batch citation verification
+
+PURPOSE:
+Guardrails must confirm that every case an AI response cites exists in
+case_content. Instead of two wildcard ILIKE scans per cited case, each
+case is indexed under normalized keys (party pairs and parsed SCC/AIR
+citations) in case_citation_keys, and a whole response is verified with:
+1. An in-memory set of keys already confirmed (no query on a hit)
+2. ONE indexed `key IN (...)` query for whatever is left
+3. For party pairs that miss the index (short forms such as
+   "Kesavananda v. State of Kerala"), ONE query for stored case names
+   containing both parties
+
+SYNC:
+Index rows are written in the same flush as CaseContent inserts/updates
+(mapper events) and backfilled at startup by sync_citation_index().
+"""
+
+import logging
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+from sqlalchemy import and_, or_, select, delete, event, inspect, insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from backend.orm.case_content import CaseContent
+from backend.orm.case_citation_key import CaseCitationKey
+from backend.utils.citation_normalizer import (
+    case_name_keys, parse_citation, split_case_name
+)
+
+logger = logging.getLogger(__name__)
+
+KNOWN_KEYS_MAX_SIZE = 200_000
+
+# Keys confirmed to exist in case_citation_keys
+_known_keys: Set[str] = set()
+
+
+def case_index_keys(case_name: str, citation: Optional[str]) -> List[Tuple[str, str]]:
+    """All (key, kind) pairs a case is indexed under"""
+    keys: List[Tuple[str, str]] = []
+
+    parties = split_case_name(case_name or "")
+    if parties:
+        keys.extend((key, "parties") for key in case_name_keys(*parties))
+
+    parsed = parse_citation(citation or "")
+    if parsed:
+        keys.append((parsed.key, "citation"))
+
+    return list(dict.fromkeys(keys))
+
+
+def _remember(keys: Iterable[str]) -> None:
+    """Add confirmed keys to the in-memory fast path"""
+    if len(_known_keys) > KNOWN_KEYS_MAX_SIZE:
+        _known_keys.clear()
+    _known_keys.update(keys)
+
+
+def clear_known_keys() -> None:
+    """Drop the in-memory fast path (after deletes or renames)"""
+    _known_keys.clear()
+
+
+async def find_unverified(db: AsyncSession, citations: Dict[str, List[str]]) -> List[str]:
+    """
+    Verify a batch of citations.
+
+    Args:
+        citations: label → candidate keys; a citation is verified when ANY
+            of its keys is indexed (citations without keys are skipped)
+
+    Returns:
+        Labels of citations with no indexed key, in input order
+    """
+    pending = {
+        label: keys for label, keys in citations.items()
+        if keys and not any(key in _known_keys for key in keys)
+    }
+    if not pending:
+        return []
+
+    lookup = {key for keys in pending.values() for key in keys}
+    result = await db.execute(
+        select(CaseCitationKey.key).where(CaseCitationKey.key.in_(lookup)).distinct()
+    )
+    found = set(result.scalars().all())
+    _remember(found)
+
+    return [
+        label for label, keys in pending.items()
+        if not any(key in found for key in keys)
+    ]
+
+
+async def match_party_names(db: AsyncSession, pairs: Dict[str, Tuple[str, str]]) -> Set[str]:
+    """
+    Fallback for party pairs that miss the index.
+
+    Args:
+        pairs: label → (party1, party2) as cited
+
+    Returns:
+        Labels whose parties both appear in some stored case name
+    """
+    if not pairs:
+        return set()
+
+    result = await db.execute(
+        select(CaseContent.case_name).where(or_(*(
+            and_(CaseContent.case_name.ilike(f"%{party1}%"), CaseContent.case_name.ilike(f"%{party2}%"))
+            for party1, party2 in pairs.values()
+        ))).distinct()
+    )
+    case_names = [name.lower() for name in result.scalars().all()]
+
+    return {
+        label for label, (party1, party2) in pairs.items()
+        if any(party1.lower() in name and party2.lower() in name for name in case_names)
+    }
+
+
+async def sync_citation_index(db: AsyncSession) -> int:
+    """
+    Index every case that has no index rows yet.
+
+    Returns number of cases indexed.
+    """
+    indexed = select(CaseCitationKey.case_id).distinct()
+    result = await db.execute(
+        select(CaseContent.id, CaseContent.case_name, CaseContent.citation)
+        .where(CaseContent.id.not_in(indexed))
+    )
+    rows = [
+        {"case_id": case_id, "key": key, "kind": kind}
+        for case_id, case_name, citation in result.all()
+        for key, kind in case_index_keys(case_name, citation)
+    ]
+
+    if rows:
+        await db.execute(insert(CaseCitationKey), rows)
+        await db.commit()
+
+    case_count = len({row["case_id"] for row in rows})
+    if case_count:
+        logger.info(f"Citation index: indexed {case_count} cases ({len(rows)} keys)")
+    return case_count
+
+
+# ================= SYNC WITH case_content =================
+
+def _write_keys(connection, target: CaseContent) -> None:
+    rows = [
+        {"case_id": target.id, "key": key, "kind": kind}
+        for key, kind in case_index_keys(target.case_name, target.citation)
+    ]
+    if rows:
+        connection.execute(insert(CaseCitationKey.__table__), rows)
+
+
+@event.listens_for(CaseContent, "after_insert")
+def _on_case_insert(mapper, connection, target: CaseContent) -> None:
+    """Index a new case in the same transaction"""
+    _write_keys(connection, target)
+
+
+@event.listens_for(CaseContent, "after_update")
+def _on_case_update(mapper, connection, target: CaseContent) -> None:
+    """Re-index when the name or citation changes"""
+    state = inspect(target)
+    if not (state.attrs.case_name.history.has_changes() or state.attrs.citation.history.has_changes()):
+        return
+    connection.execute(
+        delete(CaseCitationKey.__table__).where(CaseCitationKey.__table__.c.case_id == target.id)
+    )
+    _write_keys(connection, target)
+    clear_known_keys()
+
+
+@event.listens_for(CaseContent, "after_delete")
+def _on_case_delete(mapper, connection, target: CaseContent) -> None:
+    """Drop index rows of a deleted case"""
+    connection.execute(
+        delete(CaseCitationKey.__table__).where(CaseCitationKey.__table__.c.case_id == target.id)
+    )
+    clear_known_keys()
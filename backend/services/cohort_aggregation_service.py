@@ -46,17 +46,36 @@ CALCULATION RULES:
 =================
 - Use subject_progress.completion_percentage as mastery proxy
 - Ignore NULL or missing mastery
-- Use P50 for median
+- Use P50 for median (approximated from a 1-point histogram, within 1 point)
 - Deterministic SQL/Python logic (no randomness)
 - Same input → same result
+
+QUERY SHAPE:
+===========
+Cohort membership is a subquery (course, semester, activity window), never
+a list of user ids. Every subject's count, mean, distribution buckets and
+histogram come from one grouped statement, so a cohort page costs the
+same number of queries for any cohort size or subject count.
+
+CACHING:
+=======
+Aggregations are cached per cohort and version. A cohort's version is
+bumped when a member's subject_progress changes, or when a user
+joins/leaves the cohort. Practice attempts do not bump it: they only move
+students into the activity window, which entries pick up when they
+expire after COHORT_CACHE_TTL_SECONDS (as do other workers' writes).
+COHORT_CACHE_TTL_SECONDS=0 disables the cache.
 """
 
+import os
+import copy
+import time
 import logging
-from typing import Dict, List, Any, Optional
+from collections import OrderedDict
+from typing import Dict, List, Any, Optional, Tuple
 from datetime import datetime, timedelta
-import statistics
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, and_, func, distinct
+from sqlalchemy import select, and_, func, case, cast, event, inspect, Integer, Select
 
 from backend.orm.user import User
 from backend.orm.course import Course
@@ -71,6 +90,17 @@ ACTIVITY_WINDOW_DAYS = 90
 DISTRIBUTION_WEAK_THRESHOLD = 40
 DISTRIBUTION_STRONG_THRESHOLD = 70
 
+COHORT_CACHE_TTL_SECONDS = float(os.getenv("COHORT_CACHE_TTL_SECONDS", "300"))
+COHORT_CACHE_MAX_SIZE = int(os.getenv("COHORT_CACHE_MAX_SIZE", "1000"))
+
+CohortKey = Tuple[int, int]
+
+# (course_id, semester) -> (expires_at, version, aggregation)
+_cohort_cache: "OrderedDict[CohortKey, Tuple[float, int, Dict[str, Any]]]" = OrderedDict()
+
+# (course_id, semester) -> version stamp, bumped on every member change
+_cohort_versions: Dict[CohortKey, int] = {}
+
 
 async def get_cohort_definition(
     user_id: int,
@@ -85,29 +115,71 @@ async def get_cohort_definition(
     
     Returns cohort parameters or None if user not enrolled.
     """
-    user_stmt = select(User).where(User.id == user_id)
-    user_result = await db.execute(user_stmt)
-    user = user_result.scalar_one_or_none()
-    
-    if not user:
+    stmt = select(
+        User.course_id,
+        User.current_semester,
+        Course.name,
+        Course.code
+    ).outerjoin(
+        Course, Course.id == User.course_id
+    ).where(User.id == user_id)
+    
+    result = await db.execute(stmt)
+    row = result.one_or_none()
+    
+    if not row:
         return {"error": "User not found"}
     
-    if not user.course_id or not user.current_semester:
+    course_id, semester, course_name, course_code = row
+    if not course_id or not semester:
         return {"error": "User not enrolled in a course/semester"}
     
-    course_stmt = select(Course).where(Course.id == user.course_id)
-    course_result = await db.execute(course_stmt)
-    course = course_result.scalar_one_or_none()
-    
     return {
-        "course_id": user.course_id,
-        "course_name": course.name if course else None,
-        "course_code": course.code if course else None,
-        "semester": user.current_semester,
+        "course_id": course_id,
+        "course_name": course_name,
+        "course_code": course_code,
+        "semester": semester,
         "user_id": user_id
     }
 
 
+def _is_recently_active(activity_days: int):
+    """EXISTS clause: the user has a practice attempt in the activity window"""
+    cutoff_date = datetime.utcnow() - timedelta(days=activity_days)
+    return select(PracticeAttempt.id).where(
+        and_(
+            PracticeAttempt.user_id == User.id,
+            PracticeAttempt.attempted_at >= cutoff_date
+        )
+    ).exists()
+
+
+def _cohort_filter(course_id: int, semester: int):
+    return and_(
+        User.course_id == course_id,
+        User.current_semester == semester,
+        User.is_active == True
+    )
+
+
+def active_cohort_members_query(
+    course_id: int,
+    semester: int,
+    activity_days: int = ACTIVITY_WINDOW_DAYS
+) -> Select:
+    """
+    SELECT of active cohort member ids, for use as a subquery/CTE.
+    
+    Active = At least 1 practice attempt in last N days.
+    """
+    return select(User.id).where(
+        and_(
+            _cohort_filter(course_id, semester),
+            _is_recently_active(activity_days)
+        )
+    )
+
+
 async def get_active_cohort_members(
     course_id: int,
     semester: int,
@@ -124,23 +196,8 @@ async def get_active_cohort_members(
     - Same current_semester
     - Active in last 90 days
     """
-    cutoff_date = datetime.utcnow() - timedelta(days=activity_days)
-    
-    active_users_stmt = select(distinct(PracticeAttempt.user_id)).join(
-        User, PracticeAttempt.user_id == User.id
-    ).where(
-        and_(
-            User.course_id == course_id,
-            User.current_semester == semester,
-            User.is_active == True,
-            PracticeAttempt.attempted_at >= cutoff_date
-        )
-    )
-    
-    result = await db.execute(active_users_stmt)
-    active_user_ids = [row[0] for row in result.fetchall()]
-    
-    return active_user_ids
+    result = await db.execute(active_cohort_members_query(course_id, semester, activity_days))
+    return list(result.scalars().all())
 
 
 async def get_total_cohort_members(
@@ -151,18 +208,31 @@ async def get_total_cohort_members(
     """
     Get total count of users in the cohort (regardless of activity).
     """
-    count_stmt = select(func.count(User.id)).where(
-        and_(
-            User.course_id == course_id,
-            User.current_semester == semester,
-            User.is_active == True
-        )
-    )
+    count_stmt = select(func.count(User.id)).where(_cohort_filter(course_id, semester))
     
     result = await db.execute(count_stmt)
     return result.scalar() or 0
 
 
+async def get_cohort_member_counts(
+    course_id: int,
+    semester: int,
+    db: AsyncSession,
+    activity_days: int = ACTIVITY_WINDOW_DAYS
+) -> Tuple[int, int]:
+    """
+    Get (total, active) cohort member counts in one statement.
+    """
+    count_stmt = select(
+        func.count(User.id),
+        func.count(case((_is_recently_active(activity_days), 1)))
+    ).where(_cohort_filter(course_id, semester))
+    
+    result = await db.execute(count_stmt)
+    total, active = result.one()
+    return total or 0, active or 0
+
+
 async def get_cohort_subjects(
     course_id: int,
     semester: int,
@@ -171,8 +241,13 @@ async def get_cohort_subjects(
     """
     Get subjects for the cohort's semester from curriculum.
     """
-    curriculum_stmt = select(CourseCurriculum, Subject).join(
-        Subject, CourseCurriculum.subject_id == Subject.id
+    curriculum_stmt = select(
+        Subject.id,
+        Subject.title,
+        Subject.code,
+        Subject.category
+    ).join(
+        CourseCurriculum, CourseCurriculum.subject_id == Subject.id
     ).where(
         and_(
             CourseCurriculum.course_id == course_id,
@@ -181,84 +256,116 @@ async def get_cohort_subjects(
     ).order_by(Subject.title)
     
     result = await db.execute(curriculum_stmt)
-    rows = result.fetchall()
-    
-    subjects = []
-    for curriculum, subject in rows:
-        subjects.append({
-            "subject_id": subject.id,
-            "title": subject.title,
-            "code": subject.code,
-            "category": subject.category.value if subject.category else None
-        })
     
-    return subjects
+    return [
+        {
+            "subject_id": subject_id,
+            "title": title,
+            "code": code,
+            "category": category.value if category else None
+        }
+        for subject_id, title, code, category in result.all()
+    ]
 
 
-async def aggregate_subject_stats(
-    subject_id: int,
-    cohort_user_ids: List[int],
-    db: AsyncSession
-) -> Dict[str, Any]:
+def _empty_subject_stats() -> Dict[str, Any]:
+    return {
+        "students_with_progress": 0,
+        "avg_mastery": None,
+        "median_mastery": None,
+        "distribution": {"weak": 0, "average": 0, "strong": 0}
+    }
+
+
+def _approximate_median(histogram: List[Tuple[int, int, float]]) -> float:
     """
-    Aggregate mastery statistics for a subject within the cohort.
+    P50 from a histogram of (bucket, count, sum of values) rows.
     
-    Calculates:
-    - avg_mastery: Mean of completion_percentage
-    - median_mastery: P50 of completion_percentage
-    - distribution: {weak: <40%, average: 40-70%, strong: >70%}
+    The middle value(s) are estimated by the mean of the bucket holding
+    them; buckets are 1 point wide, so the error is under 1 point (none
+    when a bucket holds a single distinct value).
+    """
+    total = sum(count for _, count, _ in histogram)
+    middle_ranks = {(total - 1) // 2, total // 2}
+    
+    estimates = []
+    seen = 0
+    for _, count, value_sum in sorted(histogram):
+        for rank in middle_ranks:
+            if seen <= rank < seen + count:
+                estimates.append(value_sum / count)
+        seen += count
+    
+    return sum(estimates) / len(estimates)
+
+
+async def aggregate_cohort_subject_stats(
+    course_id: int,
+    semester: int,
+    subject_ids: List[int],
+    db: AsyncSession,
+    activity_days: int = ACTIVITY_WINDOW_DAYS
+) -> Dict[int, Dict[str, Any]]:
+    """
+    Aggregate mastery statistics for every subject within the cohort.
+    
+    One statement grouped by (subject, 1-point mastery bucket), joined
+    against the active-member subquery. Per subject:
+    - avg_mastery: Mean of completion_percentage (exact)
+    - median_mastery: P50 of completion_percentage (approximate)
+    - distribution: {weak: <40%, average: 40-70%, strong: >70%} (exact)
     - students_with_progress: Count with non-null progress
     
     Uses subject_progress.completion_percentage as mastery proxy.
     """
-    if not cohort_user_ids:
-        return {
-            "students_with_progress": 0,
-            "avg_mastery": None,
-            "median_mastery": None,
-            "distribution": {"weak": 0, "average": 0, "strong": 0}
-        }
-    
-    progress_stmt = select(SubjectProgress.completion_percentage).where(
+    stats = {subject_id: _empty_subject_stats() for subject_id in subject_ids}
+    if not subject_ids:
+        return stats
+    
+    members = active_cohort_members_query(course_id, semester, activity_days).cte("cohort_members")
+    mastery = SubjectProgress.completion_percentage
+    bucket = cast(mastery, Integer)
+    
+    histogram_stmt = select(
+        SubjectProgress.subject_id,
+        bucket,
+        func.count(),
+        func.sum(mastery),
+        func.count(case((mastery < DISTRIBUTION_WEAK_THRESHOLD, 1))),
+        func.count(case((mastery >= DISTRIBUTION_STRONG_THRESHOLD, 1)))
+    ).join(
+        members, members.c.id == SubjectProgress.user_id
+    ).where(
         and_(
-            SubjectProgress.subject_id == subject_id,
-            SubjectProgress.user_id.in_(cohort_user_ids),
-            SubjectProgress.completion_percentage.isnot(None)
+            SubjectProgress.subject_id.in_(subject_ids),
+            mastery.isnot(None)
         )
-    )
-    
-    result = await db.execute(progress_stmt)
-    mastery_values = [row[0] for row in result.fetchall() if row[0] is not None]
-    
-    if not mastery_values:
-        return {
-            "students_with_progress": 0,
-            "avg_mastery": None,
-            "median_mastery": None,
-            "distribution": {"weak": 0, "average": 0, "strong": 0}
-        }
-    
-    avg_mastery = statistics.mean(mastery_values)
-    median_mastery = statistics.median(mastery_values)
-    
-    weak_count = sum(1 for v in mastery_values if v < DISTRIBUTION_WEAK_THRESHOLD)
-    average_count = sum(1 for v in mastery_values if DISTRIBUTION_WEAK_THRESHOLD <= v < DISTRIBUTION_STRONG_THRESHOLD)
-    strong_count = sum(1 for v in mastery_values if v >= DISTRIBUTION_STRONG_THRESHOLD)
-    
-    return {
-        "students_with_progress": len(mastery_values),
-        "avg_mastery": round(avg_mastery, 2),
-        "median_mastery": round(median_mastery, 2),
-        "distribution": {
-            "weak": weak_count,
-            "average": average_count,
-            "strong": strong_count
-        }
-    }
+    ).group_by(SubjectProgress.subject_id, bucket)
+    
+    result = await db.execute(histogram_stmt)
+    
+    histograms: Dict[int, List[Tuple[int, int, float]]] = {}
+    for subject_id, bucket_value, count, value_sum, weak, strong in result.all():
+        histograms.setdefault(subject_id, []).append((bucket_value, count, value_sum))
+        subject_stats = stats[subject_id]
+        subject_stats["students_with_progress"] += count
+        subject_stats["distribution"]["weak"] += weak
+        subject_stats["distribution"]["average"] += count - weak - strong
+        subject_stats["distribution"]["strong"] += strong
+    
+    for subject_id, histogram in histograms.items():
+        subject_stats = stats[subject_id]
+        total_value = sum(value_sum for _, _, value_sum in histogram)
+        subject_stats["avg_mastery"] = round(total_value / subject_stats["students_with_progress"], 2)
+        subject_stats["median_mastery"] = round(_approximate_median(histogram), 2)
+    
+    return stats
 
 
 async def aggregate_global_cohort_stats(
-    cohort_user_ids: List[int],
+    course_id: int,
+    semester: int,
+    active_students: int,
     db: AsyncSession,
     activity_days: int = ACTIVITY_WINDOW_DAYS
 ) -> Dict[str, Any]:
@@ -270,49 +377,127 @@ async def aggregate_global_cohort_stats(
     - avg_answers: Average answers submitted per student
     - avg_time_per_attempt: Average time taken per attempt
     """
-    if not cohort_user_ids:
-        return {
-            "avg_attempts": 0,
-            "avg_answers": 0,
-            "avg_time_per_attempt": None
-        }
+    empty = {
+        "avg_attempts": 0,
+        "avg_answers": 0,
+        "avg_time_per_attempt": None
+    }
+    if not active_students:
+        return empty
     
     cutoff_date = datetime.utcnow() - timedelta(days=activity_days)
+    members = active_cohort_members_query(course_id, semester, activity_days).cte("cohort_members")
     
-    attempts_stmt = select(
+    per_user = select(
         PracticeAttempt.user_id,
         func.count(PracticeAttempt.id).label("attempt_count"),
         func.avg(PracticeAttempt.time_taken_seconds).label("avg_time")
+    ).join(
+        members, members.c.id == PracticeAttempt.user_id
     ).where(
-        and_(
-            PracticeAttempt.user_id.in_(cohort_user_ids),
-            PracticeAttempt.attempted_at >= cutoff_date
-        )
-    ).group_by(PracticeAttempt.user_id)
-    
-    result = await db.execute(attempts_stmt)
-    user_stats = result.fetchall()
+        PracticeAttempt.attempted_at >= cutoff_date
+    ).group_by(PracticeAttempt.user_id).subquery()
     
-    if not user_stats:
-        return {
-            "avg_attempts": 0,
-            "avg_answers": 0,
-            "avg_time_per_attempt": None
-        }
+    result = await db.execute(
+        select(func.sum(per_user.c.attempt_count), func.avg(per_user.c.avg_time))
+    )
+    total_attempts, avg_time = result.one()
     
-    total_attempts = sum(row.attempt_count for row in user_stats)
-    avg_attempts_per_student = total_attempts / len(cohort_user_ids)
+    if not total_attempts:
+        return empty
     
-    time_values = [row.avg_time for row in user_stats if row.avg_time is not None]
-    avg_time = statistics.mean(time_values) if time_values else None
+    avg_attempts_per_student = total_attempts / active_students
     
     return {
         "avg_attempts": round(avg_attempts_per_student, 2),
         "avg_answers": round(avg_attempts_per_student, 2),
-        "avg_time_per_attempt": round(avg_time, 2) if avg_time else None
+        "avg_time_per_attempt": round(float(avg_time), 2) if avg_time else None
     }
 
 
+# ================= COHORT CACHE =================
+
+def _cache_get(key: CohortKey) -> Optional[Dict[str, Any]]:
+    entry = _cohort_cache.get(key)
+    if entry is None:
+        return None
+    
+    expires_at, version, aggregation = entry
+    if expires_at < time.monotonic() or version != _cohort_versions.get(key, 0):
+        _cohort_cache.pop(key, None)
+        return None
+    
+    _cohort_cache.move_to_end(key)
+    return copy.deepcopy(aggregation)
+
+
+def _cache_set(key: CohortKey, version: int, aggregation: Dict[str, Any]) -> None:
+    """Store an aggregation, unless the cohort changed while it was computed"""
+    if COHORT_CACHE_TTL_SECONDS <= 0 or version != _cohort_versions.get(key, 0):
+        return
+    
+    _cohort_cache[key] = (time.monotonic() + COHORT_CACHE_TTL_SECONDS, version, copy.deepcopy(aggregation))
+    _cohort_cache.move_to_end(key)
+    while len(_cohort_cache) > COHORT_CACHE_MAX_SIZE:
+        _cohort_cache.popitem(last=False)
+
+
+def invalidate_cohort(course_id: Optional[int], semester: Optional[int]) -> None:
+    """Drop a cohort's cached aggregation and bump its version stamp"""
+    if course_id is None or semester is None:
+        return
+    key = (course_id, semester)
+    _cohort_cache.pop(key, None)
+    _cohort_versions[key] = _cohort_versions.get(key, 0) + 1
+
+
+def clear_cohort_cache() -> int:
+    """Clear the cohort cache. Returns number of entries cleared."""
+    count = len(_cohort_cache)
+    for course_id, semester in list(_cohort_cache):
+        invalidate_cohort(course_id, semester)
+    return count
+
+
+_users = User.__table__
+
+
+def _invalidate_member_cohort(connection, user_id: Optional[int]) -> None:
+    if user_id is None or COHORT_CACHE_TTL_SECONDS <= 0:
+        return
+    row = connection.execute(
+        select(_users.c.course_id, _users.c.current_semester).where(_users.c.id == user_id)
+    ).first()
+    if row is not None:
+        invalidate_cohort(*row)
+
+
+@event.listens_for(SubjectProgress, "after_insert")
+@event.listens_for(SubjectProgress, "after_update")
+@event.listens_for(SubjectProgress, "after_delete")
+def _on_member_progress(mapper, connection, target: SubjectProgress) -> None:
+    _invalidate_member_cohort(connection, target.user_id)
+
+
+@event.listens_for(User, "after_insert")
+@event.listens_for(User, "after_update")
+def _on_user_change(mapper, connection, target: User) -> None:
+    state = inspect(target)
+    if not any(
+        getattr(state.attrs, attribute).history.has_changes()
+        for attribute in ("course_id", "current_semester", "is_active")
+    ):
+        return
+    
+    old_course = state.attrs.course_id.history.deleted
+    old_semester = state.attrs.current_semester.history.deleted
+    invalidate_cohort(
+        old_course[0] if old_course else target.course_id,
+        old_semester[0] if old_semester else target.current_semester
+    )
+    invalidate_cohort(target.course_id, target.current_semester)
+
+
 async def get_cohort_aggregation(
     user_id: int,
     db: AsyncSession
@@ -320,7 +505,8 @@ async def get_cohort_aggregation(
     """
     Get complete cohort aggregation for a user.
     
-    Main entry point for Phase 8.1.
+    Main entry point for Phase 8.1. Five queries on a cache miss,
+    whatever the cohort size or subject count; one on a hit.
     
     Returns:
     {
@@ -364,20 +550,28 @@ async def get_cohort_aggregation(
     
     course_id = cohort_def["course_id"]
     semester = cohort_def["semester"]
+    cache_key = (course_id, semester)
     
-    total_students = await get_total_cohort_members(course_id, semester, db)
-    active_user_ids = await get_active_cohort_members(course_id, semester, db)
-    active_students = len(active_user_ids)
+    cached = _cache_get(cache_key)
+    if cached is not None:
+        return cached
+    
+    version = _cohort_versions.get(cache_key, 0)
+    
+    total_students, active_students = await get_cohort_member_counts(course_id, semester, db)
     
     subjects = await get_cohort_subjects(course_id, semester, db)
     
+    stats_by_subject = await aggregate_cohort_subject_stats(
+        course_id,
+        semester,
+        [subject["subject_id"] for subject in subjects],
+        db
+    )
+    
     subject_stats = []
     for subject in subjects:
-        stats = await aggregate_subject_stats(
-            subject["subject_id"],
-            active_user_ids,
-            db
-        )
+        stats = stats_by_subject[subject["subject_id"]]
         
         subject_stats.append({
             "subject_id": subject["subject_id"],
@@ -390,7 +584,7 @@ async def get_cohort_aggregation(
             "distribution": stats["distribution"]
         })
     
-    global_stats = await aggregate_global_cohort_stats(active_user_ids, db)
+    global_stats = await aggregate_global_cohort_stats(course_id, semester, active_students, db)
     
     logger.info(
         f"Cohort aggregation for user={user_id}: "
@@ -398,7 +592,7 @@ async def get_cohort_aggregation(
         f"active={active_students}/{total_students}"
     )
     
-    return {
+    aggregation = {
         "success": True,
         "cohort": {
             "course": cohort_def["course_name"],
@@ -412,6 +606,9 @@ async def get_cohort_aggregation(
         "global_stats": global_stats,
         "aggregated_at": datetime.utcnow().isoformat()
     }
+    
+    _cache_set(cache_key, version, aggregation)
+    return aggregation
 
 
 async def get_empty_cohort_response() -> Dict[str, Any]:
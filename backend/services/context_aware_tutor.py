@@ -18,8 +18,9 @@ import os
 import re
 import json
 import logging
-from typing import Dict, List, Any, Optional, Tuple
+from typing import Dict, List, Any, Optional, Tuple, AsyncIterator, Awaitable, Callable
 from datetime import datetime
+from collections import defaultdict
 from enum import Enum
 import google.generativeai as genai
 from sqlalchemy.ext.asyncio import AsyncSession
@@ -38,6 +39,8 @@ from backend.orm.subject_progress import SubjectProgress
 from backend.orm.practice_attempt import PracticeAttempt
 from backend.orm.practice_question import PracticeQuestion
 from backend.orm.practice_evaluation import PracticeEvaluation
+from backend.services.tutor_context_cache import cached_student_context
+from backend.services.llm_streaming import StreamResult, guarded_sse, sse_event, stream_gemini
 from backend.services.mistake_pattern_service import (
     get_patterns_for_topic,
     get_quick_diagnosis,
@@ -226,6 +229,7 @@ class StudentContext:
         self.total_attempts = total_attempts
         self.study_priorities = study_priorities
         self.diagnostic_patterns = diagnostic_patterns or []
+        self._prompt_context: Optional[str] = None
     
     def get_mastery_level(self, topic_tag: str) -> MasteryLevel:
         """Get mastery level for a topic."""
@@ -256,7 +260,12 @@ class StudentContext:
         return False
     
     def to_prompt_context(self) -> str:
-        """Convert context to prompt-friendly format."""
+        """Convert context to prompt-friendly format (built once per context)."""
+        if self._prompt_context is None:
+            self._prompt_context = self._build_prompt_context()
+        return self._prompt_context
+    
+    def _build_prompt_context(self) -> str:
         lines = [
             f"Course: {self.course_name}",
             f"Semester: {self.semester}",
@@ -301,7 +310,16 @@ async def assemble_student_context(user_id: int, db: AsyncSession) -> StudentCon
     """
     Assemble complete student context from database.
     NO AI calls - pure data assembly.
+    
+    Cached per student until their practice, progress or profile changes
+    (see tutor_context_cache), so chat turns reuse one assembled context.
     """
+    return await cached_student_context(
+        "student_context", user_id, lambda: _build_student_context(user_id, db)
+    )
+
+
+async def _build_student_context(user_id: int, db: AsyncSession) -> StudentContext:
     logger.info(f"Assembling student context: user_id={user_id}")
     
     user_stmt = (
@@ -343,18 +361,23 @@ async def assemble_student_context(user_id: int, db: AsyncSession) -> StudentCon
         )
         subjects_result = await db.execute(subjects_stmt)
         
-        for subject, sem_num in subjects_result.fetchall():
-            modules_stmt = select(ContentModule.title).where(
-                ContentModule.subject_id == subject.id
+        subject_rows = subjects_result.fetchall()
+        
+        module_titles = defaultdict(list)
+        if subject_rows:
+            modules_stmt = select(ContentModule.subject_id, ContentModule.title).where(
+                ContentModule.subject_id.in_([subject.id for subject, _ in subject_rows])
             )
             modules_result = await db.execute(modules_stmt)
-            module_titles = [r[0] for r in modules_result.fetchall()]
-            
+            for subject_id, title in modules_result.fetchall():
+                module_titles[subject_id].append(title)
+        
+        for subject, sem_num in subject_rows:
             allowed_subjects.append({
                 "id": subject.id,
                 "title": subject.title,
                 "semester": sem_num,
-                "modules": module_titles
+                "modules": module_titles[subject.id]
             })
     
     mastery_stmt = select(TopicMastery).where(TopicMastery.user_id == user_id)
@@ -419,14 +442,18 @@ async def assemble_student_context(user_id: int, db: AsyncSession) -> StudentCon
     count_result = await db.execute(count_stmt)
     total_attempts = count_result.scalar() or 0
     
-    study_priorities = []
-    for subject in allowed_subjects:
+    progress_map = {}
+    if allowed_subjects:
         progress_stmt = select(SubjectProgress).where(
             SubjectProgress.user_id == user_id,
-            SubjectProgress.subject_id == subject["id"]
+            SubjectProgress.subject_id.in_([subject["id"] for subject in allowed_subjects])
         )
         progress_result = await db.execute(progress_stmt)
-        progress = progress_result.scalar_one_or_none()
+        progress_map = {p.subject_id: p for p in progress_result.scalars().all()}
+    
+    study_priorities = []
+    for subject in allowed_subjects:
+        progress = progress_map.get(subject["id"])
         
         if progress:
             completion = progress.completion_percentage or 0
@@ -743,6 +770,123 @@ async def search_relevant_content(
     return result
 
 
+def _rejected_response(topic: Optional[str], refusal_message: str) -> Dict[str, Any]:
+    return {
+        "response": refusal_message,
+        "intent": QueryIntent.OUT_OF_SCOPE.value,
+        "topic": topic,
+        "mastery_level": MasteryLevel.UNKNOWN.value,
+        "suggestions": [],
+        "related_content": [],
+        "meta": {
+            "rejected": True,
+            "reason": "syllabus_validation_failed"
+        }
+    }
+
+
+def _unavailable_response(intent: QueryIntent, topic: Optional[str]) -> Dict[str, Any]:
+    return {
+        "response": "AI service is currently unavailable. Please try again later.",
+        "intent": intent.value,
+        "topic": topic,
+        "mastery_level": MasteryLevel.UNKNOWN.value,
+        "suggestions": [],
+        "related_content": [],
+        "meta": {"error": "model_unavailable"}
+    }
+
+
+def _build_tutor_prompt(
+    query: str,
+    intent: QueryIntent,
+    topic: Optional[str],
+    context: StudentContext,
+    relevant_content: Dict[str, List[Dict]],
+    session_history: Optional[List[Dict]]
+) -> str:
+    """Full prompt: system prompt, conversation history, query and syllabus content."""
+    system_prompt = build_tutor_system_prompt(context, intent)
+    user_prompt = build_user_prompt(query, intent, topic, context)
+    
+    if relevant_content["learn_content"]:
+        user_prompt += "\n\nRelevant Content from Student's Syllabus:\n"
+        for item in relevant_content["learn_content"]:
+            user_prompt += f"- {item['title']}: {item['summary']}\n"
+    
+    if relevant_content["cases"]:
+        user_prompt += "\n\nRelevant Cases (Student has studied):\n"
+        for case in relevant_content["cases"]:
+            user_prompt += f"- {case['case_name']} ({case['year']}): {case['ratio']}\n"
+    
+    if session_history:
+        history_text = "\n\nRecent Conversation:\n"
+        for msg in session_history[-4:]:
+            role = "Student" if msg.get("role") in ["user", "student"] else "Tutor"
+            history_text += f"{role}: {msg.get('text', '')[:200]}\n"
+        user_prompt = history_text + user_prompt
+    
+    return system_prompt + "\n\n" + user_prompt
+
+
+def _tutor_generation_config():
+    return genai.types.GenerationConfig(
+        temperature=0.3,
+        max_output_tokens=1500,
+    )
+
+
+def _complete_response(
+    ai_response: str,
+    intent: QueryIntent,
+    topic: Optional[str],
+    context: StudentContext,
+    relevant_content: Dict[str, List[Dict]]
+) -> Dict[str, Any]:
+    """Response dict around a generated answer: suggestions, related content, meta."""
+    mastery_level = context.get_mastery_level(topic) if topic else MasteryLevel.UNKNOWN
+    
+    suggestions = []
+    if mastery_level == MasteryLevel.WEAK and topic:
+        suggestions.append(f"Revise fundamentals of {topic.replace('-', ' ')} before attempting questions")
+    if context.total_attempts < 10:
+        suggestions.append("Practice more questions to improve your understanding")
+    if context.study_priorities:
+        top_priority = context.study_priorities[0]
+        if top_priority["priority"] == "High":
+            suggestions.append(f"Focus on {top_priority['subject_title']} - marked high priority")
+    
+    related_content = []
+    for item in relevant_content["learn_content"]:
+        related_content.append({
+            "type": "learn",
+            "id": item["id"],
+            "title": item["title"]
+        })
+    for case in relevant_content["cases"]:
+        related_content.append({
+            "type": "case",
+            "id": case["id"],
+            "title": case["case_name"]
+        })
+    
+    return {
+        "response": ai_response,
+        "intent": intent.value,
+        "topic": topic,
+        "mastery_level": mastery_level.value,
+        "suggestions": suggestions,
+        "related_content": related_content,
+        "meta": {
+            "course": context.course_name,
+            "semester": context.semester,
+            "total_attempts": context.total_attempts,
+            "weak_topics_count": len(context.weak_topics),
+            "strong_topics_count": len(context.strong_topics)
+        }
+    }
+
+
 async def generate_tutor_response(
     user_id: int,
     query: str,
@@ -787,61 +931,20 @@ async def generate_tutor_response(
     
     if not is_valid:
         logger.info(f"Query rejected: {refusal_message[:50]}...")
-        return {
-            "response": refusal_message,
-            "intent": QueryIntent.OUT_OF_SCOPE.value,
-            "topic": topic,
-            "mastery_level": MasteryLevel.UNKNOWN.value,
-            "suggestions": [],
-            "related_content": [],
-            "meta": {
-                "rejected": True,
-                "reason": "syllabus_validation_failed"
-            }
-        }
+        return _rejected_response(topic, refusal_message)
     
     if not tutor_model:
-        return {
-            "response": "AI service is currently unavailable. Please try again later.",
-            "intent": intent.value,
-            "topic": topic,
-            "mastery_level": MasteryLevel.UNKNOWN.value,
-            "suggestions": [],
-            "related_content": [],
-            "meta": {"error": "model_unavailable"}
-        }
+        return _unavailable_response(intent, topic)
     
     relevant_content = await search_relevant_content(query, topic, context, db)
-    
-    system_prompt = build_tutor_system_prompt(context, intent)
-    user_prompt = build_user_prompt(query, intent, topic, context)
-    
-    if relevant_content["learn_content"]:
-        user_prompt += "\n\nRelevant Content from Student's Syllabus:\n"
-        for item in relevant_content["learn_content"]:
-            user_prompt += f"- {item['title']}: {item['summary']}\n"
-    
-    if relevant_content["cases"]:
-        user_prompt += "\n\nRelevant Cases (Student has studied):\n"
-        for case in relevant_content["cases"]:
-            user_prompt += f"- {case['case_name']} ({case['year']}): {case['ratio']}\n"
-    
-    if session_history:
-        history_text = "\n\nRecent Conversation:\n"
-        for msg in session_history[-4:]:
-            role = "Student" if msg.get("role") in ["user", "student"] else "Tutor"
-            history_text += f"{role}: {msg.get('text', '')[:200]}\n"
-        user_prompt = history_text + user_prompt
+    prompt = _build_tutor_prompt(query, intent, topic, context, relevant_content, session_history)
     
     try:
         response = await tutor_model.generate_content_async(
             [
-                {"role": "user", "parts": [system_prompt + "\n\n" + user_prompt]}
+                {"role": "user", "parts": [prompt]}
             ],
-            generation_config=genai.types.GenerationConfig(
-                temperature=0.3,
-                max_output_tokens=1500,
-            )
+            generation_config=_tutor_generation_config()
         )
         
         ai_response = response.text
@@ -859,44 +962,60 @@ async def generate_tutor_response(
             "meta": {"error": str(e)}
         }
     
-    mastery_level = context.get_mastery_level(topic) if topic else MasteryLevel.UNKNOWN
+    return _complete_response(ai_response, intent, topic, context, relevant_content)
+
+
+async def stream_tutor_response(
+    user_id: int,
+    query: str,
+    db: AsyncSession,
+    session_history: Optional[List[Dict]] = None,
+    on_complete: Optional[Callable[[Dict[str, Any]], Awaitable[None]]] = None
+) -> AsyncIterator[bytes]:
+    """
+    Streaming variant of generate_tutor_response (server-sent events,
+    see llm_streaming).
+    
+    The answer is forwarded sentence by sentence through the guardrails;
+    refusals arrive as a single delta. The done event carries everything
+    generate_tutor_response returns except the response text. on_complete
+    receives the full response dict (text = what was forwarded) before
+    the done event; it is not called when generation fails.
+    """
+    logger.info(f"Tutor stream request: user_id={user_id}, query='{query[:50]}...'")
     
-    suggestions = []
-    if mastery_level == MasteryLevel.WEAK and topic:
-        suggestions.append(f"Revise fundamentals of {topic.replace('-', ' ')} before attempting questions")
-    if context.total_attempts < 10:
-        suggestions.append("Practice more questions to improve your understanding")
-    if context.study_priorities:
-        top_priority = context.study_priorities[0]
-        if top_priority["priority"] == "High":
-            suggestions.append(f"Focus on {top_priority['subject_title']} - marked high priority")
+    context = await assemble_student_context(user_id, db)
+    intent = detect_query_intent(query)
+    topic = extract_topic_from_query(query)
     
-    related_content = []
-    for item in relevant_content["learn_content"]:
-        related_content.append({
-            "type": "learn",
-            "id": item["id"],
-            "title": item["title"]
-        })
-    for case in relevant_content["cases"]:
-        related_content.append({
-            "type": "case",
-            "id": case["id"],
-            "title": case["case_name"]
-        })
+    is_valid, refusal_message = validate_query_against_syllabus(query, topic, context)
     
-    return {
-        "response": ai_response,
-        "intent": intent.value,
-        "topic": topic,
-        "mastery_level": mastery_level.value,
-        "suggestions": suggestions,
-        "related_content": related_content,
-        "meta": {
-            "course": context.course_name,
-            "semester": context.semester,
-            "total_attempts": context.total_attempts,
-            "weak_topics_count": len(context.weak_topics),
-            "strong_topics_count": len(context.strong_topics)
-        }
-    }
+    if not is_valid:
+        final = _rejected_response(topic, refusal_message)
+        yield sse_event("delta", {"text": final["response"]})
+    elif not tutor_model:
+        final = _unavailable_response(intent, topic)
+        yield sse_event("delta", {"text": final["response"]})
+    else:
+        relevant_content = await search_relevant_content(query, topic, context, db)
+        prompt = _build_tutor_prompt(query, intent, topic, context, relevant_content, session_history)
+        
+        result = StreamResult()
+        chunks = stream_gemini(
+            tutor_model,
+            [{"role": "user", "parts": [prompt]}],
+            _tutor_generation_config()
+        )
+        async for event in guarded_sse(chunks, result):
+            yield event
+        if result.error:
+            return
+        
+        final = _complete_response(result.text, intent, topic, context, relevant_content)
+        if result.blocked_reason:
+            final["meta"]["blocked"] = result.blocked_reason
+    
+    if on_complete:
+        await on_complete(final)
+    
+    yield sse_event("done", {key: value for key, value in final.items() if key != "response"})
@@ -2,6 +2,7 @@ import logging
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select, update
 from backend.orm.user import User
+from backend.services.principal_cache import invalidate_principal_id
 
 logger = logging.getLogger(__name__)
 
@@ -9,13 +10,13 @@ async def check_credits(user_id: int, required: int, db: AsyncSession) -> bool:
     """
     Check if user has enough credits.
     """
-    result = await db.execute(select(User).where(User.id == user_id))
-    user = result.scalar_one_or_none()
+    result = await db.execute(select(User.credits_remaining).where(User.id == user_id))
+    credits_remaining = result.scalar_one_or_none()
     
-    if not user:
+    if credits_remaining is None:
         return False
     
-    return user.credits_remaining >= required
+    return credits_remaining >= required
 
 
 async def deduct_credits(user_id: int, amount: int, db: AsyncSession) -> bool:
@@ -29,6 +30,8 @@ async def deduct_credits(user_id: int, amount: int, db: AsyncSession) -> bool:
             .values(credits_remaining=User.credits_remaining - amount)
         )
         await db.commit()
+        # Bulk UPDATE skips the flush events that refresh cached principals
+        invalidate_principal_id(user_id)
         logger.info(f"Deducted {amount} credits from user {user_id}")
         return True
     except Exception as e:
@@ -41,10 +44,10 @@ async def get_user_credits(user_id: int, db: AsyncSession) -> int:
     """
     Get current credit balance for user.
     """
-    result = await db.execute(select(User).where(User.id == user_id))
-    user = result.scalar_one_or_none()
+    result = await db.execute(select(User.credits_remaining).where(User.id == user_id))
+    credits_remaining = result.scalar_one_or_none()
     
-    if not user:
+    if credits_remaining is None:
         return 0
     
-    return user.credits_remaining
\ No newline at end of file
+    return credits_remaining
\ No newline at end of file
@@ -0,0 +1,408 @@
+"""
+backend/services/daily_activity_service.py
+Maintenance and queries of the user_daily_activity rollup
+
+EVENTS:
+- PracticeAttempt insert → attempts, graded/correct counts, practice time
+- PracticeAttempt update of is_correct → graded/correct counts
+- UserContentProgress insert/update → views, completions, content time
+
+Each event upserts the (user, day, subject) row with one statement in the
+same flush as the change. Deletes of source rows are not rolled back: the
+rollup records activity history. Existing history is backfilled once, on
+the first start after the rollup was introduced.
+
+READS:
+Streaks, weekly trends and consistency metrics read the rollup's rows for
+one user (one row per active day and subject) and share the bitmap streak
+helpers in backend.utils.activity_streak.
+"""
+import logging
+from collections import defaultdict
+from datetime import date, datetime, timedelta
+from typing import Dict, List, Optional, Tuple
+
+from sqlalchemy import select, update, insert, delete, event, inspect, func, case, and_
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from backend.orm.user_daily_activity import UserDailyActivity
+from backend.orm.rollup_backfill import RollupBackfill
+from backend.orm.practice_attempt import PracticeAttempt
+from backend.orm.practice_question import PracticeQuestion
+from backend.orm.user_content_progress import UserContentProgress, ContentType
+from backend.orm.learn_content import LearnContent
+from backend.orm.case_content import CaseContent
+from backend.orm.content_module import ContentModule
+from backend.utils.activity_streak import activity_bitmap, as_date, streak_from_bitmap
+from backend.utils.orm_history import value_before_flush
+
+logger = logging.getLogger(__name__)
+
+_activity = UserDailyActivity.__table__
+
+COUNTER_COLUMNS = (
+    "attempts", "graded_attempts", "correct_attempts", "practice_time_seconds",
+    "content_viewed", "content_completed", "content_time_seconds",
+)
+
+# Kinds of activity a streak can be computed over
+ACTIVITY_KINDS = {
+    "any": _activity.c.attempts + _activity.c.content_viewed > 0,
+    "practice": _activity.c.attempts > 0,
+    "content": _activity.c.content_viewed > 0,
+}
+
+SUBJECT_CACHE_MAX_SIZE = 50_000
+BACKFILL_CHUNK_SIZE = 1000
+
+# (content kind, content id) → subject id
+_subject_cache: Dict[Tuple[str, int], int] = {}
+
+
+# ================= READS =================
+
+async def get_activity_rows(
+    db: AsyncSession,
+    user_id: int,
+    since: Optional[date] = None,
+    subject_id: Optional[int] = None
+) -> List[UserDailyActivity]:
+    """A user's rollup rows (one per active day and subject), oldest first"""
+    stmt = select(UserDailyActivity).where(UserDailyActivity.user_id == user_id)
+    if since is not None:
+        stmt = stmt.where(UserDailyActivity.activity_date >= since)
+    if subject_id is not None:
+        stmt = stmt.where(UserDailyActivity.subject_id == subject_id)
+    result = await db.execute(stmt.order_by(UserDailyActivity.activity_date))
+    return list(result.scalars().all())
+
+
+async def get_activity_bitmap(
+    db: AsyncSession,
+    user_id: int,
+    kind: str = "any",
+    subject_id: Optional[int] = None,
+    window: Optional[int] = None
+) -> int:
+    """
+    Bitmap of a user's active days (bit i = active i days ago).
+
+    Args:
+        kind: "any", "practice" or "content"
+        subject_id: Only activity attributed to this subject
+        window: Only the most recent `window` days
+    """
+    today = datetime.utcnow().date()
+    stmt = select(_activity.c.activity_date).where(
+        _activity.c.user_id == user_id,
+        ACTIVITY_KINDS[kind]
+    ).distinct()
+    if subject_id is not None:
+        stmt = stmt.where(_activity.c.subject_id == subject_id)
+    if window is not None:
+        stmt = stmt.where(_activity.c.activity_date > today - timedelta(days=window))
+
+    result = await db.execute(stmt)
+    return activity_bitmap(result.scalars().all(), today, window)
+
+
+async def get_study_streak(
+    db: AsyncSession,
+    user_id: int,
+    kind: str = "any",
+    subject_id: Optional[int] = None,
+    max_days: Optional[int] = None
+) -> int:
+    """Current streak of consecutive active days (today or yesterday anchored)"""
+    bitmap = await get_activity_bitmap(
+        db, user_id, kind, subject_id, window=max_days + 1 if max_days else None
+    )
+    return streak_from_bitmap(bitmap, max_days)
+
+
+# ================= SUBJECT ATTRIBUTION =================
+
+def _cached_subject(connection, kind: str, content_id: Optional[int], stmt) -> int:
+    if content_id is None:
+        return 0
+    key = (kind, content_id)
+    if key not in _subject_cache:
+        if len(_subject_cache) > SUBJECT_CACHE_MAX_SIZE:
+            _subject_cache.clear()
+        _subject_cache[key] = connection.execute(stmt).scalar() or 0
+    return _subject_cache[key]
+
+
+def _question_subject(connection, question_id: Optional[int]) -> int:
+    return _cached_subject(
+        connection, ContentType.PRACTICE.value, question_id,
+        select(ContentModule.subject_id)
+        .join(PracticeQuestion, PracticeQuestion.module_id == ContentModule.id)
+        .where(PracticeQuestion.id == question_id)
+    )
+
+
+def _content_subject(connection, content_type: ContentType, content_id: Optional[int]) -> int:
+    if content_type == ContentType.PRACTICE:
+        return _question_subject(connection, content_id)
+    content = LearnContent if content_type == ContentType.LEARN else CaseContent
+    return _cached_subject(
+        connection, content_type.value, content_id,
+        select(ContentModule.subject_id)
+        .join(content, content.module_id == ContentModule.id)
+        .where(content.id == content_id)
+    )
+
+
+# ================= UPSERT =================
+
+def _latest(column, value):
+    """Keep the later of the stored and incoming timestamp"""
+    return case(
+        (column.is_(None), value),
+        (column > value, column),
+        else_=value
+    )
+
+
+def _upsert(
+    connection,
+    user_id: int,
+    day: date,
+    subject_id: int,
+    counters: Dict[str, int],
+    timestamps: Dict[str, datetime]
+) -> None:
+    """Add counters to the (user, day, subject) row, creating it if needed"""
+    counters = {column: delta for column, delta in counters.items() if delta}
+    if not counters and not timestamps:
+        return
+
+    key = {"user_id": user_id, "activity_date": day, "subject_id": subject_id}
+    dialect = connection.dialect.name
+
+    if dialect in ("postgresql", "sqlite"):
+        if dialect == "postgresql":
+            from sqlalchemy.dialects.postgresql import insert as dialect_insert
+        else:
+            from sqlalchemy.dialects.sqlite import insert as dialect_insert
+
+        stmt = dialect_insert(_activity).values(**key, **counters, **timestamps)
+        set_ = {column: _activity.c[column] + stmt.excluded[column] for column in counters}
+        set_.update({column: _latest(_activity.c[column], stmt.excluded[column]) for column in timestamps})
+        connection.execute(
+            stmt.on_conflict_do_update(index_elements=["user_id", "activity_date", "subject_id"], set_=set_)
+        )
+        return
+
+    values = {column: _activity.c[column] + delta for column, delta in counters.items()}
+    values.update({column: _latest(_activity.c[column], value) for column, value in timestamps.items()})
+    result = connection.execute(
+        update(_activity)
+        .where(and_(*(_activity.c[column] == value for column, value in key.items())))
+        .values(**values)
+    )
+    if result.rowcount == 0:
+        connection.execute(insert(_activity).values(**key, **counters, **timestamps))
+
+
+# ================= EVENTS =================
+
+@event.listens_for(PracticeAttempt, "after_insert")
+def _on_attempt_insert(mapper, connection, target: PracticeAttempt) -> None:
+    attempted_at = target.attempted_at or datetime.utcnow()
+    _upsert(
+        connection, target.user_id, attempted_at.date(),
+        _question_subject(connection, target.practice_question_id),
+        counters={
+            "attempts": 1,
+            "graded_attempts": int(target.is_correct is not None),
+            "correct_attempts": int(bool(target.is_correct)),
+            "practice_time_seconds": target.time_taken_seconds or 0,
+        },
+        timestamps={"last_attempted_at": attempted_at}
+    )
+
+
+@event.listens_for(PracticeAttempt, "after_update")
+def _on_attempt_update(mapper, connection, target: PracticeAttempt) -> None:
+    if not inspect(target).attrs.is_correct.history.has_changes():
+        return
+    old = value_before_flush(target, "is_correct")
+    attempted_at = target.attempted_at or datetime.utcnow()
+    _upsert(
+        connection, target.user_id, attempted_at.date(),
+        _question_subject(connection, target.practice_question_id),
+        counters={
+            "graded_attempts": int(target.is_correct is not None) - int(old is not None),
+            "correct_attempts": int(bool(target.is_correct)) - int(bool(old)),
+        },
+        timestamps={}
+    )
+
+
+@event.listens_for(UserContentProgress, "after_insert")
+def _on_progress_insert(mapper, connection, target: UserContentProgress) -> None:
+    viewed_at = target.last_viewed_at or datetime.utcnow()
+    _upsert(
+        connection, target.user_id, viewed_at.date(),
+        _content_subject(connection, target.content_type, target.content_id),
+        counters={
+            "content_viewed": 1,
+            "content_completed": int(bool(target.is_completed)),
+            "content_time_seconds": target.time_spent_seconds or 0,
+        },
+        timestamps={"last_viewed_at": viewed_at}
+    )
+
+
+@event.listens_for(UserContentProgress, "after_update")
+def _on_progress_update(mapper, connection, target: UserContentProgress) -> None:
+    viewed = inspect(target).attrs.last_viewed_at.history.has_changes()
+    completed = int(bool(target.is_completed)) - int(bool(value_before_flush(target, "is_completed")))
+    time_spent = (target.time_spent_seconds or 0) - (value_before_flush(target, "time_spent_seconds") or 0)
+    if not (viewed or completed > 0 or time_spent):
+        return
+
+    viewed_at = target.last_viewed_at or datetime.utcnow()
+    _upsert(
+        connection, target.user_id, viewed_at.date(),
+        _content_subject(connection, target.content_type, target.content_id),
+        counters={
+            "content_viewed": int(viewed),
+            "content_completed": max(completed, 0),
+            "content_time_seconds": time_spent,
+        },
+        timestamps={"last_viewed_at": viewed_at} if viewed else {}
+    )
+
+
+# ================= BACKFILL =================
+
+async def backfill_daily_activity(db: AsyncSession) -> int:
+    """
+    Build the rollup from practice_attempts and user_content_progress.
+
+    Runs once, recorded by a rollup_backfills marker; afterwards the events
+    keep it current. Rows the events wrote before the marker existed are
+    rebuilt with the rest. Content rows are attributed to the day they were
+    last viewed, the only day their history retains.
+
+    Returns number of rollup rows written.
+    """
+    if await db.get(RollupBackfill, _activity.name) is not None:
+        return 0
+
+    # Claim the backfill first: a concurrent worker fails on the marker's key
+    marker = RollupBackfill(name=_activity.name)
+    db.add(marker)
+    try:
+        await db.flush()
+    except IntegrityError:
+        await db.rollback()
+        return 0
+
+    await db.execute(delete(UserDailyActivity))
+
+    rows: Dict[Tuple[int, date, int], Dict] = defaultdict(dict)
+
+    attempt_day = func.date(PracticeAttempt.attempted_at)
+    attempts_result = await db.execute(
+        select(
+            PracticeAttempt.user_id,
+            attempt_day,
+            func.coalesce(ContentModule.subject_id, 0),
+            func.count(PracticeAttempt.id),
+            func.count(PracticeAttempt.is_correct),
+            func.count(case((PracticeAttempt.is_correct == True, 1))),
+            func.coalesce(func.sum(PracticeAttempt.time_taken_seconds), 0),
+            func.max(PracticeAttempt.attempted_at)
+        )
+        .select_from(PracticeAttempt)
+        .outerjoin(PracticeQuestion, PracticeQuestion.id == PracticeAttempt.practice_question_id)
+        .outerjoin(ContentModule, ContentModule.id == PracticeQuestion.module_id)
+        .group_by(PracticeAttempt.user_id, attempt_day, func.coalesce(ContentModule.subject_id, 0))
+    )
+    for user_id, day, subject_id, attempts, graded, correct, time_taken, last_attempted_at in attempts_result.all():
+        if day is None:
+            continue
+        rows[(user_id, as_date(day), subject_id)].update(
+            attempts=attempts,
+            graded_attempts=graded,
+            correct_attempts=correct,
+            practice_time_seconds=time_taken or 0,
+            last_attempted_at=last_attempted_at
+        )
+
+    view_day = func.date(UserContentProgress.last_viewed_at)
+    content_subject = func.coalesce(ContentModule.subject_id, 0)
+    content_result = await db.execute(
+        select(
+            UserContentProgress.user_id,
+            view_day,
+            content_subject,
+            func.count(UserContentProgress.id),
+            func.count(case((UserContentProgress.is_completed == True, 1))),
+            func.coalesce(func.sum(UserContentProgress.time_spent_seconds), 0),
+            func.max(UserContentProgress.last_viewed_at)
+        )
+        .select_from(UserContentProgress)
+        .outerjoin(
+            LearnContent,
+            and_(
+                UserContentProgress.content_type == ContentType.LEARN,
+                LearnContent.id == UserContentProgress.content_id
+            )
+        )
+        .outerjoin(
+            CaseContent,
+            and_(
+                UserContentProgress.content_type == ContentType.CASE,
+                CaseContent.id == UserContentProgress.content_id
+            )
+        )
+        .outerjoin(
+            PracticeQuestion,
+            and_(
+                UserContentProgress.content_type == ContentType.PRACTICE,
+                PracticeQuestion.id == UserContentProgress.content_id
+            )
+        )
+        .outerjoin(
+            ContentModule,
+            ContentModule.id == func.coalesce(
+                LearnContent.module_id, CaseContent.module_id, PracticeQuestion.module_id
+            )
+        )
+        .group_by(UserContentProgress.user_id, view_day, content_subject)
+    )
+    for user_id, day, subject_id, viewed, completed, time_spent, last_viewed_at in content_result.all():
+        if day is None:
+            continue
+        rows[(user_id, as_date(day), subject_id)].update(
+            content_viewed=viewed,
+            content_completed=completed,
+            content_time_seconds=time_spent or 0,
+            last_viewed_at=last_viewed_at
+        )
+
+    values = [
+        {
+            "user_id": user_id,
+            "activity_date": day,
+            "subject_id": subject_id,
+            **{column: totals.get(column, 0) for column in COUNTER_COLUMNS},
+            "last_attempted_at": totals.get("last_attempted_at"),
+            "last_viewed_at": totals.get("last_viewed_at"),
+        }
+        for (user_id, day, subject_id), totals in rows.items()
+    ]
+    for start in range(0, len(values), BACKFILL_CHUNK_SIZE):
+        await db.execute(insert(UserDailyActivity), values[start:start + BACKFILL_CHUNK_SIZE])
+    marker.rows_written = len(values)
+    await db.commit()
+
+    if values:
+        logger.info(f"Daily activity rollup: backfilled {len(values)} rows")
+    return len(values)
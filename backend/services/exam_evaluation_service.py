@@ -29,14 +29,16 @@ import os
 from typing import Dict, List, Any, Optional, Tuple
 from datetime import datetime
 from dataclasses import dataclass, field
-from collections import defaultdict
+from collections import defaultdict, OrderedDict
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, and_
+from sqlalchemy import select, and_, insert, update
+from sqlalchemy.orm import joinedload, lazyload
 
 from backend.orm.exam_session import ExamSession, ExamSessionStatus
 from backend.orm.exam_answer import ExamAnswer
 from backend.orm.exam_evaluation import ExamAnswerEvaluation, ExamSessionEvaluation
 from backend.orm.practice_question import PracticeQuestion, QuestionType
+from backend.services.keyword_matcher import KeywordMatcher, KeywordScan, compile_keywords
 
 logger = logging.getLogger(__name__)
 
@@ -179,45 +181,147 @@ def generate_rubric_template(
     )
 
 
+ISSUE_INDICATORS = [
+    "issue", "question", "matter", "whether", "problem",
+    "arises", "concerns", "relates to", "pertains to"
+]
+
+LEGAL_PRINCIPLE_TERMS = [
+    "provision", "statute", "principle", "doctrine", "rule",
+    "held", "established", "precedent", "ratio decidendi", "binding"
+]
+
+APPLICATION_INDICATORS = [
+    "in this case", "in the present", "applying", "therefore",
+    "hence", "thus", "accordingly", "here", "given facts",
+    "on the facts", "based on", "considering"
+]
+
+REASONING_INDICATORS = [
+    "because", "since", "as", "due to", "reason",
+    "consequently", "result", "follows", "leads to"
+]
+
+STRUCTURE_INDICATORS = [
+    "firstly", "secondly", "thirdly", "finally", "moreover",
+    "furthermore", "in addition", "however", "nevertheless",
+    "on the other hand", "in conclusion", "to summarize"
+]
+
+CONCLUSION_INDICATORS = [
+    "conclusion", "conclude", "therefore", "thus", "hence",
+    "accordingly", "in summary", "to summarize", "finally",
+    "in light of", "it is submitted", "it follows"
+]
+
+CONCLUSIVE_STATEMENTS = [
+    "liable", "not liable", "valid", "invalid", "entitled",
+    "not entitled", "succeed", "fail", "guilty", "not guilty",
+    "binding", "void", "voidable", "enforceable"
+]
+
+GENERIC_LEGAL_KEYWORDS = [
+    "section", "article", "act", "provision", "statute", "precedent",
+    "plaintiff", "defendant", "appellant", "respondent", "petitioner",
+    "court", "judgment", "held", "ratio", "obiter", "dictum",
+    "contract", "tort", "crime", "negligence", "liability",
+    "consideration", "offer", "acceptance", "breach", "damages",
+    "fundamental rights", "constitutional", "amendment", "jurisdiction"
+]
+
+RUBRIC_INDICATOR_TERMS = (
+    ISSUE_INDICATORS + LEGAL_PRINCIPLE_TERMS + APPLICATION_INDICATORS
+    + REASONING_INDICATORS + STRUCTURE_INDICATORS + CONCLUSION_INDICATORS
+    + CONCLUSIVE_STATEMENTS
+)
+
+
+@dataclass(frozen=True)
+class QuestionKeywords:
+    """Keyword profile of a question, built once per question version."""
+    expected: Tuple[str, ...]
+    question_terms: Tuple[str, ...]
+    matcher: KeywordMatcher
+
+
+_question_keywords_cache: "OrderedDict[Tuple[Any, Any], QuestionKeywords]" = OrderedDict()
+QUESTION_KEYWORDS_CACHE_MAX_SIZE = 2048
+
+
+def get_question_keywords(question: PracticeQuestion) -> QuestionKeywords:
+    """
+    Get the keyword profile for a question.
+    
+    Cached by (question id, updated_at) so edits to tags or the model
+    answer rebuild the matcher automatically.
+    """
+    cache_key = (question.id, getattr(question, "updated_at", None))
+    cached = _question_keywords_cache.get(cache_key) if question.id is not None else None
+    if cached is not None:
+        _question_keywords_cache.move_to_end(cache_key)
+        return cached
+    
+    expected = tuple(extract_expected_keywords(question))
+    question_lower = question.question.lower() if question.question else ""
+    question_terms = tuple(re.findall(r'\b[a-z]{4,}\b', question_lower)[:5])
+    
+    profile = QuestionKeywords(
+        expected=expected,
+        question_terms=question_terms,
+        matcher=compile_keywords(expected + question_terms + tuple(RUBRIC_INDICATOR_TERMS)),
+    )
+    
+    if question.id is not None:
+        _question_keywords_cache[cache_key] = profile
+        while len(_question_keywords_cache) > QUESTION_KEYWORDS_CACHE_MAX_SIZE:
+            _question_keywords_cache.popitem(last=False)
+    
+    return profile
+
+
 def calculate_criterion_score(
     criterion: RubricCriteria,
     answer_text: str,
     question: PracticeQuestion,
-    word_count: int
+    word_count: int,
+    scan: Optional[KeywordScan] = None
 ) -> Tuple[float, str, str]:
     """
     Calculate score for a single rubric criterion.
     
     Uses deterministic keyword-based analysis + structural checks.
+    All criteria read from one keyword scan of the answer; pass `scan`
+    to share it across criteria.
     Returns: (score, performance_level, feedback)
     """
     if not answer_text or not answer_text.strip():
         return 0, "not_attempted", "No answer provided for this criterion"
     
-    text_lower = answer_text.lower()
     max_marks = criterion.max_marks
     
-    expected_keywords = extract_expected_keywords(question)
+    profile = get_question_keywords(question)
+    if scan is None:
+        scan = profile.matcher.scan(answer_text)
     
     if criterion.name == "issue_identification":
         score, level, feedback = evaluate_issue_identification(
-            text_lower, expected_keywords, max_marks, question
+            scan, profile, max_marks
         )
     elif criterion.name == "legal_principles":
         score, level, feedback = evaluate_legal_principles(
-            text_lower, expected_keywords, max_marks, question
+            answer_text, scan, profile, max_marks
         )
     elif criterion.name == "application":
         score, level, feedback = evaluate_application(
-            text_lower, expected_keywords, max_marks, question
+            scan, profile, max_marks
         )
     elif criterion.name == "structure_clarity":
         score, level, feedback = evaluate_structure(
-            answer_text, word_count, max_marks
+            answer_text, word_count, max_marks, scan
         )
     elif criterion.name == "conclusion":
         score, level, feedback = evaluate_conclusion(
-            text_lower, max_marks
+            scan, max_marks
         )
     else:
         score = max_marks * 0.5
@@ -228,7 +332,12 @@ def calculate_criterion_score(
 
 
 def extract_expected_keywords(question: PracticeQuestion) -> List[str]:
-    """Extract expected keywords from question guidelines and correct answer."""
+    """
+    Extract expected keywords from question guidelines and correct answer.
+    
+    Order is stable (tags, then model-answer terms, then generic legal
+    keywords) so the same question always yields the same keyword list.
+    """
     keywords = []
     
     if question.tags:
@@ -239,38 +348,21 @@ def extract_expected_keywords(question: PracticeQuestion) -> List[str]:
         legal_terms = re.findall(r'\b[a-z]{4,}\b', answer_lower)
         keywords.extend(legal_terms[:20])
     
-    legal_keywords = [
-        "section", "article", "act", "provision", "statute", "precedent",
-        "plaintiff", "defendant", "appellant", "respondent", "petitioner",
-        "court", "judgment", "held", "ratio", "obiter", "dictum",
-        "contract", "tort", "crime", "negligence", "liability",
-        "consideration", "offer", "acceptance", "breach", "damages",
-        "fundamental rights", "constitutional", "amendment", "jurisdiction"
-    ]
-    keywords.extend(legal_keywords)
+    keywords.extend(GENERIC_LEGAL_KEYWORDS)
     
-    return list(set(keywords))
+    return [kw for kw in dict.fromkeys(keywords) if kw]
 
 
 def evaluate_issue_identification(
-    text: str,
-    keywords: List[str],
-    max_marks: float,
-    question: PracticeQuestion
+    scan: KeywordScan,
+    profile: QuestionKeywords,
+    max_marks: float
 ) -> Tuple[float, str, str]:
     """Evaluate issue identification criterion."""
     
-    issue_indicators = [
-        "issue", "question", "matter", "whether", "problem",
-        "arises", "concerns", "relates to", "pertains to"
-    ]
-    
-    indicator_count = sum(1 for ind in issue_indicators if ind in text)
-    keyword_matches = sum(1 for kw in keywords[:10] if kw in text)
-    
-    question_lower = question.question.lower() if question.question else ""
-    question_keywords = re.findall(r'\b[a-z]{4,}\b', question_lower)[:5]
-    question_keyword_matches = sum(1 for kw in question_keywords if kw in text)
+    indicator_count = scan.count_present(ISSUE_INDICATORS)
+    keyword_matches = scan.count_present(profile.expected[:10])
+    question_keyword_matches = scan.count_present(profile.question_terms)
     
     if indicator_count >= 2 and keyword_matches >= 3 and question_keyword_matches >= 2:
         return max_marks * 0.9, "excellent", "Issue clearly identified and well-framed"
@@ -284,9 +376,9 @@ def evaluate_issue_identification(
 
 def evaluate_legal_principles(
     text: str,
-    keywords: List[str],
-    max_marks: float,
-    question: PracticeQuestion
+    scan: KeywordScan,
+    profile: QuestionKeywords,
+    max_marks: float
 ) -> Tuple[float, str, str]:
     """Evaluate legal principles and authorities criterion."""
     
@@ -295,13 +387,8 @@ def evaluate_legal_principles(
     case_refs = len(re.findall(r'v\.\s|versus|v\s', text, re.IGNORECASE))
     act_refs = len(re.findall(r'\bact\s*(,|\s|of|19|20)', text, re.IGNORECASE))
     
-    legal_terms = [
-        "provision", "statute", "principle", "doctrine", "rule",
-        "held", "established", "precedent", "ratio decidendi", "binding"
-    ]
-    term_matches = sum(1 for term in legal_terms if term in text)
-    
-    keyword_matches = sum(1 for kw in keywords if kw in text)
+    term_matches = scan.count_present(LEGAL_PRINCIPLE_TERMS)
+    keyword_matches = scan.count_present(profile.expected)
     
     total_citations = section_refs + article_refs + case_refs + act_refs
     
@@ -316,27 +403,15 @@ def evaluate_legal_principles(
 
 
 def evaluate_application(
-    text: str,
-    keywords: List[str],
-    max_marks: float,
-    question: PracticeQuestion
+    scan: KeywordScan,
+    profile: QuestionKeywords,
+    max_marks: float
 ) -> Tuple[float, str, str]:
     """Evaluate application to facts criterion."""
     
-    application_indicators = [
-        "in this case", "in the present", "applying", "therefore",
-        "hence", "thus", "accordingly", "here", "given facts",
-        "on the facts", "based on", "considering"
-    ]
-    
-    reasoning_indicators = [
-        "because", "since", "as", "due to", "reason",
-        "consequently", "result", "follows", "leads to"
-    ]
-    
-    app_count = sum(1 for ind in application_indicators if ind in text)
-    reason_count = sum(1 for ind in reasoning_indicators if ind in text)
-    keyword_matches = sum(1 for kw in keywords if kw in text)
+    app_count = scan.count_present(APPLICATION_INDICATORS)
+    reason_count = scan.count_present(REASONING_INDICATORS)
+    keyword_matches = scan.count_present(profile.expected)
     
     if app_count >= 3 and reason_count >= 3 and keyword_matches >= 4:
         return max_marks * 0.9, "excellent", "Thorough application with nuanced analysis"
@@ -351,7 +426,8 @@ def evaluate_application(
 def evaluate_structure(
     text: str,
     word_count: int,
-    max_marks: float
+    max_marks: float,
+    scan: Optional[KeywordScan] = None
 ) -> Tuple[float, str, str]:
     """Evaluate structure and clarity criterion."""
     
@@ -363,12 +439,9 @@ def evaluate_structure(
     
     avg_sentence_length = word_count / max(sentence_count, 1)
     
-    structure_indicators = [
-        "firstly", "secondly", "thirdly", "finally", "moreover",
-        "furthermore", "in addition", "however", "nevertheless",
-        "on the other hand", "in conclusion", "to summarize"
-    ]
-    structure_count = sum(1 for ind in structure_indicators if ind.lower() in text.lower())
+    if scan is None:
+        scan = compile_keywords(STRUCTURE_INDICATORS).scan(text)
+    structure_count = scan.count_present(STRUCTURE_INDICATORS)
     
     score = 0
     
@@ -398,28 +471,16 @@ def evaluate_structure(
 
 
 def evaluate_conclusion(
-    text: str,
+    scan: KeywordScan,
     max_marks: float
 ) -> Tuple[float, str, str]:
     """Evaluate conclusion criterion."""
     
-    conclusion_indicators = [
-        "conclusion", "conclude", "therefore", "thus", "hence",
-        "accordingly", "in summary", "to summarize", "finally",
-        "in light of", "it is submitted", "it follows"
-    ]
-    
-    conclusive_statements = [
-        "liable", "not liable", "valid", "invalid", "entitled",
-        "not entitled", "succeed", "fail", "guilty", "not guilty",
-        "binding", "void", "voidable", "enforceable"
-    ]
-    
-    conclusion_count = sum(1 for ind in conclusion_indicators if ind in text)
-    statement_count = sum(1 for stmt in conclusive_statements if stmt in text)
+    conclusion_count = scan.count_present(CONCLUSION_INDICATORS)
+    statement_count = scan.count_present(CONCLUSIVE_STATEMENTS)
     
-    last_portion = text[-500:] if len(text) > 500 else text
-    conclusion_in_end = any(ind in last_portion for ind in conclusion_indicators)
+    last_portion_start = max(scan.text_length - 500, 0)
+    conclusion_in_end = scan.count_present_after(CONCLUSION_INDICATORS, last_portion_start) > 0
     
     if conclusion_count >= 2 and statement_count >= 1 and conclusion_in_end:
         return max_marks * 0.9, "excellent", "Clear, well-reasoned conclusion"
@@ -473,9 +534,12 @@ def evaluate_answer_with_rubric(
     strengths = []
     improvements = []
     
+    # One pass over the answer serves every criterion
+    scan = get_question_keywords(question).matcher.scan(answer_text)
+    
     for criterion in rubric.criteria:
         score, level, feedback = calculate_criterion_score(
-            criterion, answer_text, question, word_count
+            criterion, answer_text, question, word_count, scan
         )
         
         total_score += score
@@ -533,14 +597,19 @@ async def evaluate_exam_session(
     
     Process:
     1. Check session is submitted
-    2. Evaluate each answer with rubric
-    3. Calculate aggregate scores
-    4. Generate session-level feedback
-    5. Store evaluations
+    2. Load answers with questions and existing evaluations (one query each)
+    3. Evaluate each answer with rubric (in memory)
+    4. Calculate aggregate scores
+    5. Generate session-level feedback
+    6. Store evaluations in bulk
     
     Returns complete evaluation results.
     """
-    session_stmt = select(ExamSession).where(ExamSession.id == session_id)
+    session_stmt = (
+        select(ExamSession)
+        .options(lazyload("*"))
+        .where(ExamSession.id == session_id)
+    )
     session_result = await db.execute(session_stmt)
     session = session_result.scalar_one_or_none()
     
@@ -550,8 +619,10 @@ async def evaluate_exam_session(
     if session.status == ExamSessionStatus.IN_PROGRESS:
         return {"error": "Cannot evaluate an in-progress exam"}
     
-    existing_stmt = select(ExamSessionEvaluation).where(
-        ExamSessionEvaluation.exam_session_id == session_id
+    existing_stmt = (
+        select(ExamSessionEvaluation)
+        .options(lazyload("*"))
+        .where(ExamSessionEvaluation.exam_session_id == session_id)
     )
     existing_result = await db.execute(existing_stmt)
     existing_eval = existing_result.scalar_one_or_none()
@@ -559,17 +630,37 @@ async def evaluate_exam_session(
     if existing_eval and existing_eval.status == "evaluated" and not force_reevaluate:
         return await get_evaluation_results(session_id, db)
     
-    answers_stmt = select(ExamAnswer).where(
-        ExamAnswer.exam_session_id == session_id
-    ).order_by(ExamAnswer.question_number)
+    # Answers and their questions in one query (question collections not loaded)
+    answers_stmt = (
+        select(ExamAnswer)
+        .options(
+            lazyload("*"),
+            joinedload(ExamAnswer.question).lazyload("*"),
+        )
+        .where(ExamAnswer.exam_session_id == session_id)
+        .order_by(ExamAnswer.question_number)
+    )
     answers_result = await db.execute(answers_stmt)
-    answers = answers_result.scalars().all()
+    answers = answers_result.scalars().unique().all()
+    
+    # Existing answer evaluations keyed by answer id (one query)
+    existing_answer_evals_stmt = (
+        select(ExamAnswerEvaluation.id, ExamAnswerEvaluation.exam_answer_id)
+        .where(ExamAnswerEvaluation.exam_session_id == session_id)
+    )
+    existing_answer_evals_result = await db.execute(existing_answer_evals_stmt)
+    existing_answer_eval_ids = {
+        row.exam_answer_id: row.id for row in existing_answer_evals_result.all()
+    }
     
     answer_evaluations = []
     section_scores = defaultdict(lambda: {"marks": 0, "max": 0, "count": 0})
     topic_scores = defaultdict(lambda: {"marks": 0, "max": 0})
     total_marks_awarded = 0
     total_marks_possible = 0
+    evaluated_at = datetime.utcnow()
+    rows_to_insert = []
+    rows_to_update = []
     
     for answer in answers:
         question = answer.question
@@ -578,31 +669,30 @@ async def evaluate_exam_session(
         
         eval_result = evaluate_answer_with_rubric(answer, question)
         
-        answer_eval_stmt = select(ExamAnswerEvaluation).where(
-            ExamAnswerEvaluation.exam_answer_id == answer.id
-        )
-        answer_eval_result = await db.execute(answer_eval_stmt)
-        answer_eval = answer_eval_result.scalar_one_or_none()
-        
-        if not answer_eval:
-            answer_eval = ExamAnswerEvaluation(
-                exam_answer_id=answer.id,
-                exam_session_id=session_id,
-                question_id=question.id,
-                max_marks=eval_result["max_marks"]
-            )
-            db.add(answer_eval)
+        row = {
+            "marks_awarded": eval_result["marks_awarded"],
+            "rubric_breakdown": eval_result["rubric_breakdown"],
+            "overall_feedback": eval_result["overall_feedback"],
+            "strengths": eval_result["strengths"],
+            "improvements": eval_result["improvements"],
+            "examiner_tone": eval_result["examiner_tone"],
+            "status": "evaluated",
+            "evaluated_at": evaluated_at,
+            "evaluation_method": "rubric_fallback",
+            "confidence_score": 0.85,
+        }
         
-        answer_eval.marks_awarded = eval_result["marks_awarded"]
-        answer_eval.rubric_breakdown = eval_result["rubric_breakdown"]
-        answer_eval.overall_feedback = eval_result["overall_feedback"]
-        answer_eval.strengths = eval_result["strengths"]
-        answer_eval.improvements = eval_result["improvements"]
-        answer_eval.examiner_tone = eval_result["examiner_tone"]
-        answer_eval.status = "evaluated"
-        answer_eval.evaluated_at = datetime.utcnow()
-        answer_eval.evaluation_method = "rubric_fallback"
-        answer_eval.confidence_score = 0.85
+        existing_id = existing_answer_eval_ids.get(answer.id)
+        if existing_id is None:
+            rows_to_insert.append({
+                "exam_answer_id": answer.id,
+                "exam_session_id": session_id,
+                "question_id": question.id,
+                "max_marks": eval_result["max_marks"],
+                **row
+            })
+        else:
+            rows_to_update.append({"id": existing_id, **row})
         
         answer_evaluations.append({
             "question_number": answer.question_number,
@@ -624,6 +714,13 @@ async def evaluate_exam_session(
                 topic_scores[tag]["marks"] += eval_result["marks_awarded"]
                 topic_scores[tag]["max"] += eval_result["max_marks"]
     
+    # Write all answer evaluations: one executemany INSERT for new rows,
+    # one executemany UPDATE (by primary key) for re-evaluated rows
+    if rows_to_insert:
+        await db.execute(insert(ExamAnswerEvaluation), rows_to_insert)
+    if rows_to_update:
+        await db.execute(update(ExamAnswerEvaluation), rows_to_update)
+    
     percentage = (total_marks_awarded / total_marks_possible * 100) if total_marks_possible > 0 else 0
     grade_info = determine_grade_band(percentage)
     
@@ -716,8 +813,10 @@ async def get_evaluation_results(
     
     Returns structured data for frontend display.
     """
-    session_eval_stmt = select(ExamSessionEvaluation).where(
-        ExamSessionEvaluation.exam_session_id == session_id
+    session_eval_stmt = (
+        select(ExamSessionEvaluation)
+        .options(lazyload("*"))
+        .where(ExamSessionEvaluation.exam_session_id == session_id)
     )
     session_eval_result = await db.execute(session_eval_stmt)
     session_eval = session_eval_result.scalar_one_or_none()
@@ -725,13 +824,26 @@ async def get_evaluation_results(
     if not session_eval:
         return {"error": "Evaluation not found", "status": "pending"}
     
-    answer_evals_stmt = select(ExamAnswerEvaluation).where(
-        ExamAnswerEvaluation.exam_session_id == session_id
+    # Answers and questions come from the same query
+    answer_evals_stmt = (
+        select(ExamAnswerEvaluation)
+        .options(
+            lazyload("*"),
+            joinedload(ExamAnswerEvaluation.exam_answer).options(
+                lazyload("*"),
+                joinedload(ExamAnswer.question).lazyload("*"),
+            ),
+        )
+        .where(ExamAnswerEvaluation.exam_session_id == session_id)
     )
     answer_evals_result = await db.execute(answer_evals_stmt)
-    answer_evals = answer_evals_result.scalars().all()
+    answer_evals = answer_evals_result.scalars().unique().all()
     
-    session_stmt = select(ExamSession).where(ExamSession.id == session_id)
+    session_stmt = (
+        select(ExamSession)
+        .options(lazyload("*"), joinedload(ExamSession.subject).lazyload("*"))
+        .where(ExamSession.id == session_id)
+    )
     session_result = await db.execute(session_stmt)
     session = session_result.scalar_one_or_none()
     
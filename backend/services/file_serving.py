@@ -0,0 +1,109 @@
+"""
+backend/services/file_serving.py
+Cache-validated, range-aware file downloads
+
+PURPOSE:
+Serve stored files (submissions, memorials, certificates) so that a client
+re-opening a document it already has costs no bandwidth, and a client that
+only needs part of a document can fetch just that range.
+
+BEHAVIOUR:
+- Strong ETag = stored SHA-256 when known, else a memoized digest of the file
+- If-None-Match → 304 Not Modified with no body
+- Range / If-Range → 206 Partial Content (handled by FileResponse)
+- Responses revalidate (no-cache + ETag): /submissions/{id}/download and
+  the like keep their URL across resubmissions
+- Bodies go out via the ASGI pathsend extension (zero-copy) when the server
+  supports it, otherwise in FILE_CHUNK_SIZE reads
+"""
+
+import os
+import logging
+from collections import OrderedDict
+from typing import Optional, Tuple
+
+from fastapi import HTTPException, Request, Response, status
+from fastapi.responses import FileResponse
+from starlette.concurrency import run_in_threadpool
+
+from backend.services.file_storage import file_sha256
+
+logger = logging.getLogger(__name__)
+
+FILE_CHUNK_SIZE = 1024 * 1024  # 1MB
+REVALIDATE_CACHE_CONTROL = "private, no-cache"
+
+# (path, mtime_ns, size) -> sha256 for files without a stored digest
+_digest_cache: "OrderedDict[Tuple[str, int, int], str]" = OrderedDict()
+DIGEST_CACHE_MAX_SIZE = 1024
+
+
+async def _memoized_sha256(path: str, stat_result: os.stat_result) -> str:
+    """Get a file digest, hashing only when the file changed since last time"""
+    key = (path, stat_result.st_mtime_ns, stat_result.st_size)
+    digest = _digest_cache.get(key)
+    if digest is None:
+        digest = await run_in_threadpool(file_sha256, path)
+        _digest_cache[key] = digest
+        while len(_digest_cache) > DIGEST_CACHE_MAX_SIZE:
+            _digest_cache.popitem(last=False)
+    else:
+        _digest_cache.move_to_end(key)
+    return digest
+
+
+def _etag_matches(if_none_match: str, etag: str) -> bool:
+    """Weak comparison of an If-None-Match header against an ETag"""
+    if if_none_match.strip() == "*":
+        return True
+    candidates = [tag.strip() for tag in if_none_match.split(",")]
+    return any(tag.removeprefix("W/") == etag for tag in candidates)
+
+
+async def serve_file(
+    request: Request,
+    path: str,
+    media_type: Optional[str] = None,
+    filename: Optional[str] = None,
+    sha256: Optional[str] = None,
+) -> Response:
+    """
+    Build a download response for a stored file.
+
+    Args:
+        request: Incoming request (for conditional headers)
+        path: File path on disk
+        media_type: Content type (guessed from filename if omitted)
+        filename: Download filename for Content-Disposition
+        sha256: Stored digest of the file, used as the strong ETag
+    """
+    try:
+        stat_result = await run_in_threadpool(os.stat, path)
+    except FileNotFoundError:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="File not found"
+        )
+
+    if sha256 is None:
+        sha256 = await _memoized_sha256(str(path), stat_result)
+
+    etag = f'"{sha256}"'
+    headers = {
+        "ETag": etag,
+        "Cache-Control": REVALIDATE_CACHE_CONTROL,
+    }
+
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match and _etag_matches(if_none_match, etag):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+
+    response = FileResponse(
+        path=path,
+        headers=headers,
+        media_type=media_type,
+        filename=filename,
+        stat_result=stat_result,
+    )
+    response.chunk_size = FILE_CHUNK_SIZE
+    return response
@@ -0,0 +1,125 @@
+"""
+backend/services/file_storage.py
+Streaming, content-addressed storage for uploaded files
+
+PURPOSE:
+Copy an upload to disk in large chunks while hashing it, without ever
+holding the whole file in memory, and store it under its SHA-256 so an
+identical resubmission costs no extra disk.
+
+LAYOUT:
+    {BLOB_STORAGE_DIR}/ab/cd/abcd...ef        (sha256 hex digest)
+    {BLOB_STORAGE_DIR}/tmp/<random>.part      (in-flight uploads)
+
+GUARANTEES:
+- Peak memory is one chunk (STREAM_CHUNK_SIZE), independent of file size
+- Size limit enforced while streaming; oversized uploads never finish writing
+- Blobs are published with an atomic rename, so readers never see partial files
+"""
+
+import os
+import uuid
+import hashlib
+import logging
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Optional
+
+from fastapi import UploadFile
+from starlette.concurrency import run_in_threadpool
+
+from backend.exceptions import FileTooLargeError
+
+logger = logging.getLogger(__name__)
+
+BLOB_STORAGE_DIR = Path(os.getenv("BLOB_STORAGE_DIR", "./uploads/blobs"))
+STREAM_CHUNK_SIZE = 1024 * 1024  # 1MB
+
+_TMP_DIR = BLOB_STORAGE_DIR / "tmp"
+
+
+@dataclass
+class StoredBlob:
+    """Result of storing an upload"""
+    sha256: str
+    size: int
+    path: Path
+    deduplicated: bool  # True when an identical blob already existed
+
+
+def blob_path(sha256: str) -> Path:
+    """Get the content-addressed path for a digest"""
+    return BLOB_STORAGE_DIR / sha256[:2] / sha256[2:4] / sha256
+
+
+def is_blob_path(path: Path) -> bool:
+    """Check whether a stored path lives in the content-addressed store"""
+    resolved = Path(path).resolve()
+    return resolved == blob_path(resolved.name).resolve()
+
+
+def _publish(tmp_path: Path, sha256: str) -> tuple[Path, bool]:
+    """Move a finished temp file into the store, or drop it if already present"""
+    final_path = blob_path(sha256)
+    if final_path.exists():
+        tmp_path.unlink(missing_ok=True)
+        return final_path, True
+
+    final_path.parent.mkdir(parents=True, exist_ok=True)
+    os.replace(tmp_path, final_path)
+    return final_path, False
+
+
+async def store_upload(upload: UploadFile, max_size: Optional[int] = None) -> StoredBlob:
+    """
+    Stream an upload into the content-addressed store.
+
+    Hashes each chunk as it is written, so the file is read exactly once.
+    Raises FileTooLargeError as soon as more than max_size bytes arrive.
+    """
+    _TMP_DIR.mkdir(parents=True, exist_ok=True)
+    tmp_path = _TMP_DIR / f"{uuid.uuid4().hex}.part"
+    sha256 = hashlib.sha256()
+    size = 0
+
+    try:
+        with open(tmp_path, "wb") as f:
+            while True:
+                chunk = await upload.read(STREAM_CHUNK_SIZE)
+                if not chunk:
+                    break
+
+                size += len(chunk)
+                if max_size is not None and size > max_size:
+                    raise FileTooLargeError(max_size)
+
+                sha256.update(chunk)
+                await run_in_threadpool(f.write, chunk)
+
+        digest = sha256.hexdigest()
+        path, deduplicated = await run_in_threadpool(_publish, tmp_path, digest)
+    except BaseException:
+        tmp_path.unlink(missing_ok=True)
+        raise
+
+    if deduplicated:
+        logger.info(f"Upload deduplicated against existing blob {digest[:12]} ({size} bytes)")
+
+    return StoredBlob(sha256=digest, size=size, path=path, deduplicated=deduplicated)
+
+
+def file_sha256(path: Path) -> str:
+    """Hash a file on disk in STREAM_CHUNK_SIZE reads (blocking)"""
+    sha256 = hashlib.sha256()
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(STREAM_CHUNK_SIZE), b""):
+            sha256.update(block)
+    return sha256.hexdigest()
+
+
+def delete_blob(path: Path) -> None:
+    """
+    Remove a blob from the store.
+    Callers must ensure no other record still references it.
+    """
+    Path(path).unlink(missing_ok=True)
@@ -17,10 +17,10 @@ This service acts as a gate before any AI content reaches the user.
 """
 import logging
 import re
-from typing import Tuple, List, Optional
+from typing import Dict, Tuple, List, Optional
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select
-from backend.orm.case_content import CaseContent
+from backend.services.citation_index import find_unverified, match_party_names
+from backend.utils.citation_normalizer import case_name_keys, find_citations
 
 logger = logging.getLogger(__name__)
 
@@ -169,31 +169,41 @@ class ContentGuardrails:
         
         Prevents hallucinated judgments.
         
-        Pattern: "Case Name v. Party Name (Year)"
+        Patterns: "Case Name v. Party Name (Year)", SCC and AIR citations.
+        All citations are checked together against the normalized
+        citation index (see citation_index).
         """
         # Extract potential case citations
         case_pattern = r'([A-Z][a-zA-Z\s]+)\s+v\.?\s+([A-Z][a-zA-Z\s]+)\s*\((\d{4})\)'
         matches = re.findall(case_pattern, text)
+        reporter_citations = find_citations(text)
         
-        if not matches:
+        if not matches and not reporter_citations:
             return True, None  # No cases cited
         
+        # label -> normalized lookup keys (verified if any key is indexed)
+        citations: Dict[str, List[str]] = {}
+        party_pairs: Dict[str, Tuple[str, str]] = {}
         for party1, party2, year in matches:
             case_name = f"{party1.strip()} v. {party2.strip()}"
-            
-            # Check if case exists in database
-            stmt = select(CaseContent.id).where(
-                CaseContent.case_name.ilike(f"%{party1.strip()}%")
-            ).where(
-                CaseContent.case_name.ilike(f"%{party2.strip()}%")
-            )
-            
-            result = await db.execute(stmt)
-            case_exists = result.scalar_one_or_none() is not None
-            
-            if not case_exists:
-                logger.warning(f"Unverified case citation: {case_name} ({year})")
-                return False, f"Case '{case_name}' not found in verified database"
+            citations.setdefault(case_name, case_name_keys(party1, party2))
+            party_pairs.setdefault(case_name, (party1.strip(), party2.strip()))
+        for citation in reporter_citations:
+            citations.setdefault(str(citation), [citation.key])
+        
+        # One indexed IN lookup for everything not already known
+        unverified = await find_unverified(db, citations)
+        
+        # Short forms miss the index: accept them when both parties appear in a stored case name
+        missed = {label: party_pairs[label] for label in unverified if label in party_pairs}
+        if missed:
+            matched = await match_party_names(db, missed)
+            unverified = [label for label in unverified if label not in matched]
+        
+        if unverified:
+            case_name = unverified[0]
+            logger.warning(f"Unverified case citation: {case_name}")
+            return False, f"Case '{case_name}' not found in verified database"
         
         return True, None
     
@@ -287,6 +297,23 @@ class ContentGuardrails:
         
         return is_valid, errors
     
+    @staticmethod
+    def validate_sentence(text: str) -> Tuple[bool, Optional[str]]:
+        """
+        Checks that can run on a fragment of a streamed response.
+        
+        Legal advice and political commentary are decided by the
+        sentence itself; the remaining checks need the whole response.
+        """
+        for check in (
+            ContentGuardrails.validate_no_legal_advice,
+            ContentGuardrails.validate_no_political_bias,
+        ):
+            valid, error = check(text)
+            if not valid:
+                return False, error
+        return True, None
+    
     # ========== DISCLAIMER INJECTION ==========
     
     @staticmethod
@@ -333,6 +360,61 @@ class ContentGuardrails:
         return text
 
 
+# ========== STREAMING ==========
+
+class SentenceGuard:
+    """
+    Incremental guardrails for streamed responses.
+    
+    Text is fed in as it arrives and released one or more complete
+    sentences at a time, once ContentGuardrails.validate_sentence passes
+    on them. The first failing fragment is withheld, `violation` is set
+    and nothing more is released.
+    """
+    
+    # End of a sentence (punctuation followed by whitespace) or of a line
+    SENTENCE_BOUNDARY = re.compile(r'[.!?](?=\s)|\n')
+    
+    # Longest fragment held back waiting for a boundary
+    MAX_PENDING_CHARS = 400
+    
+    def __init__(self):
+        self._pending = ""
+        self.violation: Optional[str] = None
+    
+    def _check(self, fragment: str) -> str:
+        valid, error = ContentGuardrails.validate_sentence(fragment)
+        if not valid:
+            logger.warning(f"Streamed response blocked: {error}")
+            self.violation = error
+            return ""
+        return fragment
+    
+    def feed(self, text: str) -> str:
+        """Add streamed text; returns the text that may be forwarded now"""
+        if self.violation:
+            return ""
+        self._pending += text
+        
+        end = 0
+        for match in self.SENTENCE_BOUNDARY.finditer(self._pending):
+            end = match.end()
+        if not end and len(self._pending) > self.MAX_PENDING_CHARS:
+            end = self._pending.rfind(" ") + 1 or len(self._pending)
+        if not end:
+            return ""
+        
+        fragment, self._pending = self._pending[:end], self._pending[end:]
+        return self._check(fragment)
+    
+    def flush(self) -> str:
+        """End of stream: check and release whatever is still held"""
+        if self.violation or not self._pending:
+            return ""
+        fragment, self._pending = self._pending, ""
+        return self._check(fragment)
+
+
 # ========== CONVENIENCE FUNCTION ==========
 
 async def validate_and_format_response(
@@ -21,6 +21,22 @@ ETIQUETTE_DEDUCTION_TURN_1 = 0
 ETIQUETTE_DEDUCTION_TURN_2 = 2
 ETIQUETTE_DEDUCTION_TURN_3 = 3
 
+# Common case name patterns students use (wrong format), lowercased
+INFORMAL_CASE_NAMES = {
+    "Puttaswamy": ["puttaswamy case", "justice puttaswamy", "k.s. puttaswamy"],
+    "Subramanian Swamy": ["swamy case", "subramanian case", "dr. swamy"],
+    "Ramji Lal Modi": ["modi case", "ramji case", "1957 case"],
+    "Gurbaksh Singh Sibbia": ["sibbia case", "1980 case", "gurbaksh case"],
+    "Shreya Singhal": ["shreya case", "singhal case", "66a case"],
+    "Vishaka": ["vishaka case", "vishaka guidelines", "1997 case"],
+    "M.C. Mehta": ["mehta case", "mc mehta", "oleum gas case"]
+}
+
+# Citations for cases referenced here but not (yet) in the knowledge base
+CITATIONS_OUTSIDE_KB = {
+    "M.C. Mehta": "(1987) 1 SCC 395"
+}
+
 
 class IndiaBehaviorRules:
     """
@@ -120,40 +136,18 @@ class IndiaBehaviorRules:
         wrong_format_cases = []
         missing_cases = []
         
-        # Common case name patterns students use (wrong format)
-        informal_patterns = {
-            "Puttaswamy": ["Puttaswamy case", "Justice Puttaswamy", "K.S. Puttaswamy"],
-            "Subramanian Swamy": ["Swamy case", "Subramanian case", "Dr. Swamy"],
-            "Ramji Lal Modi": ["Modi case", "Ramji case", "1957 case"],
-            "Gurbaksh Singh Sibbia": ["Sibbia case", "1980 case", "Gurbaksh case"],
-            "Shreya Singhal": ["Shreya case", "Singhal case", "66A case"],
-            "Vishaka": ["Vishaka case", "Vishaka guidelines", "1997 case"],
-            "M.C. Mehta": ["Mehta case", "MC Mehta", "Oleum gas case"]
-        }
-        
         # Check for informal mentions without proper SCC
         arg_lower = argument.lower()
-        for case_name, informal_names in informal_patterns.items():
+        for case_name, informal_names in INFORMAL_CASE_NAMES.items():
             # Check if case is mentioned at all
-            case_mentioned = any(informal.lower() in arg_lower for informal in informal_names)
+            case_mentioned = any(informal in arg_lower for informal in informal_names)
             case_mentioned = case_mentioned or case_name.lower() in arg_lower
             
             if case_mentioned and not has_valid_scc:
                 # Case mentioned but no proper SCC citation
-                if case_name == "Puttaswamy":
-                    wrong_format_cases.append(f"{case_name} (2017) 10 SCC 1")
-                elif case_name == "Subramanian Swamy":
-                    wrong_format_cases.append(f"{case_name} (2016) 7 SCC 221")
-                elif case_name == "Ramji Lal Modi":
-                    wrong_format_cases.append(f"{case_name} (1957) SCR 874")
-                elif case_name == "Gurbaksh Singh Sibbia":
-                    wrong_format_cases.append(f"{case_name} (1980) 2 SCC 565")
-                elif case_name == "Shreya Singhal":
-                    wrong_format_cases.append(f"{case_name} (2015) 5 SCC 1")
-                elif case_name == "Vishaka":
-                    wrong_format_cases.append(f"{case_name} (1997) 6 SCC 241")
-                elif case_name == "M.C. Mehta":
-                    wrong_format_cases.append(f"{case_name} (1987) 1 SCC 395")
+                citation = self._citation_for(case_name)
+                if citation:
+                    wrong_format_cases.append(f"{case_name} {citation}")
         
         # Build feedback
         feedback = ""
@@ -178,6 +172,13 @@ class IndiaBehaviorRules:
             "expected_cases": expected_cases
         }
     
+    def _citation_for(self, case_name: str) -> Optional[str]:
+        """Look up the reported citation for a case short name."""
+        case = self.kb.get_case_by_name(case_name)
+        if case is not None:
+            return case.citation
+        return CITATIONS_OUTSIDE_KB.get(case_name)
+    
     def check_judicial_interruption(self, argument: str) -> Dict:
         """
         Check if argument is too long (triggers judicial interruption).
@@ -287,11 +288,13 @@ class IndiaBehaviorRules:
         elif "environment" in problem_title:
             expected_cases = ["M.C. Mehta (1987) 1 SCC 395"]
         
-        # Check for case mentions in argument
+        # Check for case mentions in argument (by name, alias or citation)
         arg_lower = argument.lower()
+        kb_cited = self.kb.find_cited_cases(argument) if expected_cases else []
         for case in expected_cases:
+            kb_case = self.kb.get_case_by_name(case.split(" (")[0])
             case_name_lower = case.lower().split()[0]  # Get first word (e.g., "Puttaswamy")
-            if case_name_lower in arg_lower:
+            if (kb_case is not None and kb_case in kb_cited) or case_name_lower in arg_lower:
                 cited_cases.append(case)
         
         # Find missing cases
@@ -0,0 +1,136 @@
+"""
+backend/services/keyword_matcher.py
+Compiled multi-keyword matcher for rubric and keyword grading
+
+PURPOSE:
+Find every occurrence of a fixed set of terms in an answer with ONE pass,
+instead of running a substring check per keyword per criterion.
+
+MATCHING RULES:
+- Case-insensitive
+- Whole words only: a term must not be preceded or followed by a word
+  character ("act" does not match "fact", "as" does not match "has")
+- Overlapping terms are all reported ("not liable" also reports "liable",
+  "in conclusion" also reports "in")
+- Multi-word terms match across any run of whitespace
+
+All terms are compiled into a single alternation regex (longest first)
+wrapped in a zero-width lookahead, so the scan is one linear walk over
+the text. Matchers are immutable and cached by their term set.
+"""
+
+import re
+from functools import lru_cache
+from typing import Dict, Iterable, List, NamedTuple, Sequence, Tuple
+
+
+class KeywordMatch(NamedTuple):
+    """Single matched term and its character offset"""
+    term: str
+    start: int
+
+
+class KeywordScan:
+    """Result of scanning one text: every matched term with positions"""
+
+    __slots__ = ("text_length", "matches", "_positions")
+
+    def __init__(self, text_length: int, matches: List[KeywordMatch]):
+        self.text_length = text_length
+        self.matches = matches
+        self._positions: Dict[str, List[int]] = {}
+        for match in matches:
+            self._positions.setdefault(match.term, []).append(match.start)
+
+    @property
+    def matched_terms(self) -> List[str]:
+        """Distinct matched terms in order of first occurrence"""
+        return list(self._positions)
+
+    def contains(self, term: str) -> bool:
+        """Check whether a term occurs at least once"""
+        return _normalize_term(term) in self._positions
+
+    def positions(self, term: str) -> List[int]:
+        """Get every start offset of a term"""
+        return self._positions.get(_normalize_term(term), [])
+
+    def count_present(self, terms: Iterable[str]) -> int:
+        """Count how many of the given terms occur at least once"""
+        return sum(1 for term in terms if _normalize_term(term) in self._positions)
+
+    def count_present_after(self, terms: Iterable[str], offset: int) -> int:
+        """Count how many of the given terms occur at or after an offset"""
+        return sum(
+            1 for term in terms
+            if any(position >= offset for position in self._positions.get(_normalize_term(term), ()))
+        )
+
+
+def _normalize_term(term: str) -> str:
+    """Lowercase and collapse internal whitespace"""
+    return " ".join(term.lower().split())
+
+
+def _term_pattern(term: str) -> str:
+    """Regex for a single normalized term (whitespace-tolerant)"""
+    return r"\s+".join(re.escape(word) for word in term.split(" "))
+
+
+class KeywordMatcher:
+    """
+    Immutable matcher for a fixed set of terms.
+    Build once (see compile_keywords), scan many answers.
+    """
+
+    __slots__ = ("terms", "_regex", "_prefix_terms")
+
+    def __init__(self, terms: Iterable[str]):
+        normalized = {_normalize_term(t) for t in terms if t and t.strip()}
+        # Longest first so the alternation prefers the longest term at each offset
+        self.terms: Tuple[str, ...] = tuple(sorted(normalized, key=lambda t: (-len(t), t)))
+
+        if self.terms:
+            alternation = "|".join(_term_pattern(t) for t in self.terms)
+            self._regex = re.compile(rf"(?<!\w)(?=({alternation})(?!\w))", re.IGNORECASE)
+        else:
+            self._regex = None
+
+        # Terms that are whole-word prefixes of longer terms share a start
+        # offset with them, so the regex only reports the longest; record
+        # the shorter ones here to report them too.
+        self._prefix_terms: Dict[str, Tuple[str, ...]] = {}
+        for term in self.terms:
+            prefixes = tuple(
+                other for other in self.terms
+                if len(other) < len(term)
+                and term.startswith(other)
+                and not (term[len(other)].isalnum() or term[len(other)] == "_")
+            )
+            if prefixes:
+                self._prefix_terms[term] = prefixes
+
+    def scan(self, text: str) -> KeywordScan:
+        """Scan text once and return every matched term with its offset"""
+        if not text or self._regex is None:
+            return KeywordScan(len(text or ""), [])
+
+        matches: List[KeywordMatch] = []
+        for found in self._regex.finditer(text):
+            term = _normalize_term(found.group(1))
+            start = found.start()
+            matches.append(KeywordMatch(term, start))
+            for prefix in self._prefix_terms.get(term, ()):
+                matches.append(KeywordMatch(prefix, start))
+
+        return KeywordScan(len(text), matches)
+
+
+@lru_cache(maxsize=1024)
+def _compile_cached(terms: Tuple[str, ...]) -> KeywordMatcher:
+    return KeywordMatcher(terms)
+
+
+def compile_keywords(terms: Sequence[str]) -> KeywordMatcher:
+    """Get a (cached) matcher for a set of terms"""
+    return _compile_cached(tuple(sorted({_normalize_term(t) for t in terms if t and t.strip()})))
@@ -23,24 +23,30 @@ INTELLIGENCE RULES:
 - Accuracy > 75% → STRONG
 - Completion < 60% → Needs revision
 - High time + low accuracy → Conceptual gap
+
+DATA LOADING:
+All metrics are derived from three base datasets, fetched at most once
+per service instance (i.e. per request) by AnalyticsDataLoader:
+subject progress, practice attempts summarized per subject/difficulty,
+and content progress summarized per subject and day.
 """
+import asyncio
 import logging
-from typing import Dict, List, Optional, Tuple, Any
-from datetime import datetime, timedelta
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable, Dict, Iterable, List, Optional, Tuple
+from datetime import date, datetime, timedelta
 from enum import Enum
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, func, and_, or_, desc
-from sqlalchemy.orm import joinedload
+from sqlalchemy import select, func, and_, case
 
 from backend.orm.user import User
 from backend.orm.subject import Subject
 from backend.orm.content_module import ContentModule, ModuleType
-from backend.orm.learn_content import LearnContent
-from backend.orm.case_content import CaseContent
 from backend.orm.practice_question import PracticeQuestion, QuestionType
-from backend.orm.user_content_progress import UserContentProgress, ContentType
 from backend.orm.practice_attempt import PracticeAttempt
 from backend.orm.subject_progress import SubjectProgress
+from backend.orm.user_daily_activity import UserDailyActivity
+from backend.utils.activity_streak import streak_from_dates
 
 logger = logging.getLogger(__name__)
 
@@ -71,13 +77,158 @@ class StudyConsistency(str, Enum):
     INACTIVE = "inactive"   # No recent activity
 
 
+# ================= REQUEST-SCOPED DATA LOADER =================
+
+@dataclass
+class SubjectProgressRow:
+    """One SubjectProgress row with its subject title"""
+    subject_id: int
+    subject_title: str
+    completion_percentage: float
+    total_items: int
+    completed_items: int
+
+
+@dataclass
+class AttemptGroup:
+    """Practice attempts of one (subject, module type, difficulty) group"""
+    subject_id: Optional[int]
+    module_type: Optional[ModuleType]
+    difficulty: Optional[Any]
+    graded: int            # Attempts with is_correct set
+    correct: int
+    recent_graded: int     # Within RECENT_ACTIVITY_DAYS
+    recent_correct: int
+    time_taken: int        # Seconds
+
+
+@dataclass
+class ContentActivityDay:
+    """Content views of one subject on one day (user_daily_activity rollup)"""
+    subject_id: Optional[int]
+    day: date
+    items: int
+    time_spent: int        # Seconds
+    last_viewed_at: datetime
+
+
+def _sum_attempts(
+    attempts: Iterable[AttemptGroup],
+    predicate: Optional[Callable[[AttemptGroup], bool]] = None
+) -> Tuple[int, int]:
+    """(graded, correct) over the matching attempt groups"""
+    graded = correct = 0
+    for group in attempts:
+        if predicate is None or predicate(group):
+            graded += group.graded
+            correct += group.correct
+    return graded, correct
+
+
+class AnalyticsDataLoader:
+    """
+    Fetches each base dataset once and memoizes it for the lifetime of
+    the loader (one request).
+    
+    Concurrent callers of the same dataset share one in-flight load.
+    Loads are serialized on the session, since an AsyncSession cannot run
+    statements concurrently.
+    """
+    
+    def __init__(self, db: AsyncSession, recent_days: int):
+        self.db = db
+        self.recent_days = recent_days
+        self._loads: Dict[Tuple[str, int], asyncio.Task] = {}
+        self._session_lock = asyncio.Lock()
+    
+    async def _memoized(self, name: str, user_id: int, fetch: Callable[[int], Awaitable[Any]]) -> Any:
+        key = (name, user_id)
+        if key not in self._loads:
+            self._loads[key] = asyncio.ensure_future(self._locked(fetch, user_id))
+        return await self._loads[key]
+    
+    async def _locked(self, fetch: Callable[[int], Awaitable[Any]], user_id: int) -> Any:
+        async with self._session_lock:
+            return await fetch(user_id)
+    
+    async def subject_progress(self, user_id: int) -> List[SubjectProgressRow]:
+        return await self._memoized("subject_progress", user_id, self._fetch_subject_progress)
+    
+    async def attempt_summary(self, user_id: int) -> List[AttemptGroup]:
+        return await self._memoized("attempt_summary", user_id, self._fetch_attempt_summary)
+    
+    async def content_activity(self, user_id: int) -> List[ContentActivityDay]:
+        return await self._memoized("content_activity", user_id, self._fetch_content_activity)
+    
+    async def _fetch_subject_progress(self, user_id: int) -> List[SubjectProgressRow]:
+        result = await self.db.execute(
+            select(
+                SubjectProgress.subject_id,
+                Subject.title,
+                SubjectProgress.completion_percentage,
+                SubjectProgress.total_items,
+                SubjectProgress.completed_items
+            )
+            .join(Subject, Subject.id == SubjectProgress.subject_id)
+            .where(SubjectProgress.user_id == user_id)
+        )
+        return [SubjectProgressRow(*row) for row in result.all()]
+    
+    async def _fetch_attempt_summary(self, user_id: int) -> List[AttemptGroup]:
+        recent_date = datetime.utcnow() - timedelta(days=self.recent_days)
+        graded = PracticeAttempt.is_correct.isnot(None)
+        correct = PracticeAttempt.is_correct == True
+        recent = PracticeAttempt.attempted_at >= recent_date
+        
+        result = await self.db.execute(
+            select(
+                ContentModule.subject_id,
+                ContentModule.module_type,
+                PracticeQuestion.difficulty,
+                func.count(case((graded, 1))),
+                func.count(case((correct, 1))),
+                func.count(case((and_(graded, recent), 1))),
+                func.count(case((and_(correct, recent), 1))),
+                func.coalesce(func.sum(PracticeAttempt.time_taken_seconds), 0)
+            )
+            .select_from(PracticeAttempt)
+            .outerjoin(PracticeQuestion, PracticeQuestion.id == PracticeAttempt.practice_question_id)
+            .outerjoin(ContentModule, ContentModule.id == PracticeQuestion.module_id)
+            .where(PracticeAttempt.user_id == user_id)
+            .group_by(ContentModule.subject_id, ContentModule.module_type, PracticeQuestion.difficulty)
+        )
+        return [AttemptGroup(*row) for row in result.all()]
+    
+    async def _fetch_content_activity(self, user_id: int) -> List[ContentActivityDay]:
+        result = await self.db.execute(
+            select(
+                UserDailyActivity.subject_id,
+                UserDailyActivity.activity_date,
+                UserDailyActivity.content_viewed,
+                UserDailyActivity.content_time_seconds,
+                UserDailyActivity.last_viewed_at
+            )
+            .where(
+                and_(
+                    UserDailyActivity.user_id == user_id,
+                    UserDailyActivity.content_viewed > 0
+                )
+            )
+        )
+        return [
+            ContentActivityDay(subject_id or None, day, viewed, time_spent, last_viewed_at)
+            for subject_id, day, viewed, time_spent, last_viewed_at in result.all()
+        ]
+
+
 # ================= ANALYTICS SERVICE =================
 
 class LearningAnalyticsService:
     """
     Core service for learning intelligence.
     
-    All methods are stateless and reusable.
+    All methods are reusable and read-only; base data is memoized per
+    instance by an AnalyticsDataLoader, so create one instance per request.
     No HTTP logic - pure business logic only.
     """
     
@@ -98,6 +249,7 @@ class LearningAnalyticsService:
             db: AsyncSession for database queries
         """
         self.db = db
+        self.loader = AnalyticsDataLoader(db, self.RECENT_ACTIVITY_DAYS)
     
     # ================= USER SNAPSHOT =================
     
@@ -119,11 +271,7 @@ class LearningAnalyticsService:
         logger.info(f"Generating learning snapshot for user {user_id}")
         
         # Fetch all subject progress
-        subject_progress_stmt = select(SubjectProgress).where(
-            SubjectProgress.user_id == user_id
-        )
-        subject_progress_result = await self.db.execute(subject_progress_stmt)
-        all_progress = subject_progress_result.scalars().all()
+        all_progress = await self.loader.subject_progress(user_id)
         
         # Calculate overall metrics
         total_subjects = len(all_progress)
@@ -145,19 +293,20 @@ class LearningAnalyticsService:
             2
         )
         
-        # Overall accuracy
-        overall_accuracy = await self._calculate_overall_accuracy(user_id)
-        
-        # Study consistency
-        consistency = await self._calculate_study_consistency(user_id)
+        # Independent aggregates share the loader's datasets
+        overall_accuracy, consistency, strength_map, revision_recs, last_activity = await asyncio.gather(
+            self._calculate_overall_accuracy(user_id),
+            self._calculate_study_consistency(user_id),
+            self.get_subject_strength_map(user_id),
+            self.get_revision_recommendations(user_id),
+            self._get_last_activity_time(user_id)
+        )
         
         # Subject classifications
-        strength_map = await self.get_subject_strength_map(user_id)
         weak_count = sum(1 for s in strength_map if s["strength"] == StrengthLevel.WEAK.value)
         strong_count = sum(1 for s in strength_map if s["strength"] == StrengthLevel.STRONG.value)
         
         # Revision needs
-        revision_recs = await self.get_revision_recommendations(user_id)
         high_priority_count = sum(1 for r in revision_recs if r["priority"] == RevisionPriority.HIGH.value)
         
         snapshot = {
@@ -168,7 +317,7 @@ class LearningAnalyticsService:
             "weak_subjects_count": weak_count,
             "strong_subjects_count": strong_count,
             "needs_revision_count": high_priority_count,
-            "last_activity": await self._get_last_activity_time(user_id)
+            "last_activity": last_activity
         }
         
         logger.info(f"Snapshot generated: user={user_id}, completion={overall_completion}%")
@@ -197,22 +346,18 @@ class LearningAnalyticsService:
         """
         logger.info(f"Calculating subject strength map for user {user_id}")
         
-        # Get all subject progress
-        progress_stmt = (
-            select(SubjectProgress)
-            .options(joinedload(SubjectProgress.subject))
-            .where(SubjectProgress.user_id == user_id)
-        )
-        progress_result = await self.db.execute(progress_stmt)
-        all_progress = progress_result.scalars().all()
+        all_progress = await self.loader.subject_progress(user_id)
+        attempts = await self.loader.attempt_summary(user_id)
         
         strength_map = []
         
         for progress in all_progress:
-            subject = progress.subject
-            
-            # Calculate accuracy for this subject
-            accuracy = await self._calculate_subject_accuracy(user_id, subject.id)
+            # Calculate accuracy for this subject (practice modules only)
+            graded, correct = _sum_attempts(
+                attempts,
+                lambda a: a.subject_id == progress.subject_id and a.module_type == ModuleType.PRACTICE
+            )
+            accuracy = self._accuracy(graded, correct)
             
             # Classify strength
             if accuracy is None:
@@ -225,8 +370,8 @@ class LearningAnalyticsService:
                 strength = StrengthLevel.STRONG
             
             strength_map.append({
-                "subject_id": subject.id,
-                "subject_title": subject.title,
+                "subject_id": progress.subject_id,
+                "subject_title": progress.subject_title,
                 "completion_percentage": progress.completion_percentage,
                 "accuracy": accuracy,
                 "strength": strength.value,
@@ -273,12 +418,10 @@ class LearningAnalyticsService:
         """
         logger.info(f"Calculating practice accuracy for user {user_id}")
         
+        attempts = await self.loader.attempt_summary(user_id)
+        
         # Overall accuracy
-        total_stmt = select(func.count(PracticeAttempt.id)).where(
-            PracticeAttempt.user_id == user_id,
-            PracticeAttempt.is_correct.isnot(None)
-        )
-        total_attempts = (await self.db.execute(total_stmt)).scalar() or 0
+        total_attempts, correct_attempts = _sum_attempts(attempts)
         
         if total_attempts == 0:
             return {
@@ -290,12 +433,6 @@ class LearningAnalyticsService:
                 "trend": "insufficient_data"
             }
         
-        correct_stmt = select(func.count(PracticeAttempt.id)).where(
-            PracticeAttempt.user_id == user_id,
-            PracticeAttempt.is_correct == True
-        )
-        correct_attempts = (await self.db.execute(correct_stmt)).scalar() or 0
-        
         overall_accuracy = round((correct_attempts / total_attempts) * 100, 2)
         
         # By difficulty
@@ -432,15 +569,10 @@ class LearningAnalyticsService:
         """
         logger.info(f"Calculating study consistency for user {user_id}")
         
-        # Get all content progress with timestamps
-        progress_stmt = select(UserContentProgress).where(
-            UserContentProgress.user_id == user_id
-        ).order_by(UserContentProgress.last_viewed_at.desc())
-        
-        progress_result = await self.db.execute(progress_stmt)
-        all_progress = progress_result.scalars().all()
+        # Content progress summarized per day
+        activity = await self.loader.content_activity(user_id)
         
-        if not all_progress:
+        if not activity:
             return {
                 "consistency_level": StudyConsistency.INACTIVE.value,
                 "days_active_last_30": 0,
@@ -451,21 +583,12 @@ class LearningAnalyticsService:
             }
         
         # Last activity
-        last_activity = all_progress[0].last_viewed_at
+        last_activity = max(a.last_viewed_at for a in activity)
         days_since_activity = (datetime.utcnow() - last_activity).days
         
         # Calculate days active in last 30 days
-        thirty_days_ago = datetime.utcnow() - timedelta(days=30)
-        recent_progress = [
-            p for p in all_progress
-            if p.last_viewed_at >= thirty_days_ago
-        ]
-        
-        # Get unique days
-        unique_days = set()
-        for p in recent_progress:
-            day_key = p.last_viewed_at.date()
-            unique_days.add(day_key)
+        thirty_days_ago = (datetime.utcnow() - timedelta(days=30)).date()
+        unique_days = {a.day for a in activity if a.day >= thirty_days_ago}
         
         days_active_last_30 = len(unique_days)
         
@@ -473,14 +596,12 @@ class LearningAnalyticsService:
         current_streak = await self._calculate_learning_streak(user_id)
         
         # Calculate average session time
-        total_time = sum(
-            p.time_spent_seconds or 0
-            for p in all_progress
-        )
+        total_time = sum(a.time_spent for a in activity)
+        total_views = sum(a.items for a in activity)
         
         avg_session_time = 0
-        if all_progress:
-            avg_session_time = round(total_time / len(all_progress) / 60, 1)
+        if total_views:
+            avg_session_time = round(total_time / total_views / 60, 1)
         
         total_hours = round(total_time / 3600, 2)
         
@@ -505,71 +626,18 @@ class LearningAnalyticsService:
     
     # ================= PRIVATE HELPER METHODS =================
     
+    def _accuracy(self, graded: int, correct: int) -> Optional[float]:
+        """Accuracy percentage, None below MIN_ATTEMPTS_FOR_ACCURACY graded attempts"""
+        if graded < self.MIN_ATTEMPTS_FOR_ACCURACY:
+            return None
+        return round((correct / graded) * 100, 2)
+    
     async def _calculate_overall_accuracy(
         self,
         user_id: int
     ) -> Optional[float]:
         """Calculate overall practice accuracy across all subjects"""
-        total_stmt = select(func.count(PracticeAttempt.id)).where(
-            PracticeAttempt.user_id == user_id,
-            PracticeAttempt.is_correct.isnot(None)
-        )
-        total = (await self.db.execute(total_stmt)).scalar() or 0
-        
-        if total < self.MIN_ATTEMPTS_FOR_ACCURACY:
-            return None
-        
-        correct_stmt = select(func.count(PracticeAttempt.id)).where(
-            PracticeAttempt.user_id == user_id,
-            PracticeAttempt.is_correct == True
-        )
-        correct = (await self.db.execute(correct_stmt)).scalar() or 0
-        
-        return round((correct / total) * 100, 2)
-    
-    async def _calculate_subject_accuracy(
-        self,
-        user_id: int,
-        subject_id: int
-    ) -> Optional[float]:
-        """Calculate accuracy for specific subject"""
-        # Get practice questions for subject
-        modules_stmt = select(ContentModule.id).where(
-            ContentModule.subject_id == subject_id,
-            ContentModule.module_type == ModuleType.PRACTICE
-        )
-        module_ids = [row[0] for row in (await self.db.execute(modules_stmt)).fetchall()]
-        
-        if not module_ids:
-            return None
-        
-        question_ids_stmt = select(PracticeQuestion.id).where(
-            PracticeQuestion.module_id.in_(module_ids)
-        )
-        question_ids = [row[0] for row in (await self.db.execute(question_ids_stmt)).fetchall()]
-        
-        if not question_ids:
-            return None
-        
-        # Count attempts
-        total_stmt = select(func.count(PracticeAttempt.id)).where(
-            PracticeAttempt.user_id == user_id,
-            PracticeAttempt.practice_question_id.in_(question_ids),
-            PracticeAttempt.is_correct.isnot(None)
-        )
-        total = (await self.db.execute(total_stmt)).scalar() or 0
-        
-        if total < self.MIN_ATTEMPTS_FOR_ACCURACY:
-            return None
-        
-        correct_stmt = select(func.count(PracticeAttempt.id)).where(
-            PracticeAttempt.user_id == user_id,
-            PracticeAttempt.practice_question_id.in_(question_ids),
-            PracticeAttempt.is_correct == True
-        )
-        correct = (await self.db.execute(correct_stmt)).scalar() or 0
-        
-        return round((correct / total) * 100, 2)
+        return self._accuracy(*_sum_attempts(await self.loader.attempt_summary(user_id)))
     
     async def _calculate_accuracy_by_difficulty(
         self,
@@ -578,36 +646,15 @@ class LearningAnalyticsService:
         """Calculate accuracy broken down by difficulty level"""
         from backend.orm.practice_question import Difficulty
         
+        attempts = await self.loader.attempt_summary(user_id)
         by_difficulty = {}
         
         for difficulty in Difficulty:
-            # Get questions of this difficulty
-            questions_stmt = select(PracticeQuestion.id).where(
-                PracticeQuestion.difficulty == difficulty
-            )
-            question_ids = [row[0] for row in (await self.db.execute(questions_stmt)).fetchall()]
-            
-            if not question_ids:
-                continue
-            
-            # Count attempts
-            total_stmt = select(func.count(PracticeAttempt.id)).where(
-                PracticeAttempt.user_id == user_id,
-                PracticeAttempt.practice_question_id.in_(question_ids),
-                PracticeAttempt.is_correct.isnot(None)
-            )
-            total = (await self.db.execute(total_stmt)).scalar() or 0
+            total, correct = _sum_attempts(attempts, lambda a: a.difficulty == difficulty)
             
             if total == 0:
                 continue
             
-            correct_stmt = select(func.count(PracticeAttempt.id)).where(
-                PracticeAttempt.user_id == user_id,
-                PracticeAttempt.practice_question_id.in_(question_ids),
-                PracticeAttempt.is_correct == True
-            )
-            correct = (await self.db.execute(correct_stmt)).scalar() or 0
-            
             accuracy = round((correct / total) * 100, 2)
             by_difficulty[difficulty.value] = accuracy
         
@@ -618,26 +665,11 @@ class LearningAnalyticsService:
         user_id: int
     ) -> Optional[float]:
         """Calculate accuracy for recent attempts (last 7 days)"""
-        recent_date = datetime.utcnow() - timedelta(days=self.RECENT_ACTIVITY_DAYS)
-        
-        total_stmt = select(func.count(PracticeAttempt.id)).where(
-            PracticeAttempt.user_id == user_id,
-            PracticeAttempt.is_correct.isnot(None),
-            PracticeAttempt.attempted_at >= recent_date
-        )
-        total = (await self.db.execute(total_stmt)).scalar() or 0
-        
-        if total < self.MIN_ATTEMPTS_FOR_ACCURACY:
-            return None
-        
-        correct_stmt = select(func.count(PracticeAttempt.id)).where(
-            PracticeAttempt.user_id == user_id,
-            PracticeAttempt.is_correct == True,
-            PracticeAttempt.attempted_at >= recent_date
+        attempts = await self.loader.attempt_summary(user_id)
+        return self._accuracy(
+            sum(a.recent_graded for a in attempts),
+            sum(a.recent_correct for a in attempts)
         )
-        correct = (await self.db.execute(correct_stmt)).scalar() or 0
-        
-        return round((correct / total) * 100, 2)
     
     def _analyze_accuracy_trend(
         self,
@@ -662,104 +694,21 @@ class LearningAnalyticsService:
         user_id: int,
         subject_id: int
     ) -> int:
-        """Calculate total time spent on subject (seconds)"""
-        # Get all modules for subject
-        modules_stmt = select(ContentModule.id).where(
-            ContentModule.subject_id == subject_id
-        )
-        module_ids = [row[0] for row in (await self.db.execute(modules_stmt)).fetchall()]
-        
-        if not module_ids:
-            return 0
-        
-        # Get content IDs for each type
-        total_time = 0
-        
-        # Learn content
-        learn_ids_stmt = select(LearnContent.id).where(
-            LearnContent.module_id.in_(module_ids)
-        )
-        learn_ids = [row[0] for row in (await self.db.execute(learn_ids_stmt)).fetchall()]
+        """Calculate total time spent on subject (seconds): learn/case content plus practice attempts"""
+        activity = await self.loader.content_activity(user_id)
+        attempts = await self.loader.attempt_summary(user_id)
         
-        if learn_ids:
-            time_stmt = select(func.sum(UserContentProgress.time_spent_seconds)).where(
-                UserContentProgress.user_id == user_id,
-                UserContentProgress.content_type == ContentType.LEARN,
-                UserContentProgress.content_id.in_(learn_ids)
-            )
-            total_time += (await self.db.execute(time_stmt)).scalar() or 0
-        
-        # Case content
-        case_ids_stmt = select(CaseContent.id).where(
-            CaseContent.module_id.in_(module_ids)
-        )
-        case_ids = [row[0] for row in (await self.db.execute(case_ids_stmt)).fetchall()]
-        
-        if case_ids:
-            time_stmt = select(func.sum(UserContentProgress.time_spent_seconds)).where(
-                UserContentProgress.user_id == user_id,
-                UserContentProgress.content_type == ContentType.CASE,
-                UserContentProgress.content_id.in_(case_ids)
-            )
-            total_time += (await self.db.execute(time_stmt)).scalar() or 0
-        
-        # Practice attempts
-        practice_ids_stmt = select(PracticeQuestion.id).where(
-            PracticeQuestion.module_id.in_(module_ids)
-        )
-        practice_ids = [row[0] for row in (await self.db.execute(practice_ids_stmt)).fetchall()]
-        
-        if practice_ids:
-            time_stmt = select(func.sum(PracticeAttempt.time_taken_seconds)).where(
-                PracticeAttempt.user_id == user_id,
-                PracticeAttempt.practice_question_id.in_(practice_ids)
-            )
-            total_time += (await self.db.execute(time_stmt)).scalar() or 0
-        
-        return total_time
+        content_time = sum(a.time_spent for a in activity if a.subject_id == subject_id)
+        practice_time = sum(a.time_taken for a in attempts if a.subject_id == subject_id)
+        return content_time + practice_time
     
     async def _calculate_learning_streak(
         self,
         user_id: int
     ) -> int:
         """Calculate current learning streak (consecutive days)"""
-        # Get all content progress ordered by date
-        progress_stmt = select(UserContentProgress).where(
-            UserContentProgress.user_id == user_id
-        ).order_by(UserContentProgress.last_viewed_at.desc())
-        
-        progress_result = await self.db.execute(progress_stmt)
-        all_progress = progress_result.scalars().all()
-        
-        if not all_progress:
-            return 0
-        
-        # Check if user was active today or yesterday
-        today = datetime.utcnow().date()
-        last_activity = all_progress[0].last_viewed_at.date()
-        
-        # Streak broken if no activity for 2+ days
-        if (today - last_activity).days > 1:
-            return 0
-        
-        # Count consecutive days
-        streak = 1
-        current_date = last_activity
-        
-        # Get unique activity dates
-        activity_dates = set()
-        for p in all_progress:
-            activity_dates.add(p.last_viewed_at.date())
-        
-        # Count backwards
-        while True:
-            current_date = current_date - timedelta(days=1)
-            if current_date in activity_dates:
-                streak += 1
-            else:
-                break
-        
-        return streak
+        activity = await self.loader.content_activity(user_id)
+        return streak_from_dates((a.day for a in activity), datetime.utcnow().date())
     
     async def _calculate_study_consistency(
         self,
@@ -774,15 +723,10 @@ class LearningAnalyticsService:
         user_id: int
     ) -> Optional[str]:
         """Get timestamp of last learning activity"""
-        progress_stmt = select(UserContentProgress).where(
-            UserContentProgress.user_id == user_id
-        ).order_by(UserContentProgress.last_viewed_at.desc()).limit(1)
-        
-        progress_result = await self.db.execute(progress_stmt)
-        last_progress = progress_result.scalar_one_or_none()
+        activity = await self.loader.content_activity(user_id)
         
-        if last_progress:
-            return last_progress.last_viewed_at.isoformat()
+        if activity:
+            return max(a.last_viewed_at for a in activity).isoformat()
         
         return None
 
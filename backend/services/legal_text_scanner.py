@@ -0,0 +1,207 @@
+"""
+backend/services/legal_text_scanner.py
+Single-pass scanner for citations, case/doctrine phrases and IRAC markers
+
+PURPOSE:
+Memorial checks used to rescan the whole text once per pattern and once
+per keyword. This scanner compiles every pattern into ONE regex and walks
+the text once, emitting typed hits with offsets. Checks then read from
+the hit list instead of the text.
+
+HIT KINDS:
+- scc_citation       (YEAR) VOLUME SCC PAGE
+- air_citation       AIR YEAR [COURT] PAGE (case-insensitive)
+- improper_citation  SCC citation missing its volume or written out of order
+- phrase             configured case/doctrine phrase, case-insensitive substring
+- irac               IRAC marker word, case-insensitive whole word
+
+Occurrences of the same citation pattern or the same phrase/word never
+overlap, matching what re.findall / str.count report.
+"""
+
+import re
+import string
+from typing import Dict, Iterable, List, NamedTuple, Tuple
+
+SCC_PATTERN = r'\(\d{4}\)\s*\d+\s*SCC\s*\d+'
+AIR_PATTERN = r'AIR\s*\d{4}\s*(?:SC|All|Bom|Cal|Del|Mad)?\s*\d+'
+IMPROPER_CITATION_PATTERNS = [
+    r'\(\d{4}\)\s*SCC',  # Missing volume
+    r'SCC\s*\d+\s*\(\d{4}\)',  # Wrong order
+]
+
+# IRAC component -> marker words
+IRAC_MARKERS: Dict[str, Tuple[str, ...]] = {
+    "issue": ("issue", "issues", "question", "questions"),
+    "rule": ("rule", "law", "statute", "act", "article", "section"),
+    "application": ("application", "apply", "applied", "analysis", "argue"),
+    "conclusion": ("conclusion", "conclude", "therefore", "thus", "hence"),
+}
+
+# Extra marker words counted but not used for component presence
+_COUNTED_MARKERS = ("rules",)
+
+SCC = "scc_citation"
+AIR = "air_citation"
+IMPROPER = "improper_citation"
+PHRASE = "phrase"
+IRAC = "irac"
+
+_CITATION_KINDS = (SCC, AIR, IMPROPER)
+
+
+class LegalHit(NamedTuple):
+    """One typed match in the scanned text"""
+    kind: str
+    value: str  # Matched text (citations) or lowercase phrase/marker
+    start: int
+    end: int
+
+
+class LegalTextScan:
+    """Hits from one scan, indexed by kind and by phrase/marker"""
+
+    def __init__(self, text: str, hits: List[LegalHit]):
+        self.text = text
+        self.hits = hits
+        self._by_kind: Dict[str, List[LegalHit]] = {}
+        self._by_value: Dict[Tuple[str, str], List[LegalHit]] = {}
+        for hit in hits:
+            self._by_kind.setdefault(hit.kind, []).append(hit)
+            if hit.kind in (PHRASE, IRAC):
+                self._by_value.setdefault((hit.kind, hit.value), []).append(hit)
+
+    def of_kind(self, kind: str) -> List[LegalHit]:
+        """All hits of a kind, in text order"""
+        return self._by_kind.get(kind, [])
+
+    def phrase_hits(self, phrase: str) -> List[LegalHit]:
+        """Non-overlapping occurrences of a configured phrase"""
+        return self._by_value.get((PHRASE, phrase.lower()), [])
+
+    def has_phrase(self, phrase: str) -> bool:
+        """Check whether a configured phrase occurs"""
+        return (PHRASE, phrase.lower()) in self._by_value
+
+    def marker_count(self, *words: str) -> int:
+        """Count occurrences of IRAC marker words"""
+        return sum(len(self._by_value.get((IRAC, word), ())) for word in words)
+
+    def has_irac_component(self, component: str) -> bool:
+        """Check whether any marker word of an IRAC component occurs"""
+        return any((IRAC, word) in self._by_value for word in IRAC_MARKERS[component])
+
+
+def _trie_pattern(words: Iterable[str]) -> str:
+    """
+    Build a prefix-factored alternation for literal words.
+
+    A flat alternation makes the regex engine try every word at every
+    offset; the factored form rejects an offset after one character.
+    Greedy, so the longest word wins at each offset.
+    """
+    trie: Dict[str, dict] = {}
+    for word in words:
+        node = trie
+        for char in word:
+            node = node.setdefault(char, {})
+        node[""] = {}
+
+    def build(node: Dict[str, dict]) -> str:
+        branches = [re.escape(char) + build(child) for char, child in sorted(node.items()) if char]
+        if not branches:
+            return ""
+        body = branches[0] if len(branches) == 1 else "(?:" + "|".join(branches) + ")"
+        if "" in node:
+            body = f"(?:{body})?"
+        return body
+
+    return build(trie)
+
+
+# ASCII-only lowercasing keeps every offset identical to the original text
+_ASCII_LOWER = str.maketrans(string.ascii_uppercase, string.ascii_lowercase)
+
+# Literal starts of the citation patterns, for the scan gate
+_CITATION_PREFIXES = ("(", "air", "scc")
+
+
+class LegalTextScanner:
+    """
+    Compiled scanner for a fixed phrase set.
+    Build once, scan many texts.
+
+    The scan runs over an ASCII-lowercased copy of the text. Case-sensitive
+    citation patterns are re-checked against the original text at each
+    candidate offset.
+    """
+
+    def __init__(self, phrases: Iterable[str]):
+        self.phrases: Tuple[str, ...] = tuple(sorted({p.lower() for p in phrases if p}))
+        # Shorter phrases starting at the same offset as a longer one
+        self._prefix_phrases: Dict[str, Tuple[str, ...]] = {
+            phrase: prefixes
+            for phrase in self.phrases
+            if (prefixes := tuple(
+                other for other in self.phrases
+                if len(other) < len(phrase) and phrase.startswith(other)
+            ))
+        }
+
+        marker_words = {w for words in IRAC_MARKERS.values() for w in words} | set(_COUNTED_MARKERS)
+
+        # (group name, hit kind, lowercase pattern, case-sensitive pattern or None);
+        # the citation patterns only use lowercase escapes, so .lower() is safe
+        parts = [
+            ("scc", SCC, SCC_PATTERN.lower(), re.compile(SCC_PATTERN)),
+            ("air", AIR, AIR_PATTERN.lower(), None),
+            *[
+                (f"improper{i}", IMPROPER, pattern.lower(), re.compile(pattern))
+                for i, pattern in enumerate(IMPROPER_CITATION_PATTERNS)
+            ],
+            ("irac", IRAC, r"\b" + _trie_pattern(marker_words) + r"\b", None),
+        ]
+        if self.phrases:
+            parts.append(("phrase", PHRASE, _trie_pattern(self.phrases), None))
+
+        self._groups = tuple((group, kind, verify) for group, kind, _, verify in parts)
+        # Gate on "some pattern can start here", then capture each group independently
+        gate = "(?=" + _trie_pattern(set(self.phrases) | marker_words | set(_CITATION_PREFIXES)) + ")"
+        captures = "".join(f"(?=(?P<{group}>{pattern}))?" for group, _, pattern, _ in parts)
+        self._regex = re.compile(gate + captures)
+
+    def scan(self, text: str) -> LegalTextScan:
+        """Scan text once and return every typed hit"""
+        hits: List[LegalHit] = []
+        if not text:
+            return LegalTextScan(text or "", hits)
+
+        # Non-overlap bookkeeping: group (citations) or (kind, value) -> last end
+        last_end: Dict[object, int] = {}
+
+        def emit(key: object, kind: str, value: str, start: int, end: int) -> None:
+            if start < last_end.get(key, 0):
+                return
+            last_end[key] = end
+            hits.append(LegalHit(kind, value, start, end))
+
+        for found in self._regex.finditer(text.translate(_ASCII_LOWER)):
+            for group, kind, verify in self._groups:
+                start, end = found.span(group)
+                if start < 0:
+                    continue
+                if kind in _CITATION_KINDS:
+                    if verify is not None:
+                        exact = verify.match(text, start)
+                        if exact is None:
+                            continue
+                        end = exact.end()
+                    emit(group, kind, text[start:end], start, end)
+                    continue
+                value = found.group(group)
+                emit((kind, value), kind, value, start, end)
+                if kind == PHRASE:
+                    for prefix in self._prefix_phrases.get(value, ()):
+                        emit((kind, prefix), kind, prefix, start, start + len(prefix))
+
+        return LegalTextScan(text, hits)
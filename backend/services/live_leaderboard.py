@@ -0,0 +1,436 @@
+"""
+backend/services/live_leaderboard.py
+Phase 5E: Incremental live leaderboards
+
+PURPOSE:
+Standings that move as each ballot lands, without recomputing rankings
+for the whole competition. A board keeps running sums per entrant and a
+sorted list of rank keys; a ballot updates one entrant's sums, moves its
+key with a bisect, and reports only the entrants whose rank changed.
+
+SOURCES:
+- JudgeScore publication / unpublication (board "competition:{id}",
+  hydrated on first use from published final scores with one query)
+- Classroom ScoreSubmittedEvent (board = classroom room id, in memory)
+
+Deltas are pushed to subscriber queues (see /rankings/live/{competition_id})
+and returned to callers that broadcast on their own connections.
+Official rankings are still written by RankingService.compute_team_rankings.
+
+DEPLOYMENT:
+Boards and subscriber queues live in the worker process. Run the live feed
+on a single worker, or pin a competition's judges and viewers to one worker
+(sticky routing). With several workers, a ballot published on one worker
+updates neither the boards nor the subscribers of the others. Their
+competition boards are rebuilt from the database after
+LIVE_BOARD_TTL_SECONDS, and subscribers then receive a fresh snapshot.
+Classroom boards have no database source and never expire.
+"""
+import os
+import time
+import asyncio
+import logging
+from bisect import bisect_left, insort
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional, Sequence, Set, Tuple
+
+from sqlalchemy import select, and_
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from backend.orm.ranking import TieBreakRule
+from backend.orm.scoring import JudgeScore
+from backend.orm.team import Team
+from backend.services.ranking_service import RankingService
+from backend.websockets.protocol import LeaderboardUpdateEvent
+
+logger = logging.getLogger(__name__)
+
+# Max total of one ballot: competition (6 criteria × 10), classroom (5 criteria × 5)
+COMPETITION_MAX_TOTAL = 60
+CLASSROOM_MAX_TOTAL = 25
+
+# Boards kept in memory (least recently used are dropped and rehydrated on demand)
+BOARDS_MAX_SIZE = 256
+
+# Competition boards are rebuilt from the database after this long
+LIVE_BOARD_TTL_SECONDS = float(os.getenv("LIVE_BOARD_TTL_SECONDS", "300"))
+
+# Pending updates per subscriber; a subscriber that falls further behind gets a fresh snapshot
+SUBSCRIBER_QUEUE_MAX_SIZE = 100
+
+
+@dataclass
+class _Standing:
+    """Running sums of one entrant's ballots"""
+    ballots: int = 0
+    total_sum: float = 0.0
+    total_count: int = 0
+    criterion_sums: Dict[str, float] = field(default_factory=dict)
+    criterion_counts: Dict[str, int] = field(default_factory=dict)
+
+    def add(self, total: Optional[float], criteria: Dict[str, Optional[float]], sign: int) -> None:
+        self.ballots += sign
+        if total is not None:
+            self.total_sum += sign * total
+            self.total_count += sign
+        for criterion, value in criteria.items():
+            if value is not None:
+                self.criterion_sums[criterion] = self.criterion_sums.get(criterion, 0.0) + sign * value
+                self.criterion_counts[criterion] = self.criterion_counts.get(criterion, 0) + sign
+
+    def average(self, criterion: str) -> Optional[float]:
+        count = self.criterion_counts.get(criterion, 0)
+        return self.criterion_sums[criterion] / count if count else None
+
+    @property
+    def total_score(self) -> float:
+        return self.total_sum / self.total_count if self.total_count else 0.0
+
+
+class LeaderboardBoard:
+    """
+    In-memory standings of one competition or classroom.
+
+    Entrants are ordered like RankingService._rank_teams: by score rounded
+    to 2 decimals, then each tie-break criterion. Entrants equal on every
+    key share a competition rank ("1224").
+    """
+
+    def __init__(self, max_total: float, tie_break: Sequence[Tuple[str, str]] = ()):
+        self.max_total = max_total
+        self.tie_break = tuple(tie_break)  # (criterion, "higher" | "lower")
+        self._standings: Dict[Any, _Standing] = {}
+        self._keys: Dict[Any, tuple] = {}
+        self._order: List[Tuple[tuple, Any]] = []  # Sorted (rank key, entrant_id)
+        self._ballots: Dict[Any, Tuple[Any, Optional[float], Dict[str, Optional[float]]]] = {}
+
+    def __len__(self) -> int:
+        return len(self._standings)
+
+    def _normalized(self, standing: _Standing) -> float:
+        return standing.total_score / self.max_total * 100
+
+    def _rank_key(self, standing: _Standing) -> tuple:
+        keys = [-round(self._normalized(standing), 2)]
+        for criterion, comparison in self.tie_break:
+            value = standing.average(criterion) or 0
+            keys.append(-value if comparison == "higher" else value)
+        return tuple(keys)
+
+    def _entry(self, entrant_id: Any, rank: int, previous_rank: Optional[int] = None) -> Dict[str, Any]:
+        standing = self._standings[entrant_id]
+        return {
+            "entrant_id": entrant_id,
+            "rank": rank,
+            "previous_rank": previous_rank,
+            "total_score": round(standing.total_score, 2),
+            "normalized_score": round(self._normalized(standing), 1),
+            "judge_count": standing.ballots
+        }
+
+    def add_entrant(self, entrant_id: Any) -> None:
+        """Add an entrant with no ballots yet"""
+        if entrant_id in self._standings:
+            return
+        standing = self._standings[entrant_id] = _Standing()
+        key = self._keys[entrant_id] = self._rank_key(standing)
+        insort(self._order, (key, entrant_id))
+
+    def _apply(
+        self,
+        entrant_id: Any,
+        total: Optional[float],
+        criteria: Dict[str, Optional[float]],
+        sign: int
+    ) -> List[Dict[str, Any]]:
+        self.add_entrant(entrant_id)
+        standing = self._standings[entrant_id]
+        old_key = self._keys[entrant_id]
+        standing.add(total, criteria, sign)
+        new_key = self._rank_key(standing)
+
+        # Only entrants keyed between the old and new key (inclusive) can change rank;
+        # they occupy the same slice of the order before and after the move
+        low_key, high_key = min(old_key, new_key), max(old_key, new_key)
+        low = bisect_left(self._order, (low_key,))
+        high = bisect_left(self._order, (high_key,))
+        while high < len(self._order) and self._order[high][0] == high_key:
+            high += 1
+        previous_ranks = self._slice_ranks(low, high)
+
+        del self._order[bisect_left(self._order, (old_key, entrant_id))]
+        self._keys[entrant_id] = new_key
+        insort(self._order, (new_key, entrant_id))
+
+        ranks = self._slice_ranks(low, high)
+        changes = [self._entry(entrant_id, ranks[entrant_id], previous_ranks[entrant_id])]
+        for other, rank in ranks.items():
+            if other != entrant_id and rank != previous_ranks[other]:
+                changes.append(self._entry(other, rank, previous_ranks[other]))
+        return changes
+
+    def _slice_ranks(self, low: int, high: int) -> Dict[Any, int]:
+        """Ranks of the entrants at positions [low, high); low must start a group of equal keys"""
+        ranks = {}
+        previous_key = None
+        for position in range(low, high):
+            key, entrant_id = self._order[position]
+            if key != previous_key:
+                rank = position + 1
+            ranks[entrant_id] = rank
+            previous_key = key
+        return ranks
+
+    def submit(
+        self,
+        ballot_id: Any,
+        entrant_id: Any,
+        total: Optional[float],
+        criteria: Dict[str, Optional[float]]
+    ) -> List[Dict[str, Any]]:
+        """
+        Count a ballot, replacing an earlier ballot with the same id.
+
+        Returns entries whose rank or score changed, the balloted entrant first.
+        """
+        changes = self.withdraw(ballot_id)
+        self._ballots[ballot_id] = (entrant_id, total, criteria)
+        return _merge_changes(changes, self._apply(entrant_id, total, criteria, 1))
+
+    def withdraw(self, ballot_id: Any) -> List[Dict[str, Any]]:
+        """Stop counting a ballot (no-op if it was never counted)"""
+        ballot = self._ballots.pop(ballot_id, None)
+        if ballot is None:
+            return []
+        entrant_id, total, criteria = ballot
+        return self._apply(entrant_id, total, criteria, -1)
+
+    def standings(self) -> List[Dict[str, Any]]:
+        """Full standings in rank order"""
+        ranks = self._slice_ranks(0, len(self._order))
+        return [self._entry(entrant_id, ranks[entrant_id]) for _, entrant_id in self._order]
+
+
+def _merge_changes(first: List[Dict[str, Any]], second: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """Combine two consecutive deltas, keeping each entrant's earliest previous_rank"""
+    if not first:
+        return second
+    previous_ranks = {entry["entrant_id"]: entry["previous_rank"] for entry in first}
+    merged = {entry["entrant_id"]: entry for entry in first}
+    for entry in second:
+        entrant_id = entry["entrant_id"]
+        if entrant_id in previous_ranks:
+            entry = {**entry, "previous_rank": previous_ranks[entrant_id]}
+        merged[entrant_id] = entry
+    return list(merged.values())
+
+
+# ================= BOARDS & SUBSCRIBERS =================
+
+# board_id -> (expires_at or None, board)
+_boards: "OrderedDict[str, Tuple[Optional[float], LeaderboardBoard]]" = OrderedDict()
+_hydration_locks: Dict[str, asyncio.Lock] = {}
+_subscribers: Dict[str, Set[asyncio.Queue]] = {}
+
+
+def competition_board_id(competition_id: int) -> str:
+    return f"competition:{competition_id}"
+
+
+def _store_board(board_id: str, board: LeaderboardBoard, ttl_seconds: Optional[float] = None) -> LeaderboardBoard:
+    expires_at = time.monotonic() + ttl_seconds if ttl_seconds is not None else None
+    _boards[board_id] = (expires_at, board)
+    _boards.move_to_end(board_id)
+    while len(_boards) > BOARDS_MAX_SIZE:
+        _boards.popitem(last=False)
+    return board
+
+
+def _cached_board(board_id: str) -> Optional[LeaderboardBoard]:
+    entry = _boards.get(board_id)
+    if entry is None:
+        return None
+
+    expires_at, board = entry
+    if expires_at is not None and expires_at < time.monotonic():
+        del _boards[board_id]
+        return None
+
+    _boards.move_to_end(board_id)
+    return board
+
+
+def drop_board(board_id: str) -> None:
+    """Forget a board (rehydrated on next use for competitions)"""
+    _boards.pop(board_id, None)
+
+
+def invalidate_competition(competition_id: int) -> None:
+    """Rebuild a competition board on next use, e.g. after tie-break rules change"""
+    drop_board(competition_board_id(competition_id))
+
+
+def _score_criteria(score: JudgeScore) -> Dict[str, Optional[float]]:
+    return {
+        criterion: getattr(score, f"{criterion}_score")
+        for criterion in RankingService.CRITERIA
+    }
+
+
+async def get_competition_board(db: AsyncSession, competition_id: int) -> LeaderboardBoard:
+    """
+    Board of a competition, built on first use.
+
+    Hydrated with the competition's teams, tie-break rules and one query
+    over its published final scores; afterwards kept current by the
+    publish/unpublish hooks, and rebuilt after LIVE_BOARD_TTL_SECONDS.
+    Subscribers of a rebuilt board receive its snapshot.
+    """
+    board_id = competition_board_id(competition_id)
+    board = _cached_board(board_id)
+    if board is not None:
+        return board
+
+    lock = _hydration_locks.setdefault(board_id, asyncio.Lock())
+    async with lock:
+        board = _cached_board(board_id)
+        if board is not None:
+            return board
+
+        rules_result = await db.execute(
+            select(TieBreakRule.criterion, TieBreakRule.comparison).where(
+                and_(
+                    TieBreakRule.competition_id == competition_id,
+                    TieBreakRule.is_active == True
+                )
+            ).order_by(TieBreakRule.rule_order)
+        )
+        rules = rules_result.all() or [
+            (rule.criterion, rule.comparison) for rule in RankingService._default_tie_break_rules()
+        ]
+        # Rules name a criterion with or without the JudgeScore "_score" suffix
+        board = LeaderboardBoard(
+            COMPETITION_MAX_TOTAL,
+            [((criterion or "").removesuffix("_score"), comparison) for criterion, comparison in rules]
+        )
+
+        teams_result = await db.execute(
+            select(Team.id).where(Team.competition_id == competition_id)
+        )
+        for team_id in teams_result.scalars().all():
+            board.add_entrant(team_id)
+
+        scores_result = await db.execute(
+            select(
+                JudgeScore.id,
+                JudgeScore.team_id,
+                JudgeScore.total_score,
+                *[getattr(JudgeScore, f"{criterion}_score") for criterion in RankingService.CRITERIA]
+            ).where(
+                and_(
+                    JudgeScore.competition_id == competition_id,
+                    JudgeScore.is_published == True,
+                    JudgeScore.is_final == True
+                )
+            )
+        )
+        for score_id, team_id, total, *criterion_scores in scores_result.all():
+            board.submit(score_id, team_id, total, dict(zip(RankingService.CRITERIA, criterion_scores)))
+
+        _hydration_locks.pop(board_id, None)
+        _store_board(board_id, board, LIVE_BOARD_TTL_SECONDS)
+        for queue in _subscribers.get(board_id, ()):
+            _push_snapshot(queue, board_id, board)
+        return board
+
+
+def get_classroom_board(room_id: str) -> LeaderboardBoard:
+    """Board of a classroom session (created empty)"""
+    board = _cached_board(room_id)
+    if board is None:
+        board = _store_board(room_id, LeaderboardBoard(CLASSROOM_MAX_TOTAL))
+    return board
+
+
+def subscribe(board_id: str) -> asyncio.Queue:
+    """Register a client; updates for the board are put on the returned queue"""
+    queue: asyncio.Queue = asyncio.Queue(maxsize=SUBSCRIBER_QUEUE_MAX_SIZE)
+    _subscribers.setdefault(board_id, set()).add(queue)
+    return queue
+
+
+def unsubscribe(board_id: str, queue: asyncio.Queue) -> None:
+    queues = _subscribers.get(board_id)
+    if queues is not None:
+        queues.discard(queue)
+        if not queues:
+            del _subscribers[board_id]
+
+
+def snapshot_message(board_id: str, board: LeaderboardBoard) -> dict:
+    """Full standings, sent on connect and to subscribers that fell behind"""
+    return LeaderboardUpdateEvent(room_id=board_id, rankings=board.standings(), is_snapshot=True).dict()
+
+
+def _push_snapshot(queue: asyncio.Queue, board_id: str, board: LeaderboardBoard) -> None:
+    """Replace a subscriber's pending updates with the full standings"""
+    while not queue.empty():
+        queue.get_nowait()
+    queue.put_nowait(snapshot_message(board_id, board))
+
+
+def _publish(board_id: str, board: LeaderboardBoard, changes: List[Dict[str, Any]]) -> None:
+    if not changes:
+        return
+    message = LeaderboardUpdateEvent(room_id=board_id, rankings=changes).dict()
+    for queue in _subscribers.get(board_id, ()):
+        try:
+            queue.put_nowait(message)
+        except asyncio.QueueFull:
+            # Pending deltas are superseded by a snapshot
+            _push_snapshot(queue, board_id, board)
+
+
+# ================= HOOKS =================
+
+async def on_judge_score_published(db: AsyncSession, score: JudgeScore) -> List[Dict[str, Any]]:
+    """
+    Count a newly published score. Call after the publish is committed.
+    Returns the changed standings (already pushed to subscribers).
+    """
+    if not score.is_final:
+        return []
+    try:
+        board = await get_competition_board(db, score.competition_id)
+        changes = board.submit(score.id, score.team_id, score.total_score, _score_criteria(score))
+    except Exception as e:
+        # Live standings are best-effort; drop the board so it is rebuilt from the database
+        logger.error(f"Live leaderboard update failed for score {score.id}: {e}")
+        invalidate_competition(score.competition_id)
+        return []
+
+    _publish(competition_board_id(score.competition_id), board, changes)
+    return changes
+
+
+def on_judge_score_unpublished(score: JudgeScore) -> List[Dict[str, Any]]:
+    """Stop counting an unpublished score (boards not in memory are rebuilt without it)"""
+    board_id = competition_board_id(score.competition_id)
+    board = _cached_board(board_id)
+    if board is None:
+        return []
+    changes = board.withdraw(score.id)
+    _publish(board_id, board, changes)
+    return changes
+
+
+def on_classroom_score(room_id: str, scored_by: str, user_id: str, total_score: float) -> List[Dict[str, Any]]:
+    """
+    Count a classroom score. A scorer re-scoring the same student replaces
+    their earlier score. Returns the changed standings.
+    """
+    board = get_classroom_board(room_id)
+    changes = board.submit((scored_by, user_id), user_id, total_score, {})
+    _publish(room_id, board, changes)
+    return changes
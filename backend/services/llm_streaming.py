@@ -0,0 +1,107 @@
+"""
+backend/services/llm_streaming.py
+Server-sent-event streaming of LLM responses
+
+PROTOCOL (text/event-stream):
+- event: delta  data: {"text": "..."}   forwarded response text, in order
+- event: done   data: {...}             endpoint-specific result metadata
+- event: error  data: {"detail": "..."} generation failed; no done follows
+
+Text is forwarded as the model produces it, sentence by sentence through
+guardrails.SentenceGuard, so students see the first sentence instead of
+waiting for the whole completion. When a sentence fails the guardrails
+the stream stops there and the done event reports `blocked`.
+"""
+import json
+import logging
+from contextlib import aclosing
+from dataclasses import dataclass
+from typing import Any, AsyncIterator, Dict, Optional
+
+from fastapi.responses import StreamingResponse
+
+from backend.services.guardrails import SentenceGuard
+
+logger = logging.getLogger(__name__)
+
+SSE_HEADERS = {
+    "Cache-Control": "no-cache",
+    # Disable proxy buffering (nginx) so events are delivered immediately
+    "X-Accel-Buffering": "no",
+}
+
+
+def sse_event(event: str, data: Dict[str, Any]) -> bytes:
+    """Encode one server-sent event"""
+    return f"event: {event}\ndata: {json.dumps(data, default=str)}\n\n".encode("utf-8")
+
+
+def sse_response(events: AsyncIterator[bytes]) -> StreamingResponse:
+    return StreamingResponse(events, media_type="text/event-stream", headers=SSE_HEADERS)
+
+
+async def stream_gemini(model, contents, generation_config=None) -> AsyncIterator[str]:
+    """Text chunks of a Gemini completion as they arrive"""
+    response = await model.generate_content_async(
+        contents,
+        generation_config=generation_config,
+        stream=True
+    )
+    async for chunk in response:
+        try:
+            text = chunk.text
+        except ValueError:
+            # Chunks without text parts (finish reason / safety metadata)
+            continue
+        if text:
+            yield text
+
+
+@dataclass
+class StreamResult:
+    """Outcome of a guarded stream, filled in as it runs"""
+    text: str = ""
+    blocked_reason: Optional[str] = None
+    error: Optional[str] = None
+
+    @property
+    def completed(self) -> bool:
+        return self.error is None and self.blocked_reason is None
+
+
+async def guarded_sse(
+    chunks: AsyncIterator[str],
+    result: StreamResult,
+    error_event: bool = True
+) -> AsyncIterator[bytes]:
+    """
+    Forward text chunks as delta events through the sentence guardrails.
+
+    Stops early (closing the upstream stream) when a sentence is blocked.
+    Upstream failures end the stream with an error event, unless
+    error_event is False (callers that send a fallback reply instead).
+    Either way `result` holds the forwarded text and the outcome; the
+    caller sends the done event.
+    """
+    guard = SentenceGuard()
+    try:
+        async with aclosing(chunks) as upstream:
+            async for chunk in upstream:
+                released = guard.feed(chunk)
+                if released:
+                    result.text += released
+                    yield sse_event("delta", {"text": released})
+                if guard.violation:
+                    result.blocked_reason = guard.violation
+                    return
+
+        released = guard.flush()
+        if released:
+            result.text += released
+            yield sse_event("delta", {"text": released})
+        result.blocked_reason = guard.violation
+    except Exception as e:
+        logger.error(f"LLM stream failed: {e}")
+        result.error = str(e)
+        if error_event:
+            yield sse_event("error", {"detail": "AI generation failed"})
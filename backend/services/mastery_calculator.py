@@ -42,13 +42,14 @@ from typing import List, Dict, Any, Optional
 from datetime import datetime, timedelta
 from collections import defaultdict
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, and_, func
+from sqlalchemy import select, and_
 
 from backend.orm.practice_attempt import PracticeAttempt
 from backend.orm.practice_question import PracticeQuestion
 from backend.orm.topic_mastery import TopicMastery
 from backend.orm.subject_progress import SubjectProgress
 from backend.orm.content_module import ContentModule
+from backend.services.daily_activity_service import get_study_streak
 
 logger = logging.getLogger(__name__)
 
@@ -502,40 +503,7 @@ async def calculate_study_streak(
     """
     Calculate current study streak based on practice attempts.
     
-    A streak is consecutive days with at least one attempt.
+    A streak is consecutive days with at least one attempt, read from
+    the user_daily_activity rollup.
     """
-    
-    stmt = select(
-        func.date(PracticeAttempt.attempted_at).label("attempt_date")
-    ).where(
-        PracticeAttempt.user_id == user_id
-    ).distinct().order_by(
-        func.date(PracticeAttempt.attempted_at).desc()
-    )
-    
-    result = await db.execute(stmt)
-    dates = [row[0] for row in result.fetchall()]
-    
-    if not dates:
-        return 0
-    
-    today = datetime.utcnow().date()
-    last_attempt = dates[0] if isinstance(dates[0], type(today)) else datetime.strptime(str(dates[0]), "%Y-%m-%d").date()
-    
-    if (today - last_attempt).days > 1:
-        return 0
-    
-    streak = 1
-    current_date = last_attempt
-    
-    for attempt_date in dates[1:]:
-        if not isinstance(attempt_date, type(today)):
-            attempt_date = datetime.strptime(str(attempt_date), "%Y-%m-%d").date()
-        
-        if (current_date - attempt_date).days == 1:
-            streak += 1
-            current_date = attempt_date
-        else:
-            break
-    
-    return streak
+    return await get_study_streak(db, user_id, kind="practice")
@@ -4,11 +4,18 @@ Phase 4: Memorial Analysis Service
 Extracts text from PDF and performs AI analysis with India-specific legal feedback.
 """
 import os
-import re
 import json
 from typing import List, Dict, Tuple, Optional
 from datetime import datetime
 
+from backend.services.pdf_extraction_service import extract_pdf, extract_pdf_blocking
+from backend.services.legal_text_scanner import (
+    AIR, AIR_PATTERN, IMPROPER, SCC, SCC_PATTERN, LegalTextScan, LegalTextScanner
+)
+
+# Compiled on first use from KEY_CASES / KEY_DOCTRINES
+_scanner: Optional[LegalTextScanner] = None
+
 
 class MemorialAnalysisService:
     """
@@ -16,8 +23,8 @@ class MemorialAnalysisService:
     """
     
     # India-specific legal terms and case patterns
-    SCC_PATTERN = r'\(\d{4}\)\s*\d+\s*SCC\s*\d+'
-    AIR_PATTERN = r'AIR\s*\d{4}\s*(SC|All|Bom|Cal|Del|Mad)?\s*\d+'
+    SCC_PATTERN = SCC_PATTERN
+    AIR_PATTERN = AIR_PATTERN
     
     # Key Indian legal doctrines to check
     KEY_DOCTRINES = {
@@ -64,6 +71,10 @@ class MemorialAnalysisService:
         """
         Extract text from PDF and count pages.
         
+        Pages are parsed in parallel worker processes and the result is
+        cached by file SHA-256. Blocking; async callers should use
+        extract_text_and_pages_async.
+        
         Args:
             file_path: Path to PDF file
         
@@ -71,82 +82,109 @@ class MemorialAnalysisService:
             Tuple of (extracted_text, page_count)
         """
         try:
-            import pdfplumber
-            
-            text_parts = []
-            page_count = 0
-            
-            with pdfplumber.open(file_path) as pdf:
-                page_count = len(pdf.pages)
-                
-                # Extract text from first 50 pages only
-                for i, page in enumerate(pdf.pages[:50]):
-                    page_text = page.extract_text()
-                    if page_text:
-                        text_parts.append(page_text)
-            
-            full_text = "\n\n".join(text_parts)
-            return full_text, page_count
-            
+            extracted = extract_pdf_blocking(file_path)
+            return extracted.text, extracted.page_count
         except ImportError:
             raise RuntimeError("pdfplumber not installed. Install with: pip install pdfplumber")
         except Exception as e:
             raise RuntimeError(f"PDF extraction failed: {str(e)}")
     
     @staticmethod
-    def check_citations(text: str) -> Dict:
+    async def extract_text_and_pages_async(
+        file_path: str,
+        sha256: Optional[str] = None
+    ) -> Tuple[str, int]:
+        """
+        Extract text from PDF without blocking the event loop.
+        
+        Args:
+            file_path: Path to PDF file
+            sha256: Stored digest of the file, if known
+        
+        Returns:
+            Tuple of (extracted_text, page_count)
+        """
+        try:
+            extracted = await extract_pdf(file_path, sha256=sha256)
+            return extracted.text, extracted.page_count
+        except ImportError:
+            raise RuntimeError("pdfplumber not installed. Install with: pip install pdfplumber")
+        except Exception as e:
+            raise RuntimeError(f"PDF extraction failed: {str(e)}")
+    
+    @staticmethod
+    def scan_text(text: str) -> LegalTextScan:
+        """
+        Scan memorial text once for citations, case/doctrine phrases and IRAC markers.
+        
+        Args:
+            text: Extracted text from PDF
+        
+        Returns:
+            LegalTextScan shared by all checks
+        """
+        global _scanner
+        if _scanner is None:
+            phrases = [
+                keyword
+                for keywords in list(MemorialAnalysisService.KEY_CASES.values())
+                + list(MemorialAnalysisService.KEY_DOCTRINES.values())
+                for keyword in keywords
+            ]
+            _scanner = LegalTextScanner(phrases)
+        return _scanner.scan(text)
+    
+    @staticmethod
+    def check_citations(text: str, scan: Optional[LegalTextScan] = None) -> Dict:
         """
         Check SCC and AIR citation format in the text.
         
         Args:
             text: Extracted text from PDF
+            scan: Shared scan of the text (scanned here if omitted)
         
         Returns:
             Dictionary with citation analysis results
         """
-        scc_matches = re.findall(MemorialAnalysisService.SCC_PATTERN, text)
-        air_matches = re.findall(MemorialAnalysisService.AIR_PATTERN, text, re.IGNORECASE)
+        scan = scan or MemorialAnalysisService.scan_text(text)
         
-        # Check for improper formats
-        improper_patterns = [
-            r'\(\d{4}\)\s*SCC',  # Missing volume
-            r'SCC\s*\d+\s*\(\d{4}\)',  # Wrong order
-        ]
+        scc_matches = [hit.value for hit in scan.of_kind(SCC)]
+        air_count = len(scan.of_kind(AIR))
         
-        improper_citations = []
-        for pattern in improper_patterns:
-            improper_citations.extend(re.findall(pattern, text))
+        # Missing volume or wrong order
+        improper_count = len(scan.of_kind(IMPROPER))
         
         return {
             "scc_count": len(scc_matches),
-            "air_count": len(air_matches),
-            "improper_count": len(improper_citations),
-            "proper_format_ratio": len(scc_matches) / (len(scc_matches) + len(improper_citations) + 0.01),
+            "air_count": air_count,
+            "improper_count": improper_count,
+            "proper_format_ratio": len(scc_matches) / (len(scc_matches) + improper_count + 0.01),
             "sample_citations": scc_matches[:5] if scc_matches else []
         }
     
     @staticmethod
-    def check_irac_structure(text: str) -> Dict:
+    def check_irac_structure(text: str, scan: Optional[LegalTextScan] = None) -> Dict:
         """
         Check for IRAC structure in the text.
         
         Args:
             text: Extracted text from PDF
+            scan: Shared scan of the text (scanned here if omitted)
         
         Returns:
             Dictionary with IRAC analysis results
         """
-        text_lower = text.lower()
+        scan = scan or MemorialAnalysisService.scan_text(text)
         
         # Check for IRAC components
-        has_issue = bool(re.search(r'\b(issue|issues|question|questions)\b', text_lower))
-        has_rule = bool(re.search(r'\b(rule|law|statute|act|article|section)\b', text_lower))
-        has_application = bool(re.search(r'\b(application|apply|applied|analysis|argue)\b', text_lower))
-        has_conclusion = bool(re.search(r'\b(conclusion|conclude|therefore|thus|hence)\b', text_lower))
+        has_issue = scan.has_irac_component("issue")
+        has_rule = scan.has_irac_component("rule")
+        has_application = scan.has_irac_component("application")
+        has_conclusion = scan.has_irac_component("conclusion")
         
         # Count IRAC sections
-        issue_keywords = len(re.findall(r'\bissue\b', text_lower))
-        rule_keywords = len(re.findall(r'\b(rule|rules)\b', text_lower))
+        issue_keywords = scan.marker_count("issue")
+        rule_keywords = scan.marker_count("rule", "rules")
         
         components_present = sum([has_issue, has_rule, has_application, has_conclusion])
         
@@ -162,32 +200,33 @@ class MemorialAnalysisService:
         }
     
     @staticmethod
-    def detect_cases(text: str) -> List[Dict]:
+    def detect_cases(text: str, scan: Optional[LegalTextScan] = None) -> List[Dict]:
         """
         Detect key case citations in the text.
         
         Args:
             text: Extracted text from PDF
+            scan: Shared scan of the text (scanned here if omitted)
         
         Returns:
             List of detected cases with context
         """
+        scan = scan or MemorialAnalysisService.scan_text(text)
         detected = []
-        text_lower = text.lower()
         
         for case_name, keywords in MemorialAnalysisService.KEY_CASES.items():
-            # Check if any keyword is present
-            found = any(keyword.lower() in text_lower for keyword in keywords)
+            keywords_found = [k for k in keywords if scan.has_phrase(k)]
             
-            if found:
+            if keywords_found:
                 # Count occurrences
-                count = sum(text_lower.count(keyword.lower()) for keyword in keywords[:2])
+                count = sum(len(scan.phrase_hits(keyword)) for keyword in keywords[:2])
                 
                 # Find context (first occurrence)
                 context = ""
                 for keyword in keywords[:2]:
-                    idx = text_lower.find(keyword.lower())
-                    if idx != -1:
+                    hits = scan.phrase_hits(keyword)
+                    if hits:
+                        idx = hits[0].start
                         start = max(0, idx - 100)
                         end = min(len(text), idx + 100)
                         context = text[start:end].strip()
@@ -198,27 +237,28 @@ class MemorialAnalysisService:
                     "found": True,
                     "count": count,
                     "context": context[:200],
-                    "keywords_found": [k for k in keywords if k.lower() in text_lower][:3]
+                    "keywords_found": keywords_found[:3]
                 })
         
         return detected
     
     @staticmethod
-    def check_doctrines(text: str) -> List[Dict]:
+    def check_doctrines(text: str, scan: Optional[LegalTextScan] = None) -> List[Dict]:
         """
         Check for key legal doctrines in the text.
         
         Args:
             text: Extracted text from PDF
+            scan: Shared scan of the text (scanned here if omitted)
         
         Returns:
             List of doctrine analysis results
         """
-        text_lower = text.lower()
+        scan = scan or MemorialAnalysisService.scan_text(text)
         results = []
         
         for doctrine, keywords in MemorialAnalysisService.KEY_DOCTRINES.items():
-            found_keywords = [k for k in keywords if k.lower() in text_lower]
+            found_keywords = [k for k in keywords if scan.has_phrase(k)]
             found_count = len(found_keywords)
             
             # Determine status
@@ -307,16 +347,30 @@ Return response in this JSON format:
         Returns:
             Complete analysis results
         """
-        # Step 1: Extract text
         text, page_count = MemorialAnalysisService.extract_text_and_pages(file_path)
+        return MemorialAnalysisService.analyze_text(text, team_side, page_count)
+    
+    @staticmethod
+    def analyze_text(text: str, team_side: str, page_count: int) -> Dict:
+        """
+        Run analysis checks and scoring on extracted memorial text.
         
-        # Step 2: Run analysis checks
-        citation_analysis = MemorialAnalysisService.check_citations(text)
-        irac_analysis = MemorialAnalysisService.check_irac_structure(text)
-        detected_cases = MemorialAnalysisService.detect_cases(text)
-        doctrine_analysis = MemorialAnalysisService.check_doctrines(text)
+        Args:
+            text: Extracted memorial text
+            team_side: 'petitioner' or 'respondent'
+            page_count: Number of pages in PDF
         
-        # Step 3: Calculate scores based on analysis
+        Returns:
+            Complete analysis results
+        """
+        # Run analysis checks (one scan shared by every check)
+        scan = MemorialAnalysisService.scan_text(text)
+        citation_analysis = MemorialAnalysisService.check_citations(text, scan)
+        irac_analysis = MemorialAnalysisService.check_irac_structure(text, scan)
+        detected_cases = MemorialAnalysisService.detect_cases(text, scan)
+        doctrine_analysis = MemorialAnalysisService.check_doctrines(text, scan)
+        
+        # Calculate scores based on analysis
         citation_score = min(5, max(1, int(citation_analysis["proper_format_ratio"] * 5)))
         irac_score = min(5, max(1, int(irac_analysis["irac_completeness"] * 5) + 1))
         
@@ -327,7 +381,7 @@ Return response in this JSON format:
         
         overall = round((citation_score + irac_score + reasoning_score) / 3, 1)
         
-        # Step 4: Generate feedback
+        # Generate feedback
         strengths = []
         improvements = []
         missing_doctrines = []
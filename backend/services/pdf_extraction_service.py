@@ -0,0 +1,253 @@
+"""
+backend/services/pdf_extraction_service.py
+Process-pool PDF text extraction with a digest cache
+
+PURPOSE:
+Keep pdfplumber parsing off the event loop. Pages are extracted in
+parallel chunks across worker processes and the result is cached by the
+file's SHA-256 so re-analysis of the same PDF never parses it again.
+Concurrent requests for the same digest (e.g. the upload prefetch and an
+analysis started right after it) share one extraction.
+
+LIMITS:
+- Text is extracted from the first MAX_EXTRACT_PAGES pages only
+- The page count always reflects the whole document
+"""
+
+import os
+import asyncio
+import logging
+import threading
+from collections import OrderedDict
+from concurrent.futures import Future, ProcessPoolExecutor
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Tuple
+
+from starlette.concurrency import run_in_threadpool
+
+from backend.services.file_storage import file_sha256
+
+logger = logging.getLogger(__name__)
+
+MAX_EXTRACT_PAGES = 50
+
+# Pages parsed per worker task
+PAGES_PER_CHUNK = int(os.getenv("PDF_EXTRACT_PAGES_PER_CHUNK", "10"))
+
+# Worker processes for PDF parsing
+EXTRACT_WORKERS = int(os.getenv("PDF_EXTRACT_WORKERS", str(min(4, os.cpu_count() or 2))))
+
+# Extracted documents kept in memory (keyed by sha256)
+TEXT_CACHE_MAX_SIZE = int(os.getenv("PDF_TEXT_CACHE_MAX_SIZE", "256"))
+
+
+@dataclass(frozen=True)
+class ExtractedPdf:
+    """Extracted text of one PDF"""
+    sha256: str
+    page_count: int
+    pages: Tuple[str, ...]  # One entry per extracted page ("" when a page has no text)
+
+    @property
+    def text(self) -> str:
+        """Full text, non-empty pages joined by blank lines"""
+        return "\n\n".join(page for page in self.pages if page)
+
+
+_extract_pool: Optional[ProcessPoolExecutor] = None
+
+_text_cache: "OrderedDict[str, ExtractedPdf]" = OrderedDict()
+
+# sha256 -> extraction in progress; shared by the async and blocking paths
+_inflight: Dict[str, Future] = {}
+_inflight_lock = threading.Lock()
+
+
+# ================= WORKER FUNCTIONS =================
+
+def _count_pages(file_path: str) -> int:
+    """Count pages of a PDF (runs inside a worker process)"""
+    import pdfplumber
+
+    with pdfplumber.open(file_path) as pdf:
+        return len(pdf.pages)
+
+
+def _extract_page_range(file_path: str, start: int, stop: int) -> List[str]:
+    """Extract text of pages [start, stop) (runs inside a worker process)"""
+    import pdfplumber
+
+    with pdfplumber.open(file_path) as pdf:
+        return [page.extract_text() or "" for page in pdf.pages[start:stop]]
+
+
+def _get_extract_pool() -> ProcessPoolExecutor:
+    """Lazily create the shared extraction pool"""
+    global _extract_pool
+    if _extract_pool is None:
+        _extract_pool = ProcessPoolExecutor(max_workers=EXTRACT_WORKERS)
+    return _extract_pool
+
+
+def _submit_chunks(file_path: str, page_count: int) -> List[Future]:
+    """Queue every page chunk at once so workers parse them in parallel"""
+    pool = _get_extract_pool()
+    last_page = min(page_count, MAX_EXTRACT_PAGES)
+    return [
+        pool.submit(_extract_page_range, file_path, start, min(start + PAGES_PER_CHUNK, last_page))
+        for start in range(0, last_page, PAGES_PER_CHUNK)
+    ]
+
+
+# ================= CACHE =================
+
+def _cache_get(sha256: Optional[str]) -> Optional[ExtractedPdf]:
+    """Get a cached extraction"""
+    if sha256 is None:
+        return None
+    cached = _text_cache.get(sha256)
+    if cached is not None:
+        _text_cache.move_to_end(sha256)
+    return cached
+
+
+def _cache_put(extracted: ExtractedPdf) -> None:
+    """Store an extraction with LRU eviction"""
+    _text_cache[extracted.sha256] = extracted
+    _text_cache.move_to_end(extracted.sha256)
+    while len(_text_cache) > TEXT_CACHE_MAX_SIZE:
+        _text_cache.popitem(last=False)
+
+
+def _claim(sha256: str) -> Tuple[Future, bool]:
+    """Get the in-flight extraction of a digest; True when the caller must run it"""
+    with _inflight_lock:
+        future = _inflight.get(sha256)
+        if future is not None:
+            return future, False
+        future = Future()
+        _inflight[sha256] = future
+        return future, True
+
+
+def _settle(sha256: str, future: Future, result: Optional[ExtractedPdf] = None,
+            error: Optional[BaseException] = None) -> None:
+    """Publish the outcome of an extraction to everyone waiting on it"""
+    with _inflight_lock:
+        _inflight.pop(sha256, None)
+    if error is not None:
+        future.set_exception(error)
+    else:
+        future.set_result(result)
+
+
+def clear_text_cache() -> int:
+    """Clear extracted text cache. Returns number of entries cleared."""
+    count = len(_text_cache)
+    _text_cache.clear()
+    return count
+
+
+# ================= PUBLIC API =================
+
+async def count_pages(file_path: str, sha256: Optional[str] = None) -> int:
+    """
+    Count pages of a PDF without extracting any text.
+
+    Uses the cached extraction when the digest is known.
+    """
+    cached = _cache_get(sha256)
+    if cached is not None:
+        return cached.page_count
+
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(_get_extract_pool(), _count_pages, str(file_path))
+
+
+async def extract_pdf(file_path: str, sha256: Optional[str] = None) -> ExtractedPdf:
+    """
+    Extract text from a PDF in parallel page chunks.
+
+    Args:
+        file_path: Path to PDF file
+        sha256: Digest of the file if already known (hashed otherwise)
+
+    Returns:
+        ExtractedPdf (served from cache when this content was seen before,
+        or shared with an extraction of the same content already running)
+    """
+    file_path = str(file_path)
+    if sha256 is None:
+        sha256 = await run_in_threadpool(file_sha256, file_path)
+
+    cached = _cache_get(sha256)
+    if cached is not None:
+        return cached
+
+    future, owner = _claim(sha256)
+    if not owner:
+        return await asyncio.wrap_future(future)
+
+    try:
+        # Finished between the cache check and the claim
+        cached = _cache_get(sha256)
+        if cached is not None:
+            _settle(sha256, future, cached)
+            return cached
+
+        page_count = await count_pages(file_path)
+        pages: List[str] = []
+        for chunk in _submit_chunks(file_path, page_count):
+            pages.extend(await asyncio.wrap_future(chunk))
+
+        extracted = ExtractedPdf(sha256=sha256, page_count=page_count, pages=tuple(pages))
+        _cache_put(extracted)
+    except BaseException as e:
+        _settle(sha256, future, error=e)
+        raise
+
+    _settle(sha256, future, extracted)
+    logger.info(f"Extracted {len(pages)}/{page_count} pages from PDF {sha256[:12]}")
+    return extracted
+
+
+def extract_pdf_blocking(file_path: str, sha256: Optional[str] = None) -> ExtractedPdf:
+    """
+    Blocking variant of extract_pdf for synchronous callers.
+
+    Still parses chunks in parallel across the pool and shares the cache.
+    Must not be called from the event loop thread.
+    """
+    file_path = str(file_path)
+    if sha256 is None:
+        sha256 = file_sha256(file_path)
+
+    cached = _cache_get(sha256)
+    if cached is not None:
+        return cached
+
+    future, owner = _claim(sha256)
+    if not owner:
+        return future.result()
+
+    try:
+        cached = _cache_get(sha256)
+        if cached is not None:
+            _settle(sha256, future, cached)
+            return cached
+
+        page_count = _get_extract_pool().submit(_count_pages, file_path).result()
+        pages = [
+            page_text
+            for chunk in _submit_chunks(file_path, page_count)
+            for page_text in chunk.result()
+        ]
+
+        extracted = ExtractedPdf(sha256=sha256, page_count=page_count, pages=tuple(pages))
+        _cache_put(extracted)
+    except BaseException as e:
+        _settle(sha256, future, error=e)
+        raise
+
+    _settle(sha256, future, extracted)
+    return extracted
@@ -0,0 +1,165 @@
+"""
+backend/services/principal_cache.py
+Authenticated-user (principal) cache for JWT dependencies
+
+PURPOSE:
+Every authenticated request resolves the JWT `sub` (email) to a User row.
+This module keeps a short-lived, size-bounded snapshot of that row so most
+requests skip the lookup entirely.
+
+GUARANTEES:
+- Entries expire after PRINCIPAL_CACHE_TTL_SECONDS (deactivation lands within seconds)
+- Entries are invalidated as soon as a User row is flushed with changes;
+  bulk UPDATE statements bypass the flush and must call
+  invalidate_principal_id themselves (see credit_service.deduct_credits)
+- A load that races with an invalidation is never written back (version stamp)
+- Cached rows are re-attached to the request session, never shared across sessions
+
+LIMITATIONS:
+- A principal served from the cache carries column values only: its
+  relationships (course, bookmarks, progress, ...) are not loaded and
+  cannot be lazy-loaded on an AsyncSession. Code that needs them queries
+  them explicitly.
+- Column values can be up to PRINCIPAL_CACHE_TTL_SECONDS old when another
+  worker changed the row; read balances such as credits_remaining from the
+  database, not from the principal.
+"""
+
+import os
+import time
+import logging
+from collections import OrderedDict
+from typing import Any, Dict, Optional, Tuple
+
+from sqlalchemy import select, event, inspect
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import make_transient_to_detached
+
+from backend.orm.user import User
+
+logger = logging.getLogger(__name__)
+
+PRINCIPAL_CACHE_TTL_SECONDS = float(os.getenv("PRINCIPAL_CACHE_TTL_SECONDS", "10"))
+PRINCIPAL_CACHE_MAX_SIZE = int(os.getenv("PRINCIPAL_CACHE_MAX_SIZE", "10000"))
+
+# sub -> (expires_at, version, column snapshot)
+_principals: "OrderedDict[str, Tuple[float, int, Dict[str, Any]]]" = OrderedDict()
+
+# sub -> version stamp, bumped on every invalidation
+_versions: "OrderedDict[str, int]" = OrderedDict()
+
+# user id -> sub of its cached snapshot
+_subs_by_id: Dict[int, str] = {}
+
+_COLUMN_KEYS = tuple(column.key for column in User.__table__.columns)
+
+
+def _current_version(sub: str) -> int:
+    """Get the version stamp for a token subject"""
+    return _versions.get(sub, 0)
+
+
+def _snapshot(user: User) -> Dict[str, Any]:
+    """Copy the column values of a loaded User"""
+    return {key: getattr(user, key) for key in _COLUMN_KEYS}
+
+
+def _cache_get(sub: str) -> Optional[Dict[str, Any]]:
+    """Get a live snapshot for a subject, dropping it if stale"""
+    entry = _principals.get(sub)
+    if entry is None:
+        return None
+
+    expires_at, version, snapshot = entry
+    if expires_at < time.monotonic() or version != _current_version(sub):
+        _principals.pop(sub, None)
+        return None
+
+    _principals.move_to_end(sub)
+    return snapshot
+
+
+def _cache_set(sub: str, version: int, snapshot: Dict[str, Any]) -> None:
+    """Store a snapshot with LRU eviction, unless invalidated meanwhile"""
+    if version != _current_version(sub):
+        return
+
+    _principals[sub] = (time.monotonic() + PRINCIPAL_CACHE_TTL_SECONDS, version, snapshot)
+    _principals.move_to_end(sub)
+    _subs_by_id[snapshot["id"]] = sub
+    while len(_principals) > PRINCIPAL_CACHE_MAX_SIZE:
+        _, (_, _, evicted) = _principals.popitem(last=False)
+        _subs_by_id.pop(evicted["id"], None)
+
+
+async def _attach(db: AsyncSession, snapshot: Dict[str, Any]) -> User:
+    """Rebuild a User from a snapshot and attach it to the session without SQL"""
+    user = User(**snapshot)
+    make_transient_to_detached(user)
+    return await db.merge(user, load=False)
+
+
+async def get_user_by_sub(db: AsyncSession, sub: str) -> Optional[User]:
+    """
+    Resolve a JWT subject (user email) to a User attached to `db`.
+
+    Cache hits issue no query; misses load the row and populate the cache.
+    Returns None when no such user exists (negative results are not cached).
+    Relationships of a cached principal are not loaded (see LIMITATIONS).
+    """
+    snapshot = _cache_get(sub)
+    if snapshot is not None:
+        return await _attach(db, snapshot)
+
+    version = _current_version(sub)
+    result = await db.execute(select(User).where(User.email == sub))
+    user = result.scalar_one_or_none()
+
+    if user is not None:
+        _cache_set(sub, version, _snapshot(user))
+
+    return user
+
+
+def invalidate_principal(sub: str) -> None:
+    """Drop a subject from the cache and bump its version stamp"""
+    entry = _principals.pop(sub, None)
+    if entry is not None:
+        _subs_by_id.pop(entry[2]["id"], None)
+    _versions[sub] = _versions.get(sub, 0) + 1
+    _versions.move_to_end(sub)
+    while len(_versions) > PRINCIPAL_CACHE_MAX_SIZE:
+        _versions.popitem(last=False)
+
+
+def invalidate_principal_id(user_id: int) -> None:
+    """Invalidate by user id, for writes that do not know the user's email"""
+    sub = _subs_by_id.get(user_id)
+    if sub is not None:
+        invalidate_principal(sub)
+
+
+def clear_principal_cache() -> int:
+    """Clear the principal cache. Returns number of entries cleared."""
+    count = len(_principals)
+    for sub in list(_principals):
+        invalidate_principal(sub)
+    return count
+
+
+# ================= INVALIDATION =================
+
+@event.listens_for(User, "after_update")
+def _on_user_update(mapper, connection, target: User) -> None:
+    """Invalidate on any flushed change (role, is_active, semester, course, ...)"""
+    state = inspect(target)
+    email_history = state.attrs.email.history
+    for old_email in email_history.deleted or ():
+        invalidate_principal(old_email)
+    invalidate_principal(target.email)
+
+
+@event.listens_for(User, "after_delete")
+def _on_user_delete(mapper, connection, target: User) -> None:
+    """Invalidate when a user row is removed"""
+    invalidate_principal(target.email)
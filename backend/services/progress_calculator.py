@@ -4,8 +4,15 @@ Phase 7: Progress Metrics Calculator
 
 Computes objective, measurable progress signals for faculty oversight.
 NO subjective scoring. NO AI evaluation. NO grades.
+
+Institution-wide metrics are computed set-based (one statement for all
+projects) and cached per institution for INSTITUTION_METRICS_TTL_SECONDS
+(0 disables the cache).
 """
-from typing import Dict, List, Optional, Any
+import os
+import time
+from collections import OrderedDict
+from typing import Dict, List, Optional, Any, Tuple
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select, and_, func
 from datetime import datetime
@@ -16,6 +23,14 @@ from backend.orm.moot_project import IRACBlock
 from backend.orm.oral_round import OralRound, OralResponse, RoundTranscript
 from backend.orm.team_activity import TeamActivityLog
 
+IRAC_BLOCKS_PER_ISSUE = 4  # I/R/A/C
+
+INSTITUTION_METRICS_TTL_SECONDS = float(os.getenv("INSTITUTION_METRICS_TTL_SECONDS", "30"))
+INSTITUTION_METRICS_CACHE_MAX_SIZE = 1000
+
+# institution_id -> (expires_at, metrics)
+_institution_metrics: "OrderedDict[int, Tuple[float, Dict[str, Any]]]" = OrderedDict()
+
 
 class ProjectProgressMetrics:
     """Container for computed project progress metrics"""
@@ -180,32 +195,27 @@ async def calculate_irac_completeness(
     if issues_count == 0:
         return 0.0
     
-    # Get all IRAC blocks for this project
-    blocks_result = await db.execute(
-        select(IRACBlock).where(
-            and_(
-                IRACBlock.project_id == project_id,
-                IRACBlock.is_active == True
-            )
+    # Unique (issue, block type) pairs among active blocks
+    filled_pairs = select(IRACBlock.issue_id, IRACBlock.block_type).where(
+        and_(
+            IRACBlock.project_id == project_id,
+            IRACBlock.is_active == True
         )
-    )
-    blocks = blocks_result.scalars().all()
+    ).distinct().subquery()
+    filled_result = await db.execute(select(func.count()).select_from(filled_pairs))
     
-    # Count unique block types per issue
-    issue_blocks: Dict[int, set] = {}
-    for block in blocks:
-        if block.issue_id not in issue_blocks:
-            issue_blocks[block.issue_id] = set()
-        issue_blocks[block.issue_id].add(block.block_type)
-    
-    # Calculate completeness
-    total_required = issues_count * 4  # I/R/A/C for each issue
-    total_filled = sum(len(blocks) for blocks in issue_blocks.values())
-    
-    # Cap at total_required (in case of duplicate blocks)
-    total_filled = min(total_filled, total_required)
-    
-    return (total_filled / total_required * 100) if total_required > 0 else 0.0
+    return irac_percentage(filled_result.scalar() or 0, issues_count)
+
+
+def irac_percentage(filled_blocks: int, issues_count: int) -> float:
+    """
+    Completeness % from unique filled (issue, block type) pairs.
+    Capped at 100 (blocks of deleted issues can outnumber required blocks).
+    """
+    total_required = issues_count * IRAC_BLOCKS_PER_ISSUE
+    if total_required == 0:
+        return 0.0
+    return min(filled_blocks, total_required) / total_required * 100
 
 
 async def get_last_activity_timestamp(
@@ -226,9 +236,101 @@ async def get_last_activity_timestamp(
     return last_log.timestamp if last_log else None
 
 
-async def get_institution_wide_metrics(
+async def get_project_completeness_rows(
     db: AsyncSession,
     institution_id: int
+) -> List[Dict[str, Any]]:
+    """
+    Issue counts and IRAC completeness of every active project of an
+    institution, in one statement (grouped subqueries joined to projects).
+    """
+    active_projects = and_(
+        MootProject.institution_id == institution_id,
+        MootProject.is_active == True
+    )
+    project_ids = select(MootProject.id).where(active_projects)
+    
+    issue_counts = select(
+        MootIssue.project_id,
+        func.count(MootIssue.id).label("issues_count")
+    ).where(
+        MootIssue.project_id.in_(project_ids)
+    ).group_by(MootIssue.project_id).subquery()
+    
+    filled_pairs = select(
+        IRACBlock.project_id,
+        IRACBlock.issue_id,
+        IRACBlock.block_type
+    ).where(
+        and_(
+            IRACBlock.project_id.in_(project_ids),
+            IRACBlock.is_active == True
+        )
+    ).distinct().subquery()
+    
+    filled_counts = select(
+        filled_pairs.c.project_id,
+        func.count().label("filled_blocks")
+    ).group_by(filled_pairs.c.project_id).subquery()
+    
+    result = await db.execute(
+        select(
+            MootProject.id,
+            MootProject.team_id,
+            MootProject.is_locked,
+            func.coalesce(issue_counts.c.issues_count, 0),
+            func.coalesce(filled_counts.c.filled_blocks, 0)
+        ).outerjoin(
+            issue_counts, issue_counts.c.project_id == MootProject.id
+        ).outerjoin(
+            filled_counts, filled_counts.c.project_id == MootProject.id
+        ).where(active_projects)
+    )
+    
+    return [
+        {
+            "project_id": project_id,
+            "team_id": team_id,
+            "is_locked": bool(is_locked),
+            "issues_count": issues_count,
+            "irac_completeness": irac_percentage(filled_blocks, issues_count),
+        }
+        for project_id, team_id, is_locked, issues_count, filled_blocks in result.all()
+    ]
+
+
+def _cached_metrics(institution_id: int) -> Optional[Dict[str, Any]]:
+    entry = _institution_metrics.get(institution_id)
+    if entry is None:
+        return None
+    expires_at, metrics = entry
+    if expires_at < time.monotonic():
+        _institution_metrics.pop(institution_id, None)
+        return None
+    return dict(metrics)
+
+
+def _cache_metrics(institution_id: int, metrics: Dict[str, Any]) -> None:
+    if INSTITUTION_METRICS_TTL_SECONDS <= 0:
+        return
+    _institution_metrics[institution_id] = (time.monotonic() + INSTITUTION_METRICS_TTL_SECONDS, dict(metrics))
+    _institution_metrics.move_to_end(institution_id)
+    while len(_institution_metrics) > INSTITUTION_METRICS_CACHE_MAX_SIZE:
+        _institution_metrics.popitem(last=False)
+
+
+def invalidate_institution_metrics(institution_id: Optional[int] = None) -> None:
+    """Drop cached metrics for one institution (or all)"""
+    if institution_id is None:
+        _institution_metrics.clear()
+    else:
+        _institution_metrics.pop(institution_id, None)
+
+
+async def get_institution_wide_metrics(
+    db: AsyncSession,
+    institution_id: int,
+    use_cache: bool = True
 ) -> Dict[str, Any]:
     """
     Phase 7: Get high-level metrics for faculty dashboard.
@@ -239,59 +341,35 @@ async def get_institution_wide_metrics(
     - Teams with active projects
     - Average IRAC completeness
     - Average issues per project
+    
+    One query for any number of projects; results are cached for
+    INSTITUTION_METRICS_TTL_SECONDS unless use_cache is False.
     """
-    # Get all projects for institution
-    projects_result = await db.execute(
-        select(MootProject).where(
-            and_(
-                MootProject.institution_id == institution_id,
-                MootProject.is_active == True
-            )
-        )
-    )
-    projects = projects_result.scalars().all()
+    if use_cache:
+        cached = _cached_metrics(institution_id)
+        if cached is not None:
+            return cached
+    
+    projects = await get_project_completeness_rows(db, institution_id)
     
     total_projects = len(projects)
     
     # Status breakdown
-    draft_count = sum(1 for p in projects if not p.is_locked)
-    locked_count = sum(1 for p in projects if p.is_locked)
+    locked_count = sum(1 for p in projects if p["is_locked"])
+    draft_count = total_projects - locked_count
     
     # Unique teams
-    team_ids = set(p.team_id for p in projects)
-    teams_count = len(team_ids)
+    teams_count = len(set(p["team_id"] for p in projects))
     
     # Calculate averages
     if total_projects > 0:
-        # Get all issues for these projects
-        project_ids = [p.id for p in projects]
-        
-        issues_result = await db.execute(
-            select(func.count(MootIssue.id)).where(
-                MootIssue.project_id.in_(project_ids)
-            )
-        )
-        total_issues = issues_result.scalar() or 0
-        avg_issues = total_issues / total_projects
-        
-        # Average IRAC completeness
-        total_completeness = 0.0
-        for project in projects:
-            issues_result = await db.execute(
-                select(func.count(MootIssue.id)).where(
-                    MootIssue.project_id == project.id
-                )
-            )
-            project_issues = issues_result.scalar() or 0
-            completeness = await calculate_irac_completeness(db, project.id, project_issues)
-            total_completeness += completeness
-        
-        avg_irac_completeness = total_completeness / total_projects
+        avg_issues = sum(p["issues_count"] for p in projects) / total_projects
+        avg_irac_completeness = sum(p["irac_completeness"] for p in projects) / total_projects
     else:
         avg_issues = 0.0
         avg_irac_completeness = 0.0
     
-    return {
+    metrics = {
         "total_projects": total_projects,
         "draft_projects": draft_count,
         "locked_projects": locked_count,
@@ -299,3 +377,6 @@ async def get_institution_wide_metrics(
         "average_issues_per_project": round(avg_issues, 1),
         "average_irac_completeness": round(avg_irac_completeness, 1),
     }
+    
+    _cache_metrics(institution_id, metrics)
+    return metrics
@@ -5,16 +5,16 @@ Phase 5E: Ranking computation, tie-break rules, and leaderboard generation
 import logging
 from typing import List, Optional, Dict, Tuple
 from datetime import datetime
-from statistics import mean, stdev
-from collections import defaultdict
+from itertools import groupby
 
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, and_, desc, func
+from sqlalchemy import select, and_, desc, func, insert, update
 
 from backend.orm.ranking import TeamRanking, RankingType, RankStatus, Leaderboard, WinnerSelection, TieBreakRule
 from backend.orm.scoring import JudgeScore, EvaluationStatus
 from backend.orm.team import Team
 from backend.orm.competition import Competition, CompetitionRound
+from backend.orm.submission_slot import SubmissionSlot
 
 logger = logging.getLogger(__name__)
 
@@ -35,6 +35,16 @@ class RankingService:
         "responsiveness_score"
     ]
     
+    # Judged criteria (JudgeScore.<criterion>_score, TeamRanking.<criterion>_avg)
+    CRITERIA = (
+        "issue_framing",
+        "legal_reasoning",
+        "use_of_authority",
+        "structure_clarity",
+        "oral_advocacy",
+        "responsiveness"
+    )
+    
     @staticmethod
     async def compute_team_rankings(
         competition_id: int,
@@ -46,27 +56,121 @@ class RankingService:
         """
         Phase 5E: Compute rankings for all teams in a competition.
         Aggregates judge scores and applies tie-break rules.
+        
+        Scores are averaged per team in one grouped query, teams are ordered
+        by score and every tie-break rule with one sort, and all TeamRanking
+        rows are written with one bulk update plus one bulk insert.
         """
         logger.info(f"Computing rankings for competition {competition_id}, type {ranking_type.value}")
         
-        # Get all teams in competition
-        teams_result = await db.execute(
-            select(Team).where(Team.competition_id == competition_id)
-        )
-        teams = teams_result.scalars().all()
+        team_aggregates = await RankingService._load_team_aggregates(competition_id, round_id, db)
         
-        if not teams:
+        if not team_aggregates:
             logger.warning(f"No teams found for competition {competition_id}")
             return []
         
-        # Get all published judge scores for this competition
-        scores_query = select(JudgeScore).where(
+        # Get custom tie-break rules for competition
+        rules_result = await db.execute(
+            select(TieBreakRule).where(
+                and_(
+                    TieBreakRule.competition_id == competition_id,
+                    TieBreakRule.is_active == True
+                )
+            ).order_by(TieBreakRule.rule_order)
+        )
+        rules = rules_result.scalars().all() or RankingService._default_tie_break_rules()
+        
+        ranked_teams = RankingService._rank_teams(team_aggregates, rules)
+        
+        # Bulk upsert TeamRanking records
+        scope = and_(
+            TeamRanking.competition_id == competition_id,
+            TeamRanking.ranking_type == ranking_type,
+            TeamRanking.round_id == round_id if round_id else TeamRanking.round_id.is_(None)
+        )
+        existing_result = await db.execute(
+            select(TeamRanking.team_id, TeamRanking.id).where(scope)
+        )
+        existing_ids = dict(existing_result.all())
+        
+        computed_at = datetime.utcnow()
+        updates = []
+        inserts = []
+        for team_data in ranked_teams:
+            values = {
+                "rank": team_data["rank"],
+                "total_score": team_data["total_score"],
+                "raw_score": team_data["raw_score"],
+                "normalized_score": team_data["normalized_score"],
+                **{f"{criterion}_avg": team_data[f"{criterion}_avg"] for criterion in RankingService.CRITERIA},
+                "is_tied": team_data.get("is_tied", False),
+                "tied_with_team_ids": team_data.get("tied_with", []),
+                "tie_break_reason": team_data.get("tie_break_reason"),
+                "tie_break_applied": team_data.get("tie_break_applied"),
+                "computed_at": computed_at,
+                "computed_by": computed_by
+            }
+            
+            ranking_id = existing_ids.get(team_data["team_id"])
+            if ranking_id is not None:
+                updates.append({"id": ranking_id, **values})
+            else:
+                inserts.append({
+                    "institution_id": team_data["institution_id"],
+                    "competition_id": competition_id,
+                    "round_id": round_id,
+                    "team_id": team_data["team_id"],
+                    "ranking_type": ranking_type,
+                    "status": RankStatus.DRAFT,
+                    "is_published": False,
+                    **values
+                })
+        
+        if updates:
+            await db.execute(update(TeamRanking), updates)
+        if inserts:
+            await db.execute(insert(TeamRanking), inserts)
+        await db.commit()
+        
+        rankings_result = await db.execute(
+            select(TeamRanking).where(scope).order_by(TeamRanking.rank, TeamRanking.team_id)
+        )
+        rankings = rankings_result.scalars().all()
+        
+        logger.info(f"Rankings computed: {len(rankings)} teams ranked")
+        return rankings
+    
+    @staticmethod
+    async def _load_team_aggregates(
+        competition_id: int,
+        round_id: Optional[int],
+        db: AsyncSession
+    ) -> List[Dict]:
+        """
+        Aggregate published final judge scores for every team of a competition
+        with one grouped query. Teams without scores get zero scores.
+        """
+        teams_result = await db.execute(
+            select(Team.id, func.coalesce(Team.institution_id, Competition.institution_id))
+            .join(Competition, Competition.id == Team.competition_id)
+            .where(Team.competition_id == competition_id)
+            .order_by(Team.id)
+        )
+        teams = teams_result.all()
+        
+        scores_query = select(
+            JudgeScore.team_id,
+            func.count(JudgeScore.id),
+            func.avg(JudgeScore.total_score),
+            func.sum(JudgeScore.total_score),
+            *[func.avg(getattr(JudgeScore, f"{criterion}_score")) for criterion in RankingService.CRITERIA]
+        ).where(
             and_(
                 JudgeScore.competition_id == competition_id,
                 JudgeScore.is_published == True,
                 JudgeScore.is_final == True
             )
-        )
+        ).group_by(JudgeScore.team_id)
         
         if round_id:
             scores_query = scores_query.where(JudgeScore.slot_id.in_(
@@ -74,307 +178,118 @@ class RankingService:
             ))
         
         scores_result = await db.execute(scores_query)
-        all_scores = scores_result.scalars().all()
+        team_scores = {row[0]: row[1:] for row in scores_result.all()}
         
-        # Group scores by team
-        team_scores = defaultdict(list)
-        for score in all_scores:
-            team_scores[score.team_id].append(score)
-        
-        # Compute aggregated scores for each team
         team_aggregates = []
-        for team in teams:
-            scores = team_scores.get(team.id, [])
+        for team_id, institution_id in teams:
+            aggregate = {"team_id": team_id, "institution_id": institution_id}
+            scores = team_scores.get(team_id)
             
-            if not scores:
+            if scores is None:
                 # Team has no scores yet
-                aggregate = {
-                    "team_id": team.id,
+                aggregate.update({
                     "has_scores": False,
+                    "judge_count": 0,
                     "total_score": 0,
-                    "normalized_score": 0
-                }
+                    "raw_score": 0,
+                    **{f"{criterion}_avg": None for criterion in RankingService.CRITERIA}
+                })
             else:
-                # Aggregate scores across all judges
-                aggregate = RankingService._aggregate_scores(team.id, scores)
-                aggregate["has_scores"] = True
+                judge_count, total_avg, total_sum, *criterion_avgs = scores
+                aggregate.update({
+                    "has_scores": True,
+                    "judge_count": judge_count,
+                    "total_score": total_avg or 0,
+                    "raw_score": total_sum or 0,
+                    **{
+                        f"{criterion}_avg": value
+                        for criterion, value in zip(RankingService.CRITERIA, criterion_avgs)
+                    }
+                })
+            
+            # Calculate normalized score (0-100)
+            # Max possible per judge = 60 (6 criteria × 10)
+            # Normalized = (average_total / 60) × 100
+            aggregate["normalized_score"] = (aggregate["total_score"] / 60) * 100
             
             team_aggregates.append(aggregate)
         
-        # Sort by total score (descending)
-        team_aggregates.sort(key=lambda x: x.get("normalized_score", 0), reverse=True)
-        
-        # Apply tie-breaking
-        ranked_teams = await RankingService._apply_tie_breaking(
-            competition_id, team_aggregates, db
-        )
-        
-        # Create/update TeamRanking records
-        rankings = []
-        current_rank = 1
-        
-        for i, team_data in enumerate(ranked_teams):
-            # Check for ties
-            is_tied = team_data.get("is_tied", False)
-            
-            # Determine actual rank
-            if i > 0 and not is_tied:
-                # If previous team was tied with others, skip ranks accordingly
-                prev_team = ranked_teams[i-1]
-                if prev_team.get("is_tied"):
-                    # Find how many teams were tied at previous rank
-                    tied_count = sum(1 for t in ranked_teams[:i] if t.get("rank") == prev_team.get("rank"))
-                    current_rank = prev_team.get("rank", 1) + tied_count
-                else:
-                    current_rank = i + 1
-            elif not is_tied:
-                current_rank = i + 1
-            
-            team_data["rank"] = current_rank
-            
-            # Check for existing ranking
-            existing_result = await db.execute(
-                select(TeamRanking).where(
-                    and_(
-                        TeamRanking.competition_id == competition_id,
-                        TeamRanking.team_id == team_data["team_id"],
-                        TeamRanking.ranking_type == ranking_type
-                    )
-                )
+        return team_aggregates
+    
+    @staticmethod
+    def _default_tie_break_rules() -> List[TieBreakRule]:
+        """Criterion comparison in DEFAULT_TIE_BREAK_ORDER"""
+        return [
+            TieBreakRule(
+                rule_name=f"higher_{crit}",
+                criterion=crit,
+                comparison="higher",
+                rule_order=i+1
             )
-            existing = existing_result.scalar_one_or_none()
-            
-            if existing:
-                # Update existing
-                existing.rank = current_rank
-                existing.total_score = team_data.get("total_score")
-                existing.normalized_score = team_data.get("normalized_score")
-                existing.issue_framing_avg = team_data.get("issue_framing_avg")
-                existing.legal_reasoning_avg = team_data.get("legal_reasoning_avg")
-                existing.use_of_authority_avg = team_data.get("use_of_authority_avg")
-                existing.structure_clarity_avg = team_data.get("structure_clarity_avg")
-                existing.oral_advocacy_avg = team_data.get("oral_advocacy_avg")
-                existing.responsiveness_avg = team_data.get("responsiveness_avg")
-                existing.is_tied = is_tied
-                existing.tied_with_team_ids = team_data.get("tied_with", [])
-                existing.tie_break_reason = team_data.get("tie_break_reason")
-                existing.tie_break_applied = team_data.get("tie_break_applied")
-                existing.computed_at = datetime.utcnow()
-                existing.computed_by = computed_by
-                
-                ranking = existing
-            else:
-                # Create new
-                ranking = TeamRanking(
-                    institution_id=team.institution_id,
-                    competition_id=competition_id,
-                    round_id=round_id,
-                    team_id=team_data["team_id"],
-                    ranking_type=ranking_type,
-                    rank=current_rank,
-                    total_score=team_data.get("total_score"),
-                    normalized_score=team_data.get("normalized_score"),
-                    issue_framing_avg=team_data.get("issue_framing_avg"),
-                    legal_reasoning_avg=team_data.get("legal_reasoning_avg"),
-                    use_of_authority_avg=team_data.get("use_of_authority_avg"),
-                    structure_clarity_avg=team_data.get("structure_clarity_avg"),
-                    oral_advocacy_avg=team_data.get("oral_advocacy_avg"),
-                    responsiveness_avg=team_data.get("responsiveness_avg"),
-                    is_tied=is_tied,
-                    tied_with_team_ids=team_data.get("tied_with", []),
-                    tie_break_reason=team_data.get("tie_break_reason"),
-                    tie_break_applied=team_data.get("tie_break_applied"),
-                    status=RankStatus.DRAFT,
-                    is_published=False,
-                    computed_at=datetime.utcnow(),
-                    computed_by=computed_by
-                )
-                db.add(ranking)
-            
-            rankings.append(ranking)
-        
-        await db.commit()
-        
-        logger.info(f"Rankings computed: {len(rankings)} teams ranked")
-        return rankings
+            for i, crit in enumerate(RankingService.DEFAULT_TIE_BREAK_ORDER)
+        ]
     
     @staticmethod
-    def _aggregate_scores(team_id: int, scores: List[JudgeScore]) -> Dict:
+    def _rank_teams(team_aggregates: List[Dict], rules: List[TieBreakRule]) -> List[Dict]:
         """
-        Aggregate scores from multiple judges for a single team.
+        Phase 5E: Order teams and apply tie-break rules when teams have equal scores.
+        
+        Teams are sorted once on (score rounded to 2 decimals, rule 1, rule 2, ...),
+        so tie-break rules only decide between teams level on score. Teams equal
+        on every key share a competition rank ("1224"). Teams level on score are
+        marked tied, with the rule that separated them recorded.
         """
-        # Collect all criterion scores
-        criterion_scores = {
-            "issue_framing": [],
-            "legal_reasoning": [],
-            "use_of_authority": [],
-            "structure_clarity": [],
-            "oral_advocacy": [],
-            "responsiveness": []
+        def rule_key(team: Dict, rule: TieBreakRule) -> float:
+            # Rules name a criterion with or without the JudgeScore "_score" suffix
+            criterion = (rule.criterion or "").removesuffix("_score")
+            value = team.get(f"{criterion}_avg") or 0
+            return -value if rule.comparison == "higher" else value
+        
+        sort_keys = {
+            team["team_id"]: (
+                -round(team["normalized_score"], 2),
+                *(rule_key(team, rule) for rule in rules)
+            )
+            for team in team_aggregates
         }
-        
-        total_scores = []
-        
-        for score in scores:
-            if score.issue_framing_score is not None:
-                criterion_scores["issue_framing"].append(score.issue_framing_score)
-            if score.legal_reasoning_score is not None:
-                criterion_scores["legal_reasoning"].append(score.legal_reasoning_score)
-            if score.use_of_authority_score is not None:
-                criterion_scores["use_of_authority"].append(score.use_of_authority_score)
-            if score.structure_clarity_score is not None:
-                criterion_scores["structure_clarity"].append(score.structure_clarity_score)
-            if score.oral_advocacy_score is not None:
-                criterion_scores["oral_advocacy"].append(score.oral_advocacy_score)
-            if score.responsiveness_score is not None:
-                criterion_scores["responsiveness"].append(score.responsiveness_score)
+        ranked_teams = sorted(team_aggregates, key=lambda team: sort_keys[team["team_id"]])
+        
+        # Competition ranks: a team shares the rank of an identical predecessor
+        previous_key = None
+        for i, team in enumerate(ranked_teams):
+            key = sort_keys[team["team_id"]]
+            if key != previous_key:
+                rank = i + 1
+            team["rank"] = rank
+            previous_key = key
+        
+        # Teams level on score form contiguous groups after the sort
+        for _, group in groupby(ranked_teams, key=lambda team: sort_keys[team["team_id"]][0]):
+            tied_teams = list(group)
+            if len(tied_teams) < 2:
+                continue
             
-            if score.total_score is not None:
-                total_scores.append(score.total_score)
-        
-        # Calculate averages
-        aggregate = {
-            "team_id": team_id,
-            "judge_count": len(scores),
-            "issue_framing_avg": mean(criterion_scores["issue_framing"]) if criterion_scores["issue_framing"] else None,
-            "legal_reasoning_avg": mean(criterion_scores["legal_reasoning"]) if criterion_scores["legal_reasoning"] else None,
-            "use_of_authority_avg": mean(criterion_scores["use_of_authority"]) if criterion_scores["use_of_authority"] else None,
-            "structure_clarity_avg": mean(criterion_scores["structure_clarity"]) if criterion_scores["structure_clarity"] else None,
-            "oral_advocacy_avg": mean(criterion_scores["oral_advocacy"]) if criterion_scores["oral_advocacy"] else None,
-            "responsiveness_avg": mean(criterion_scores["responsiveness"]) if criterion_scores["responsiveness"] else None,
-            "total_score": mean(total_scores) if total_scores else 0,
-            "raw_score": sum(total_scores) if total_scores else 0
-        }
-        
-        # Calculate normalized score (0-100)
-        # Max possible per judge = 60 (6 criteria × 10)
-        # Normalized = (average_total / 60) × 100
-        if aggregate["total_score"]:
-            aggregate["normalized_score"] = (aggregate["total_score"] / 60) * 100
-        else:
-            aggregate["normalized_score"] = 0
-        
-        return aggregate
-    
-    @staticmethod
-    async def _apply_tie_breaking(
-        competition_id: int,
-        team_aggregates: List[Dict],
-        db: AsyncSession
-    ) -> List[Dict]:
-        """
-        Phase 5E: Apply tie-break rules when teams have equal scores.
-        """
-        # Get custom tie-break rules for competition
-        rules_result = await db.execute(
-            select(TieBreakRule).where(
-                and_(
-                    TieBreakRule.competition_id == competition_id,
-                    TieBreakRule.is_active == True
-                )
-            ).order_by(TieBreakRule.rule_order)
-        )
-        custom_rules = rules_result.scalars().all()
-        
-        # Group teams by score for tie detection
-        score_groups = defaultdict(list)
-        for team in team_aggregates:
-            # Round to 2 decimal places for comparison
-            score_key = round(team.get("normalized_score", 0), 2)
-            score_groups[score_key].append(team)
-        
-        # Process ties
-        for score, tied_teams in score_groups.items():
-            if len(tied_teams) > 1:
-                # We have a tie!
-                tied_team_ids = [t["team_id"] for t in tied_teams]
+            tied_team_ids = [t["team_id"] for t in tied_teams]
+            for position, team in enumerate(tied_teams):
+                team["is_tied"] = True
+                team["tied_with"] = tied_team_ids
                 
-                # Try to break tie using rules
-                broken_teams = await RankingService._break_tie(
-                    tied_teams, custom_rules, db
+                # Rule that separated this team from its neighbour in the group
+                neighbour = tied_teams[1] if position == 0 else tied_teams[position - 1]
+                deciding_rule = next(
+                    (rule for rule in rules if rule_key(team, rule) != rule_key(neighbour, rule)),
+                    None
                 )
                 
-                # Mark all as tied initially
-                for team in tied_teams:
-                    team["is_tied"] = True
-                    team["tied_with"] = tied_team_ids
-                
-                # Update with break results
-                if broken_teams:
-                    for i, team in enumerate(broken_teams):
-                        team["tie_rank"] = i + 1
-                        if i == 0:
-                            team["tie_break_reason"] = "Won tie-break"
-                            team["tie_break_applied"] = custom_rules[0].rule_name if custom_rules else "criterion_comparison"
-                        else:
-                            team["tie_break_reason"] = f"Lost tie-break at position {i+1}"
-        
-        # Sort by score, then by tie_rank if present
-        team_aggregates.sort(key=lambda x: (
-            x.get("normalized_score", 0),
-            -x.get("tie_rank", 1)  # Higher tie_rank = lower actual rank
-        ), reverse=True)
-        
-        return team_aggregates
-    
-    @staticmethod
-    async def _break_tie(
-        tied_teams: List[Dict],
-        custom_rules: List[TieBreakRule],
-        db: AsyncSession
-    ) -> List[Dict]:
-        """
-        Break a tie between teams using available rules.
-        Returns teams sorted by tie-break result.
-        """
-        if not custom_rules:
-            # Use default criterion comparison
-            custom_rules = [
-                TieBreakRule(
-                    rule_name=f"higher_{crit}",
-                    criterion=crit,
-                    comparison="higher",
-                    rule_order=i+1
-                )
-                for i, crit in enumerate(RankingService.DEFAULT_TIE_BREAK_ORDER)
-            ]
-        
-        # Try each rule
-        remaining_teams = tied_teams.copy()
-        result_order = []
-        
-        for rule in custom_rules:
-            if len(remaining_teams) <= 1:
-                break
-            
-            # Sort by this criterion
-            if rule.comparison == "higher":
-                remaining_teams.sort(
-                    key=lambda x: x.get(f"{rule.criterion}_avg", 0),
-                    reverse=True
-                )
-            else:
-                remaining_teams.sort(
-                    key=lambda x: x.get(f"{rule.criterion}_avg", 0)
-                )
-            
-            # Find best score
-            best_score = remaining_teams[0].get(f"{rule.criterion}_avg", 0)
-            
-            # Teams with best score win this tie-break
-            winners = [t for t in remaining_teams if t.get(f"{rule.criterion}_avg", 0) == best_score]
-            losers = [t for t in remaining_teams if t.get(f"{rule.criterion}_avg", 0) != best_score]
-            
-            # Add losers to result (they rank lower)
-            result_order.extend(losers)
-            
-            # Continue with winners for next rule
-            remaining_teams = winners
-        
-        # Add remaining teams (still tied after all rules)
-        result_order.extend(remaining_teams)
+                if deciding_rule is None:
+                    team["tie_break_reason"] = "Tied after all tie-break rules"
+                elif position == 0:
+                    team["tie_break_reason"] = "Won tie-break"
+                else:
+                    team["tie_break_reason"] = f"Lost tie-break at position {position + 1}"
+                team["tie_break_applied"] = deciding_rule.rule_name if deciding_rule else None
         
-        return result_order
+        return ranked_teams
     
     @staticmethod
     async def generate_leaderboard(
@@ -13,7 +13,7 @@ from typing import List, Dict, Any, Optional
 from datetime import datetime
 from collections import defaultdict
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, and_, func
+from sqlalchemy import select, and_, func, case
 from sqlalchemy.orm import selectinload
 
 from backend.orm.subject import Subject
@@ -25,6 +25,7 @@ from backend.orm.topic_mastery import TopicMastery
 from backend.orm.subject_progress import SubjectProgress
 from backend.orm.practice_attempt import PracticeAttempt
 from backend.orm.user import User
+from backend.utils.priority_scoring import staleness_column, weighted_scores, priority_labels
 
 logger = logging.getLogger(__name__)
 
@@ -36,6 +37,19 @@ CURRICULUM_RELEVANCE_WEIGHT = 0.15
 HIGH_PRIORITY_THRESHOLD = 0.60
 MEDIUM_PRIORITY_THRESHOLD = 0.35
 
+MODULE_PRIORITY_WEIGHTS = {
+    "mastery_deficit": MASTERY_DEFICIT_WEIGHT,
+    "freshness": CONTENT_FRESHNESS_WEIGHT,
+    "exam": EXAM_IMPORTANCE_WEIGHT,
+    "curriculum": CURRICULUM_RELEVANCE_WEIGHT,
+}
+
+# Exam importance by module type (other types: 0.5)
+EXAM_SCORES = {
+    ModuleType.PRACTICE: 0.8,
+    ModuleType.CASES: 0.7,
+}
+
 
 def get_priority_label(score: float) -> str:
     if score >= HIGH_PRIORITY_THRESHOLD:
@@ -87,150 +101,176 @@ def generate_why_text(
     return f"{action}: {', '.join(reasons)}."
 
 
-async def compute_module_mastery(
+def _empty_module_mastery() -> Dict[str, Any]:
+    return {
+        "mastery_percent": 0.0,
+        "total_attempts": 0,
+        "correct_attempts": 0,
+        "last_attempt_date": None,
+        "days_since_last": 999
+    }
+
+
+async def compute_modules_mastery(
     user_id: int,
-    module_id: int,
+    module_ids: List[int],
     db: AsyncSession
-) -> Dict[str, Any]:
+) -> Dict[int, Dict[str, Any]]:
     """
-    Compute mastery statistics for a specific module.
+    Compute mastery statistics for several modules with one grouped query.
     
     Returns:
-        {
-            "mastery_percent": 45.5,
-            "total_attempts": 12,
-            "correct_attempts": 6,
-            "last_attempt_date": datetime,
-            "days_since_last": 5
-        }
+        Module ID → statistics (see compute_module_mastery); modules
+        without attempts get zeroed statistics
     """
-    questions_stmt = select(PracticeQuestion.id).where(
-        PracticeQuestion.module_id == module_id
-    )
-    questions_result = await db.execute(questions_stmt)
-    question_ids = [row[0] for row in questions_result.fetchall()]
-    
-    if not question_ids:
-        return {
-            "mastery_percent": 0.0,
-            "total_attempts": 0,
-            "correct_attempts": 0,
-            "last_attempt_date": None,
-            "days_since_last": 999
-        }
-    
-    attempts_stmt = select(
-        func.count(PracticeAttempt.id).label("total"),
-        func.sum(
-            func.cast(PracticeAttempt.is_correct == True, Integer)
-        ).label("correct"),
-        func.max(PracticeAttempt.attempted_at).label("last_attempt")
-    ).where(
-        and_(
-            PracticeAttempt.user_id == user_id,
-            PracticeAttempt.practice_question_id.in_(question_ids)
-        )
-    )
+    stats = {module_id: _empty_module_mastery() for module_id in module_ids}
+    if not module_ids:
+        return stats
     
-    from sqlalchemy import Integer
     attempts_stmt = select(
+        PracticeQuestion.module_id,
         func.count(PracticeAttempt.id).label("total"),
+        func.count(case((PracticeAttempt.is_correct == True, 1))).label("correct"),
         func.max(PracticeAttempt.attempted_at).label("last_attempt")
+    ).join(
+        PracticeQuestion,
+        PracticeAttempt.practice_question_id == PracticeQuestion.id
     ).where(
         and_(
             PracticeAttempt.user_id == user_id,
-            PracticeAttempt.practice_question_id.in_(question_ids)
+            PracticeQuestion.module_id.in_(module_ids)
         )
-    )
-    
-    result = await db.execute(attempts_stmt)
-    row = result.fetchone()
-    
-    total_attempts = row.total or 0
-    last_attempt = row.last_attempt
+    ).group_by(PracticeQuestion.module_id)
     
-    correct_stmt = select(func.count(PracticeAttempt.id)).where(
-        and_(
-            PracticeAttempt.user_id == user_id,
-            PracticeAttempt.practice_question_id.in_(question_ids),
-            PracticeAttempt.is_correct == True
-        )
-    )
-    correct_result = await db.execute(correct_stmt)
-    correct_attempts = correct_result.scalar() or 0
-    
-    mastery_percent = 0.0
-    if total_attempts > 0:
-        mastery_percent = (correct_attempts / total_attempts) * 100
+    now = datetime.utcnow()
+    for row in (await db.execute(attempts_stmt)).all():
+        total_attempts = row.total or 0
+        correct_attempts = row.correct or 0
+        
+        mastery_percent = 0.0
+        if total_attempts > 0:
+            mastery_percent = (correct_attempts / total_attempts) * 100
+        
+        days_since_last = 999
+        if row.last_attempt:
+            days_since_last = (now - row.last_attempt).days
+        
+        stats[row.module_id] = {
+            "mastery_percent": round(mastery_percent, 2),
+            "total_attempts": total_attempts,
+            "correct_attempts": correct_attempts,
+            "last_attempt_date": row.last_attempt,
+            "days_since_last": days_since_last
+        }
     
-    days_since_last = 999
-    if last_attempt:
-        days_since_last = (datetime.utcnow() - last_attempt).days
+    return stats
+
+
+async def compute_module_mastery(
+    user_id: int,
+    module_id: int,
+    db: AsyncSession
+) -> Dict[str, Any]:
+    """
+    Compute mastery statistics for a specific module.
     
+    Returns:
+        {
+            "mastery_percent": 45.5,
+            "total_attempts": 12,
+            "correct_attempts": 6,
+            "last_attempt_date": datetime,
+            "days_since_last": 5
+        }
+    """
+    stats = await compute_modules_mastery(user_id, [module_id], db)
+    return stats[module_id]
+
+
+def _learn_item(lc: LearnContent) -> Dict[str, Any]:
     return {
-        "mastery_percent": round(mastery_percent, 2),
-        "total_attempts": total_attempts,
-        "correct_attempts": correct_attempts,
-        "last_attempt_date": last_attempt,
-        "days_since_last": days_since_last
+        "type": "learn",
+        "id": lc.id,
+        "title": lc.title,
+        "summary": lc.summary,
+        "estimated_time": lc.estimated_time_minutes
     }
 
 
-async def get_module_content_items(
-    module: ContentModule,
+def _case_item(cc: CaseContent) -> Dict[str, Any]:
+    return {
+        "type": "case",
+        "id": cc.id,
+        "title": cc.case_name,
+        "year": cc.year,
+        "importance": cc.exam_importance.value if cc.exam_importance else "medium"
+    }
+
+
+def _practice_item(pq: PracticeQuestion) -> Dict[str, Any]:
+    return {
+        "type": "practice",
+        "id": pq.id,
+        "title": pq.question[:100] + "..." if len(pq.question) > 100 else pq.question,
+        "difficulty": pq.difficulty.value if pq.difficulty else "medium",
+        "question_type": pq.question_type.value if pq.question_type else "mcq"
+    }
+
+
+async def get_modules_content_items(
+    modules: List[ContentModule],
     db: AsyncSession
-) -> List[Dict[str, Any]]:
+) -> Dict[int, List[Dict[str, Any]]]:
     """
-    Get all content items for a module in recommended order.
-    Order: Learn → Cases → Practice
+    Get content items of several modules, one query per module type.
+    
+    Returns:
+        Module ID → items in recommended order (see get_module_content_items)
     """
-    items = []
+    items = {module.id: [] for module in modules}
+    ids_by_type = defaultdict(list)
+    for module in modules:
+        ids_by_type[module.module_type].append(module.id)
     
-    if module.module_type == ModuleType.LEARN:
+    if ids_by_type[ModuleType.LEARN]:
         learn_stmt = select(LearnContent).where(
-            LearnContent.module_id == module.id
+            LearnContent.module_id.in_(ids_by_type[ModuleType.LEARN])
         ).order_by(LearnContent.order_index)
         learn_result = await db.execute(learn_stmt)
         for lc in learn_result.scalars().all():
-            items.append({
-                "type": "learn",
-                "id": lc.id,
-                "title": lc.title,
-                "summary": lc.summary,
-                "estimated_time": lc.estimated_time_minutes
-            })
-    
-    elif module.module_type == ModuleType.CASES:
+            items[lc.module_id].append(_learn_item(lc))
+    
+    if ids_by_type[ModuleType.CASES]:
         case_stmt = select(CaseContent).where(
-            CaseContent.module_id == module.id
+            CaseContent.module_id.in_(ids_by_type[ModuleType.CASES])
         ).order_by(CaseContent.exam_importance.desc(), CaseContent.year.desc())
         case_result = await db.execute(case_stmt)
         for cc in case_result.scalars().all():
-            items.append({
-                "type": "case",
-                "id": cc.id,
-                "title": cc.case_name,
-                "year": cc.year,
-                "importance": cc.exam_importance.value if cc.exam_importance else "medium"
-            })
-    
-    elif module.module_type == ModuleType.PRACTICE:
+            items[cc.module_id].append(_case_item(cc))
+    
+    if ids_by_type[ModuleType.PRACTICE]:
         practice_stmt = select(PracticeQuestion).where(
-            PracticeQuestion.module_id == module.id
+            PracticeQuestion.module_id.in_(ids_by_type[ModuleType.PRACTICE])
         ).order_by(PracticeQuestion.difficulty, PracticeQuestion.order_index)
         practice_result = await db.execute(practice_stmt)
         for pq in practice_result.scalars().all():
-            items.append({
-                "type": "practice",
-                "id": pq.id,
-                "title": pq.question[:100] + "..." if len(pq.question) > 100 else pq.question,
-                "difficulty": pq.difficulty.value if pq.difficulty else "medium",
-                "question_type": pq.question_type.value if pq.question_type else "mcq"
-            })
+            items[pq.module_id].append(_practice_item(pq))
     
     return items
 
 
+async def get_module_content_items(
+    module: ContentModule,
+    db: AsyncSession
+) -> List[Dict[str, Any]]:
+    """
+    Get all content items for a module in recommended order.
+    Order: Learn → Cases → Practice
+    """
+    items = await get_modules_content_items([module], db)
+    return items[module.id]
+
+
 async def generate_study_map(
     user_id: int,
     subject_id: int,
@@ -241,12 +281,14 @@ async def generate_study_map(
     
     Algorithm:
     1. Fetch subject and all its modules
-    2. For each module, compute mastery statistics
+    2. Load mastery statistics (one grouped query) and content items
+       (one query per module type) for all modules
     3. Calculate priority score based on:
        - Mastery deficit (40%)
        - Content freshness (25%)
        - Exam importance (20%)
        - Curriculum relevance (15%)
+       (all modules scored together in one column-wise pass)
     4. Sort modules by priority
     5. Include content items for each module
     
@@ -288,50 +330,44 @@ async def generate_study_map(
             "message": "No active modules found for this subject. Content coming soon!"
         }
     
+    module_ids = [module.id for module in modules]
+    mastery_by_module = await compute_modules_mastery(user_id, module_ids, db)
+    items_by_module = await get_modules_content_items(modules, db)
+    
+    mastery = [mastery_by_module[module_id]["mastery_percent"] for module_id in module_ids]
+    days_since = [mastery_by_module[module_id]["days_since_last"] for module_id in module_ids]
+    
+    components = {
+        "mastery_deficit": [(100 - percent) / 100 for percent in mastery],
+        "freshness": staleness_column(days_since, 30),
+        "exam": [EXAM_SCORES.get(module.module_type, 0.5) for module in modules],
+        "curriculum": [0.5] * len(modules),
+    }
+    scores = weighted_scores(components, MODULE_PRIORITY_WEIGHTS)
+    labels = priority_labels(scores, HIGH_PRIORITY_THRESHOLD, MEDIUM_PRIORITY_THRESHOLD)
+    
     module_priorities = []
     
-    for module in modules:
-        mastery_stats = await compute_module_mastery(user_id, module.id, db)
-        
-        content_items = await get_module_content_items(module, db)
+    for i, module in enumerate(modules):
+        mastery_stats = mastery_by_module[module.id]
+        content_items = items_by_module[module.id]
         content_count = len(content_items)
         
-        mastery_deficit = (100 - mastery_stats["mastery_percent"]) / 100
-        
-        freshness_score = min(mastery_stats["days_since_last"] / 30, 1.0)
-        
-        exam_score = 0.5
-        if module.module_type == ModuleType.PRACTICE:
-            exam_score = 0.8
-        elif module.module_type == ModuleType.CASES:
-            exam_score = 0.7
-        
-        curriculum_score = 0.5
-        
-        priority_score = (
-            mastery_deficit * MASTERY_DEFICIT_WEIGHT +
-            freshness_score * CONTENT_FRESHNESS_WEIGHT +
-            exam_score * EXAM_IMPORTANCE_WEIGHT +
-            curriculum_score * CURRICULUM_RELEVANCE_WEIGHT
-        )
-        
-        priority_label = get_priority_label(priority_score)
-        
         why_text = generate_why_text(
             module.title,
             mastery_stats["mastery_percent"],
             mastery_stats["total_attempts"] > 0,
             mastery_stats["days_since_last"],
             content_count,
-            priority_label
+            labels[i]
         )
         
         module_priorities.append({
             "module_id": module.id,
             "module_title": module.title,
             "module_type": module.module_type.value if module.module_type else None,
-            "priority": priority_label,
-            "priority_score": round(priority_score, 4),
+            "priority": labels[i],
+            "priority_score": round(scores[i], 4),
             "why": why_text,
             "mastery_percent": mastery_stats["mastery_percent"],
             "total_attempts": mastery_stats["total_attempts"],
@@ -37,16 +37,26 @@ PLANNING LOGIC:
 NO AI CALLS - ALL LOGIC IS DETERMINISTIC
 NO FIXED SCHEDULES - ADAPTS TO DATA
 NO HARDCODED SYLLABUS LOGIC
+
+CONTENT INDEX:
+Plan generation loads each subject's learn/case/practice content once
+(three queries for all subjects) into an in-memory SubjectContentIndex
+with time estimates precomputed; topic lookups are then pure in-memory
+and memoized per topic tag. Indexes are dropped when content or modules
+of the subject change, and expire after STUDY_CONTENT_INDEX_TTL_SECONDS.
 """
 
+import os
+import time
 import logging
+from collections import OrderedDict
 from typing import Dict, List, Any, Optional, Tuple
 from datetime import datetime, timedelta
 from collections import defaultdict
 from dataclasses import dataclass, field, asdict
 from enum import Enum
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, and_, func, desc, or_
+from sqlalchemy import select, and_, func, desc, or_, event, inspect
 from sqlalchemy.orm import joinedload
 
 from backend.orm.user import User
@@ -62,7 +72,7 @@ from backend.orm.practice_attempt import PracticeAttempt
 from backend.orm.study_plan import StudyPlan
 from backend.orm.study_plan_item import StudyPlanItem
 from backend.services.study_priority_engine import (
-    compute_topic_priority,
+    compute_user_topic_priorities,
     get_priority_label,
     WEAK_MASTERY,
     STRONG_MASTERY,
@@ -99,6 +109,9 @@ MIN_SESSION_MINUTES = 30
 MAX_SESSION_MINUTES = 120
 DEFAULT_DAILY_STUDY_MINUTES = 120
 
+STUDY_CONTENT_INDEX_TTL_SECONDS = float(os.getenv("STUDY_CONTENT_INDEX_TTL_SECONDS", "600"))
+STUDY_CONTENT_INDEX_MAX_SUBJECTS = 512
+
 MASTERY_THRESHOLDS = {
     "weak": WEAK_MASTERY,
     "strong": STRONG_MASTERY,
@@ -184,52 +197,61 @@ class StudyPlanResult:
         }
 
 
-def estimate_learn_time(content: LearnContent) -> int:
-    """Estimate time to study learn content based on length."""
-    if content.estimated_time_minutes:
-        return content.estimated_time_minutes
+def _learn_minutes(estimated_time_minutes: Optional[int], body_length: int) -> int:
+    if estimated_time_minutes:
+        return estimated_time_minutes
     
-    body_length = len(content.body) if content.body else 0
     estimated = int(body_length * LEARN_TIME_PER_100_CHARS / 100)
     return max(10, min(45, estimated))
 
 
-def estimate_case_time(case: CaseContent) -> int:
-    """Estimate time to study a case based on importance and length."""
+def estimate_learn_time(content: LearnContent) -> int:
+    """Estimate time to study learn content based on length."""
+    return _learn_minutes(content.estimated_time_minutes, len(content.body) if content.body else 0)
+
+
+def _case_minutes(exam_importance: Optional[Enum], total_length: int) -> int:
     base_time = CASE_BASE_TIME_MINUTES
     
-    if case.exam_importance and case.exam_importance.value == "high":
+    if exam_importance and exam_importance.value == "high":
         base_time += 10
-    elif case.exam_importance and case.exam_importance.value == "low":
+    elif exam_importance and exam_importance.value == "low":
         base_time -= 5
     
+    length_factor = min(total_length / 2000, 1.0)
+    adjusted = base_time + int(length_factor * 10)
+    
+    return max(10, min(30, adjusted))
+
+
+def estimate_case_time(case: CaseContent) -> int:
+    """Estimate time to study a case based on importance and length."""
     total_length = sum([
         len(case.facts or ""),
         len(case.issue or ""),
         len(case.judgment or ""),
         len(case.ratio or ""),
     ])
-    
-    length_factor = min(total_length / 2000, 1.0)
-    adjusted = base_time + int(length_factor * 10)
-    
-    return max(10, min(30, adjusted))
+    return _case_minutes(case.exam_importance, total_length)
 
 
-def estimate_practice_time(question: PracticeQuestion, avg_time: Optional[float] = None) -> int:
-    """Estimate time for practice question based on marks and history."""
+def _practice_minutes(marks: Optional[int], question_type: Optional[Enum], avg_time: Optional[float] = None) -> int:
     if avg_time:
         return int(avg_time / 60)
     
-    marks = question.marks or 5
-    estimated = marks * TIME_PER_MARK_MINUTES
+    estimated = (marks or 5) * TIME_PER_MARK_MINUTES
     
-    if question.question_type and question.question_type.value == "essay":
+    if question_type and question_type.value == "essay":
         estimated = int(estimated * 1.5)
     
     return max(5, min(60, estimated))
 
 
+def estimate_practice_time(question: PracticeQuestion, avg_time: Optional[float] = None) -> int:
+    """Estimate time for practice question based on marks and history."""
+    return _practice_minutes(question.marks, question.question_type, avg_time)
+
+
 def generate_why_explanation(
     topic_tag: str,
     mastery_percent: Optional[float],
@@ -367,27 +389,17 @@ async def fetch_user_learning_data(
         subjects_result = await db.execute(subjects_stmt)
         subject_ids = [row[0] for row in subjects_result.fetchall()]
     
-    subject_map = {}
-    for subject_id in subject_ids:
-        subject_stmt = select(Subject).where(Subject.id == subject_id)
-        subject_result = await db.execute(subject_stmt)
-        subject = subject_result.scalar_one_or_none()
-        if subject:
-            subject_map[subject_id] = {
-                "id": subject_id,
-                "title": subject.title,
-            }
-    
-    all_priorities = []
-    for subject_id in subject_ids:
-        priorities = await compute_topic_priority(
-            user_id, subject_id, db, user_semester
-        )
-        for p in priorities:
-            p["subject_name"] = subject_map.get(subject_id, {}).get("title", "Unknown")
-        all_priorities.extend(priorities)
+    subjects_stmt = select(Subject.id, Subject.title).where(Subject.id.in_(subject_ids))
+    subject_map = {
+        row.id: {"id": row.id, "title": row.title}
+        for row in (await db.execute(subjects_stmt)).all()
+    }
     
-    all_priorities.sort(key=lambda x: x["priority_score"], reverse=True)
+    all_priorities = await compute_user_topic_priorities(
+        user_id, db, user_semester, subject_ids
+    )
+    for p in all_priorities:
+        p["subject_name"] = subject_map.get(p["subject_id"], {}).get("title", "Unknown")
     
     mastery_stmt = select(TopicMastery).where(TopicMastery.user_id == user_id)
     mastery_result = await db.execute(mastery_stmt)
@@ -409,87 +421,244 @@ async def fetch_user_learning_data(
     return user, all_priorities, topic_mastery_map, subject_map
 
 
+# ================= STUDY CONTENT INDEX =================
+
+@dataclass
+class SubjectContentIndex:
+    """
+    Plannable content of one subject in module order, with time
+    estimates precomputed. Each entry pairs the lowercase text a topic is
+    matched against (learn: title, cases/practice: tags) with the item.
+    """
+    subject_id: int
+    learn: List[Tuple[str, Dict]] = field(default_factory=list)
+    cases: List[Tuple[str, Dict]] = field(default_factory=list)
+    practice: List[Tuple[str, Dict]] = field(default_factory=list)
+    loaded_at: float = field(default_factory=time.monotonic)
+    by_topic: Dict[Optional[str], Dict[str, List[Dict]]] = field(default_factory=dict)
+    
+    def content_for_topic(self, topic_tag: Optional[str]) -> Dict[str, List[Dict]]:
+        """Learn, case and practice items for a topic (memoized per tag)"""
+        if topic_tag not in self.by_topic:
+            self.by_topic[topic_tag] = self._match(topic_tag)
+        return {kind: list(items) for kind, items in self.by_topic[topic_tag].items()}
+    
+    def _match(self, topic_tag: Optional[str]) -> Dict[str, List[Dict]]:
+        if not topic_tag:
+            return {
+                "learn": [item for _, item in self.learn],
+                "cases": [item for _, item in self.cases],
+                "practice": [item for _, item in self.practice],
+            }
+        
+        tag_lower = topic_tag.lower()
+        topic_words = tag_lower.replace("-", " ").replace("_", " ")
+        return {
+            "learn": [item for title, item in self.learn if topic_words in title or tag_lower in title],
+            "cases": [item for tags, item in self.cases if tag_lower in tags],
+            "practice": [item for tags, item in self.practice if tag_lower in tags],
+        }
+
+
+# subject_id -> index, least recently used first
+_content_indexes: "OrderedDict[int, SubjectContentIndex]" = OrderedDict()
+
+# Bumped on every invalidation; a load that raced with one is not stored
+_content_index_generation = 0
+
+
+async def _build_content_indexes(
+    subject_ids: List[int],
+    db: AsyncSession
+) -> Dict[int, SubjectContentIndex]:
+    """Load learn, case and practice content of the subjects (three queries)"""
+    indexes = {subject_id: SubjectContentIndex(subject_id) for subject_id in subject_ids}
+    module_order = (ContentModule.subject_id, ContentModule.order_index, ContentModule.id)
+    
+    learn_result = await db.execute(
+        select(
+            ContentModule.subject_id,
+            LearnContent.id,
+            LearnContent.module_id,
+            LearnContent.title,
+            LearnContent.estimated_time_minutes,
+            func.coalesce(func.length(LearnContent.body), 0)
+        )
+        .join(ContentModule, ContentModule.id == LearnContent.module_id)
+        .where(
+            ContentModule.subject_id.in_(subject_ids),
+            ContentModule.module_type == ModuleType.LEARN
+        )
+        .order_by(*module_order, LearnContent.order_index, LearnContent.id)
+    )
+    for subject_id, item_id, module_id, title, estimated_minutes, body_length in learn_result.all():
+        indexes[subject_id].learn.append((
+            (title or "").lower(),
+            {
+                "id": item_id,
+                "module_id": module_id,
+                "title": title,
+                "estimated_time": _learn_minutes(estimated_minutes, body_length),
+            }
+        ))
+    
+    case_length = sum(
+        func.coalesce(func.length(column), 0)
+        for column in (CaseContent.facts, CaseContent.issue, CaseContent.judgment, CaseContent.ratio)
+    )
+    case_result = await db.execute(
+        select(
+            ContentModule.subject_id,
+            CaseContent.id,
+            CaseContent.module_id,
+            CaseContent.case_name,
+            CaseContent.tags,
+            CaseContent.exam_importance,
+            case_length
+        )
+        .join(ContentModule, ContentModule.id == CaseContent.module_id)
+        .where(
+            ContentModule.subject_id.in_(subject_ids),
+            ContentModule.module_type == ModuleType.CASES
+        )
+        .order_by(*module_order, CaseContent.id)
+    )
+    for subject_id, item_id, module_id, case_name, tags, importance, total_length in case_result.all():
+        indexes[subject_id].cases.append((
+            (tags or "").lower(),
+            {
+                "id": item_id,
+                "module_id": module_id,
+                "title": case_name,
+                "estimated_time": _case_minutes(importance, total_length or 0),
+                "importance": importance.value if importance else "medium",
+            }
+        ))
+    
+    practice_result = await db.execute(
+        select(
+            ContentModule.subject_id,
+            PracticeQuestion.id,
+            PracticeQuestion.module_id,
+            PracticeQuestion.question,
+            PracticeQuestion.tags,
+            PracticeQuestion.marks,
+            PracticeQuestion.question_type
+        )
+        .join(ContentModule, ContentModule.id == PracticeQuestion.module_id)
+        .where(
+            ContentModule.subject_id.in_(subject_ids),
+            ContentModule.module_type == ModuleType.PRACTICE
+        )
+        .order_by(*module_order, PracticeQuestion.order_index, PracticeQuestion.id)
+    )
+    for subject_id, item_id, module_id, text, tags, marks, question_type in practice_result.all():
+        indexes[subject_id].practice.append((
+            (tags or "").lower(),
+            {
+                "id": item_id,
+                "module_id": module_id,
+                "title": text[:100] + "..." if text and len(text) > 100 else text,
+                "estimated_time": _practice_minutes(marks, question_type),
+                "marks": marks,
+                "type": question_type.value if question_type else "mcq",
+            }
+        ))
+    
+    return indexes
+
+
+async def load_content_indexes(
+    subject_ids: List[int],
+    db: AsyncSession
+) -> Dict[int, SubjectContentIndex]:
+    """
+    Content indexes for the subjects: cached ones are reused, the rest
+    are loaded together in one batch.
+    """
+    now = time.monotonic()
+    indexes = {}
+    missing = []
+    
+    for subject_id in dict.fromkeys(subject_ids):
+        index = _content_indexes.get(subject_id)
+        if index is not None and now - index.loaded_at < STUDY_CONTENT_INDEX_TTL_SECONDS:
+            _content_indexes.move_to_end(subject_id)
+            indexes[subject_id] = index
+        else:
+            missing.append(subject_id)
+    
+    if missing:
+        generation = _content_index_generation
+        built = await _build_content_indexes(missing, db)
+        indexes.update(built)
+        
+        if generation == _content_index_generation:
+            for subject_id, index in built.items():
+                _content_indexes[subject_id] = index
+                _content_indexes.move_to_end(subject_id)
+            while len(_content_indexes) > STUDY_CONTENT_INDEX_MAX_SUBJECTS:
+                _content_indexes.popitem(last=False)
+    
+    return indexes
+
+
+def invalidate_content_index(subject_id: Optional[int] = None) -> None:
+    """Drop one subject's content index (or all of them)"""
+    global _content_index_generation
+    _content_index_generation += 1
+    if subject_id is None:
+        _content_indexes.clear()
+    else:
+        _content_indexes.pop(subject_id, None)
+
+
+def _attribute_values(target, attribute: str) -> set:
+    """Current and pre-flush values of an attribute"""
+    history = getattr(inspect(target).attrs, attribute).history
+    return {getattr(target, attribute), *history.deleted} - {None}
+
+
+_modules = ContentModule.__table__
+
+
+@event.listens_for(LearnContent, "after_insert")
+@event.listens_for(LearnContent, "after_update")
+@event.listens_for(LearnContent, "after_delete")
+@event.listens_for(CaseContent, "after_insert")
+@event.listens_for(CaseContent, "after_update")
+@event.listens_for(CaseContent, "after_delete")
+@event.listens_for(PracticeQuestion, "after_insert")
+@event.listens_for(PracticeQuestion, "after_update")
+@event.listens_for(PracticeQuestion, "after_delete")
+def _on_content_change(mapper, connection, target) -> None:
+    if not _content_indexes:
+        invalidate_content_index()
+        return
+    module_ids = _attribute_values(target, "module_id")
+    subject_ids = connection.execute(
+        select(_modules.c.subject_id).where(_modules.c.id.in_(module_ids))
+    ).scalars().all() if module_ids else []
+    for subject_id in subject_ids:
+        invalidate_content_index(subject_id)
+
+
+@event.listens_for(ContentModule, "after_insert")
+@event.listens_for(ContentModule, "after_update")
+@event.listens_for(ContentModule, "after_delete")
+def _on_module_change(mapper, connection, target: ContentModule) -> None:
+    for subject_id in _attribute_values(target, "subject_id"):
+        invalidate_content_index(subject_id)
+
+
 async def fetch_content_for_topic(
     subject_id: int,
     topic_tag: Optional[str],
     db: AsyncSession
 ) -> Dict[str, List[Dict]]:
     """Fetch learn, case, and practice content for a topic."""
-    content = {
-        "learn": [],
-        "cases": [],
-        "practice": [],
-    }
-    
-    modules_stmt = select(ContentModule).where(
-        ContentModule.subject_id == subject_id
-    )
-    modules_result = await db.execute(modules_stmt)
-    modules = modules_result.scalars().all()
-    
-    for module in modules:
-        if module.module_type == ModuleType.LEARN:
-            learn_stmt = select(LearnContent).where(
-                LearnContent.module_id == module.id
-            ).limit(5)
-            learn_result = await db.execute(learn_stmt)
-            
-            for item in learn_result.scalars().all():
-                if topic_tag:
-                    title_lower = item.title.lower() if item.title else ""
-                    topic_lower = topic_tag.lower().replace("-", " ").replace("_", " ")
-                    if topic_lower not in title_lower and topic_tag.lower() not in title_lower:
-                        continue
-                
-                content["learn"].append({
-                    "id": item.id,
-                    "module_id": module.id,
-                    "title": item.title,
-                    "estimated_time": estimate_learn_time(item),
-                })
-        
-        elif module.module_type == ModuleType.CASES:
-            case_stmt = select(CaseContent).where(
-                CaseContent.module_id == module.id
-            ).limit(5)
-            case_result = await db.execute(case_stmt)
-            
-            for case in case_result.scalars().all():
-                if topic_tag:
-                    tags = case.tags.lower() if case.tags else ""
-                    if topic_tag.lower() not in tags:
-                        continue
-                
-                content["cases"].append({
-                    "id": case.id,
-                    "module_id": module.id,
-                    "title": case.case_name,
-                    "estimated_time": estimate_case_time(case),
-                    "importance": case.exam_importance.value if case.exam_importance else "medium",
-                })
-        
-        elif module.module_type == ModuleType.PRACTICE:
-            practice_stmt = select(PracticeQuestion).where(
-                PracticeQuestion.module_id == module.id
-            ).limit(10)
-            practice_result = await db.execute(practice_stmt)
-            
-            for q in practice_result.scalars().all():
-                if topic_tag:
-                    tags = q.tags.lower() if q.tags else ""
-                    if topic_tag.lower() not in tags:
-                        continue
-                
-                content["practice"].append({
-                    "id": q.id,
-                    "module_id": module.id,
-                    "title": q.question_text[:100] + "..." if q.question_text and len(q.question_text) > 100 else q.question_text,
-                    "estimated_time": estimate_practice_time(q),
-                    "marks": q.marks,
-                    "type": q.question_type.value if q.question_type else "mcq",
-                })
-    
-    return content
+    indexes = await load_content_indexes([subject_id], db)
+    return indexes[subject_id].content_for_topic(topic_tag)
 
 
 def categorize_topics_by_mastery(
@@ -595,6 +764,17 @@ async def create_session_items(
     subject_map: Dict[int, Dict],
     topic_mastery_map: Dict[str, Dict],
     db: AsyncSession
+) -> List[PlanItem]:
+    """Create plan items for a single topic session (loads its subject's content index)."""
+    indexes = await load_content_indexes([topic["subject_id"]], db)
+    return build_session_items(topic, subject_map, topic_mastery_map, indexes)
+
+
+def build_session_items(
+    topic: Dict,
+    subject_map: Dict[int, Dict],
+    topic_mastery_map: Dict[str, Dict],
+    content_indexes: Dict[int, SubjectContentIndex]
 ) -> List[PlanItem]:
     """
     Create plan items for a single topic session.
@@ -615,7 +795,8 @@ async def create_session_items(
     priority = topic.get("priority", "Medium")
     category = topic.get("category", "medium")
     
-    content = await fetch_content_for_topic(subject_id, topic_tag, db)
+    index = content_indexes.get(subject_id) or SubjectContentIndex(subject_id)
+    content = index.content_for_topic(topic_tag)
     
     activity_type = ActivityType.LEARN
     if category == "revision":
@@ -734,9 +915,11 @@ async def generate_daily_plan(
     
     selected_topics = select_topics_for_session(categories, target_minutes, set())
     
+    content_indexes = await load_content_indexes([t["subject_id"] for t in selected_topics], db)
+    
     all_items = []
     for topic in selected_topics:
-        items = await create_session_items(topic, subject_map, topic_mastery_map, db)
+        items = build_session_items(topic, subject_map, topic_mastery_map, content_indexes)
         all_items.extend(items)
     
     total_time = sum(item.estimated_time_minutes for item in all_items)
@@ -810,6 +993,9 @@ async def generate_weekly_plan(
     
     categories = categorize_topics_by_mastery(priorities, topic_mastery_map)
     
+    # One content load for every subject the plan can draw from
+    content_indexes = await load_content_indexes([p["subject_id"] for p in priorities], db)
+    
     day_plans = []
     already_selected = set()
     base_date = datetime.utcnow()
@@ -837,7 +1023,7 @@ async def generate_weekly_plan(
         
         all_items = []
         for topic in selected_topics:
-            items = await create_session_items(topic, subject_map, topic_mastery_map, db)
+            items = build_session_items(topic, subject_map, topic_mastery_map, content_indexes)
             all_items.extend(items)
         
         total_time = sum(item.estimated_time_minutes for item in all_items)
@@ -47,7 +47,8 @@ NO AI/LLM CALLS - ALL LOGIC IS DETERMINISTIC
 """
 
 import logging
-from typing import List, Dict, Any, Optional
+from dataclasses import dataclass, field
+from typing import List, Dict, Any, Optional, Tuple
 from datetime import datetime, timedelta
 from collections import defaultdict
 from sqlalchemy.ext.asyncio import AsyncSession
@@ -63,6 +64,7 @@ from backend.orm.study_plan import StudyPlan
 from backend.orm.study_plan_item import StudyPlanItem
 from backend.orm.user import User
 from backend.orm.curriculum import CourseCurriculum
+from backend.utils.priority_scoring import staleness_column, weighted_scores, priority_labels
 
 logger = logging.getLogger(__name__)
 
@@ -82,6 +84,8 @@ CRITICAL_STALE_DAYS = 7
 MODERATE_STALE_DAYS = 14
 REVIEW_STALE_DAYS = 21
 
+NO_HISTORY_MESSAGE = "No practice history yet. Start with any subject to get personalized recommendations!"
+
 
 def get_priority_label(score: float) -> str:
     if score >= HIGH_PRIORITY_THRESHOLD:
@@ -163,145 +167,234 @@ def generate_action_recommendations(
     return actions
 
 
-async def compute_topic_priority(
+@dataclass
+class TopicFeatures:
+    """
+    Priority features of a user's topics as parallel columns (index i =
+    one TopicMastery row).
+
+    subject_semesters holds the curriculum semester of each topic's
+    subject (None when the subject is not in any curriculum) and
+    max_questions the largest question count of any topic in the
+    same subject.
+    """
+    topic_tags: List[str] = field(default_factory=list)
+    subject_ids: List[int] = field(default_factory=list)
+    mastery_percent: List[float] = field(default_factory=list)
+    days_since: List[int] = field(default_factory=list)
+    question_counts: List[int] = field(default_factory=list)
+    max_questions: List[int] = field(default_factory=list)
+    subject_semesters: List[Optional[int]] = field(default_factory=list)
+
+    def __len__(self) -> int:
+        return len(self.topic_tags)
+
+
+PRIORITY_WEIGHTS = {
+    "mastery_deficit": MASTERY_DEFICIT_WEIGHT,
+    "staleness": STALENESS_WEIGHT,
+    "importance": IMPORTANCE_WEIGHT,
+    "urgency": SEMESTER_URGENCY_WEIGHT,
+}
+
+
+def semester_urgency(subject_semester: int, user_semester: int) -> float:
+    if subject_semester == user_semester:
+        return 1.0
+    elif subject_semester < user_semester:
+        return 0.5
+    else:
+        return 0.2
+
+
+async def load_topic_features(
     user_id: int,
-    subject_id: int,
     db: AsyncSession,
-    user_semester: int = 1
-) -> List[Dict[str, Any]]:
+    subject_ids: Optional[List[int]] = None
+) -> TopicFeatures:
     """
-    Compute priority scores for all topics in a subject.
-    
-    Algorithm:
-    1. Fetch topic mastery data
-    2. Calculate days since last practice
-    3. Count questions per topic
-    4. Apply priority formula
-    5. Generate explanations
-    
-    Returns:
-        List of topic priorities sorted by score (highest first)
+    Load priority features of a user's topics.
+
+    Three queries whatever the number of subjects: the user's topic
+    mastery rows, question counts grouped by (subject, tags) and the
+    curriculum semester of each subject.
+
+    Args:
+        subject_ids: Restrict to these subjects (default: every subject
+            the user has topic mastery in)
     """
-    
-    logger.info(f"Computing topic priorities: user={user_id}, subject={subject_id}")
-    
-    mastery_stmt = select(TopicMastery).where(
-        and_(
-            TopicMastery.user_id == user_id,
-            TopicMastery.subject_id == subject_id
-        )
-    )
-    mastery_result = await db.execute(mastery_stmt)
-    masteries = mastery_result.scalars().all()
-    
+    mastery_stmt = select(
+        TopicMastery.subject_id,
+        TopicMastery.topic_tag,
+        TopicMastery.mastery_score,
+        TopicMastery.last_practiced_at
+    ).where(
+        TopicMastery.user_id == user_id
+    ).order_by(TopicMastery.subject_id, TopicMastery.id)
+    if subject_ids is not None:
+        if not subject_ids:
+            return TopicFeatures()
+        mastery_stmt = mastery_stmt.where(TopicMastery.subject_id.in_(subject_ids))
+
+    mastery_rows = (await db.execute(mastery_stmt)).all()
+    if not mastery_rows:
+        return TopicFeatures()
+
+    subjects = sorted({row.subject_id for row in mastery_rows})
+
     question_count_stmt = select(
+        ContentModule.subject_id,
         PracticeQuestion.tags,
         func.count(PracticeQuestion.id).label("count")
     ).join(
         ContentModule,
         PracticeQuestion.module_id == ContentModule.id
     ).where(
-        ContentModule.subject_id == subject_id
-    ).group_by(PracticeQuestion.tags)
-    
-    question_result = await db.execute(question_count_stmt)
-    question_counts = {}
-    max_questions = 1
-    
-    for row in question_result.fetchall():
+        ContentModule.subject_id.in_(subjects)
+    ).group_by(ContentModule.subject_id, PracticeQuestion.tags)
+
+    question_counts: Dict[int, Dict[str, int]] = defaultdict(dict)
+    max_questions: Dict[int, int] = defaultdict(lambda: 1)
+
+    for row in (await db.execute(question_count_stmt)).all():
         if row.tags:
+            counts = question_counts[row.subject_id]
             tags = row.tags.split(",") if isinstance(row.tags, str) else row.tags
             for tag in tags:
                 tag = tag.strip()
                 if tag:
-                    question_counts[tag] = question_counts.get(tag, 0) + row.count
-                    max_questions = max(max_questions, question_counts[tag])
-    
-    subject_stmt = select(Subject).where(Subject.id == subject_id)
-    subject_result = await db.execute(subject_stmt)
-    subject = subject_result.scalar_one_or_none()
-    
-    subject_semester = user_semester
-    if subject:
-        curriculum_stmt = select(CourseCurriculum.semester).where(
-            CourseCurriculum.subject_id == subject_id
-        ).limit(1)
-        curriculum_result = await db.execute(curriculum_stmt)
-        curriculum_row = curriculum_result.scalar_one_or_none()
-        if curriculum_row:
-            subject_semester = curriculum_row
-    
+                    counts[tag] = counts.get(tag, 0) + row.count
+                    max_questions[row.subject_id] = max(max_questions[row.subject_id], counts[tag])
+
+    semester_stmt = select(
+        CourseCurriculum.subject_id,
+        func.min(CourseCurriculum.semester_number)
+    ).where(
+        CourseCurriculum.subject_id.in_(subjects)
+    ).group_by(CourseCurriculum.subject_id)
+    semesters = dict((await db.execute(semester_stmt)).all())
+
     now = datetime.utcnow()
+    features = TopicFeatures()
+    for row in mastery_rows:
+        features.topic_tags.append(row.topic_tag)
+        features.subject_ids.append(row.subject_id)
+        features.mastery_percent.append((row.mastery_score or 0.0) * 100)
+        features.days_since.append((now - row.last_practiced_at).days if row.last_practiced_at else 999)
+        features.question_counts.append(question_counts[row.subject_id].get(row.topic_tag, 0))
+        features.max_questions.append(max_questions[row.subject_id])
+        features.subject_semesters.append(semesters.get(row.subject_id))
+
+    return features
+
+
+def score_topic_features(features: TopicFeatures, user_semester: int = 1) -> List[Dict[str, Any]]:
+    """
+    Apply the priority formula to every topic in one column-wise pass.
+
+    Returns:
+        List of topic priorities sorted by score (highest first)
+    """
+    components = {
+        "mastery_deficit": [(100 - mastery) / 100 for mastery in features.mastery_percent],
+        "staleness": staleness_column(features.days_since, STALENESS_CAP_DAYS),
+        "importance": [
+            count / peak if peak > 0 else 0.0
+            for count, peak in zip(features.question_counts, features.max_questions)
+        ],
+        "urgency": [
+            semester_urgency(semester or user_semester, user_semester)
+            for semester in features.subject_semesters
+        ],
+    }
+    scores = weighted_scores(components, PRIORITY_WEIGHTS)
+    labels = priority_labels(scores, HIGH_PRIORITY_THRESHOLD, MEDIUM_PRIORITY_THRESHOLD)
+
     priorities = []
-    
-    for mastery in masteries:
-        mastery_percent = mastery.mastery_score * 100
-        mastery_deficit = (100 - mastery_percent) / 100
-        
-        days_since = 999
-        if mastery.last_practiced_at:
-            days_since = (now - mastery.last_practiced_at).days
-        
-        staleness = min(days_since / STALENESS_CAP_DAYS, 1.0)
-        
-        q_count = question_counts.get(mastery.topic_tag, 0)
-        importance = q_count / max_questions if max_questions > 0 else 0.0
-        
-        if subject_semester == user_semester:
-            urgency = 1.0
-        elif subject_semester < user_semester:
-            urgency = 0.5
-        else:
-            urgency = 0.2
-        
-        priority_score = (
-            mastery_deficit * MASTERY_DEFICIT_WEIGHT +
-            staleness * STALENESS_WEIGHT +
-            importance * IMPORTANCE_WEIGHT +
-            urgency * SEMESTER_URGENCY_WEIGHT
-        )
-        
-        priority_label = get_priority_label(priority_score)
-        
-        explanation = generate_explanation(
-            mastery.topic_tag,
-            mastery_percent,
-            days_since,
-            q_count,
-            priority_label
-        )
-        
-        actions = generate_action_recommendations(
-            mastery_percent,
-            days_since,
-            priority_label
-        )
-        
+    for i, topic_tag in enumerate(features.topic_tags):
+        mastery_percent = features.mastery_percent[i]
+        days_since = features.days_since[i]
+        q_count = features.question_counts[i]
+
         priorities.append({
-            "topic_tag": mastery.topic_tag,
-            "subject_id": subject_id,
+            "topic_tag": topic_tag,
+            "subject_id": features.subject_ids[i],
             "mastery_percent": round(mastery_percent, 2),
             "days_since_practice": days_since,
             "question_count": q_count,
-            "priority_score": round(priority_score, 4),
-            "priority": priority_label,
-            "explanation": explanation,
-            "recommended_actions": actions,
-            "components": {
-                "mastery_deficit": round(mastery_deficit, 4),
-                "staleness": round(staleness, 4),
-                "importance": round(importance, 4),
-                "urgency": round(urgency, 4)
-            }
+            "priority_score": round(scores[i], 4),
+            "priority": labels[i],
+            "explanation": generate_explanation(topic_tag, mastery_percent, days_since, q_count, labels[i]),
+            "recommended_actions": generate_action_recommendations(mastery_percent, days_since, labels[i]),
+            "components": {name: round(column[i], 4) for name, column in components.items()}
         })
-    
+
     priorities.sort(key=lambda x: x["priority_score"], reverse=True)
-    
-    logger.info(f"Computed priorities for {len(priorities)} topics")
-    
     return priorities
 
 
+async def compute_user_topic_priorities(
+    user_id: int,
+    db: AsyncSession,
+    user_semester: int = 1,
+    subject_ids: Optional[List[int]] = None
+) -> List[Dict[str, Any]]:
+    """
+    Compute priority scores for a user's topics across subjects.
+
+    Features of all topics are loaded together (see load_topic_features)
+    and scored in one pass, so the cost does not grow with the number of
+    subjects.
+
+    Returns:
+        List of topic priorities sorted by score (highest first)
+    """
+    features = await load_topic_features(user_id, db, subject_ids)
+    priorities = score_topic_features(features, user_semester)
+
+    logger.info(f"Computed priorities for {len(priorities)} topics: user={user_id}")
+
+    return priorities
+
+
+async def compute_topic_priority(
+    user_id: int,
+    subject_id: int,
+    db: AsyncSession,
+    user_semester: int = 1
+) -> List[Dict[str, Any]]:
+    """
+    Compute priority scores for all topics in a subject.
+    
+    Returns:
+        List of topic priorities sorted by score (highest first)
+    """
+    return await compute_user_topic_priorities(user_id, db, user_semester, [subject_id])
+
+
+async def _load_user_priorities(
+    user_id: int,
+    db: AsyncSession
+) -> Tuple[List[SubjectProgress], List[Dict[str, Any]]]:
+    """The user's subject progress rows and topic priorities over those subjects"""
+    user_semester_stmt = select(User.current_semester).where(User.id == user_id)
+    user_semester = (await db.execute(user_semester_stmt)).scalar_one_or_none() or 1
+
+    progress_stmt = select(SubjectProgress).where(
+        SubjectProgress.user_id == user_id
+    )
+    progress_result = await db.execute(progress_stmt)
+    subject_progresses = progress_result.scalars().all()
+
+    if not subject_progresses:
+        return [], []
+
+    priorities = await compute_user_topic_priorities(
+        user_id, db, user_semester, [sp.subject_id for sp in subject_progresses]
+    )
+    return subject_progresses, priorities
+
+
 async def get_study_recommendations(
     user_id: int,
     db: AsyncSession,
@@ -319,16 +412,7 @@ async def get_study_recommendations(
     
     logger.info(f"Generating study recommendations: user={user_id}")
     
-    user_stmt = select(User).where(User.id == user_id)
-    user_result = await db.execute(user_stmt)
-    user = user_result.scalar_one_or_none()
-    user_semester = user.current_semester if user and user.current_semester else 1
-    
-    progress_stmt = select(SubjectProgress).where(
-        SubjectProgress.user_id == user_id
-    )
-    progress_result = await db.execute(progress_stmt)
-    subject_progresses = progress_result.scalars().all()
+    subject_progresses, all_priorities = await _load_user_priorities(user_id, db)
     
     if not subject_progresses:
         subjects_stmt = select(Subject).limit(3)
@@ -348,18 +432,16 @@ async def get_study_recommendations(
                 }
                 for s in subjects
             ],
-            "message": "No practice history yet. Start with any subject to get personalized recommendations!"
+            "message": NO_HISTORY_MESSAGE
         }
     
-    all_priorities = []
-    subject_priorities = {}
+    topics_by_subject = defaultdict(list)
+    for p in all_priorities:
+        topics_by_subject[p["subject_id"]].append(p)
     
+    subject_priorities = {}
     for sp in subject_progresses:
-        priorities = await compute_topic_priority(
-            user_id, sp.subject_id, db, user_semester
-        )
-        all_priorities.extend(priorities)
-        
+        priorities = topics_by_subject.get(sp.subject_id)
         if priorities:
             avg_priority = sum(p["priority_score"] for p in priorities) / len(priorities)
             subject_priorities[sp.subject_id] = {
@@ -369,8 +451,6 @@ async def get_study_recommendations(
                 "topic_count": len(priorities)
             }
     
-    all_priorities.sort(key=lambda x: x["priority_score"], reverse=True)
-    
     next_topic = all_priorities[0] if all_priorities else None
     
     needs_revision = [
@@ -389,19 +469,24 @@ async def get_study_recommendations(
         reverse=True
     )
     
+    top_subjects = sorted_subjects[:3]
+    titles = {}
+    if top_subjects:
+        titles_stmt = select(Subject.id, Subject.title).where(
+            Subject.id.in_([sp["subject_id"] for sp in top_subjects])
+        )
+        titles = dict((await db.execute(titles_stmt)).all())
+    
     focus_subjects = []
-    for sp in sorted_subjects[:3]:
-        subject_stmt = select(Subject).where(Subject.id == sp["subject_id"])
-        subject_result = await db.execute(subject_stmt)
-        subject = subject_result.scalar_one_or_none()
-        
-        if subject:
+    for sp in top_subjects:
+        title = titles.get(sp["subject_id"])
+        if title:
             focus_subjects.append({
                 "subject_id": sp["subject_id"],
-                "subject_title": subject.title,
+                "subject_title": title,
                 "mastery_percent": round(sp["mastery_percent"], 2),
                 "topic_count": sp["topic_count"],
-                "explanation": f"{subject.title} needs attention with {round(sp['mastery_percent'])}% overall mastery."
+                "explanation": f"{title} needs attention with {round(sp['mastery_percent'])}% overall mastery."
             })
     
     return {
@@ -433,12 +518,12 @@ async def generate_weekly_study_plan(
     
     logger.info(f"Generating {weeks}-week study plan: user={user_id}")
     
-    recommendations = await get_study_recommendations(user_id, db)
+    subject_progresses, all_topics = await _load_user_priorities(user_id, db)
     
-    if recommendations.get("message"):
+    if not subject_progresses:
         return {
             "success": False,
-            "message": recommendations["message"],
+            "message": NO_HISTORY_MESSAGE,
             "plan": None
         }
     
@@ -454,19 +539,6 @@ async def generate_weekly_study_plan(
     for plan in active_plans:
         plan.is_active = False
     
-    all_topics = []
-    progress_stmt = select(SubjectProgress).where(
-        SubjectProgress.user_id == user_id
-    )
-    progress_result = await db.execute(progress_stmt)
-    
-    for sp in progress_result.scalars().all():
-        priorities = await compute_topic_priority(user_id, sp.subject_id, db)
-        for p in priorities:
-            all_topics.append(p)
-    
-    all_topics.sort(key=lambda x: x["priority_score"], reverse=True)
-    
     high_priority = [t for t in all_topics if t["priority"] == "High"]
     medium_priority = [t for t in all_topics if t["priority"] == "Medium"]
     low_priority = [t for t in all_topics if t["priority"] == "Low"]
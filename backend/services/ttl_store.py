@@ -0,0 +1,266 @@
+"""
+backend/services/ttl_store.py
+Bounded key-value stores with per-entry expiry
+
+PURPOSE:
+Process-level state (tutor conversations, moot round contexts, validation
+metrics) used to live in plain dicts that were only pruned when someone
+happened to read an expired key, so they grew for the life of the worker.
+A TTLStore bounds that state both in time and in size.
+
+GUARANTEES:
+- Entries expire ttl_seconds after they were last written
+- At most max_size entries are kept; the least recently used go first
+- Expired entries are removed by a background sweep every
+  TTL_STORE_SWEEP_SECONDS (started on the running event loop at the first
+  write), not only when they are read again
+
+BACKENDS:
+- memory (default): an OrderedDict per store, private to the worker
+- sqlite: with TTL_STORE_PATH set, every store keeps its entries in that
+  SQLite file (one namespace per store), so all workers on the host share
+  them. Values are pickled, keys are compared as strings, and a value read
+  from the store is a copy: callers must set() it again after changing it.
+
+  The store is called synchronously from request handlers, so its sqlite3
+  calls run on the event loop. WAL mode keeps readers from waiting on
+  writers, and a writer waits at most TTL_STORE_BUSY_TIMEOUT_SECONDS (50ms
+  by default) for the lock instead of sqlite3's 5s default. Under heavier
+  write contention a call raises sqlite3.OperationalError ("database is
+  locked") rather than stalling every request on the worker.
+"""
+
+import os
+import time
+import pickle
+import asyncio
+import logging
+import sqlite3
+import threading
+import weakref
+from collections import OrderedDict
+from typing import Any, Hashable, Iterator, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+TTL_STORE_PATH = os.getenv("TTL_STORE_PATH", "")
+TTL_STORE_SWEEP_SECONDS = float(os.getenv("TTL_STORE_SWEEP_SECONDS", "60"))
+TTL_STORE_BUSY_TIMEOUT_SECONDS = float(os.getenv("TTL_STORE_BUSY_TIMEOUT_SECONDS", "0.05"))
+
+# Every live store, swept by the background task
+_stores: "weakref.WeakSet[TTLStore]" = weakref.WeakSet()
+_sweeper: Optional[asyncio.Task] = None
+
+_MISSING = object()
+
+
+class TTLStore:
+    """In-memory TTL + LRU store"""
+
+    def __init__(self, namespace: str, ttl_seconds: float, max_size: int):
+        self.namespace = namespace
+        self.ttl_seconds = ttl_seconds
+        self.max_size = max_size
+        # key -> (expires_at, value)
+        self._entries: "OrderedDict[Hashable, Tuple[float, Any]]" = OrderedDict()
+        _stores.add(self)
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        entry = self._entries.get(key)
+        if entry is None:
+            return default
+
+        expires_at, value = entry
+        if expires_at < time.monotonic():
+            self._entries.pop(key, None)
+            return default
+
+        self._entries.move_to_end(key)
+        return value
+
+    def set(self, key: Hashable, value: Any) -> None:
+        """Store a value, restarting its TTL"""
+        self._entries[key] = (time.monotonic() + self.ttl_seconds, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+        _ensure_sweeper()
+
+    def pop(self, key: Hashable, default: Any = None) -> Any:
+        value = self.get(key, default)
+        self._entries.pop(key, None)
+        return value
+
+    def items(self) -> List[Tuple[Hashable, Any]]:
+        """Live entries, least recently used first"""
+        now = time.monotonic()
+        return [(key, value) for key, (expires_at, value) in self._entries.items() if expires_at >= now]
+
+    def values(self) -> List[Any]:
+        return [value for _, value in self.items()]
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+    def purge_expired(self) -> int:
+        """Drop expired entries. Returns number of entries removed."""
+        now = time.monotonic()
+        expired = [key for key, (expires_at, _) in self._entries.items() if expires_at < now]
+        for key in expired:
+            del self._entries[key]
+        return len(expired)
+
+    def __contains__(self, key: Hashable) -> bool:
+        return self.get(key, _MISSING) is not _MISSING
+
+    def __len__(self) -> int:
+        return len(self.items())
+
+    def __iter__(self) -> Iterator[Hashable]:
+        return iter([key for key, _ in self.items()])
+
+
+class SQLiteTTLStore(TTLStore):
+    """TTL + LRU store kept in a SQLite file shared by all workers"""
+
+    def __init__(self, namespace: str, ttl_seconds: float, max_size: int, path: str):
+        self.namespace = namespace
+        self.ttl_seconds = ttl_seconds
+        self.max_size = max_size
+        self._lock = threading.Lock()
+        self._db = sqlite3.connect(
+            path, timeout=TTL_STORE_BUSY_TIMEOUT_SECONDS, isolation_level=None, check_same_thread=False
+        )
+        with self._lock:
+            self._db.execute("PRAGMA journal_mode=WAL")
+            # Commits skip the fsync; losing the last few cache writes on power loss is fine
+            self._db.execute("PRAGMA synchronous=NORMAL")
+            self._db.execute(
+                "CREATE TABLE IF NOT EXISTS ttl_store ("
+                " namespace TEXT NOT NULL,"
+                " key TEXT NOT NULL,"
+                " value BLOB NOT NULL,"
+                " expires_at REAL NOT NULL,"
+                " accessed_at REAL NOT NULL,"
+                " PRIMARY KEY (namespace, key))"
+            )
+            self._db.execute(
+                "CREATE INDEX IF NOT EXISTS ix_ttl_store_accessed ON ttl_store (namespace, accessed_at)"
+            )
+        _stores.add(self)
+
+    def _execute(self, sql: str, *params) -> int:
+        """Run a statement; returns the affected row count"""
+        with self._lock:
+            return self._db.execute(sql, params).rowcount
+
+    def _query(self, sql: str, *params) -> List[Tuple]:
+        with self._lock:
+            return self._db.execute(sql, params).fetchall()
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        now = time.time()
+        rows = self._query(
+            "SELECT value FROM ttl_store WHERE namespace = ? AND key = ? AND expires_at >= ?",
+            self.namespace, str(key), now
+        )
+        if not rows:
+            return default
+
+        self._execute(
+            "UPDATE ttl_store SET accessed_at = ? WHERE namespace = ? AND key = ?",
+            now, self.namespace, str(key)
+        )
+        return pickle.loads(rows[0][0])
+
+    def set(self, key: Hashable, value: Any) -> None:
+        now = time.time()
+        self._execute(
+            "INSERT OR REPLACE INTO ttl_store (namespace, key, value, expires_at, accessed_at)"
+            " VALUES (?, ?, ?, ?, ?)",
+            self.namespace, str(key), pickle.dumps(value), now + self.ttl_seconds, now
+        )
+        self._execute(
+            "DELETE FROM ttl_store WHERE namespace = ? AND key IN ("
+            " SELECT key FROM ttl_store WHERE namespace = ?"
+            " ORDER BY accessed_at DESC LIMIT -1 OFFSET ?)",
+            self.namespace, self.namespace, self.max_size
+        )
+        _ensure_sweeper()
+
+    def pop(self, key: Hashable, default: Any = None) -> Any:
+        value = self.get(key, default)
+        self._execute("DELETE FROM ttl_store WHERE namespace = ? AND key = ?", self.namespace, str(key))
+        return value
+
+    def items(self) -> List[Tuple[Hashable, Any]]:
+        rows = self._query(
+            "SELECT key, value FROM ttl_store WHERE namespace = ? AND expires_at >= ?"
+            " ORDER BY accessed_at",
+            self.namespace, time.time()
+        )
+        return [(key, pickle.loads(value)) for key, value in rows]
+
+    def clear(self) -> None:
+        self._execute("DELETE FROM ttl_store WHERE namespace = ?", self.namespace)
+
+    def purge_expired(self) -> int:
+        return self._execute(
+            "DELETE FROM ttl_store WHERE namespace = ? AND expires_at < ?",
+            self.namespace, time.time()
+        )
+
+    def __len__(self) -> int:
+        return self._query(
+            "SELECT count(*) FROM ttl_store WHERE namespace = ? AND expires_at >= ?",
+            self.namespace, time.time()
+        )[0][0]
+
+
+def create_ttl_store(namespace: str, ttl_seconds: float, max_size: int) -> TTLStore:
+    """
+    Create a store on the configured backend.
+
+    Args:
+        namespace: Unique name of the store (its partition of the SQLite file)
+        ttl_seconds: Lifetime of an entry after its last write
+        max_size: Maximum number of entries kept
+    """
+    if TTL_STORE_PATH:
+        return SQLiteTTLStore(namespace, ttl_seconds, max_size, TTL_STORE_PATH)
+    return TTLStore(namespace, ttl_seconds, max_size)
+
+
+# ================= SWEEP =================
+
+def sweep_expired() -> int:
+    """Purge expired entries from every store. Returns number of entries removed."""
+    removed = 0
+    for store in list(_stores):
+        try:
+            removed += store.purge_expired()
+        except Exception as e:
+            logger.error(f"TTL store sweep failed for {store.namespace}: {str(e)}")
+    return removed
+
+
+async def _sweep_loop() -> None:
+    while True:
+        await asyncio.sleep(TTL_STORE_SWEEP_SECONDS)
+        removed = sweep_expired()
+        if removed:
+            logger.info(f"TTL store sweep removed {removed} expired entries")
+
+
+def _ensure_sweeper() -> None:
+    """Start the sweep task on the running loop (no-op outside one)"""
+    global _sweeper
+    if TTL_STORE_SWEEP_SECONDS <= 0:
+        return
+    try:
+        loop = asyncio.get_running_loop()
+    except RuntimeError:
+        return
+    if _sweeper is not None and not _sweeper.done() and _sweeper.get_loop() is loop:
+        return
+    _sweeper = loop.create_task(_sweep_loop(), name="ttl-store-sweep")
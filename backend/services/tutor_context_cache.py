@@ -0,0 +1,230 @@
+"""
+backend/services/tutor_context_cache.py
+Per-student cache of assembled tutor contexts
+
+PURPOSE:
+Every tutor turn needs the student's context (course, subjects, mastery,
+recent mistakes, memory). That data only changes when the student
+practices, completes content or updates their profile, so chat turns
+reuse the assembled context instead of re-running the same mastery,
+subject and activity queries.
+
+GUARANTEES:
+- A student's entries are dropped when their attempts, evaluations,
+  mastery, progress, content completion or profile rows are flushed,
+  and their version stamp is bumped; stamps are never reused, so a
+  build that started before the change is never written back
+- Curriculum and content changes (subjects, modules, learn/case content)
+  invalidate every student's entries
+- A build that races with an invalidation is never written back
+- Entries expire after TUTOR_CONTEXT_TTL_SECONDS even without changes,
+  bounding time-derived fields such as "days since last practice"
+  (0 disables the cache)
+
+Cached values are shared between requests and must be treated as
+read-only by callers.
+"""
+
+import os
+import time
+import logging
+import itertools
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, Dict, Hashable, Optional, Tuple, TypeVar
+
+from sqlalchemy import select, event, inspect
+
+from backend.orm.user import User
+from backend.orm.course import Course
+from backend.orm.subject import Subject
+from backend.orm.curriculum import CourseCurriculum
+from backend.orm.content_module import ContentModule
+from backend.orm.learn_content import LearnContent
+from backend.orm.case_content import CaseContent
+from backend.orm.topic_mastery import TopicMastery
+from backend.orm.subject_progress import SubjectProgress
+from backend.orm.practice_attempt import PracticeAttempt
+from backend.orm.practice_evaluation import PracticeEvaluation
+from backend.orm.user_content_progress import UserContentProgress
+
+logger = logging.getLogger(__name__)
+
+TUTOR_CONTEXT_TTL_SECONDS = float(os.getenv("TUTOR_CONTEXT_TTL_SECONDS", "300"))
+# Students whose contexts (and version stamps) are kept
+TUTOR_CONTEXT_CACHE_MAX_SIZE = int(os.getenv("TUTOR_CONTEXT_CACHE_MAX_SIZE", "5000"))
+
+T = TypeVar("T")
+
+ContextKey = Tuple[str, Hashable]
+
+# user_id -> {(kind, key): (expires_at, version, value)}, least recently used student first
+_contexts: "OrderedDict[int, Dict[ContextKey, Tuple[float, Tuple[int, int], Any]]]" = OrderedDict()
+
+# user_id -> version stamp, replaced on every invalidation of that student
+_versions: "OrderedDict[int, int]" = OrderedDict()
+
+# Source of version stamps, shared by all students so none is ever reissued
+_stamps = itertools.count(1)
+
+# Bumped when shared curriculum/content data changes
+_catalog_generation = 0
+
+
+def student_context_version(user_id: int) -> Tuple[int, int]:
+    """Current version stamp of a student's context"""
+    return _catalog_generation, _versions.get(user_id, 0)
+
+
+def _cache_get(user_id: int, context_key: ContextKey) -> Optional[Any]:
+    entries = _contexts.get(user_id)
+    entry = entries.get(context_key) if entries else None
+    if entry is None:
+        return None
+
+    expires_at, version, value = entry
+    if expires_at < time.monotonic() or version != student_context_version(user_id):
+        entries.pop(context_key, None)
+        return None
+
+    _contexts.move_to_end(user_id)
+    return value
+
+
+def _cache_set(user_id: int, context_key: ContextKey, version: Tuple[int, int], value: Any) -> None:
+    if version != student_context_version(user_id):
+        return
+
+    _contexts.setdefault(user_id, {})[context_key] = (time.monotonic() + TUTOR_CONTEXT_TTL_SECONDS, version, value)
+    _contexts.move_to_end(user_id)
+    while len(_contexts) > TUTOR_CONTEXT_CACHE_MAX_SIZE:
+        _contexts.popitem(last=False)
+
+
+async def cached_student_context(
+    kind: str,
+    user_id: int,
+    build: Callable[[], Awaitable[T]],
+    key: Hashable = None
+) -> T:
+    """
+    Get a student's context of the given kind, building it on a miss.
+
+    Args:
+        kind: Context flavour (e.g. "student_context", "tutor_memory")
+        user_id: Student the context belongs to
+        build: Coroutine factory assembling the context from the database
+        key: Extra cache key for contexts with parameters (subject, scope, ...)
+
+    Exceptions raised by build propagate and nothing is cached.
+    """
+    if TUTOR_CONTEXT_TTL_SECONDS <= 0:
+        return await build()
+
+    context_key = (kind, key)
+    value = _cache_get(user_id, context_key)
+    if value is not None:
+        return value
+
+    version = student_context_version(user_id)
+    value = await build()
+    _cache_set(user_id, context_key, version, value)
+    return value
+
+
+def invalidate_student_context(user_id: Optional[int]) -> None:
+    """Drop every cached context of a student and give them a new version stamp"""
+    if user_id is None:
+        return
+    _contexts.pop(user_id, None)
+    _versions[user_id] = next(_stamps)
+    _versions.move_to_end(user_id)
+    while len(_versions) > TUTOR_CONTEXT_CACHE_MAX_SIZE:
+        # A student without a stamp is at version 0: drop what was built under the evicted one
+        evicted_user_id, _ = _versions.popitem(last=False)
+        _contexts.pop(evicted_user_id, None)
+
+
+def clear_tutor_context_cache() -> int:
+    """Drop every cached context. Returns number of entries cleared."""
+    global _catalog_generation
+    _catalog_generation += 1
+    count = sum(len(entries) for entries in _contexts.values())
+    _contexts.clear()
+    return count
+
+
+# ================= INVALIDATION =================
+
+def _user_ids(target, attribute: str = "user_id"):
+    """Current and pre-flush values of a target's user reference"""
+    history = getattr(inspect(target).attrs, attribute).history
+    values = {getattr(target, attribute)}
+    values.update(history.deleted or ())
+    return values
+
+
+@event.listens_for(PracticeAttempt, "after_insert")
+@event.listens_for(PracticeAttempt, "after_update")
+@event.listens_for(PracticeAttempt, "after_delete")
+@event.listens_for(TopicMastery, "after_insert")
+@event.listens_for(TopicMastery, "after_update")
+@event.listens_for(TopicMastery, "after_delete")
+@event.listens_for(SubjectProgress, "after_insert")
+@event.listens_for(SubjectProgress, "after_update")
+@event.listens_for(SubjectProgress, "after_delete")
+def _on_learning_change(mapper, connection, target) -> None:
+    for user_id in _user_ids(target):
+        invalidate_student_context(user_id)
+
+
+@event.listens_for(UserContentProgress, "after_insert")
+@event.listens_for(UserContentProgress, "after_update")
+def _on_content_progress_change(mapper, connection, target: UserContentProgress) -> None:
+    """Content completion changes subject progress; plain views do not"""
+    if inspect(target).attrs.is_completed.history.has_changes():
+        invalidate_student_context(target.user_id)
+
+
+@event.listens_for(UserContentProgress, "after_delete")
+def _on_content_progress_delete(mapper, connection, target: UserContentProgress) -> None:
+    if target.is_completed:
+        invalidate_student_context(target.user_id)
+
+
+@event.listens_for(PracticeEvaluation, "after_insert")
+@event.listens_for(PracticeEvaluation, "after_update")
+def _on_evaluation_change(mapper, connection, target: PracticeEvaluation) -> None:
+    """Evaluations feed the recent-mistakes section"""
+    attempts = PracticeAttempt.__table__
+    user_id = connection.execute(
+        select(attempts.c.user_id).where(attempts.c.id == target.practice_attempt_id)
+    ).scalar_one_or_none()
+    invalidate_student_context(user_id)
+
+
+@event.listens_for(User, "after_update")
+@event.listens_for(User, "after_delete")
+def _on_profile_change(mapper, connection, target: User) -> None:
+    """Semester, course and other profile changes"""
+    invalidate_student_context(target.id)
+
+
+@event.listens_for(Course, "after_update")
+@event.listens_for(Course, "after_delete")
+@event.listens_for(Subject, "after_insert")
+@event.listens_for(Subject, "after_update")
+@event.listens_for(Subject, "after_delete")
+@event.listens_for(CourseCurriculum, "after_insert")
+@event.listens_for(CourseCurriculum, "after_update")
+@event.listens_for(CourseCurriculum, "after_delete")
+@event.listens_for(ContentModule, "after_insert")
+@event.listens_for(ContentModule, "after_update")
+@event.listens_for(ContentModule, "after_delete")
+@event.listens_for(LearnContent, "after_insert")
+@event.listens_for(LearnContent, "after_update")
+@event.listens_for(LearnContent, "after_delete")
+@event.listens_for(CaseContent, "after_insert")
+@event.listens_for(CaseContent, "after_update")
+@event.listens_for(CaseContent, "after_delete")
+def _on_catalog_change(mapper, connection, target) -> None:
+    clear_tutor_context_cache()
@@ -21,6 +21,7 @@ from backend.orm.subject_progress import SubjectProgress
 from backend.orm.practice_attempt import PracticeAttempt
 from backend.orm.practice_question import PracticeQuestion
 from backend.orm.content_module import ContentModule
+from backend.services.tutor_context_cache import cached_student_context
 
 logger = logging.getLogger(__name__)
 
@@ -44,7 +45,15 @@ async def assemble_context(user_id: int, db: AsyncSession) -> Dict[str, Any]:
         - No hallucinated topics (only from mastery table)
         - Works with empty mastery tables
         - Zero AI calls
+        - Cached per student until their practice, progress or profile
+          changes (see tutor_context_cache)
     """
+    return await cached_student_context(
+        "tutor_context", user_id, lambda: _build_context(user_id, db)
+    )
+
+
+async def _build_context(user_id: int, db: AsyncSession) -> Dict[str, Any]:
     logger.info(f"Assembling tutor context for user_id={user_id}")
     
     user_stmt = (
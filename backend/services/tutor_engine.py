@@ -6,7 +6,7 @@ Phase 9A: AI Tutor conversation engine
 import os
 import logging
 import uuid
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, AsyncIterator
 from datetime import datetime
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select, and_
@@ -17,6 +17,7 @@ from backend.orm.user import User
 from backend.orm.tutor_session import TutorSession
 from backend.orm.tutor_message import TutorMessage
 from backend.schemas.tutor_schemas import ChatResponse, ProvenanceItem
+from backend.services.llm_streaming import StreamResult, guarded_sse, sse_event, stream_gemini
 
 logger = logging.getLogger(__name__)
 
@@ -25,6 +26,8 @@ GEMINI_API_KEY = os.getenv("GEMINI_API_KEY")
 if GEMINI_API_KEY:
     genai.configure(api_key=GEMINI_API_KEY)
 
+FALLBACK_REPLY = "I'm having trouble processing your question right now. Please try again."
+
 
 class TutorEngine:
     """
@@ -65,24 +68,8 @@ class TutorEngine:
             ChatResponse with content, provenance, confidence
         """
         
-        # 1. Get or create session
-        if session_id:
-            session = await self._get_session(session_id)
-            if not session or session.user_id != self.user.id:
-                # Invalid session - create new
-                session = await self._create_session()
-        else:
-            session = await self._create_session()
-        
-        # 2. Store user message
-        user_msg = TutorMessage(
-            session_id=session.session_id,
-            role="user",
-            content=user_input
-        )
-        self.db.add(user_msg)
-        session.increment_message_count()
-        await self.db.flush()
+        # 1-2. Get or create session, store user message
+        session = await self._start_turn(user_input, session_id)
         
         # 3. Build prompt
         system_prompt = self._build_system_prompt(retrieved_docs)
@@ -92,26 +79,88 @@ class TutorEngine:
         try:
             response = self.model.generate_content(
                 [system_prompt, user_prompt],
-                generation_config=genai.types.GenerationConfig(
-                    temperature=0.7,
-                    max_output_tokens=500
-                )
+                generation_config=self._generation_config()
             )
             
             assistant_content = response.text.strip()
         
         except Exception as e:
             logger.error(f"Gemini API error: {e}")
-            assistant_content = "I'm having trouble processing your question right now. Please try again."
+            assistant_content = FALLBACK_REPLY
             retrieved_docs = []
         
-        # 5. Calculate confidence (average similarity of retrieved docs)
+        # 5-7. Confidence, provenance, store assistant message
+        return await self._finish_turn(session, assistant_content, retrieved_docs)
+    
+    async def chat_stream(
+        self,
+        user_input: str,
+        session_id: Optional[str],
+        retrieved_docs: List[Dict[str, Any]]
+    ) -> AsyncIterator[bytes]:
+        """
+        Streaming variant of chat (server-sent events, see llm_streaming).
+        
+        The reply is forwarded sentence by sentence through the guardrails
+        as Gemini produces it. When the stream ends the assistant message
+        is stored exactly as chat() would store it, and the done event
+        carries the ChatResponse fields except the content. If generation
+        fails before anything was forwarded, the fallback reply is sent
+        and stored instead.
+        """
+        session = await self._start_turn(user_input, session_id)
+        
+        system_prompt = self._build_system_prompt(retrieved_docs)
+        user_prompt = self._build_user_prompt(user_input)
+        
+        result = StreamResult()
+        chunks = stream_gemini(self.model, [system_prompt, user_prompt], self._generation_config())
+        async for event in guarded_sse(chunks, result, error_event=False):
+            yield event
+        
+        assistant_content = result.text.strip()
+        if result.error and not assistant_content:
+            assistant_content = FALLBACK_REPLY
+            retrieved_docs = []
+            yield sse_event("delta", {"text": assistant_content})
+        
+        response = await self._finish_turn(session, assistant_content, retrieved_docs)
+        done = response.dict(exclude={"content"})
+        done["blocked"] = result.blocked_reason
+        yield sse_event("done", done)
+    
+    async def _start_turn(self, user_input: str, session_id: Optional[str]) -> TutorSession:
+        """Get or create the session and store the user message"""
+        if session_id:
+            session = await self._get_session(session_id)
+            if not session or session.user_id != self.user.id:
+                # Invalid session - create new
+                session = await self._create_session()
+        else:
+            session = await self._create_session()
+        
+        user_msg = TutorMessage(
+            session_id=session.session_id,
+            role="user",
+            content=user_input
+        )
+        self.db.add(user_msg)
+        session.increment_message_count()
+        await self.db.flush()
+        return session
+    
+    async def _finish_turn(
+        self,
+        session: TutorSession,
+        assistant_content: str,
+        retrieved_docs: List[Dict[str, Any]]
+    ) -> ChatResponse:
+        """Store the assistant message and build the response"""
+        # Confidence (average similarity of retrieved docs)
         confidence_score = self._calculate_confidence(retrieved_docs)
         
-        # 6. Build provenance
         provenance = self._build_provenance(retrieved_docs)
         
-        # 7. Store assistant message
         assistant_msg = TutorMessage(
             session_id=session.session_id,
             role="assistant",
@@ -127,7 +176,6 @@ class TutorEngine:
         
         logger.info(f"Tutor response generated: session={session.session_id}, confidence={confidence_score:.2f}")
         
-        # 8. Return response
         return ChatResponse(
             message_id=assistant_msg.id,
             session_id=session.session_id,
@@ -137,6 +185,13 @@ class TutorEngine:
             timestamp=assistant_msg.created_at.isoformat()
         )
     
+    @staticmethod
+    def _generation_config():
+        return genai.types.GenerationConfig(
+            temperature=0.7,
+            max_output_tokens=500
+        )
+    
     async def _get_session(self, session_id: str) -> Optional[TutorSession]:
         """Fetch existing session"""
         result = await self.db.execute(
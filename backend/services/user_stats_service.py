@@ -0,0 +1,186 @@
+"""
+backend/services/user_stats_service.py
+Maintenance of the user_stats dashboard rollup
+
+EVENTS:
+- UserContentProgress insert/update/delete → completed count, time spent,
+  last activity and study streak
+- PracticeAttempt insert/update/delete → attempt and correct counts
+
+Each event applies its delta with one UPDATE in the same flush as the
+change. Users without a rollup row are skipped by events and rebuilt from
+the source tables the first time their stats are read.
+"""
+import logging
+from datetime import datetime, timedelta
+from typing import Optional
+
+from sqlalchemy import select, update, event, inspect, func, case, and_
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from backend.orm.user_stats import UserStats
+from backend.orm.user_content_progress import UserContentProgress
+from backend.orm.practice_attempt import PracticeAttempt
+from backend.utils.activity_streak import streak_from_dates
+from backend.utils.orm_history import value_before_flush
+
+logger = logging.getLogger(__name__)
+
+_stats = UserStats.__table__
+
+
+async def _build_stats(db: AsyncSession, user_id: int) -> UserStats:
+    """Rebuild a user's rollup row from the source tables"""
+    progress_result = await db.execute(
+        select(
+            func.count(case((UserContentProgress.is_completed == True, 1))),
+            func.coalesce(func.sum(UserContentProgress.time_spent_seconds), 0),
+            func.max(UserContentProgress.last_viewed_at)
+        ).where(UserContentProgress.user_id == user_id)
+    )
+    content_completed, time_spent, last_activity_at = progress_result.one()
+
+    attempts_result = await db.execute(
+        select(
+            func.count(PracticeAttempt.id),
+            func.count(case((PracticeAttempt.is_correct == True, 1)))
+        ).where(PracticeAttempt.user_id == user_id)
+    )
+    total_attempts, correct_attempts = attempts_result.one()
+
+    dates_result = await db.execute(
+        select(UserContentProgress.last_viewed_at)
+        .where(UserContentProgress.user_id == user_id)
+    )
+    active_dates = [viewed_at.date() for viewed_at in dates_result.scalars().all() if viewed_at]
+    today = datetime.utcnow().date()
+    streak = streak_from_dates(active_dates, today)
+
+    return UserStats(
+        user_id=user_id,
+        content_completed=content_completed or 0,
+        total_time_spent_seconds=time_spent or 0,
+        last_activity_at=last_activity_at,
+        total_attempts=total_attempts or 0,
+        correct_attempts=correct_attempts or 0,
+        study_streak=streak,
+        streak_last_date=max(active_dates) if streak else None
+    )
+
+
+async def get_user_stats(db: AsyncSession, user_id: int) -> UserStats:
+    """
+    Dashboard totals of a user: one primary-key read, or a one-time
+    rebuild from the source tables when the user has no rollup row yet.
+    """
+    stats = await db.get(UserStats, user_id)
+    if stats is not None:
+        return stats
+
+    stats = await _build_stats(db, user_id)
+    db.add(stats)
+    try:
+        await db.commit()
+    except IntegrityError:
+        # Built concurrently by another request
+        await db.rollback()
+        stats = await db.get(UserStats, user_id)
+    return stats
+
+
+# ================= EVENTS =================
+
+def _apply(connection, user_id: Optional[int], **values) -> None:
+    if user_id is None or not values:
+        return
+    connection.execute(
+        update(_stats).where(_stats.c.user_id == user_id).values(updated_at=datetime.utcnow(), **values)
+    )
+
+
+def _activity_values(viewed_at: Optional[datetime]) -> dict:
+    """Last activity and streak update for a content view at viewed_at"""
+    if viewed_at is None:
+        return {}
+    day = viewed_at.date()
+    return {
+        "last_activity_at": case(
+            (
+                and_(_stats.c.last_activity_at.is_not(None), _stats.c.last_activity_at > viewed_at),
+                _stats.c.last_activity_at
+            ),
+            else_=viewed_at
+        ),
+        "study_streak": case(
+            (_stats.c.streak_last_date >= day, _stats.c.study_streak),
+            (_stats.c.streak_last_date == day - timedelta(days=1), _stats.c.study_streak + 1),
+            else_=1
+        ),
+        "streak_last_date": case(
+            (_stats.c.streak_last_date > day, _stats.c.streak_last_date),
+            else_=day
+        ),
+    }
+
+
+@event.listens_for(UserContentProgress, "after_insert")
+def _on_progress_insert(mapper, connection, target: UserContentProgress) -> None:
+    _apply(
+        connection, target.user_id,
+        content_completed=_stats.c.content_completed + (1 if target.is_completed else 0),
+        total_time_spent_seconds=_stats.c.total_time_spent_seconds + (target.time_spent_seconds or 0),
+        **_activity_values(target.last_viewed_at)
+    )
+
+
+@event.listens_for(UserContentProgress, "after_update")
+def _on_progress_update(mapper, connection, target: UserContentProgress) -> None:
+    values = {}
+
+    completed_delta = int(bool(target.is_completed)) - int(bool(value_before_flush(target, "is_completed")))
+    if completed_delta:
+        values["content_completed"] = _stats.c.content_completed + completed_delta
+
+    time_delta = (target.time_spent_seconds or 0) - (value_before_flush(target, "time_spent_seconds") or 0)
+    if time_delta:
+        values["total_time_spent_seconds"] = _stats.c.total_time_spent_seconds + time_delta
+
+    if inspect(target).attrs.last_viewed_at.history.has_changes():
+        values.update(_activity_values(target.last_viewed_at))
+
+    _apply(connection, target.user_id, **values)
+
+
+@event.listens_for(UserContentProgress, "after_delete")
+def _on_progress_delete(mapper, connection, target: UserContentProgress) -> None:
+    _apply(
+        connection, target.user_id,
+        content_completed=_stats.c.content_completed - (1 if target.is_completed else 0),
+        total_time_spent_seconds=_stats.c.total_time_spent_seconds - (target.time_spent_seconds or 0)
+    )
+
+
+@event.listens_for(PracticeAttempt, "after_insert")
+def _on_attempt_insert(mapper, connection, target: PracticeAttempt) -> None:
+    _apply(
+        connection, target.user_id,
+        total_attempts=_stats.c.total_attempts + 1,
+        correct_attempts=_stats.c.correct_attempts + (1 if target.is_correct else 0)
+    )
+
+
+@event.listens_for(PracticeAttempt, "after_update")
+def _on_attempt_update(mapper, connection, target: PracticeAttempt) -> None:
+    correct_delta = int(bool(target.is_correct)) - int(bool(value_before_flush(target, "is_correct")))
+    if correct_delta:
+        _apply(connection, target.user_id, correct_attempts=_stats.c.correct_attempts + correct_delta)
+
+
+@event.listens_for(PracticeAttempt, "after_delete")
+def _on_attempt_delete(mapper, connection, target: PracticeAttempt) -> None:
+    _apply(
+        connection, target.user_id,
+        total_attempts=_stats.c.total_attempts - 1,
+        correct_attempts=_stats.c.correct_attempts - (1 if target.is_correct else 0)
+    )
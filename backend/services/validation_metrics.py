@@ -3,27 +3,47 @@ backend/services/validation_metrics.py
 Phase 3: Validation Metrics Tracking
 
 Track session completion rate and feedback relevance for student validation.
-In-memory storage for MVP (resets on server restart).
+Kept in bounded TTL stores (resets on server restart unless TTL_STORE_PATH
+is set).
 """
+import os
+import uuid
 import logging
-from typing import Dict, List
+from typing import List
 from datetime import datetime
 
+from backend.services.ttl_store import create_ttl_store
+
 logger = logging.getLogger(__name__)
 
+VALIDATION_METRICS_TTL_SECONDS = float(os.getenv("VALIDATION_METRICS_TTL_SECONDS", str(30 * 24 * 3600)))
+VALIDATION_METRICS_MAX_SIZE = int(os.getenv("VALIDATION_METRICS_MAX_SIZE", "10000"))
+
 
 class ValidationMetrics:
     """
     Track validation metrics for Phase 3 student testing.
     
-    Metrics stored in memory only (dict) - resets on server restart.
+    Metrics expire after VALIDATION_METRICS_TTL_SECONDS and at most
+    VALIDATION_METRICS_MAX_SIZE sessions and ratings are kept.
     """
     
     def __init__(self):
-        """Initialize in-memory metrics storage."""
-        self.sessions: Dict[str, dict] = {}  # session_id -> session data
-        self.feedback_ratings: List[dict] = []  # student feedback ratings
+        """Initialize metrics storage."""
+        # session_id -> session data
+        self.sessions = create_ttl_store(
+            "validation_sessions", VALIDATION_METRICS_TTL_SECONDS, VALIDATION_METRICS_MAX_SIZE
+        )
+        # rating id -> student feedback rating
+        self.ratings = create_ttl_store(
+            "validation_ratings", VALIDATION_METRICS_TTL_SECONDS, VALIDATION_METRICS_MAX_SIZE
+        )
         
+    @property
+    def feedback_ratings(self) -> List[dict]:
+        """Live feedback ratings, oldest first"""
+        return self.ratings.values()
+    
     def track_session_completion(
         self, 
         session_id: str, 
@@ -38,12 +58,12 @@ class ValidationMetrics:
             turns_completed: Number of turns completed (0-3)
             max_turns: Maximum turns allowed (default 3)
         """
-        self.sessions[session_id] = {
+        self.sessions.set(session_id, {
             "turns_completed": turns_completed,
             "max_turns": max_turns,
             "completed": turns_completed >= max_turns,
             "timestamp": datetime.utcnow().isoformat()
-        }
+        })
         
         logger.info(f"Session {session_id}: {turns_completed}/{max_turns} turns completed")
         
@@ -55,7 +75,7 @@ class ValidationMetrics:
             session_id: Session that received feedback
             student_rating: 1-5 scale from student survey (1=poor, 5=excellent)
         """
-        self.feedback_ratings.append({
+        self.ratings.set(uuid.uuid4().hex, {
             "session_id": session_id,
             "rating": student_rating,
             "timestamp": datetime.utcnow().isoformat()
@@ -70,11 +90,12 @@ class ValidationMetrics:
         Returns:
             Completion rate as percentage (0-100)
         """
-        if not self.sessions:
+        sessions = self.sessions.values()
+        if not sessions:
             return 0.0
         
-        completed = sum(1 for s in self.sessions.values() if s["completed"])
-        total = len(self.sessions)
+        completed = sum(1 for s in sessions if s["completed"])
+        total = len(sessions)
         
         rate = (completed / total) * 100
         logger.info(f"Completion rate: {completed}/{total} = {rate:.1f}%")
@@ -87,10 +108,11 @@ class ValidationMetrics:
         Returns:
             Average rating (1-5 scale), or 0 if no ratings
         """
-        if not self.feedback_ratings:
+        feedback_ratings = self.feedback_ratings
+        if not feedback_ratings:
             return 0.0
         
-        avg = sum(r["rating"] for r in self.feedback_ratings) / len(self.feedback_ratings)
+        avg = sum(r["rating"] for r in feedback_ratings) / len(feedback_ratings)
         return round(avg, 2)
     
     def export_validation_report(self) -> dict:
@@ -102,8 +124,10 @@ class ValidationMetrics:
         """
         completion_rate = self.calculate_completion_rate()
         avg_rating = self.calculate_avg_feedback_rating()
-        total_sessions = len(self.sessions)
-        total_ratings = len(self.feedback_ratings)
+        sessions = dict(self.sessions.items())
+        feedback_ratings = self.feedback_ratings
+        total_sessions = len(sessions)
+        total_ratings = len(feedback_ratings)
         
         # Decision gate: proceed to Phase 4 if ≥60% completion
         should_proceed = completion_rate >= 60
@@ -114,7 +138,7 @@ class ValidationMetrics:
             "metrics": {
                 "total_sessions": total_sessions,
                 "completion_rate_percent": round(completion_rate, 1),
-                "sessions_completed_3_turns": sum(1 for s in self.sessions.values() if s["completed"]),
+                "sessions_completed_3_turns": sum(1 for s in sessions.values() if s["completed"]),
                 "avg_feedback_rating": avg_rating,
                 "total_feedback_ratings": total_ratings
             },
@@ -124,8 +148,8 @@ class ValidationMetrics:
                 "recommendation": "PROCEED to Phase 4" if should_proceed else "ITERATE and retest",
                 "should_proceed": should_proceed
             },
-            "all_sessions": self.sessions,
-            "all_ratings": self.feedback_ratings
+            "all_sessions": sessions,
+            "all_ratings": feedback_ratings
         }
         
         logger.info(f"Validation report: {report['decision_gate']['recommendation']}")
@@ -133,8 +157,8 @@ class ValidationMetrics:
     
     def reset(self):
         """Reset all metrics (for testing)."""
-        self.sessions = {}
-        self.feedback_ratings = []
+        self.sessions.clear()
+        self.ratings.clear()
         logger.info("Validation metrics reset")
 
 
@@ -0,0 +1,124 @@
+"""
+backend/tests/test_audio_transcription.py
+Transcription queue: admission under load, shutdown, status flushes and round cache
+"""
+import asyncio
+from datetime import datetime
+
+import pytest
+from sqlalchemy import select
+
+from backend.orm.oral_round_transcript import OralRoundTranscript
+from backend.services import audio_transcription
+from backend.services.audio_transcription import AudioTranscriptionService, TranscriptionQueueFull
+
+
+@pytest.fixture
+def service(tmp_path, monkeypatch):
+    monkeypatch.setattr(audio_transcription, "AUDIO_UPLOAD_DIR", str(tmp_path))
+    service = AudioTranscriptionService()
+    # No workers: queued chunks stay queued
+    service._queue = asyncio.Queue(maxsize=1)
+    return service
+
+
+async def queue_chunk(service, chunk_index: int) -> dict:
+    return await service.process_audio_chunk(
+        round_id=1,
+        audio_data=b"opus",
+        speaker_role="petitioner",
+        chunk_index=chunk_index,
+        timestamp=datetime(2026, 1, 1, 10, 0, 0)
+    )
+
+
+@pytest.mark.asyncio
+async def test_full_queue_is_rejected_up_front(service):
+    assert (await queue_chunk(service, 0))["status"] == "queued"
+    with pytest.raises(TranscriptionQueueFull):
+        await queue_chunk(service, 1)
+
+
+@pytest.mark.asyncio
+async def test_queue_filled_during_save_rolls_back(service, tmp_path, monkeypatch):
+    load_round = service._load_round
+
+    async def concurrent_upload_wins(round_id, db):
+        # Another upload takes the last slot while this chunk was being written
+        service._queue.put_nowait(object())
+        return await load_round(round_id, db)
+
+    monkeypatch.setattr(service, "_load_round", concurrent_upload_wins)
+    with pytest.raises(TranscriptionQueueFull):
+        await queue_chunk(service, 0)
+
+    assert service._rounds[1].pending == 0
+    assert not service._chunk_status
+    assert not list((tmp_path / "1").iterdir())
+
+
+@pytest.mark.asyncio
+async def test_shutdown_drains_queue_and_persists(tmp_path, monkeypatch):
+    monkeypatch.setattr(audio_transcription, "AUDIO_UPLOAD_DIR", str(tmp_path))
+    service = AudioTranscriptionService()
+    transcribed, flushed = [], []
+
+    async def run_job(job):
+        transcribed.append(job.status["chunk_id"])
+
+    async def flush_statuses():
+        flushed.append(len(transcribed))
+
+    monkeypatch.setattr(service, "_run_job", run_job)
+    monkeypatch.setattr(service, "flush_statuses", flush_statuses)
+
+    chunk_ids = [(await queue_chunk(service, i))["chunk_id"] for i in range(3)]
+    await service.shutdown()
+
+    assert transcribed == chunk_ids
+    assert flushed and flushed[-1] == 3
+    assert service._queue is None
+
+
+def finished_chunk(chunk_id: str, round_id) -> dict:
+    return {
+        "chunk_id": chunk_id,
+        "round_id": round_id,
+        "status": "completed",
+        "speaker_role": "petitioner",
+        "chunk_index": 0,
+        "created_at": "2026-01-01T10:00:00+00:00",
+        "transcript_text": "May it please the court",
+        "confidence": 0.9,
+    }
+
+
+@pytest.mark.asyncio
+async def test_bad_row_does_not_hold_back_batch(service, db_session, session_factory, monkeypatch):
+    monkeypatch.setattr(audio_transcription, "AsyncSessionLocal", session_factory)
+    monkeypatch.setattr(audio_transcription, "STATUS_FLUSH_MAX_ATTEMPTS", 2)
+    # round_id is NOT NULL, so this row fails on every attempt
+    service._unsaved = [finished_chunk("a", 1), finished_chunk("bad", None), finished_chunk("b", 1)]
+
+    assert await service.flush_statuses() == 2
+    assert [status["chunk_id"] for status in service._unsaved] == ["bad"]
+
+    assert await service.flush_statuses() == 0
+    assert service._unsaved == []
+    assert service._flush_attempts == {}
+
+    chunk_ids = (await db_session.execute(select(OralRoundTranscript.audio_chunk_id))).scalars().all()
+    assert sorted(chunk_ids) == ["a", "b"]
+
+
+@pytest.mark.asyncio
+async def test_round_with_queued_chunks_is_not_evicted(service, monkeypatch):
+    monkeypatch.setattr(audio_transcription, "ROUND_CACHE_MAX_SIZE", 1)
+    service._queue = asyncio.Queue(maxsize=10)
+    await queue_chunk(service, 0)
+
+    await service.get_live_segments(2)
+    await service.get_live_segments(3)
+
+    assert list(service._rounds) == [1, 3]
+    assert (await service.get_live_segments(1))["pending_chunks"] == 1
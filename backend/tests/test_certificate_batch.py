@@ -0,0 +1,101 @@
+"""
+backend/tests/test_certificate_batch.py
+Competition certificate batches: recipients, rendering and bulk insert
+"""
+from datetime import datetime
+from pathlib import Path
+
+import pytest
+import pytest_asyncio
+from sqlalchemy import select
+
+from backend.orm.competition import Competition
+from backend.orm.competition_certificate import CompetitionCertificate
+from backend.orm.ranking import TeamRanking, RankingType
+from backend.orm.team import Team, TeamMember, TeamRole
+from backend.orm.user import User, UserRole
+from backend.services import certificate_batch_service
+from backend.services.certificate_batch_service import create_batch, get_batch, issue_competition_certificates
+from backend.services.certificate_generator import CertificateGenerator
+
+
+@pytest_asyncio.fixture
+async def competition(db_session) -> Competition:
+    competition = Competition(
+        title="National Moot 2026",
+        description="Final rounds",
+        problem_id=1,
+        start_date=datetime(2026, 3, 1),
+        memorial_deadline=datetime(2026, 3, 10),
+        oral_start_date=datetime(2026, 3, 20),
+        oral_end_date=datetime(2026, 3, 22),
+        created_by_id=1
+    )
+    db_session.add(competition)
+    await db_session.flush()
+
+    for rank, side in enumerate(["petitioner", "respondent"], start=1):
+        team = Team(competition_id=competition.id, name=f"Team {rank}", side=side)
+        db_session.add(team)
+        await db_session.flush()
+        db_session.add(TeamRanking(
+            institution_id=1,
+            competition_id=competition.id,
+            team_id=team.id,
+            ranking_type=RankingType.OVERALL,
+            rank=rank,
+            total_score=90.0 - rank
+        ))
+        for speaker, role in enumerate([TeamRole.SPEAKER_1, TeamRole.SPEAKER_2], start=1):
+            student = User(
+                email=f"team{rank}.speaker{speaker}@test.com",
+                full_name=f"Speaker {rank}.{speaker}",
+                password_hash="x",
+                role=UserRole.STUDENT
+            )
+            db_session.add(student)
+            await db_session.flush()
+            db_session.add(TeamMember(team_id=team.id, user_id=student.id, role=role))
+
+    await db_session.commit()
+    return competition
+
+
+@pytest.fixture
+def generator(tmp_path, monkeypatch):
+    generator = CertificateGenerator(upload_dir=str(tmp_path) + "/")
+    monkeypatch.setattr(certificate_batch_service, "get_certificate_generator", lambda: generator)
+    return generator
+
+
+@pytest.mark.asyncio
+async def test_small_batch_issues_every_participant(db_session, competition, generator):
+    batch = create_batch(competition.id, requested_by=1)
+    await issue_competition_certificates(db_session, batch)
+
+    assert batch.status == "completed", batch.error
+    assert (batch.total, batch.rendered, batch.issued) == (4, 4, 4)
+    assert get_batch(batch.batch_id).to_dict()["progress_percentage"] == 100
+
+    certificates = (await db_session.execute(
+        select(CompetitionCertificate).order_by(CompetitionCertificate.final_rank)
+    )).scalars().all()
+    assert [c.final_rank for c in certificates] == [1, 1, 2, 2]
+    for certificate in certificates:
+        assert Path(certificate.pdf_file_path).read_bytes().startswith(b"%PDF")
+
+
+@pytest.mark.asyncio
+async def test_rerun_skips_issued_certificates(db_session, competition, generator):
+    await issue_competition_certificates(db_session, create_batch(competition.id, requested_by=1))
+
+    batch = await issue_competition_certificates(db_session, create_batch(competition.id, requested_by=1))
+    assert batch.status == "completed", batch.error
+    assert (batch.total, batch.issued) == (0, 0)
+
+
+@pytest.mark.asyncio
+async def test_unknown_competition_fails_batch(db_session, generator):
+    batch = await issue_competition_certificates(db_session, create_batch(999, requested_by=1))
+    assert batch.status == "failed"
+    assert "not found" in batch.error
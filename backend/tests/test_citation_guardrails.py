@@ -0,0 +1,63 @@
+"""
+backend/tests/test_citation_guardrails.py
+Guardrail citation checks against the normalized citation index
+"""
+import pytest
+import pytest_asyncio
+from sqlalchemy import event
+
+from backend.orm.content_module import ContentModule, ModuleType
+from backend.orm.case_content import CaseContent, ExamImportance
+from backend.services.citation_index import clear_known_keys
+from backend.services.guardrails import ContentGuardrails
+
+
+@pytest_asyncio.fixture
+async def stored_cases(db_session):
+    clear_known_keys()
+    module = ContentModule(subject_id=1, module_type=ModuleType.CASES, title="Cases", order_index=0)
+    db_session.add(module)
+    await db_session.flush()
+
+    db_session.add(CaseContent(
+        module_id=module.id, case_name="Kesavananda Bharati v. State of Kerala", year=1973,
+        citation="(1973) 4 SCC 225", facts="Land reforms", issue="Amending power",
+        judgment="Basic structure", ratio="Basic structure doctrine",
+        exam_importance=ExamImportance.HIGH, tags="basic-structure"
+    ))
+    await db_session.commit()
+    yield
+    clear_known_keys()
+
+
+@pytest.fixture
+def statements(db_engine):
+    executed = []
+
+    def record(conn, cursor, statement, parameters, context, executemany):
+        executed.append(statement)
+
+    event.listen(db_engine.sync_engine, "before_cursor_execute", record)
+    yield executed
+    event.remove(db_engine.sync_engine, "before_cursor_execute", record)
+
+
+@pytest.mark.asyncio
+async def test_indexed_name_and_citation_verify_in_one_query(db_session, stored_cases, statements):
+    text = "See: Kesavananda Bharati v. State of Kerala (1973), reported at (1973) 4 SCC 225."
+    assert await ContentGuardrails.validate_case_citations(text, db_session) == (True, None)
+    assert len(statements) == 1
+
+
+@pytest.mark.asyncio
+async def test_short_form_name_still_verifies(db_session, stored_cases):
+    text = "On the basic structure doctrine, Kesavananda v. State of Kerala (1973) is the leading case."
+    assert await ContentGuardrails.validate_case_citations(text, db_session) == (True, None)
+
+
+@pytest.mark.asyncio
+async def test_unknown_case_is_rejected(db_session, stored_cases):
+    text = "As held in 1973, Kesavananda v. State of Gujarat (1973) found the power unlimited."
+    valid, reason = await ContentGuardrails.validate_case_citations(text, db_session)
+    assert not valid
+    assert "Kesavananda v. State of Gujarat" in reason
@@ -0,0 +1,166 @@
+"""
+backend/tests/test_cohort_aggregation.py
+Cohort aggregation: member subquery, aggregation cache and invalidation
+"""
+from datetime import datetime
+
+import pytest
+import pytest_asyncio
+from sqlalchemy import event, select
+
+from backend.orm.user import User, UserRole
+from backend.orm.course import Course
+from backend.orm.subject import Subject, SubjectCategory
+from backend.orm.curriculum import CourseCurriculum
+from backend.orm.subject_progress import SubjectProgress
+from backend.orm.practice_attempt import PracticeAttempt
+from backend.services.cohort_aggregation_service import get_cohort_aggregation, clear_cohort_cache
+from backend.services.benchmark_percentile_service import get_benchmark_comparison
+
+
+COHORT_SIZE = 12
+
+
+@pytest_asyncio.fixture
+async def cohort(db_session):
+    """Course/semester cohort of active students with progress in one subject"""
+    clear_cohort_cache()
+    course = Course(name="BA LLB", code="BA_LLB", duration_years=5, total_semesters=10)
+    subject = Subject(title="Constitutional Law", code="CONST", category=SubjectCategory.CORE)
+    db_session.add_all([course, subject])
+    await db_session.flush()
+    db_session.add(CourseCurriculum(course_id=course.id, subject_id=subject.id, semester_number=3))
+
+    students = []
+    for i in range(COHORT_SIZE):
+        student = User(
+            email=f"cohort{i}@test.com", full_name=f"Student {i}", password_hash="x",
+            role=UserRole.STUDENT, course_id=course.id, current_semester=3
+        )
+        db_session.add(student)
+        await db_session.flush()
+        students.append(student)
+        db_session.add(SubjectProgress(user_id=student.id, subject_id=subject.id, completion_percentage=float(i * 5)))
+        for question_id in range(3):
+            db_session.add(PracticeAttempt(
+                user_id=student.id, practice_question_id=question_id + 1, selected_option="A",
+                is_correct=True, attempted_at=datetime.utcnow()
+            ))
+
+    # Same cohort, but no recent practice: not an active member
+    db_session.add(User(
+        email="inactive@test.com", full_name="Inactive", password_hash="x",
+        role=UserRole.STUDENT, course_id=course.id, current_semester=3
+    ))
+    await db_session.commit()
+    yield students, subject
+    clear_cohort_cache()
+
+
+@pytest.fixture
+def statements(db_engine):
+    """SQL statements and parameters executed on the test engine"""
+    executed = []
+
+    def record(conn, cursor, statement, parameters, context, executemany):
+        executed.append((statement, parameters))
+
+    event.listen(db_engine.sync_engine, "before_cursor_execute", record)
+    yield executed
+    event.remove(db_engine.sync_engine, "before_cursor_execute", record)
+
+
+@pytest.mark.asyncio
+async def test_benchmark_filters_by_member_subquery(db_session, cohort, statements):
+    students, subject = cohort
+    result = await get_benchmark_comparison(students[-1].id, db_session)
+
+    assert result["success"]
+    assert result["cohort"]["active_students"] == COHORT_SIZE
+    [benchmark] = result["subjects"]
+    assert benchmark["cohort_size"] == COHORT_SIZE
+    assert benchmark["student_mastery"] == float((COHORT_SIZE - 1) * 5)
+    assert benchmark["percentile"] == 100
+
+    [(sql, params)] = [(sql, params) for sql, params in statements if "FROM subject_progress" in sql]
+    assert "IN (SELECT users.id" in sql
+    # Member ids are never bound one by one
+    assert len(params) < COHORT_SIZE
+
+
+@pytest.mark.asyncio
+async def test_benchmark_query_count_does_not_grow_with_subjects(db_session, cohort, statements):
+    students, subject = cohort
+    await get_benchmark_comparison(students[0].id, db_session)
+    one_subject = len(statements)
+
+    course_id = students[0].course_id
+    for i in range(3):
+        extra = Subject(title=f"Elective {i}", code=f"ELEC{i}", category=SubjectCategory.CORE)
+        db_session.add(extra)
+        await db_session.flush()
+        db_session.add(CourseCurriculum(course_id=course_id, subject_id=extra.id, semester_number=3))
+        db_session.add(SubjectProgress(user_id=students[0].id, subject_id=extra.id, completion_percentage=50.0))
+    await db_session.commit()
+
+    statements.clear()
+    result = await get_benchmark_comparison(students[0].id, db_session)
+    assert len(result["subjects"]) == 4
+    assert len(statements) == one_subject
+
+
+@pytest.mark.asyncio
+async def test_aggregation_is_cached(db_session, cohort, statements):
+    students, _ = cohort
+    first = await get_cohort_aggregation(students[0].id, db_session)
+    assert first["cohort"]["active_students"] == COHORT_SIZE
+    assert first["cohort"]["total_students"] == COHORT_SIZE + 1
+
+    statements.clear()
+    assert await get_cohort_aggregation(students[1].id, db_session) == first
+    # Only the caller's cohort lookup
+    assert len(statements) == 1
+
+
+@pytest.mark.asyncio
+async def test_member_progress_invalidates_cache(db_session, cohort):
+    students, subject = cohort
+    first = await get_cohort_aggregation(students[0].id, db_session)
+
+    progress = (await db_session.execute(
+        select(SubjectProgress).where(SubjectProgress.user_id == students[0].id)
+    )).scalar_one()
+    progress.completion_percentage = 100.0
+    await db_session.commit()
+
+    second = await get_cohort_aggregation(students[0].id, db_session)
+    assert second["subjects"][0]["avg_mastery"] > first["subjects"][0]["avg_mastery"]
+
+
+@pytest.mark.asyncio
+async def test_leaving_cohort_invalidates_cache(db_session, cohort):
+    students, _ = cohort
+    await get_cohort_aggregation(students[0].id, db_session)
+
+    students[-1].current_semester = 4
+    await db_session.commit()
+
+    aggregation = await get_cohort_aggregation(students[0].id, db_session)
+    assert aggregation["cohort"]["active_students"] == COHORT_SIZE - 1
+
+
+@pytest.mark.asyncio
+async def test_practice_attempt_keeps_cache(db_session, cohort, statements):
+    students, _ = cohort
+    await get_cohort_aggregation(students[0].id, db_session)
+
+    db_session.add(PracticeAttempt(
+        user_id=students[0].id, practice_question_id=9, selected_option="B",
+        is_correct=False, attempted_at=datetime.utcnow()
+    ))
+    await db_session.commit()
+
+    statements.clear()
+    await get_cohort_aggregation(students[0].id, db_session)
+    # Only the student's own cohort lookup; the aggregation is served from cache
+    assert len(statements) == 1
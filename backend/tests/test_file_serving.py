@@ -0,0 +1,166 @@
+"""
+backend/tests/test_file_serving.py
+Stored-file downloads: validators, cache policy, submission and memorial access
+"""
+import hashlib
+
+import pytest
+import pytest_asyncio
+from fastapi import HTTPException
+from starlette.requests import Request
+
+from backend.orm.user import User, UserRole
+from backend.orm.team import Team, TeamMember, TeamRole
+from backend.orm.memorial import MemorialSubmission
+from backend.orm.submission import Submission, SubmissionType
+from backend.services import file_serving, file_storage
+from backend.services.file_serving import serve_file, REVALIDATE_CACHE_CONTROL
+from backend.routes.submissions import download_submission
+from backend.routes.memorial_submission import download_memorial
+
+
+CONTENT = b"%PDF-1.4 memorial body"
+
+
+def make_request(headers=None) -> Request:
+    return Request({
+        "type": "http",
+        "method": "GET",
+        "path": "/download",
+        "headers": [(name.lower().encode(), value.encode()) for name, value in (headers or {}).items()],
+    })
+
+
+@pytest.fixture
+def stored_file(tmp_path):
+    path = tmp_path / "memorial.pdf"
+    path.write_bytes(CONTENT)
+    return path
+
+
+@pytest.mark.asyncio
+async def test_download_revalidates_by_default(stored_file):
+    response = await serve_file(make_request(), str(stored_file), media_type="application/pdf")
+    assert response.status_code == 200
+    assert response.headers["cache-control"] == REVALIDATE_CACHE_CONTROL
+    assert response.headers["etag"] == f'"{hashlib.sha256(CONTENT).hexdigest()}"'
+
+
+@pytest.mark.asyncio
+async def test_matching_etag_returns_304(stored_file):
+    etag = f'"{hashlib.sha256(CONTENT).hexdigest()}"'
+    response = await serve_file(make_request({"If-None-Match": etag}), str(stored_file))
+    assert response.status_code == 304
+    assert response.body == b""
+
+
+@pytest.mark.asyncio
+async def test_missing_file_is_404(tmp_path):
+    with pytest.raises(HTTPException) as exc:
+        await serve_file(make_request(), str(tmp_path / "gone.pdf"))
+    assert exc.value.status_code == 404
+
+
+# ================= SUBMISSION DOWNLOAD =================
+
+@pytest_asyncio.fixture
+async def submission(db_session, stored_file) -> Submission:
+    submission = Submission(
+        institution_id=1,
+        competition_id=1,
+        team_id=7,
+        submission_type=SubmissionType.MEMORIAL_PETITIONER,
+        file_name="memorial.pdf",
+        file_path=str(stored_file),
+        file_hash=hashlib.sha256(CONTENT).hexdigest(),
+        mime_type="application/pdf"
+    )
+    db_session.add(submission)
+    await db_session.commit()
+    return submission
+
+
+async def make_student(db_session, email: str) -> User:
+    student = User(email=email, full_name="Student", password_hash="x", role=UserRole.STUDENT, institution_id=1)
+    db_session.add(student)
+    await db_session.commit()
+    return student
+
+
+@pytest.mark.asyncio
+async def test_team_member_can_download(db_session, submission):
+    student = await make_student(db_session, "member@test.com")
+    db_session.add(TeamMember(team_id=7, user_id=student.id, role=TeamRole.SPEAKER_1))
+    await db_session.commit()
+
+    response = await download_submission(submission.id, make_request(), current_user=student, db=db_session)
+    assert response.status_code == 200
+    assert response.headers["cache-control"] == REVALIDATE_CACHE_CONTROL
+
+
+@pytest.mark.asyncio
+async def test_other_student_is_forbidden(db_session, submission):
+    outsider = await make_student(db_session, "outsider@test.com")
+    # Member of another team, whose membership id may equal the outsider's user id
+    db_session.add(TeamMember(id=outsider.id, team_id=8, user_id=outsider.id + 100, role=TeamRole.SPEAKER_1))
+    await db_session.commit()
+
+    with pytest.raises(HTTPException) as exc:
+        await download_submission(submission.id, make_request(), current_user=outsider, db=db_session)
+    assert exc.value.status_code == 403
+
+
+# ================= MEMORIAL DOWNLOAD =================
+
+DIGEST = hashlib.sha256(CONTENT).hexdigest()
+
+
+@pytest_asyncio.fixture
+async def memorial(db_session, tmp_path, monkeypatch) -> MemorialSubmission:
+    monkeypatch.setattr(file_storage, "BLOB_STORAGE_DIR", tmp_path / "blobs")
+    path = file_storage.blob_path(DIGEST)
+    path.parent.mkdir(parents=True)
+    path.write_bytes(CONTENT)
+
+    team = Team(competition_id=3, name="Team A", side="petitioner")
+    db_session.add(team)
+    await db_session.flush()
+    memorial = MemorialSubmission(team_id=team.id, file_path=str(path), original_filename="team_a.pdf")
+    db_session.add(memorial)
+    await db_session.commit()
+    return memorial
+
+
+@pytest.mark.asyncio
+async def test_judge_revalidates_memorial_by_stored_digest(db_session, memorial, monkeypatch):
+    async def no_hashing(path, stat_result):
+        raise AssertionError("memorial digest should come from its blob path")
+
+    monkeypatch.setattr(file_serving, "_memoized_sha256", no_hashing)
+    judge = {"id": 5, "role": "judge"}
+
+    response = await download_memorial(3, memorial.id, make_request(), db=db_session, current_user=judge)
+    assert response.status_code == 200
+    assert response.headers["etag"] == f'"{DIGEST}"'
+
+    revalidated = await download_memorial(
+        3, memorial.id, make_request({"If-None-Match": f'"{DIGEST}"'}), db=db_session, current_user=judge
+    )
+    assert revalidated.status_code == 304
+
+
+@pytest.mark.asyncio
+async def test_memorial_access_is_checked(db_session, memorial):
+    member = {"id": 6, "role": "student", "team_id": memorial.team_id}
+    response = await download_memorial(3, memorial.id, make_request(), db=db_session, current_user=member)
+    assert response.status_code == 200
+
+    with pytest.raises(HTTPException) as exc:
+        outsider = {"id": 7, "role": "student", "team_id": memorial.team_id + 1}
+        await download_memorial(3, memorial.id, make_request(), db=db_session, current_user=outsider)
+    assert exc.value.status_code == 403
+
+    # Memorial ids are only valid within their competition
+    with pytest.raises(HTTPException) as exc:
+        await download_memorial(4, memorial.id, make_request(), db=db_session, current_user=member)
+    assert exc.value.status_code == 404
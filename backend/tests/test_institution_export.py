@@ -0,0 +1,61 @@
+"""
+backend/tests/test_institution_export.py
+Dataset export endpoints: who may export which institution
+"""
+import pytest
+from fastapi import HTTPException
+from fastapi.responses import StreamingResponse
+
+from backend.orm.user import User, UserRole
+from backend.routes.institution_admin import export_institution_dataset
+from backend.routes.analytics import export_institution_analytics_v5
+
+
+def make_user(role: UserRole, institution_id: int = 1) -> User:
+    return User(id=10, email="export@test.com", full_name="Export User", role=role, institution_id=institution_id)
+
+
+@pytest.mark.asyncio
+async def test_student_cannot_export_own_institution():
+    with pytest.raises(HTTPException) as exc:
+        await export_institution_dataset(1, "practice_attempts", "csv", current_user=make_user(UserRole.STUDENT))
+    assert exc.value.status_code == 403
+
+
+@pytest.mark.asyncio
+async def test_admin_cannot_export_other_institution():
+    with pytest.raises(HTTPException) as exc:
+        await export_institution_dataset(2, "practice_attempts", "csv", current_user=make_user(UserRole.ADMIN))
+    assert exc.value.status_code == 403
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("role, institution_id", [
+    (UserRole.ADMIN, 1),
+    (UserRole.FACULTY, 1),
+    (UserRole.SUPER_ADMIN, 2),
+])
+async def test_staff_export_streams(role, institution_id):
+    response = await export_institution_dataset(
+        institution_id, "practice_attempts", "csv", current_user=make_user(role)
+    )
+    assert isinstance(response, StreamingResponse)
+    assert f"practice_attempts_institution_{institution_id}_" in response.headers["content-disposition"]
+
+
+@pytest.mark.asyncio
+async def test_unknown_dataset_is_404():
+    with pytest.raises(HTTPException) as exc:
+        await export_institution_dataset(1, "passwords", "csv", current_user=make_user(UserRole.ADMIN))
+    assert exc.value.status_code == 404
+
+
+@pytest.mark.asyncio
+async def test_analytics_export_is_limited_to_own_institution():
+    with pytest.raises(HTTPException) as exc:
+        await export_institution_analytics_v5("practice_attempts", "csv", 2, current_user=make_user(UserRole.FACULTY))
+    assert exc.value.status_code == 403
+
+    with pytest.raises(HTTPException) as exc:
+        await export_institution_analytics_v5("practice_attempts", "csv", None, current_user=make_user(UserRole.STUDENT))
+    assert exc.value.status_code == 403
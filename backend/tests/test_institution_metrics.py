@@ -0,0 +1,119 @@
+"""
+backend/tests/test_institution_metrics.py
+Institution-wide project metrics: grouped query and per-institution cache
+"""
+import pytest
+import pytest_asyncio
+from sqlalchemy import event
+
+from backend.orm.moot_project import MootProject, MootIssue, IRACBlock
+from backend.services import progress_calculator
+from backend.services.progress_calculator import (
+    get_institution_wide_metrics, get_project_completeness_rows,
+    calculate_irac_completeness, invalidate_institution_metrics
+)
+
+
+INSTITUTION_ID = 1
+
+
+async def add_project(db_session, team_id: int, issues: int, filled_blocks: list, is_locked=False) -> MootProject:
+    """Project with `issues` issues; filled_blocks[i] are the block types written for issue i"""
+    project = MootProject(
+        institution_id=INSTITUTION_ID, team_id=team_id, title=f"Project {team_id}",
+        is_locked=is_locked, created_by=1
+    )
+    db_session.add(project)
+    await db_session.flush()
+
+    for order in range(issues):
+        issue = MootIssue(institution_id=INSTITUTION_ID, project_id=project.id, issue_order=order)
+        db_session.add(issue)
+        await db_session.flush()
+        for block_type in filled_blocks[order] if order < len(filled_blocks) else []:
+            db_session.add(IRACBlock(
+                institution_id=INSTITUTION_ID, project_id=project.id, issue_id=issue.id,
+                block_type=block_type, created_by=1
+            ))
+    return project
+
+
+@pytest_asyncio.fixture
+async def projects(db_session):
+    invalidate_institution_metrics()
+    created = [
+        # Half of the blocks, plus a superseded version that must not count twice
+        await add_project(db_session, team_id=1, issues=2, filled_blocks=[["issue", "rule", "rule"], ["issue", "rule"]]),
+        await add_project(db_session, team_id=1, issues=1, filled_blocks=[["issue", "rule", "analysis", "conclusion"]], is_locked=True),
+        await add_project(db_session, team_id=2, issues=0, filled_blocks=[]),
+    ]
+    # Another institution's project
+    db_session.add(MootProject(institution_id=2, team_id=3, title="Elsewhere", created_by=1))
+    await db_session.commit()
+    yield created
+    invalidate_institution_metrics()
+
+
+@pytest.fixture
+def statements(db_engine):
+    executed = []
+
+    def record(conn, cursor, statement, parameters, context, executemany):
+        executed.append(statement)
+
+    event.listen(db_engine.sync_engine, "before_cursor_execute", record)
+    yield executed
+    event.remove(db_engine.sync_engine, "before_cursor_execute", record)
+
+
+@pytest.mark.asyncio
+async def test_grouped_rows_match_per_project_calculation(db_session, projects):
+    rows = {row["project_id"]: row for row in await get_project_completeness_rows(db_session, INSTITUTION_ID)}
+    assert set(rows) == {project.id for project in projects}
+
+    for project, issues_count in zip(projects, [2, 1, 0]):
+        assert rows[project.id]["issues_count"] == issues_count
+        assert rows[project.id]["irac_completeness"] == await calculate_irac_completeness(
+            db_session, project.id, issues_count
+        )
+    assert [rows[project.id]["irac_completeness"] for project in projects] == [50.0, 100.0, 0.0]
+
+
+@pytest.mark.asyncio
+async def test_metrics_in_one_query_then_cached(db_session, projects, statements):
+    metrics = await get_institution_wide_metrics(db_session, INSTITUTION_ID)
+    assert len(statements) == 1
+    assert metrics == {
+        "total_projects": 3,
+        "draft_projects": 2,
+        "locked_projects": 1,
+        "active_teams": 2,
+        "average_issues_per_project": 1.0,
+        "average_irac_completeness": 50.0,
+    }
+
+    statements.clear()
+    assert await get_institution_wide_metrics(db_session, INSTITUTION_ID) == metrics
+    assert statements == []
+
+
+@pytest.mark.asyncio
+async def test_bypass_and_invalidate_cache(db_session, projects):
+    await get_institution_wide_metrics(db_session, INSTITUTION_ID)
+    await add_project(db_session, team_id=3, issues=1, filled_blocks=[])
+    await db_session.commit()
+
+    # Within the TTL the cached metrics are served
+    assert (await get_institution_wide_metrics(db_session, INSTITUTION_ID))["total_projects"] == 3
+    assert (await get_institution_wide_metrics(db_session, INSTITUTION_ID, use_cache=False))["total_projects"] == 4
+
+    invalidate_institution_metrics(INSTITUTION_ID)
+    assert (await get_institution_wide_metrics(db_session, INSTITUTION_ID))["total_projects"] == 4
+
+
+@pytest.mark.asyncio
+async def test_zero_ttl_disables_cache(db_session, projects, monkeypatch, statements):
+    monkeypatch.setattr(progress_calculator, "INSTITUTION_METRICS_TTL_SECONDS", 0)
+    await get_institution_wide_metrics(db_session, INSTITUTION_ID)
+    await get_institution_wide_metrics(db_session, INSTITUTION_ID)
+    assert len(statements) == 2
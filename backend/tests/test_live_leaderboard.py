@@ -0,0 +1,113 @@
+"""
+backend/tests/test_live_leaderboard.py
+Live competition boards: expiry, rebuild snapshots and the websocket feed
+"""
+import asyncio
+from datetime import datetime
+
+import pytest
+import pytest_asyncio
+from starlette.websockets import WebSocketDisconnect
+
+import backend.database
+from backend.orm.competition import Competition
+from backend.orm.team import Team
+from backend.orm.user import User, UserRole
+from backend.routes import rankings
+from backend.services import live_leaderboard
+
+
+@pytest.fixture(autouse=True)
+def empty_boards(monkeypatch):
+    monkeypatch.setattr(live_leaderboard, "_boards", type(live_leaderboard._boards)())
+    monkeypatch.setattr(live_leaderboard, "_subscribers", {})
+
+
+@pytest_asyncio.fixture
+async def competition(db_session) -> Competition:
+    now = datetime.utcnow()
+    competition = Competition(
+        title="Moot", description="Moot", problem_id=1, institution_id=1, start_date=now,
+        memorial_deadline=now, oral_start_date=now, oral_end_date=now, created_by_id=1
+    )
+    db_session.add(competition)
+    await db_session.flush()
+    db_session.add_all([
+        Team(competition_id=competition.id, institution_id=1, name=name, side=side)
+        for name, side in [("A", "petitioner"), ("B", "respondent")]
+    ])
+    await db_session.commit()
+    return competition
+
+
+@pytest.mark.asyncio
+async def test_competition_board_is_rebuilt_after_ttl(db_session, competition, monkeypatch):
+    board = await live_leaderboard.get_competition_board(db_session, competition.id)
+    assert await live_leaderboard.get_competition_board(db_session, competition.id) is board
+
+    monkeypatch.setattr(live_leaderboard, "LIVE_BOARD_TTL_SECONDS", -1)
+    live_leaderboard.invalidate_competition(competition.id)
+    stale = await live_leaderboard.get_competition_board(db_session, competition.id)
+    rebuilt = await live_leaderboard.get_competition_board(db_session, competition.id)
+    assert rebuilt is not stale
+    assert len(rebuilt) == 2
+
+
+@pytest.mark.asyncio
+async def test_classroom_boards_do_not_expire(monkeypatch):
+    monkeypatch.setattr(live_leaderboard, "LIVE_BOARD_TTL_SECONDS", -1)
+    board = live_leaderboard.get_classroom_board("room-1")
+    assert live_leaderboard.get_classroom_board("room-1") is board
+
+
+@pytest.mark.asyncio
+async def test_rebuild_sends_subscribers_a_snapshot(db_session, competition):
+    board_id = live_leaderboard.competition_board_id(competition.id)
+    queue = live_leaderboard.subscribe(board_id)
+    await live_leaderboard.get_competition_board(db_session, competition.id)
+
+    message = queue.get_nowait()
+    assert message["is_snapshot"]
+    assert len(message["rankings"]) == 2
+    assert queue.empty()
+
+
+class FakeWebSocket:
+    """Just enough of starlette's WebSocket for the live feed"""
+
+    def __init__(self):
+        self.sent = []
+        self.incoming: asyncio.Queue = asyncio.Queue()
+
+    async def accept(self):
+        pass
+
+    async def close(self, code: int = 1000, reason: str = ""):
+        raise AssertionError(f"Feed refused: {code} {reason}")
+
+    async def send_json(self, data):
+        self.sent.append(data)
+
+    async def receive(self):
+        return await self.incoming.get()
+
+
+@pytest.mark.asyncio
+async def test_feed_ends_when_client_leaves(session_factory, competition, monkeypatch):
+    monkeypatch.setattr(backend.database, "AsyncSessionLocal", session_factory)
+    monkeypatch.setattr(rankings, "decode_token", lambda token: {"type": "access", "sub": "admin@example.com"})
+
+    async def super_admin(db, sub):
+        return User(email=sub, role=UserRole.SUPER_ADMIN, is_active=True)
+    monkeypatch.setattr(rankings, "get_user_by_sub", super_admin)
+
+    websocket = FakeWebSocket()
+    feed = asyncio.create_task(rankings.live_leaderboard_feed(websocket, competition.id, token="t"))
+    while not websocket.sent:
+        await asyncio.sleep(0)
+    assert websocket.sent[0]["is_snapshot"]
+
+    # No update is pending: only the receive side can notice the disconnect
+    await websocket.incoming.put({"type": "websocket.disconnect", "code": 1000})
+    await asyncio.wait_for(feed, timeout=1)
+    assert live_leaderboard._subscribers == {}
@@ -0,0 +1,130 @@
+"""
+backend/tests/test_llm_streaming.py
+Server-sent-event streaming: guarded deltas, early stop, errors and endpoints
+"""
+import json
+
+import pytest
+from fastapi.responses import StreamingResponse
+
+from backend.orm.user import User, UserRole
+from backend.services.llm_streaming import StreamResult, guarded_sse, SSE_HEADERS
+from backend.routes import debate
+
+
+def parse_events(raw: bytes):
+    """(event, data) pairs of a text/event-stream body"""
+    events = []
+    for block in raw.decode("utf-8").split("\n\n"):
+        if not block:
+            continue
+        event_line, data_line = block.split("\n")
+        events.append((event_line[len("event: "):], json.loads(data_line[len("data: "):])))
+    return events
+
+
+class Upstream:
+    """Async chunk source recording how far it was consumed and whether it was closed"""
+
+    def __init__(self, chunks, fail_after=None):
+        self.chunks = chunks
+        self.fail_after = fail_after
+        self.sent = 0
+        self.closed = False
+
+    async def __call__(self):
+        try:
+            for chunk in self.chunks:
+                if self.fail_after is not None and self.sent == self.fail_after:
+                    raise RuntimeError("model overloaded")
+                self.sent += 1
+                yield chunk
+        finally:
+            self.closed = True
+
+
+async def collect(events):
+    return b"".join([event async for event in events])
+
+
+@pytest.mark.asyncio
+async def test_sentences_are_forwarded_as_they_complete():
+    upstream = Upstream(["Consideration is ", "something of value. It must", " move from the promisee."])
+    result = StreamResult()
+    events = guarded_sse(upstream(), result)
+
+    first = await events.__anext__()
+    assert parse_events(first) == [("delta", {"text": "Consideration is something of value."})]
+    # The first sentence went out before the model finished
+    assert upstream.sent == 2
+
+    rest = parse_events(await collect(events))
+    assert rest == [("delta", {"text": " It must move from the promisee."})]
+    assert result.completed
+    assert result.text == "Consideration is something of value. It must move from the promisee."
+
+
+@pytest.mark.asyncio
+async def test_blocked_sentence_stops_stream_and_closes_upstream():
+    upstream = Upstream(["Offer needs acceptance. ", "You should sue them. ", "More text. ", "Even more."])
+    result = StreamResult()
+    events = parse_events(await collect(guarded_sse(upstream(), result)))
+
+    assert events == [("delta", {"text": "Offer needs acceptance."})]
+    assert result.blocked_reason
+    assert upstream.closed
+    assert upstream.sent < len(upstream.chunks)
+
+
+@pytest.mark.asyncio
+async def test_upstream_failure_sends_error_event():
+    upstream = Upstream(["A contract is an agreement. ", "Enforceable by law."], fail_after=1)
+    result = StreamResult()
+    events = parse_events(await collect(guarded_sse(upstream(), result)))
+
+    assert events == [
+        ("delta", {"text": "A contract is an agreement."}),
+        ("error", {"detail": "AI generation failed"}),
+    ]
+    assert result.error == "model overloaded"
+    assert not result.completed
+
+
+# ================= ENDPOINT =================
+
+class FakeChunk:
+    def __init__(self, text):
+        self.text = text
+
+
+class FakeModel:
+    """Stands in for the Gemini model of routes.debate"""
+
+    def __init__(self, chunks):
+        self.chunks = chunks
+
+    async def generate_content_async(self, contents, generation_config=None, stream=False):
+        assert stream
+
+        async def response():
+            for text in self.chunks:
+                yield FakeChunk(text)
+
+        return response()
+
+
+@pytest.mark.asyncio
+async def test_ai_coach_streams_deltas_then_done(monkeypatch):
+    monkeypatch.setattr(debate, "model", FakeModel(["What does the ", "Constitution say?"]))
+    student = User(id=1, email="coach@test.com", full_name="Coach Student", role=UserRole.STUDENT)
+
+    response = await debate.ai_coach(debate.AICoachRequest(question="Where do I start?"), current_user=student, stream=True)
+    assert isinstance(response, StreamingResponse)
+    assert response.media_type == "text/event-stream"
+    assert response.headers["cache-control"] == SSE_HEADERS["Cache-Control"]
+
+    events = parse_events(await collect(response.body_iterator))
+    deltas = [data["text"] for event, data in events if event == "delta"]
+    assert deltas[:2] == ["What does the ", "Constitution say?"]
+    assert debate.AI_DISCLAIMER in deltas[-1]
+    assert events[-1] == ("done", {"success": True, "disclaimer": debate.AI_DISCLAIMER})
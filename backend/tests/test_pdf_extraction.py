@@ -0,0 +1,83 @@
+"""
+backend/tests/test_pdf_extraction.py
+PDF text extraction: digest cache and in-flight sharing
+"""
+import asyncio
+
+import pytest
+from reportlab.pdfgen import canvas
+
+from backend.services import pdf_extraction_service
+from backend.services.file_storage import file_sha256
+from backend.services.pdf_extraction_service import extract_pdf, extract_pdf_blocking, clear_text_cache
+
+
+PAGES = ["Issue one: jurisdiction", "Issue two: merits", "Prayer for relief"]
+
+
+@pytest.fixture
+def memorial_pdf(tmp_path):
+    path = tmp_path / "memorial.pdf"
+    pdf = canvas.Canvas(str(path))
+    for text in PAGES:
+        pdf.drawString(72, 720, text)
+        pdf.showPage()
+    pdf.save()
+    clear_text_cache()
+    yield str(path)
+    clear_text_cache()
+
+
+@pytest.fixture
+def extractions(monkeypatch):
+    """Number of times the page chunks of a PDF were submitted to the pool"""
+    calls = []
+    submit = pdf_extraction_service._submit_chunks
+
+    def counting_submit(file_path, page_count):
+        calls.append(file_path)
+        return submit(file_path, page_count)
+
+    monkeypatch.setattr(pdf_extraction_service, "_submit_chunks", counting_submit)
+    return calls
+
+
+@pytest.mark.asyncio
+async def test_extracts_every_page(memorial_pdf):
+    extracted = await extract_pdf(memorial_pdf)
+    assert extracted.page_count == len(PAGES)
+    for page, text in zip(extracted.pages, PAGES):
+        assert text in page
+
+
+@pytest.mark.asyncio
+async def test_concurrent_requests_share_one_extraction(memorial_pdf, extractions):
+    sha256 = file_sha256(memorial_pdf)
+    results = await asyncio.gather(*(extract_pdf(memorial_pdf, sha256) for _ in range(4)))
+
+    assert len(extractions) == 1
+    assert all(result is results[0] for result in results)
+    assert not pdf_extraction_service._inflight
+
+
+@pytest.mark.asyncio
+async def test_cached_content_is_not_extracted_again(memorial_pdf, extractions):
+    first = await extract_pdf(memorial_pdf)
+    assert await extract_pdf(memorial_pdf) is first
+    assert extract_pdf_blocking(memorial_pdf) is first
+    assert len(extractions) == 1
+
+
+@pytest.mark.asyncio
+async def test_failed_extraction_is_not_shared_afterwards(memorial_pdf, monkeypatch):
+    def broken_submit(file_path, page_count):
+        raise RuntimeError("worker crashed")
+
+    monkeypatch.setattr(pdf_extraction_service, "_submit_chunks", broken_submit)
+    with pytest.raises(RuntimeError):
+        await extract_pdf(memorial_pdf)
+    assert not pdf_extraction_service._inflight
+
+    monkeypatch.undo()
+    extracted = await extract_pdf(memorial_pdf)
+    assert extracted.page_count == len(PAGES)
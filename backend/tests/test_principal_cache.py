@@ -0,0 +1,115 @@
+"""
+backend/tests/test_principal_cache.py
+Principal cache: hits, flush invalidation and bulk-update invalidation
+"""
+import pytest
+import pytest_asyncio
+from sqlalchemy import event
+
+from backend.orm.user import User, UserRole
+from backend.services import principal_cache
+from backend.services.principal_cache import get_user_by_sub, clear_principal_cache
+from backend.services.credit_service import deduct_credits, check_credits
+
+
+EMAIL = "cached.student@test.com"
+
+
+@pytest_asyncio.fixture
+async def student(db_session) -> User:
+    clear_principal_cache()
+    user = User(
+        email=EMAIL,
+        full_name="Cached Student",
+        password_hash="x",
+        role=UserRole.STUDENT,
+        credits_remaining=10
+    )
+    db_session.add(user)
+    await db_session.commit()
+    yield user
+    clear_principal_cache()
+
+
+@pytest.fixture
+def statements(db_engine):
+    """SQL statements executed on the test engine"""
+    executed = []
+
+    def record(conn, cursor, statement, parameters, context, executemany):
+        executed.append(statement)
+
+    event.listen(db_engine.sync_engine, "before_cursor_execute", record)
+    yield executed
+    event.remove(db_engine.sync_engine, "before_cursor_execute", record)
+
+
+@pytest.mark.asyncio
+async def test_cache_hit_issues_no_query(student, session_factory, statements):
+    async with session_factory() as session:
+        first = await get_user_by_sub(session, EMAIL)
+    assert first.id == student.id
+
+    statements.clear()
+    async with session_factory() as session:
+        second = await get_user_by_sub(session, EMAIL)
+        assert second.id == student.id
+        assert second.role == UserRole.STUDENT
+    assert statements == []
+
+
+@pytest.mark.asyncio
+async def test_flushed_update_invalidates(student, session_factory):
+    async with session_factory() as session:
+        await get_user_by_sub(session, EMAIL)
+
+    async with session_factory() as session:
+        user = await session.get(User, student.id)
+        user.is_active = False
+        await session.commit()
+
+    async with session_factory() as session:
+        user = await get_user_by_sub(session, EMAIL)
+        assert user.is_active is False
+
+
+@pytest.mark.asyncio
+async def test_deduct_credits_invalidates(student, session_factory):
+    """Bulk UPDATE bypasses flush events; deduct_credits invalidates explicitly"""
+    async with session_factory() as session:
+        cached = await get_user_by_sub(session, EMAIL)
+        assert cached.credits_remaining == 10
+    assert student.id in principal_cache._subs_by_id
+
+    async with session_factory() as session:
+        assert await deduct_credits(student.id, 7, session)
+    assert student.id not in principal_cache._subs_by_id
+
+    async with session_factory() as session:
+        user = await get_user_by_sub(session, EMAIL)
+        assert user.credits_remaining == 3
+        assert not await check_credits(student.id, 5, session)
+
+
+@pytest.mark.asyncio
+async def test_credit_check_reads_database_not_principal(student, session_factory):
+    """A principal attached to the session must not shadow the stored balance"""
+    async with session_factory() as session:
+        await get_user_by_sub(session, EMAIL)
+
+    async with session_factory() as other:
+        await deduct_credits(student.id, 8, other)
+
+    async with session_factory() as session:
+        # Re-populate the cache, then change the row behind its back
+        await get_user_by_sub(session, EMAIL)
+    async with session_factory() as session:
+        await session.execute(
+            User.__table__.update().where(User.__table__.c.id == student.id).values(credits_remaining=0)
+        )
+        await session.commit()
+
+    async with session_factory() as session:
+        principal = await get_user_by_sub(session, EMAIL)
+        assert principal.credits_remaining == 2  # stale snapshot, within TTL
+        assert not await check_credits(student.id, 1, session)
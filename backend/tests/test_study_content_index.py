@@ -0,0 +1,103 @@
+"""
+backend/tests/test_study_content_index.py
+Study planner content index: build, topic matching, cache and invalidation
+"""
+import pytest
+import pytest_asyncio
+from sqlalchemy import event
+
+from backend.orm.content_module import ContentModule, ModuleType
+from backend.orm.learn_content import LearnContent
+from backend.orm.case_content import CaseContent, ExamImportance
+from backend.orm.practice_question import PracticeQuestion, QuestionType
+from backend.services.study_planner_service import (
+    load_content_indexes, fetch_content_for_topic, invalidate_content_index
+)
+
+
+SUBJECT_ID = 1
+LONG_QUESTION = "Discuss whether an advertisement can amount to a unilateral offer. " * 3
+
+
+@pytest_asyncio.fixture
+async def subject_content(db_session):
+    invalidate_content_index()
+    learn = ContentModule(subject_id=SUBJECT_ID, module_type=ModuleType.LEARN, title="Concepts", order_index=0)
+    cases = ContentModule(subject_id=SUBJECT_ID, module_type=ModuleType.CASES, title="Cases", order_index=1)
+    practice = ContentModule(subject_id=SUBJECT_ID, module_type=ModuleType.PRACTICE, title="Practice", order_index=2)
+    db_session.add_all([learn, cases, practice])
+    await db_session.flush()
+
+    db_session.add_all([
+        LearnContent(module_id=learn.id, title="Offer and Acceptance", body="x" * 2000, order_index=0),
+        LearnContent(module_id=learn.id, title="Consideration", body="Something of value", order_index=1),
+        CaseContent(
+            module_id=cases.id, case_name="Carlill v Carbolic Smoke Ball Co", year=1893,
+            facts="Smoke ball", issue="Offer", judgment="Plaintiff won", ratio="Unilateral offer",
+            exam_importance=ExamImportance.HIGH, tags="offer,acceptance"
+        ),
+        PracticeQuestion(
+            module_id=practice.id, question_type=QuestionType.ESSAY, question=LONG_QUESTION,
+            correct_answer="Yes", marks=10, tags="offer", order_index=0
+        ),
+        PracticeQuestion(
+            module_id=practice.id, question_type=QuestionType.MCQ, question="What is consideration?",
+            correct_answer="A", marks=1, tags="consideration", order_index=1
+        ),
+    ])
+    await db_session.commit()
+    yield
+    invalidate_content_index()
+
+
+@pytest.fixture
+def statements(db_engine):
+    executed = []
+
+    def record(conn, cursor, statement, parameters, context, executemany):
+        executed.append(statement)
+
+    event.listen(db_engine.sync_engine, "before_cursor_execute", record)
+    yield executed
+    event.remove(db_engine.sync_engine, "before_cursor_execute", record)
+
+
+@pytest.mark.asyncio
+async def test_builds_index_in_module_order(db_session, subject_content, statements):
+    indexes = await load_content_indexes([SUBJECT_ID], db_session)
+    assert len(statements) == 3
+
+    index = indexes[SUBJECT_ID]
+    assert [item["title"] for _, item in index.learn] == ["Offer and Acceptance", "Consideration"]
+    assert [item["importance"] for _, item in index.cases] == ["high"]
+
+    essay, mcq = [item for _, item in index.practice]
+    assert essay["title"] == LONG_QUESTION[:100] + "..."
+    assert (essay["type"], essay["marks"]) == ("essay", 10)
+    assert mcq["title"] == "What is consideration?"
+
+
+@pytest.mark.asyncio
+async def test_topic_matching(db_session, subject_content):
+    content = await fetch_content_for_topic(SUBJECT_ID, "offer", db_session)
+    assert [item["title"] for item in content["learn"]] == ["Offer and Acceptance"]
+    assert len(content["cases"]) == 1
+    assert len(content["practice"]) == 1
+
+    everything = await fetch_content_for_topic(SUBJECT_ID, None, db_session)
+    assert (len(everything["learn"]), len(everything["cases"]), len(everything["practice"])) == (2, 1, 2)
+
+
+@pytest.mark.asyncio
+async def test_cached_until_content_changes(db_session, subject_content, statements):
+    await load_content_indexes([SUBJECT_ID], db_session)
+    statements.clear()
+    await load_content_indexes([SUBJECT_ID], db_session)
+    assert statements == []
+
+    module_id = (await load_content_indexes([SUBJECT_ID], db_session))[SUBJECT_ID].learn[0][1]["module_id"]
+    db_session.add(LearnContent(module_id=module_id, title="Offer revocation", body="...", order_index=2))
+    await db_session.commit()
+
+    content = await fetch_content_for_topic(SUBJECT_ID, "offer", db_session)
+    assert [item["title"] for item in content["learn"]] == ["Offer and Acceptance", "Offer revocation"]
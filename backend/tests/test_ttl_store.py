@@ -0,0 +1,141 @@
+"""
+backend/tests/test_ttl_store.py
+Bounded TTL stores: expiry, LRU bound, sweep and the shared SQLite backend
+"""
+import asyncio
+import sqlite3
+import time
+
+import pytest
+
+from backend.services import ttl_store
+from backend.services.ttl_store import TTLStore, SQLiteTTLStore, create_ttl_store, sweep_expired
+
+
+class Clock:
+    """Controllable replacement for time.monotonic/time.time"""
+
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = Clock()
+    monkeypatch.setattr(ttl_store.time, "monotonic", clock)
+    monkeypatch.setattr(ttl_store.time, "time", clock)
+    return clock
+
+
+@pytest.fixture(params=["memory", "sqlite"])
+def make_store(request, tmp_path):
+    def make(namespace: str, ttl_seconds: float = 60, max_size: int = 10) -> TTLStore:
+        if request.param == "sqlite":
+            return SQLiteTTLStore(namespace, ttl_seconds, max_size, str(tmp_path / "ttl.db"))
+        return TTLStore(namespace, ttl_seconds, max_size)
+    return make
+
+
+def test_entries_expire_after_last_write(make_store, clock):
+    store = make_store("sessions", ttl_seconds=60)
+    store.set("a", {"turns": 1})
+    clock.now += 50
+    store.set("a", {"turns": 2})
+    clock.now += 50
+    assert store.get("a") == {"turns": 2}
+
+    clock.now += 11
+    assert store.get("a") is None
+    assert "a" not in store
+    assert len(store) == 0
+
+
+def test_least_recently_used_entry_goes_first(make_store, clock):
+    store = make_store("ratings", max_size=2)
+    store.set("a", 1)
+    clock.now += 1
+    store.set("b", 2)
+    clock.now += 1
+    store.get("a")
+    clock.now += 1
+    store.set("c", 3)
+
+    assert sorted(store) == ["a", "c"]
+    assert [value for _, value in store.items()] == [1, 3]
+
+
+def test_pop_and_clear(make_store, clock):
+    store = make_store("contexts")
+    store.set("a", 1)
+    store.set("b", 2)
+    assert store.pop("a") == 1
+    assert store.pop("a", "gone") == "gone"
+    store.clear()
+    assert len(store) == 0
+
+
+def test_sweep_removes_expired_entries_without_reads(make_store, clock):
+    store = make_store("sweep", ttl_seconds=10)
+    for key in "abc":
+        store.set(key, key)
+    clock.now += 5
+    store.set("d", "d")
+    clock.now += 6
+
+    assert sweep_expired() >= 3
+    assert store.purge_expired() == 0
+    assert sorted(store) == ["d"]
+
+
+def test_sqlite_stores_share_entries_by_namespace(tmp_path, clock):
+    path = str(tmp_path / "shared.db")
+    worker_a = SQLiteTTLStore("sessions", 60, 10, path)
+    worker_b = SQLiteTTLStore("sessions", 60, 10, path)
+    other = SQLiteTTLStore("ratings", 60, 10, path)
+
+    worker_a.set(42, {"history": ["hello"]})
+    assert worker_b.get(42) == {"history": ["hello"]}
+    assert other.get(42) is None
+
+    # Values are copies: changes need another set()
+    session = worker_b.get(42)
+    session["history"].append("again")
+    assert worker_a.get(42) == {"history": ["hello"]}
+
+
+def test_sqlite_store_gives_up_quickly_on_a_locked_file(tmp_path):
+    path = str(tmp_path / "locked.db")
+    store = SQLiteTTLStore("sessions", 60, 10, path)
+    other_worker = sqlite3.connect(path, isolation_level=None)
+    other_worker.execute("BEGIN IMMEDIATE")
+
+    started = time.perf_counter()
+    with pytest.raises(sqlite3.OperationalError):
+        store.set("a", 1)
+    assert time.perf_counter() - started < 1
+    other_worker.execute("ROLLBACK")
+
+    store.set("a", 1)
+    assert store.get("a") == 1
+
+
+def test_backend_follows_configuration(tmp_path, monkeypatch):
+    assert type(create_ttl_store("plain", 60, 10)) is TTLStore
+
+    monkeypatch.setattr(ttl_store, "TTL_STORE_PATH", str(tmp_path / "configured.db"))
+    assert isinstance(create_ttl_store("shared", 60, 10), SQLiteTTLStore)
+
+
+@pytest.mark.asyncio
+async def test_sweeper_starts_on_first_write(monkeypatch):
+    monkeypatch.setattr(ttl_store, "_sweeper", None)
+    TTLStore("background", 60, 10).set("a", 1)
+
+    sweeper = ttl_store._sweeper
+    assert sweeper is not None and not sweeper.done()
+    sweeper.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await sweeper
@@ -0,0 +1,91 @@
+"""
+backend/tests/test_tutor_context_cache.py
+Tutor context cache: hits, invalidation, stamp eviction and write events
+"""
+import pytest
+
+from backend.orm.practice_attempt import PracticeAttempt
+from backend.services import tutor_context_cache
+from backend.services.tutor_context_cache import (
+    cached_student_context, invalidate_student_context, clear_tutor_context_cache
+)
+
+
+class Builder:
+    """Build coroutine factory that counts its calls"""
+
+    def __init__(self, value="context"):
+        self.value = value
+        self.calls = 0
+
+    async def __call__(self):
+        self.calls += 1
+        return f"{self.value} #{self.calls}"
+
+
+@pytest.fixture(autouse=True)
+def empty_cache():
+    clear_tutor_context_cache()
+    tutor_context_cache._versions.clear()
+    yield
+    clear_tutor_context_cache()
+    tutor_context_cache._versions.clear()
+
+
+@pytest.mark.asyncio
+async def test_hit_reuses_context_per_kind_and_key():
+    build = Builder()
+    assert await cached_student_context("student_context", 1, build) == "context #1"
+    assert await cached_student_context("student_context", 1, build) == "context #1"
+    assert await cached_student_context("student_context", 1, build, key=7) == "context #2"
+    assert await cached_student_context("student_context", 2, build) == "context #3"
+    assert build.calls == 3
+
+
+@pytest.mark.asyncio
+async def test_invalidation_drops_student_entries():
+    build = Builder()
+    await cached_student_context("student_context", 1, build)
+    await cached_student_context("tutor_memory", 1, build)
+    await cached_student_context("student_context", 2, build)
+
+    invalidate_student_context(1)
+    assert 1 not in tutor_context_cache._contexts
+    assert await cached_student_context("student_context", 1, build) == "context #4"
+    assert await cached_student_context("student_context", 2, build) == "context #3"
+
+
+@pytest.mark.asyncio
+async def test_evicted_stamp_does_not_revive_stale_entry(monkeypatch):
+    monkeypatch.setattr(tutor_context_cache, "TUTOR_CONTEXT_CACHE_MAX_SIZE", 2)
+    build = Builder()
+    await cached_student_context("student_context", 1, build)
+
+    invalidate_student_context(1)
+    # Two other students push student 1's stamp out
+    invalidate_student_context(2)
+    invalidate_student_context(3)
+    assert 1 not in tutor_context_cache._versions
+
+    assert await cached_student_context("student_context", 1, build) == "context #2"
+
+
+@pytest.mark.asyncio
+async def test_build_racing_invalidation_is_not_stored():
+    async def build_while_student_practices():
+        invalidate_student_context(1)
+        return "stale"
+
+    assert await cached_student_context("student_context", 1, build_while_student_practices) == "stale"
+    assert await cached_student_context("student_context", 1, Builder("fresh")) == "fresh #1"
+
+
+@pytest.mark.asyncio
+async def test_practice_attempt_invalidates(db_session):
+    build = Builder()
+    await cached_student_context("student_context", 5, build)
+
+    db_session.add(PracticeAttempt(user_id=5, practice_question_id=1, selected_option="A", is_correct=False))
+    await db_session.commit()
+
+    assert await cached_student_context("student_context", 5, build) == "context #2"
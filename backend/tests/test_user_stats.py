@@ -0,0 +1,131 @@
+"""
+backend/tests/test_user_stats.py
+user_stats rollup: event deltas match a rebuild from the source tables
+"""
+from datetime import datetime, timedelta
+
+import pytest
+import pytest_asyncio
+
+from backend.orm.user import User, UserRole
+from backend.orm.user_stats import UserStats
+from backend.orm.user_content_progress import UserContentProgress, ContentType
+from backend.orm.practice_attempt import PracticeAttempt
+from backend.services.user_stats_service import get_user_stats, _build_stats
+
+
+TOTALS = (
+    "content_completed", "total_time_spent_seconds", "last_activity_at",
+    "total_attempts", "correct_attempts", "study_streak", "streak_last_date",
+)
+
+
+@pytest_asyncio.fixture
+async def student(db_session) -> User:
+    user = User(email="stats@test.com", full_name="Stats Student", password_hash="x", role=UserRole.STUDENT)
+    db_session.add(user)
+    await db_session.commit()
+    # Create the rollup row so the events maintain it
+    await get_user_stats(db_session, user.id)
+    return user
+
+
+async def read_stats(session_factory, user_id: int) -> UserStats:
+    async with session_factory() as session:
+        return await session.get(UserStats, user_id)
+
+
+async def rebuilt_stats(session_factory, user_id: int) -> UserStats:
+    async with session_factory() as session:
+        return await _build_stats(session, user_id)
+
+
+def totals(stats: UserStats) -> tuple:
+    return tuple(getattr(stats, column) for column in TOTALS)
+
+
+@pytest.mark.asyncio
+async def test_content_events_update_totals_and_streak(db_session, session_factory, student):
+    now = datetime.utcnow().replace(microsecond=0)
+    yesterday = UserContentProgress(
+        user_id=student.id, content_type=ContentType.LEARN, content_id=1,
+        is_completed=True, last_viewed_at=now - timedelta(days=1), time_spent_seconds=300
+    )
+    today = UserContentProgress(
+        user_id=student.id, content_type=ContentType.CASE, content_id=2,
+        last_viewed_at=now, time_spent_seconds=120
+    )
+    db_session.add_all([yesterday, today])
+    await db_session.commit()
+
+    stats = await read_stats(session_factory, student.id)
+    assert stats.content_completed == 1
+    assert stats.total_time_spent_seconds == 420
+    assert stats.last_activity_at == now
+    assert (stats.study_streak, stats.streak_last_date) == (2, now.date())
+
+    today.is_completed = True
+    today.time_spent_seconds = 200
+    await db_session.commit()
+
+    stats = await read_stats(session_factory, student.id)
+    assert stats.content_completed == 2
+    assert stats.total_time_spent_seconds == 500
+    assert totals(stats) == totals(await rebuilt_stats(session_factory, student.id))
+
+
+@pytest.mark.asyncio
+async def test_attempt_events_update_counts(db_session, session_factory, student):
+    attempts = [
+        PracticeAttempt(user_id=student.id, practice_question_id=question_id, selected_option="A", is_correct=correct)
+        for question_id, correct in [(1, True), (2, False), (3, None)]
+    ]
+    db_session.add_all(attempts)
+    await db_session.commit()
+
+    stats = await read_stats(session_factory, student.id)
+    assert (stats.total_attempts, stats.correct_attempts) == (3, 1)
+
+    # Essay graded later
+    attempts[2].is_correct = True
+    await db_session.commit()
+    stats = await read_stats(session_factory, student.id)
+    assert (stats.total_attempts, stats.correct_attempts) == (3, 2)
+
+    await db_session.delete(attempts[0])
+    await db_session.commit()
+    stats = await read_stats(session_factory, student.id)
+    assert (stats.total_attempts, stats.correct_attempts) == (2, 1)
+    assert totals(stats) == totals(await rebuilt_stats(session_factory, student.id))
+
+
+@pytest.mark.asyncio
+async def test_deleted_progress_is_subtracted(db_session, session_factory, student):
+    progress = UserContentProgress(
+        user_id=student.id, content_type=ContentType.LEARN, content_id=1,
+        is_completed=True, time_spent_seconds=90
+    )
+    db_session.add(progress)
+    await db_session.commit()
+
+    await db_session.delete(progress)
+    await db_session.commit()
+
+    stats = await read_stats(session_factory, student.id)
+    assert (stats.content_completed, stats.total_time_spent_seconds) == (0, 0)
+
+
+@pytest.mark.asyncio
+async def test_missing_row_is_rebuilt_on_first_read(db_session, session_factory):
+    user = User(email="late@test.com", full_name="Late Student", password_hash="x", role=UserRole.STUDENT)
+    db_session.add(user)
+    await db_session.commit()
+    db_session.add(PracticeAttempt(user_id=user.id, practice_question_id=1, selected_option="B", is_correct=True))
+    await db_session.commit()
+
+    # No rollup row yet: the event skipped this user
+    assert await read_stats(session_factory, user.id) is None
+
+    stats = await get_user_stats(db_session, user.id)
+    assert (stats.total_attempts, stats.correct_attempts) == (1, 1)
+    assert await read_stats(session_factory, user.id) is not None
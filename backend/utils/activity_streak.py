@@ -0,0 +1,63 @@
+# backend/utils/activity_streak.py
+"""
+Shared study-streak arithmetic.
+
+Activity days are packed into an int bitmap (bit i set = active i days
+before today), so a streak is a count of consecutive set bits and any
+window of days is a mask. Every streak shown to users (dashboard,
+analytics, mastery, tutor memory) uses these rules:
+- A streak is current while the last active day is today or yesterday
+- It counts consecutive active days back from that day
+"""
+from datetime import date, datetime
+from typing import Any, Iterable, Optional
+
+
+def as_date(value: Any) -> date:
+    """Normalize a date, datetime or ISO string (SQLite func.date()) to a date"""
+    if isinstance(value, datetime):
+        return value.date()
+    if isinstance(value, date):
+        return value
+    return datetime.strptime(str(value)[:10], "%Y-%m-%d").date()
+
+
+def activity_bitmap(days: Iterable[Any], today: date, window: Optional[int] = None) -> int:
+    """
+    Bitmap of active days relative to today.
+
+    Args:
+        days: Active days (dates, datetimes or ISO strings; duplicates allowed)
+        window: Only keep the most recent `window` days
+    """
+    bitmap = 0
+    for day in days:
+        offset = (today - as_date(day)).days
+        if offset >= 0 and (window is None or offset < window):
+            bitmap |= 1 << offset
+    return bitmap
+
+
+def _trailing_ones(bitmap: int) -> int:
+    return ((bitmap ^ (bitmap + 1)).bit_length() - 1)
+
+
+def streak_from_bitmap(bitmap: int, max_days: Optional[int] = None) -> int:
+    """Current streak of an activity bitmap (anchored on today or yesterday)"""
+    if bitmap & 1:
+        streak = _trailing_ones(bitmap)
+    elif bitmap & 2:
+        streak = _trailing_ones(bitmap >> 1)
+    else:
+        streak = 0
+    return min(streak, max_days) if max_days is not None else streak
+
+
+def streak_from_dates(days: Iterable[Any], today: date, max_days: Optional[int] = None) -> int:
+    """Current streak of a collection of active days"""
+    return streak_from_bitmap(activity_bitmap(days, today), max_days)
+
+
+def active_days_in_window(bitmap: int, window: int) -> int:
+    """Number of active days among the last `window` days (today included)"""
+    return bin(bitmap & ((1 << window) - 1)).count("1")
@@ -0,0 +1,140 @@
+# backend/utils/citation_normalizer.py
+"""
+Canonical forms for case names and law-report citations.
+
+Used to build and query the normalized citation index, so that
+"K.S. Puttaswamy v. UOI" and "Justice K.S. Puttaswamy (Retd.) v. Union of India"
+resolve to the same lookup keys, and "(2017) 10 SCC 1" and "(2017)10 SCC 1"
+to the same citation key.
+"""
+import re
+from typing import List, NamedTuple, Optional, Tuple
+
+# Honorifics and descriptors that carry no identity
+_NOISE_TOKENS = {
+    "the", "justice", "retd", "dr", "shri", "smt", "sri", "mr", "mrs", "ms",
+    "and", "anr", "anrs", "ors", "others", "another",
+}
+
+# Corporate suffixes, dropped so "Co." / "Company" / "Ltd" variants agree
+_SUFFIX_TOKENS = {
+    "co", "company", "ltd", "limited", "pvt", "private", "inc", "corp", "corporation", "llp",
+}
+
+# Common abbreviations, expanded to their full token sequence
+_EXPANSIONS = {
+    "uoi": ("union", "of", "india"),
+    "govt": ("government",),
+}
+
+# Party surnames too generic to identify a case on their own
+_GENERIC_TOKENS = {"india", "state", "union", "government", "commissioner", "others", "of"}
+
+_TOKEN_PATTERN = re.compile(r"[a-z0-9]+")
+_MESSRS_PATTERN = re.compile(r"\bm/s\b\.?")
+_VERSUS_PATTERN = re.compile(r"\s+(?:v|vs|versus)\.?\s+", re.IGNORECASE)
+
+SCC_CITATION_PATTERN = re.compile(
+    r"\((\d{4})\)\s*(?:Supp\s*\(?(\d+)\)?\s*)?(\d+)?\s*SCC\s*(\d+)", re.IGNORECASE
+)
+AIR_CITATION_PATTERN = re.compile(
+    r"AIR\s*(\d{4})\s*([A-Za-z]+)\s*(\d+)", re.IGNORECASE
+)
+
+
+class ParsedCitation(NamedTuple):
+    """A law-report citation broken into its parts"""
+    reporter: str  # "SCC" or "AIR"
+    year: int
+    volume: str  # Volume for SCC ("supp3" for supplements), court for AIR
+    page: int
+
+    @property
+    def key(self) -> str:
+        """Index key, e.g. 'scc:2017:10:1' or 'air:1978:sc:597'"""
+        return f"{self.reporter.lower()}:{self.year}:{self.volume.lower()}:{self.page}"
+
+    def __str__(self) -> str:
+        if self.reporter == "AIR":
+            return f"AIR {self.year} {self.volume} {self.page}"
+        volume = f"Supp ({self.volume[4:]})" if self.volume.startswith("supp") else self.volume
+        return " ".join(part for part in (f"({self.year})", volume, "SCC", str(self.page)) if part)
+
+
+def _tokens(text: str) -> List[str]:
+    tokens: List[str] = []
+    for token in _TOKEN_PATTERN.findall(_MESSRS_PATTERN.sub(" ", text.lower())):
+        tokens.extend(_EXPANSIONS.get(token, (token,)))
+    return tokens
+
+
+def canonical_party(name: str) -> str:
+    """
+    Canonical form of one party name.
+
+    Lowercased, punctuation removed, honorifics and corporate suffixes dropped,
+    common abbreviations expanded.
+    """
+    tokens = [t for t in _tokens(name) if t not in _NOISE_TOKENS]
+    while tokens and tokens[-1] in _SUFFIX_TOKENS:
+        tokens.pop()
+    return " ".join(tokens)
+
+
+def party_variants(name: str) -> List[str]:
+    """
+    Canonical variants a party may be cited by, most specific first:
+    full canonical name, name without initials, distinctive surname.
+    """
+    canonical = canonical_party(name)
+    if not canonical:
+        return []
+
+    tokens = canonical.split()
+    variants = [canonical]
+
+    without_initials = " ".join(t for t in tokens if len(t) > 1)
+    if without_initials and without_initials not in variants:
+        variants.append(without_initials)
+
+    surname = tokens[-1]
+    if len(surname) > 2 and surname not in _GENERIC_TOKENS and surname not in variants:
+        variants.append(surname)
+
+    return variants
+
+
+def split_case_name(case_name: str) -> Optional[Tuple[str, str]]:
+    """Split 'A v. B' into its two parties (None if not a two-party name)"""
+    parts = _VERSUS_PATTERN.split(case_name, maxsplit=1)
+    if len(parts) != 2:
+        return None
+    return parts[0], parts[1]
+
+
+def case_name_keys(party1: str, party2: str) -> List[str]:
+    """All party-pair lookup keys for a case, e.g. 'puttaswamy v union of india'"""
+    return [
+        f"{a} v {b}"
+        for a in party_variants(party1)
+        for b in party_variants(party2)
+    ]
+
+
+def find_citations(text: str) -> List[ParsedCitation]:
+    """Parse every SCC and AIR citation in text"""
+    citations = []
+    for match in SCC_CITATION_PATTERN.finditer(text):
+        year, supplement, volume, page = match.groups()
+        volume = f"supp{supplement}" if supplement else (volume or "")
+        citations.append(ParsedCitation("SCC", int(year), volume, int(page)))
+    for match in AIR_CITATION_PATTERN.finditer(text):
+        year, court, page = match.groups()
+        citations.append(ParsedCitation("AIR", int(year), court, int(page)))
+    return citations
+
+
+def parse_citation(text: str) -> Optional[ParsedCitation]:
+    """Parse the first SCC (else AIR) citation in text"""
+    citations = find_citations(text)
+    return citations[0] if citations else None
@@ -0,0 +1,19 @@
+# backend/utils/orm_history.py
+"""
+Attribute history helpers for mapper event listeners.
+
+Rollup listeners (user_stats, user_daily_activity) turn an update of a
+source row into a delta, which needs the value the row had before the
+flush alongside the new one.
+"""
+from typing import Any
+
+from sqlalchemy import inspect
+
+
+def value_before_flush(target: Any, attribute: str) -> Any:
+    """Value of an attribute before the flush (current value when unchanged)"""
+    history = getattr(inspect(target).attrs, attribute).history
+    if history.deleted:
+        return history.deleted[0]
+    return getattr(target, attribute)
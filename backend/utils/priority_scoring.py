@@ -0,0 +1,39 @@
+# backend/utils/priority_scoring.py
+"""
+Column-wise priority scoring.
+
+Scorers keep one list per feature (index i = one topic or module) and
+combine them in a single pass, so everything a user is studying is
+scored together after one load instead of item by item. Used by the
+study priority engine (topics) and the study map (modules).
+"""
+from typing import Dict, List, Sequence
+
+
+def staleness_column(days_since: Sequence[int], cap_days: int) -> List[float]:
+    """Days since last practice scaled to 0-1 (1.0 at cap_days or more)"""
+    return [min(days / cap_days, 1.0) for days in days_since]
+
+
+def weighted_scores(components: Dict[str, Sequence[float]], weights: Dict[str, float]) -> List[float]:
+    """
+    Weighted sum of component columns.
+
+    Args:
+        components: Column per component name (all the same length)
+        weights: Weight per component name; only these components are used
+    """
+    factors = list(weights.values())
+    columns = [components[name] for name in weights]
+    return [
+        sum(factor * value for factor, value in zip(factors, values))
+        for values in zip(*columns)
+    ]
+
+
+def priority_labels(scores: Sequence[float], high: float, medium: float) -> List[str]:
+    """High / Medium / Low label per score"""
+    return [
+        "High" if score >= high else "Medium" if score >= medium else "Low"
+        for score in scores
+    ]
@@ -16,6 +16,7 @@ from backend.websockets.protocol import (
     LeaderboardUpdateEvent, ErrorEvent, parse_event, validate_event
 )
 from backend.state_machines.classroom_session import SessionStateMachine
+from backend.services import live_leaderboard
 
 
 class ClassroomConnectionManager:
@@ -81,6 +82,7 @@ class ClassroomConnectionManager:
             if not self.active_connections[room_id]:
                 del self.active_connections[room_id]
                 del self.room_data[room_id]
+                live_leaderboard.drop_board(room_id)
             elif participant:
                 # Broadcast user left
                 event = UserLeftEvent(
@@ -231,10 +233,13 @@ async def handle_classroom_event(
                 # Check if all scores submitted
                 # TODO: Check completion
                 
-                # If complete, broadcast leaderboard
+                # Broadcast the standings that moved
+                rankings = live_leaderboard.on_classroom_score(
+                    room_id, user_id, event.user_id, event.total_score
+                )
                 leaderboard = LeaderboardUpdateEvent(
                     room_id=room_id,
-                    rankings=[]  # TODO: Get rankings
+                    rankings=rankings
                 )
                 await manager.broadcast(room_id, leaderboard.dict())
     
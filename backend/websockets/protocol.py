@@ -242,6 +242,7 @@ class LeaderboardUpdateEvent(BaseEvent):
     """Leaderboard updated."""
     type: Literal[EventType.LEADERBOARD_UPDATE] = EventType.LEADERBOARD_UPDATE
     rankings: List[Dict[str, Any]]
+    is_snapshot: bool = False  # Full standings rather than only the entries that changed
 
 
 # Match Events (Online 1v1 only)
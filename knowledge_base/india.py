@@ -1,17 +1,21 @@
 """India Legal Knowledge Base — Phase 1 MVP. Contains 15 landmark Supreme Court cases covering core Indian moot court topics. All citations in SCC format. Zero foreign cases."""
-from typing import List, Dict, Optional
+from typing import Any, List, Dict, Iterable, Optional, Tuple
+import json
+import math
+import os
 import re
 
 
 class LandmarkCase:
     """Represents a landmark Supreme Court case of India."""
     
-    def __init__(self, name: str, citation: str, year: int, key_principle: str, must_cite_for: List[str]):
+    def __init__(self, name: str, citation: str, year: int, key_principle: str, must_cite_for: List[str], aliases: Optional[List[str]] = None):
         self.name = name
         self.citation = citation
         self.year = year
         self.key_principle = key_principle
         self.must_cite_for = must_cite_for
+        self.aliases = aliases or []
     
     def matches_argument(self, argument: str) -> bool:
         """Returns True if any token from must_cite_for appears in argument.lower()."""
@@ -42,14 +46,16 @@ LANDMARK_CASES: Dict[str, List[LandmarkCase]] = {
             citation="(2017) 10 SCC 1",
             year=2017,
             key_principle="Right to privacy fundamental under Article 21; proportionality test required",
-            must_cite_for=["privacy", "personal data", "data protection", "aadhaar", "surveillance", "biometric"]
+            must_cite_for=["privacy", "personal data", "data protection", "aadhaar", "surveillance", "biometric"],
+            aliases=["Puttaswamy", "K.S. Puttaswamy"]
         ),
         LandmarkCase(
             name="Anuradha Bhasin v. Union of India",
             citation="(2020) 3 SCC 637",
             year=2020,
             key_principle="Internet shutdowns must satisfy proportionality test; freedom of speech extends to internet",
-            must_cite_for=["internet shutdown", "digital rights", "online speech", "network suspension"]
+            must_cite_for=["internet shutdown", "digital rights", "online speech", "network suspension"],
+            aliases=["Anuradha Bhasin"]
         ),
     ],
     "free_speech": [
@@ -58,14 +64,16 @@ LANDMARK_CASES: Dict[str, List[LandmarkCase]] = {
             citation="(2015) 5 SCC 1",
             year=2015,
             key_principle="Struck down Section 66A IT Act for vagueness; reasonable restrictions under Article 19(2) must be narrowly tailored",
-            must_cite_for=["social media", "online speech", "section 66a", "it act", "hate speech online"]
+            must_cite_for=["social media", "online speech", "section 66a", "it act", "hate speech online"],
+            aliases=["Shreya Singhal"]
         ),
         LandmarkCase(
             name="Ramji Lal Modi v. State of Uttar Pradesh",
             citation="(1957) SCR 874",
             year=1957,
             key_principle="Section 295A IPC constitutional; requires 'deliberate and malicious intention' to outrage religious feelings",
-            must_cite_for=["religious sentiments", "section 295a", "blasphemy", "hurting religious feelings"]
+            must_cite_for=["religious sentiments", "section 295a", "blasphemy", "hurting religious feelings"],
+            aliases=["Ramji Lal Modi"]
         ),
     ],
     "constitutional_law": [
@@ -74,14 +82,16 @@ LANDMARK_CASES: Dict[str, List[LandmarkCase]] = {
             citation="(1973) 4 SCC 225",
             year=1973,
             key_principle="Basic Structure Doctrine; Parliament cannot amend basic structure of Constitution",
-            must_cite_for=["constitutional amendment", "basic structure", "parliament power", "article 368"]
+            must_cite_for=["constitutional amendment", "basic structure", "parliament power", "article 368"],
+            aliases=["Kesavananda Bharati", "Kesavananda"]
         ),
         LandmarkCase(
             name="Maneka Gandhi v. Union of India",
             citation="(1978) 1 SCC 248",
             year=1978,
             key_principle="'Procedure established by law' under Article 21 must be fair, just and reasonable",
-            must_cite_for=["due process", "article 21", "procedure established by law", "fair procedure"]
+            must_cite_for=["due process", "article 21", "procedure established by law", "fair procedure"],
+            aliases=["Maneka Gandhi", "Maneka"]
         ),
     ],
     "bail": [
@@ -90,14 +100,16 @@ LANDMARK_CASES: Dict[str, List[LandmarkCase]] = {
             citation="(1977) 2 SCC 52",
             year=1977,
             key_principle="Bail is rule, jail exception; presumption of innocence fundamental",
-            must_cite_for=["bail", "grant bail", "custody", "jail", "pre-trial detention"]
+            must_cite_for=["bail", "grant bail", "custody", "jail", "pre-trial detention"],
+            aliases=["Balchand"]
         ),
         LandmarkCase(
             name="Gurbaksh Singh Sibbia v. State of Punjab",
             citation="(1980) 2 SCC 565",
             year=1980,
             key_principle="Anticipatory bail under Section 438 CrPC available even before FIR",
-            must_cite_for=["anticipatory bail", "section 438", "pre-arrest bail", "fear of arrest"]
+            must_cite_for=["anticipatory bail", "section 438", "pre-arrest bail", "fear of arrest"],
+            aliases=["Gurbaksh Singh Sibbia", "Sibbia"]
         ),
     ],
     "defamation": [
@@ -106,7 +118,8 @@ LANDMARK_CASES: Dict[str, List[LandmarkCase]] = {
             citation="(2016) 7 SCC 221",
             year=2016,
             key_principle="Criminal defamation (Sections 499/500 IPC) constitutional; reputation integral to dignity under Article 21",
-            must_cite_for=["defamation", "reputation", "section 499", "section 500"]
+            must_cite_for=["defamation", "reputation", "section 499", "section 500"],
+            aliases=["Subramanian Swamy"]
         ),
     ],
     "lgbtq_rights": [
@@ -115,7 +128,8 @@ LANDMARK_CASES: Dict[str, List[LandmarkCase]] = {
             citation="(2018) 10 SCC 1",
             year=2018,
             key_principle="Section 377 IPC unconstitutional for consensual same-sex relations; sexual orientation integral to privacy under Article 21",
-            must_cite_for=["lgbtq", "section 377", "sexual orientation", "homosexuality", "same sex"]
+            must_cite_for=["lgbtq", "section 377", "sexual orientation", "homosexuality", "same sex"],
+            aliases=["Navtej Singh Johar", "Navtej"]
         ),
     ],
     "gender_equality": [
@@ -124,7 +138,8 @@ LANDMARK_CASES: Dict[str, List[LandmarkCase]] = {
             citation="(2018) 7 SCC 436",
             year=2018,
             key_principle="Section 497 IPC (adultery) unconstitutional; treats women as property of husband",
-            must_cite_for=["adultery", "gender equality", "section 497", "women rights", "sexual autonomy"]
+            must_cite_for=["adultery", "gender equality", "section 497", "women rights", "sexual autonomy"],
+            aliases=["Joseph Shine"]
         ),
     ],
     "sexual_harassment": [
@@ -133,7 +148,8 @@ LANDMARK_CASES: Dict[str, List[LandmarkCase]] = {
             citation="(1997) 6 SCC 241",
             year=1997,
             key_principle="Laid down binding guidelines for prevention of sexual harassment at workplace (pre-POSH Act)",
-            must_cite_for=["sexual harassment", "workplace", "posh act", "vishaka guidelines", "safe workplace"]
+            must_cite_for=["sexual harassment", "workplace", "posh act", "vishaka guidelines", "safe workplace"],
+            aliases=["Vishaka"]
         ),
     ],
     "socio_economic_rights": [
@@ -142,7 +158,8 @@ LANDMARK_CASES: Dict[str, List[LandmarkCase]] = {
             citation="(2001) 5 SCC 572",
             year=2001,
             key_principle="Right to food integral to right to life under Article 21; state obligated to prevent starvation deaths",
-            must_cite_for=["right to food", "welfare", "nfsa", "starvation", "hunger", "social security"]
+            must_cite_for=["right to food", "welfare", "nfsa", "starvation", "hunger", "social security"],
+            aliases=["PUCL", "People's Union for Civil Liberties"]
         ),
     ],
     "affirmative_action": [
@@ -151,7 +168,8 @@ LANDMARK_CASES: Dict[str, List[LandmarkCase]] = {
             citation="(1992) Supp (3) SCC 217",
             year=1992,
             key_principle="50% cap on reservations; 'creamy layer' exclusion for OBCs",
-            must_cite_for=["reservation", "sc/st", "obc", "creamy layer", "50 percent cap", "affirmative action"]
+            must_cite_for=["reservation", "sc/st", "obc", "creamy layer", "50 percent cap", "affirmative action"],
+            aliases=["Indra Sawhney", "Mandal case"]
         ),
     ],
     "criminal_law": [
@@ -160,7 +178,8 @@ LANDMARK_CASES: Dict[str, List[LandmarkCase]] = {
             citation="(1980) 2 SCC 684",
             year=1980,
             key_principle="Death penalty only in 'rarest of rare' cases; life imprisonment is rule, death penalty exception",
-            must_cite_for=["death penalty", "capital punishment", "rarest of rare", "section 302", "murder"]
+            must_cite_for=["death penalty", "capital punishment", "rarest of rare", "section 302", "murder"],
+            aliases=["Bachan Singh"]
         ),
     ],
 }
@@ -212,6 +231,172 @@ AIR_PATTERN = re.compile(r"AIR\s+\d{4}\s+(SC|Bom|Del|Cal|Guj|Ker|Mad|Pat|Raj)\s+
 INDIAN_CASE_NAME_PATTERN = re.compile(r"[A-Z][a-z]+(?:\s+[A-Z][a-z]+)*(?:\s+v\.\s+[A-Z][a-z]+(?:\s+[A-Z][a-z]+)*)")
 
 
+# Knowledge Base Index
+#
+# Built once from LANDMARK_CASES / STATUTE_MAP so lookups cost time
+# proportional to the argument, not to the number of cases:
+# - phrase postings: first token of each must_cite_for phrase -> cases
+# - alias postings: first token of each case alias -> case
+# - citation table: normalized citation -> case
+# - statute n-grams: every contiguous token run of a topic key -> topic
+
+_TOKEN_PATTERN = re.compile(r"[a-z0-9]+")
+
+# phrase tokens, payload
+_Postings = Dict[str, List[Tuple[Tuple[str, ...], Any]]]
+
+
+def _normalize_token(token: str) -> str:
+    """Fold simple plurals so 'rights' matches 'right'."""
+    if len(token) > 3 and token.endswith("s") and not token.endswith("ss"):
+        return token[:-1]
+    return token
+
+
+def tokenize(text: str) -> List[str]:
+    """Lowercase word tokens with simple plural folding."""
+    return [_normalize_token(token) for token in _TOKEN_PATTERN.findall(text.lower())]
+
+
+def normalize_citation(citation: str) -> str:
+    """Canonical form of a citation: single spaces, upper case."""
+    return " ".join(citation.upper().split())
+
+
+def _add_posting(postings: _Postings, phrase: str, payload: Any) -> None:
+    tokens = tuple(tokenize(phrase))
+    if tokens:
+        postings.setdefault(tokens[0], []).append((tokens, payload))
+
+
+def _match_postings(tokens: List[str], postings: _Postings) -> Iterable[Tuple[Tuple[str, ...], Any]]:
+    """Yield every posting whose phrase occurs as a token run in tokens."""
+    for i, token in enumerate(tokens):
+        for phrase, payload in postings.get(token, ()):
+            if tuple(tokens[i:i + len(phrase)]) == phrase:
+                yield phrase, payload
+
+
+class KnowledgeBaseIndex:
+    """Inverted index over landmark cases and statute topics."""
+    
+    def __init__(self, cases: List[LandmarkCase], statutes: Dict[str, StatuteProvision]):
+        self.cases = cases
+        self.statutes = statutes
+        self._phrases: _Postings = {}
+        self._aliases: _Postings = {}
+        self._by_alias: Dict[Tuple[str, ...], LandmarkCase] = {}
+        self._by_citation: Dict[str, int] = {}
+        self._statute_ngrams: Dict[str, Tuple[int, str]] = {}
+        
+        phrase_cases: Dict[Tuple[str, ...], set] = {}
+        for position, case in enumerate(cases):
+            for keyword in case.must_cite_for:
+                _add_posting(self._phrases, keyword, (position, keyword))
+                phrase_cases.setdefault(tuple(tokenize(keyword)), set()).add(position)
+            
+            for alias in [case.name] + case.aliases:
+                _add_posting(self._aliases, alias, position)
+                self._by_alias.setdefault(tuple(tokenize(alias)), case)
+            
+            self._by_citation.setdefault(normalize_citation(case.citation), position)
+        
+        # Rarer, longer phrases say more about which case applies
+        total = max(len(cases), 1)
+        self._phrase_weight = {
+            phrase: (1 + 0.5 * (len(phrase) - 1)) * math.log(1 + total / len(positions))
+            for phrase, positions in phrase_cases.items()
+        }
+        
+        for order, key in enumerate(statutes):
+            parts = key.split("_")
+            for start in range(len(parts)):
+                for stop in range(start + 1, len(parts) + 1):
+                    self._statute_ngrams.setdefault("_".join(parts[start:stop]), (order, key))
+    
+    def rank_cases(self, argument: str) -> List[Tuple[LandmarkCase, float]]:
+        """Cases whose must_cite_for phrases occur in the argument, best first."""
+        scores: Dict[int, float] = {}
+        seen = set()
+        for phrase, (position, keyword) in _match_postings(tokenize(argument), self._phrases):
+            if (position, keyword) in seen:
+                continue
+            seen.add((position, keyword))
+            scores[position] = scores.get(position, 0.0) + self._phrase_weight[phrase]
+        
+        ranked = sorted(scores.items(), key=lambda item: (-item[1], item[0]))
+        return [(self.cases[position], score) for position, score in ranked]
+    
+    def cited_cases(self, argument: str) -> List[LandmarkCase]:
+        """Cases named (by any alias) or cited (by citation) in the argument."""
+        positions = {position for _, position in _match_postings(tokenize(argument), self._aliases)}
+        for citation in extract_citations(argument):
+            position = self._by_citation.get(normalize_citation(citation))
+            if position is not None:
+                positions.add(position)
+        return [self.cases[position] for position in sorted(positions)]
+    
+    def case_by_alias(self, name: str) -> Optional[LandmarkCase]:
+        """Exact lookup of a case by its full name or alias."""
+        return self._by_alias.get(tuple(tokenize(name)))
+    
+    def case_by_citation(self, citation: str) -> Optional[LandmarkCase]:
+        """Exact lookup of a case by citation."""
+        position = self._by_citation.get(normalize_citation(citation))
+        return self.cases[position] if position is not None else None
+    
+    def statute_for_topic(self, topic: str) -> Optional[StatuteProvision]:
+        """
+        First statute (in map order) whose key contains the topic or is
+        contained in it, matching on whole underscore/space-separated words.
+        """
+        words = topic.lower().replace("_", " ").split()
+        best: Optional[Tuple[int, str]] = self._statute_ngrams.get("_".join(words))
+        for start in range(len(words)):
+            for stop in range(start + 1, len(words) + 1):
+                key = "_".join(words[start:stop])
+                if key in self.statutes:
+                    order = self._statute_ngrams[key][0]
+                    if best is None or order < best[0]:
+                        best = (order, key)
+        return self.statutes[best[1]] if best else None
+
+
+def _build_index() -> KnowledgeBaseIndex:
+    return KnowledgeBaseIndex(
+        [case for cases in LANDMARK_CASES.values() for case in cases],
+        STATUTE_MAP
+    )
+
+
+def load_knowledge_base(path: str) -> KnowledgeBaseIndex:
+    """
+    Replace the built-in cases and statutes with those from a JSON file
+    and rebuild the index.
+    
+    Format:
+        {
+          "landmark_cases": {"<topic>": [{"name", "citation", "year",
+                             "key_principle", "must_cite_for", "aliases"?}]},
+          "statutes": {"<topic>": {"act", "sections", "key_case"?}}
+        }
+    """
+    global _index
+    with open(path, encoding="utf-8") as f:
+        data = json.load(f)
+    
+    LANDMARK_CASES.clear()
+    for topic, cases in data.get("landmark_cases", {}).items():
+        LANDMARK_CASES[topic] = [LandmarkCase(**case) for case in cases]
+    
+    STATUTE_MAP.clear()
+    for topic, statute in data.get("statutes", {}).items():
+        STATUTE_MAP[topic] = StatuteProvision(**statute)
+    
+    _index = _build_index()
+    return _index
+
+
 # Helper Functions
 
 def is_valid_scc_citation(text: str) -> bool:
@@ -222,34 +407,49 @@ def is_valid_scc_citation(text: str) -> bool:
 def extract_citations(text: str) -> List[str]:
     """Extract all SCC and AIR citations from text."""
     scc_matches = SCC_PATTERN.findall(text)
-    air_matches = AIR_PATTERN.findall(text)
+    air_matches = [match.group(0) for match in AIR_PATTERN.finditer(text)]
     return scc_matches + air_matches
 
 
 def get_all_landmark_cases() -> List[LandmarkCase]:
     """Get all landmark cases as a flat list."""
-    all_cases = []
-    for cases in LANDMARK_CASES.values():
-        all_cases.extend(cases)
-    return all_cases
+    return list(_index.cases)
 
 
 def find_relevant_cases(argument: str) -> List[LandmarkCase]:
-    """Find cases that match the given argument."""
-    relevant = []
-    for case in get_all_landmark_cases():
-        if case.matches_argument(argument):
-            relevant.append(case)
-    return relevant
+    """Find cases that match the given argument, most relevant first."""
+    return [case for case, _ in _index.rank_cases(argument)]
+
+
+def rank_relevant_cases(argument: str) -> List[Tuple[LandmarkCase, float]]:
+    """Find cases that match the given argument with relevance scores."""
+    return _index.rank_cases(argument)
+
+
+def find_cited_cases(argument: str) -> List[LandmarkCase]:
+    """Find cases the argument names or cites."""
+    return _index.cited_cases(argument)
+
+
+def get_case_by_name(name: str) -> Optional[LandmarkCase]:
+    """Get a case by its full name or a known short name."""
+    return _index.case_by_alias(name)
+
+
+def get_case_by_citation(citation: str) -> Optional[LandmarkCase]:
+    """Get a case by its citation."""
+    return _index.case_by_citation(citation)
 
 
 def get_statute_for_topic(topic: str) -> Optional[StatuteProvision]:
     """Get statute provision for a given topic."""
-    topic_lower = topic.lower()
-    for key, provision in STATUTE_MAP.items():
-        if key in topic_lower or topic_lower in key:
-            return provision
-    return None
+    return _index.statute_for_topic(topic)
+
+
+_index = _build_index()
+
+if os.getenv("INDIA_KB_DATA_FILE"):
+    load_knowledge_base(os.environ["INDIA_KB_DATA_FILE"])
 
 
 def run_phase1_validation():